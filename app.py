@@ -1,12 +1,14 @@
 from flask import Flask, render_template, jsonify, request
-import urllib.request
-import json
+from weather_outfit_adk.providers import HTTPConnectionPool, OpenMeteoProvider, OPEN_METEO_HOST
 
 app = Flask(__name__,
             template_folder='frontend/templates',
             static_folder='frontend/static',
             static_url_path='/static')
 
+# Open-Meteo (free, no API key needed!) over a keep-alive connection pool
+open_meteo = OpenMeteoProvider(HTTPConnectionPool(OPEN_METEO_HOST, name="open_meteo"))
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -16,7 +18,6 @@ def get_weather():
     city = request.args.get('city', 'Redmond')
     
     try:
-        # Using Open-Meteo (free, no API key needed!)
         coords = {
             'Redmond': (47.6740, -122.1215),
             'Seattle': (47.6062, -122.3321),
@@ -30,48 +31,15 @@ def get_weather():
             coords[city] = (47.6740, -122.1215)  # default to Redmond
         
         lat, lon = coords[city]
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,weather_code&temperature_unit=fahrenheit"
+        current = open_meteo.current(lat, lon)
+        temp = current['temperature']
         
-        with urllib.request.urlopen(url) as response:
-            data = json.loads(response.read())
-            current = data['current']
-            temp = current['temperature_2m']
-            
-            # Simple weather descriptions
-            weather_codes = {
-                0: 'Clear sky',
-                1: 'Partly cloudy',
-                2: 'Overcast',
-                3: 'Overcast',
-                45: 'Foggy',
-                48: 'Foggy',
-                51: 'Light drizzle',
-                53: 'Moderate drizzle',
-                55: 'Dense drizzle',
-                61: 'Slight rain',
-                63: 'Moderate rain',
-                65: 'Heavy rain',
-                71: 'Slight snow',
-                73: 'Moderate snow',
-                75: 'Heavy snow',
-                80: 'Slight rain showers',
-                81: 'Moderate rain showers',
-                82: 'Violent rain showers',
-                85: 'Slight snow showers',
-                86: 'Heavy snow showers',
-                95: 'Thunderstorm',
-                96: 'Thunderstorm with hail',
-                99: 'Thunderstorm with hail'
-            }
-            
-            condition = weather_codes.get(current['weather_code'], 'Partly cloudy')
-            
-            return jsonify({
-                'temperature': round(temp, 1),
-                'feels_like': round(temp - 2, 1),
-                'condition': condition,
-                'city': city
-            })
+        return jsonify({
+            'temperature': round(temp, 1),
+            'feels_like': round(temp - 2, 1),
+            'condition': current['condition'],
+            'city': city
+        })
     except Exception as e:
         print(f"Error: {e}")
         return jsonify({
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Outfit Lattice Benchmark
+
+Compares plan_outfit as it was written (if/elif chains evaluated on every
+call, kept in outfit_reference.py as the parity reference) with the
+precomputed lattice it now reads from:
+
+- Per-call latency over a random mix of weather and contexts
+- Lattice size and build time (paid once at import)
+
+Usage:
+    python benchmark_outfit_lattice.py [calls]
+"""
+
+import random
+import sys
+import time
+
+from outfit_reference import reference_plan_outfit
+from weather_outfit_adk.tools.outfit_lattice import LATTICE, _build_lattice
+from weather_outfit_adk.tools.outfit_tools import plan_outfit
+
+ACTIVITIES = ["casual", "work", "sports", "formal"]
+FORMALITIES = ["casual", "business_casual", "formal"]
+MOVEMENTS = ["low", "medium", "high"]
+PERSONAS = ["practical", "fashion", "kid_friendly"]
+COMFORTS = ["runs_cold", "neutral", "runs_hot"]
+
+
+def _requests(calls: int):
+    random.seed(5)
+    return [
+        (
+            round(random.uniform(10, 100), 1),
+            round(random.uniform(0, 100), 1),
+            round(random.uniform(0, 30), 1),
+            random.choice(ACTIVITIES),
+            random.choice(FORMALITIES),
+            random.choice(MOVEMENTS),
+            random.choice(PERSONAS),
+            random.choice(COMFORTS),
+        )
+        for _ in range(calls)
+    ]
+
+
+def measure(plan, requests) -> float:
+    """Mean microseconds per call (best of 3 runs)"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for args in requests:
+            plan(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / len(requests) * 1e6
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    requests = _requests(calls)
+    assert all(plan_outfit(*args) == reference_plan_outfit(*args) for args in requests[:2000])
+
+    print("Benchmarking Outfit Lattice")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    _build_lattice()
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Lattice: {len(LATTICE)} plans, built in {build_ms:.1f} ms")
+
+    before = measure(reference_plan_outfit, requests)
+    after = measure(plan_outfit, requests)
+    print(f"Per call ({calls} calls):")
+    print(f"   if/elif rules: {before:6.2f} µs")
+    print(f"   lattice:       {after:6.2f} µs ({before / after:.1f}x faster)")
+
+    print("=" * 60)
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
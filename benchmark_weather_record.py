@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Weather Record Benchmark
+
+Compares cached weather stored as per-call dicts (ISO timestamp strings,
+deep-copied on every read, cached_at parsed on every hit) with the
+__slots__ WeatherRecord now used by the weather tools:
+
+- Memory per cached entry (tracemalloc, includes the cache's bookkeeping)
+- Hit-path latency: cache lookup through to the tool-facing dict
+
+Usage:
+    python benchmark_weather_record.py [entries]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from weather_outfit_adk.cache import WeatherCache, WeatherRecord
+
+CONDITIONS = ["partly cloudy", "light rain", "rainy", "snowy"]
+CITIES = ["Seattle", "Denver", "Miami", "Boston", "Austin", "Chicago", "Phoenix", "Portland"]
+
+
+def _weather_dict(i: int) -> dict:
+    """A weather dict as built by get_current_weather before records existed"""
+    target = datetime(2025, 11, 14, 9) + timedelta(hours=i % 240)
+    return {
+        "temperature": round(40 + random.random() * 40, 1),
+        "feels_like": round(38 + random.random() * 40, 1),
+        "condition": "".join(random.choice(CONDITIONS)),  # A fresh string per result, as parsed from JSON
+        "rain_chance": round(random.random() * 100, 1),
+        "wind_speed": round(random.random() * 20, 1),
+        "humidity": round(30 + random.random() * 60, 1),
+        "timestamp": target.isoformat(),
+        "city": CITIES[i % len(CITIES)],
+        "source": "".join("meteostat"),
+        "cached_at": datetime.now().isoformat(),
+    }
+
+
+def _fill(entries: int, as_record: bool):
+    cache = WeatherCache(name="bench", max_entries=entries * 2, max_bytes=1 << 30, stripes=16)
+    random.seed(7)
+    for i in range(entries):
+        weather = _weather_dict(i)
+        cache.put((f"geohash:{i:06d}", "2025-11-14"), WeatherRecord.from_dict(weather) if as_record else weather)
+    return cache
+
+
+def measure_memory(entries: int, as_record: bool) -> float:
+    """Bytes allocated per cached entry"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    cache = _fill(entries, as_record)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert len(cache) == entries
+    return allocated / entries
+
+
+def _serve_dict(cache: WeatherCache, key, city: str) -> dict:
+    """The previous hit path: copy-on-read dict, relabel, parse cached_at"""
+    weather, stale = cache.get_stale(key)
+    weather["from_cache"] = True
+    weather["city"] = city
+    age = datetime.now() - datetime.fromisoformat(weather["cached_at"])
+    assert age.total_seconds() >= 0
+    return weather
+
+
+def _serve_record(cache: WeatherCache, key, city: str) -> dict:
+    """The record hit path: shared immutable record, one dict built at the boundary"""
+    weather, stale = cache.get_stale(key)
+    assert time.time() - weather.cached_at >= 0
+    return weather.to_dict(from_cache=True, city=city)
+
+
+def measure_hits(entries: int, as_record: bool, lookups: int = 50000) -> float:
+    """Mean microseconds per cache hit"""
+    cache = _fill(entries, as_record)
+    serve = _serve_record if as_record else _serve_dict
+    random.seed(11)
+    keys = [(f"geohash:{random.randrange(entries):06d}", "2025-11-14") for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in keys:
+        serve(cache, key, "Seattle")
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("Benchmarking Weather Records")
+    print("-" * 60)
+
+    dict_bytes = measure_memory(entries, as_record=False)
+    record_bytes = measure_memory(entries, as_record=True)
+    print(f"Memory per entry ({entries} entries):")
+    print(f"   dict:   {dict_bytes:8.0f} bytes")
+    print(f"   record: {record_bytes:8.0f} bytes ({record_bytes / dict_bytes:.0%} of dict)")
+
+    dict_us = measure_hits(entries, as_record=False)
+    record_us = measure_hits(entries, as_record=True)
+    print("Hit path (lookup -> tool dict):")
+    print(f"   dict:   {dict_us:8.2f} µs")
+    print(f"   record: {record_us:8.2f} µs ({dict_us / record_us:.1f}x faster)")
+
+    print("=" * 60)
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
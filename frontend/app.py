@@ -13,7 +13,7 @@ from flask_cors import CORS
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from weather_outfit_adk.monitoring import setup_logging, agent_metrics
-from weather_outfit_adk.tools.weather_tools import get_current_weather
+from weather_outfit_adk.tools.weather_tools import get_weather_smart, get_weather_batch
 from outfit_generator import generate_comprehensive_outfit
 
 # Initialize Flask app
@@ -28,10 +28,8 @@ logger = setup_logging("frontend", enable_cloud_logging=False)
 # In-memory session storage for tracking (demo purposes)
 sessions = {}
 
-# Weather data cache with TTL (5 minutes)
-from datetime import datetime, timedelta
-weather_cache = {}
-WEATHER_CACHE_TTL = timedelta(minutes=5)
+# Weather is cached by get_weather_smart, shared across gunicorn workers
+# when WEATHER_SHARED_CACHE_PATH is set
 
 # ADK Coach Agent configuration
 import requests
@@ -89,22 +87,6 @@ def call_coach_agent(message, user_id=None, session_id=None):
         logger.error(f"Error calling Coach Agent: {str(e)}")
         return None
 
-def get_cached_weather(city):
-    """Get cached weather data if available and not expired"""
-    city_key = city.lower().strip()
-    if city_key in weather_cache:
-        cached_data, timestamp = weather_cache[city_key]
-        if datetime.now() - timestamp < WEATHER_CACHE_TTL:
-            logger.info(f"Using cached weather data for {city}")
-            return cached_data
-    return None
-
-def cache_weather_data(city, data):
-    """Cache weather data with timestamp"""
-    city_key = city.lower().strip()
-    weather_cache[city_key] = (data, datetime.now())
-    logger.info(f"Cached weather data for {city}")
-
 import random
 
 
@@ -427,20 +409,14 @@ def weather():
         
         logger.info(f"Weather request for city: {city}")
         
-        # Check cache first
-        cached_data = get_cached_weather(city)
-        if cached_data:
-            return jsonify(cached_data)
-        
-        # Fetch real weather data
-        weather_data = get_current_weather(city)
+        # Cached (shared across workers) or fresh weather data
+        weather_data = get_weather_smart(city)
+        if weather_data.get('from_cache'):
+            logger.info(f"Using cached weather data for {city}")
         
         # Add UV index (not in current data)
         weather_data['uv_index'] = 5
         
-        # Cache the data
-        cache_weather_data(city, weather_data)
-        
         logger.info(f"Weather response - City: {city}, Temp: {weather_data.get('temperature')}°F")
         
         return jsonify(weather_data)
@@ -450,6 +426,23 @@ def weather():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/weather/batch', methods=['GET'])
+def weather_batch():
+    """Get weather for a comma-separated list of cities in one request"""
+    try:
+        cities = [c for c in request.args.get('cities', '').split(',') if c.strip()]
+        if not cities:
+            return jsonify({'error': 'No cities provided'}), 400
+        
+        logger.info(f"Batch weather request for {len(cities)} cities")
+        
+        return jsonify(get_weather_batch(cities, request.args.get('datetime')))
+        
+    except Exception as e:
+        logger.error(f"Batch weather error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/outfit', methods=['GET'])
 def outfit():
     """Get outfit suggestions based on weather and preferences (reuses weather data from client)"""
@@ -470,7 +463,7 @@ def outfit():
         # Only fetch weather if not provided (fallback)
         if temp is None or not condition:
             logger.info("Weather data not provided, fetching from API")
-            weather_data = get_current_weather(city)
+            weather_data = get_weather_smart(city)
             temp = weather_data.get('temperature', 65)
             condition = weather_data.get('condition', 'partly cloudy')
         else:
@@ -538,7 +531,7 @@ def chat():
                 logger.info("⚠️ Falling back to direct functions")
                 
                 # Get weather context for better responses
-                weather_data = get_current_weather(city)
+                weather_data = get_weather_smart(city)
                 temp = weather_data.get('temperature', 65)
                 condition = weather_data.get('condition', 'partly cloudy')
                 
@@ -0,0 +1,185 @@
+"""
+Outfit Rule Reference
+
+plan_outfit as it was written before the rules became tables and the
+lattice: if/elif chains evaluated on every call. test_outfit_rules.py
+checks the current plan_outfit against it, and benchmark_outfit_lattice.py
+measures it as the "before" case.
+"""
+
+from typing import List, Optional
+
+
+def reference_plan_outfit(
+    temperature, rain_chance, wind_speed, activity_category="casual", formality_level="casual",
+    movement_level="medium", persona="practical", comfort_profile="neutral"
+):
+    """plan_outfit as it was written before the rules became tables"""
+    adjusted_temp = _reference_adjust_for_comfort(temperature, comfort_profile)
+    return {
+        "top": _reference_top(adjusted_temp, activity_category, formality_level),
+        "bottom": _reference_bottom(adjusted_temp, activity_category, movement_level),
+        "outer_layer": _reference_outer_layer(adjusted_temp, wind_speed, rain_chance, formality_level),
+        "footwear": _reference_footwear(activity_category, formality_level, rain_chance),
+        "accessories": _reference_accessories(rain_chance, wind_speed, adjusted_temp, activity_category),
+        "notes": _reference_generate_notes(
+            temperature, adjusted_temp, rain_chance, wind_speed,
+            activity_category, persona, comfort_profile
+        ),
+    }
+
+
+def _reference_adjust_for_comfort(temp: float, comfort_profile: str) -> float:
+    """Adjust perceived temperature based on comfort profile."""
+    if comfort_profile == "runs_cold":
+        return temp - 5
+    elif comfort_profile == "runs_hot":
+        return temp + 5
+    return temp
+
+
+def _reference_top(temp: float, activity: str, formality: str) -> str:
+    """Select appropriate top layer."""
+    if formality == "formal":
+        if temp < 60:
+            return "dress shirt or blouse with sweater"
+        return "dress shirt or blouse"
+    
+    if activity == "sports":
+        return "moisture-wicking athletic shirt or tank"
+    
+    if temp < 40:
+        return "long-sleeve thermal or henley"
+    elif temp < 60:
+        return "long-sleeve shirt or light sweater"
+    elif temp < 75:
+        return "t-shirt or short-sleeve shirt"
+    else:
+        return "light t-shirt or tank top"
+
+
+def _reference_bottom(temp: float, activity: str, movement: str) -> str:
+    """Select appropriate bottom layer."""
+    if activity == "sports":
+        if temp < 50:
+            return "athletic leggings or joggers"
+        return "athletic shorts or breathable pants"
+    
+    if temp < 40:
+        return "warm pants or jeans"
+    elif temp < 65:
+        return "jeans or casual pants"
+    elif temp < 80:
+        return "light pants or shorts"
+    else:
+        return "shorts or light skirt"
+
+
+def _reference_outer_layer(temp: float, wind: float, rain: float, formality: str) -> Optional[str]:
+    """Select jacket or coat if needed."""
+    if temp >= 75 and wind < 15 and rain < 30:
+        return None
+    
+    needs_warmth = temp < 50
+    needs_wind_protection = wind > 15
+    needs_rain_protection = rain > 40
+    
+    if formality == "formal":
+        if needs_rain_protection:
+            return "dress coat with rain protection"
+        elif needs_warmth:
+            return "wool coat or blazer"
+        return None
+    
+    if needs_rain_protection:
+        if needs_warmth:
+            return "insulated rain jacket"
+        return "light rain jacket or windbreaker"
+    
+    if needs_warmth:
+        if temp < 32:
+            return "heavy winter coat"
+        elif temp < 50:
+            return "medium jacket or fleece"
+        return "light jacket"
+    
+    if needs_wind_protection:
+        return "windbreaker"
+    
+    return None
+
+
+def _reference_footwear(activity: str, formality: str, rain: float) -> str:
+    """Select appropriate footwear."""
+    if formality == "formal":
+        if rain > 40:
+            return "dress shoes (waterproof if possible)"
+        return "dress shoes or heels"
+    
+    if activity == "sports":
+        return "athletic shoes or trail shoes"
+    
+    if rain > 40:
+        return "waterproof boots or rain boots"
+    elif activity == "work":
+        return "comfortable work shoes or loafers"
+    
+    return "sneakers or casual shoes"
+
+
+def _reference_accessories(rain: float, wind: float, temp: float, activity: str) -> List[str]:
+    """Select accessories like umbrella, hat, scarf."""
+    accessories = []
+    
+    if rain > 40:
+        accessories.append("umbrella")
+    
+    if temp < 40:
+        accessories.append("warm hat or beanie")
+        accessories.append("scarf")
+        if temp < 30:
+            accessories.append("gloves")
+    
+    if wind > 20 and activity == "sports":
+        accessories.append("windproof cap")
+    
+    if temp > 80:
+        accessories.append("sunglasses")
+        accessories.append("sunscreen")
+    
+    return accessories
+
+
+def _reference_generate_notes(
+    orig_temp: float, adj_temp: float, rain: float, wind: float,
+    activity: str, persona: str, comfort_profile: str
+) -> str:
+    """Generate outfit explanation."""
+    notes = []
+    
+    if persona == "kid_friendly":
+        if adj_temp < 50:
+            notes.append("Bundle up warm - it's chilly out there!")
+        elif rain > 40:
+            notes.append("Don't forget your rain gear for puddle jumping!")
+        else:
+            notes.append("Perfect weather for fun outside!")
+    elif persona == "fashion":
+        notes.append("Layer colors and textures for a stylish look.")
+        if rain > 40:
+            notes.append("Rain doesn't mean sacrificing style - try a trendy rain jacket.")
+    else:
+        temp_desc = "cold" if adj_temp < 50 else "mild" if adj_temp < 70 else "warm"
+        notes.append(f"Weather is {temp_desc} at {int(orig_temp)}°F.")
+    
+    if comfort_profile == "runs_cold":
+        notes.append("Since you tend to feel cold, adding extra layers is recommended.")
+    elif comfort_profile == "runs_hot":
+        notes.append("Since you tend to feel warm, lighter options are better.")
+    
+    if activity == "sports":
+        notes.append("Choose breathable, flexible clothing for movement.")
+    elif activity == "formal":
+        notes.append("Dress to impress while staying comfortable.")
+    
+    return " ".join(notes)
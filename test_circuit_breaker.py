@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Circuit Breaker Tests
+
+Verifies the per-upstream circuit breaker: opening after consecutive
+failures, failing fast while open and half-open probing.
+"""
+
+import asyncio
+
+from weather_outfit_adk.providers import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitExceeded,
+    WeatherProviderError,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail(breaker, error):
+    try:
+        with breaker.guard():
+            raise error
+    except type(error):
+        pass
+
+
+def test_opens_after_consecutive_failures():
+    """Consecutive upstream failures open the circuit; a success in between resets the count"""
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=30, clock=FakeClock())
+
+    _fail(breaker, ConnectionRefusedError())
+    _fail(breaker, WeatherProviderError("boom", status=502))
+    with breaker.guard():
+        pass
+    _fail(breaker, TimeoutError())
+    _fail(breaker, TimeoutError())
+    assert breaker.state == "closed"
+    _fail(breaker, TimeoutError())
+    assert breaker.state == "open"
+
+    try:
+        with breaker.guard():
+            assert False, "call should not run while open"
+    except CircuitOpenError as e:
+        assert 0 < e.retry_in <= 30
+    print("✅ Opens after consecutive failures")
+
+
+def test_client_errors_do_not_trip():
+    """4xx responses and locally shed calls say nothing about upstream health"""
+    breaker = CircuitBreaker("test", failure_threshold=1, clock=FakeClock())
+
+    _fail(breaker, WeatherProviderError("not found", status=404))
+    _fail(breaker, RateLimitExceeded("shed", reason="deadline"))
+    assert breaker.state == "closed"
+    print("✅ Client errors do not trip")
+
+
+def test_half_open_probing():
+    """After the reset time one probe is let through; its outcome closes or re-opens the circuit"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=30, half_open_calls=1, clock=clock)
+    _fail(breaker, ConnectionResetError())
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    try:
+        breaker.before_call()  # Only one probe at a time
+        assert False, "expected CircuitOpenError"
+    except CircuitOpenError:
+        pass
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 29
+    assert breaker.state == "open"
+    clock.now += 1
+
+    # A probe that was shed locally frees its slot without deciding anything
+    _fail(breaker, RateLimitExceeded("shed", reason="quota"))
+    assert breaker.state == "half_open"
+
+    async def probe():
+        async with breaker.guard_async():
+            await asyncio.sleep(0)
+
+    asyncio.run(probe())
+    assert breaker.state == "closed"
+    assert breaker.stats() == {"state": "closed", "consecutive_failures": 0}
+    print("✅ Half-open probing")
+
+
+def main():
+    print("Testing Circuit Breaker")
+    print("-" * 60)
+
+    tests = [
+        test_opens_after_consecutive_failures,
+        test_client_errors_do_not_trip,
+        test_half_open_probing,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL CIRCUIT BREAKER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
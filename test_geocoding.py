@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""
+Geocoding Tests
+
+Checks the bundled gazetteer and the geocoder's learned cache and
+remote fallback (against a local stub geocoding server).
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from weather_outfit_adk.geo import CityResolver, Gazetteer, Geocoder, LearnedPlaceCache, normalize_place_name
+from weather_outfit_adk.providers import HTTPConnectionPool, AsyncHTTPConnectionPool, CircuitBreaker
+
+
+class StubGeocodingHandler(BaseHTTPRequestHandler):
+    """Answers /v1/search with one US result and counts requests"""
+
+    protocol_version = "HTTP/1.1"
+    requests = 0
+
+    def do_GET(self):
+        StubGeocodingHandler.requests += 1
+        body = json.dumps({"results": [{
+            "name": "Hood River", "latitude": 45.7054, "longitude": -121.5215, "elevation": 47,
+            "country_code": "US", "admin1": "Oregon", "population": 8313,
+        }]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_normalize_place_name():
+    assert normalize_place_name("  São  Paulo ") == "sao paulo"
+    assert normalize_place_name("St. Louis") == "st louis"
+    assert normalize_place_name("Winston-Salem") == "winston salem"
+    print("✅ Place name normalization")
+
+
+def test_gazetteer_lookup():
+    gazetteer = Gazetteer()
+    assert gazetteer.lookup("Seattle").coordinates == (47.6062, -122.3321, 50)
+    assert gazetteer.lookup("NYC").name == "New York"
+    assert gazetteer.lookup("sao paulo") is not None
+    # Ambiguous names prefer the most populous place unless qualified
+    assert gazetteer.lookup("Portland").admin == "OR"
+    assert gazetteer.lookup("Portland", "Maine").admin == "ME"
+    assert gazetteer.lookup("Portland", "TX") is None
+    assert gazetteer.lookup("Atlantis") is None
+    names = {place.name for place in gazetteer.search_prefix("san ")}
+    assert {"San Francisco", "San Diego"} <= names
+    print("✅ Gazetteer lookup")
+
+
+def test_fuzzy_candidates():
+    resolver = CityResolver(Gazetteer())
+    assert resolver.candidates("seatle")[0].place.name == "Seattle"
+    assert resolver.candidates("los angelos")[0].place.name == "Los Angeles"
+    assert resolver.candidates("san fr")[0].place.name == "San Francisco"
+    assert resolver.candidates("londn, uk")[0].place.country == "GB"
+
+    portland = resolver.candidates("Portland", limit=3)
+    assert [c.score for c in portland[:2]] == [1.0, 1.0]
+    assert portland[0].place.admin == "OR"
+
+    scores = [c.score for c in resolver.candidates("bostn")]
+    assert scores == sorted(scores, reverse=True)
+    assert resolver.candidates("xyz") == []
+    print("✅ Fuzzy city candidates")
+
+
+def test_fuzzy_qualifier_does_not_crowd_out():
+    """A closer key the qualifier rules out doesn't hide the place it allows"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cities.tsv")
+        with open(path, "w") as f:
+            f.write("# name\taliases\tadmin\tcountry\tlatitude\tlongitude\televation\tpopulation\n")
+            f.write("Springfeld\t\tMO\tUS\t37.2\t-93.3\t400\t1000\n")
+            f.write("Springfield\t\tIL\tUS\t39.8\t-89.6\t180\t114000\n")
+        gazetteer = Gazetteer(path)
+        resolver = CityResolver(gazetteer)
+        assert resolver.candidates("springfeld")[0].place.admin == "MO"
+        best = resolver.best("springfeld, il")
+        assert best is not None and best.place.admin == "IL"
+    print("✅ Qualifier doesn't crowd out fuzzy matches")
+
+
+def test_geocoder_offline_only():
+    with tempfile.TemporaryDirectory() as tmp:
+        geocoder = Geocoder(Gazetteer(), LearnedPlaceCache(os.path.join(tmp, "cache.tsv")))
+        assert geocoder.resolve("Redmond, WA").name == "Redmond"
+        assert geocoder.resolve("chicgo").name == "Chicago"
+        assert geocoder.resolve("Hood River, OR") is None
+    print("✅ Geocoder offline lookups")
+
+
+def test_remote_fallback_written_back():
+    StubGeocodingHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGeocodingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "geocode", "cache.tsv")
+            geocoder = Geocoder(
+                Gazetteer(),
+                LearnedPlaceCache(path),
+                remote_enabled=True,
+                pool=HTTPConnectionPool("127.0.0.1", port=port, scheme="http"),
+                pool_async=AsyncHTTPConnectionPool("127.0.0.1", port=port, scheme="http"),
+            )
+            assert geocoder.resolve("Hood River, Oregon").coordinates == (45.7054, -121.5215, 47)
+            assert geocoder.resolve("Hood River, Oregon").name == "Hood River"
+            assert asyncio.run(geocoder.resolve_async("Hood River, OR")).admin == "OR"
+            assert StubGeocodingHandler.requests == 2
+
+            # A fresh process reads the learned places back from disk
+            reloaded = Geocoder(Gazetteer(), LearnedPlaceCache(path))
+            assert reloaded.resolve("hood river oregon").name == "Hood River"
+    finally:
+        server.shutdown()
+    print("✅ Remote fallback written back to cache")
+
+
+def test_remote_negative_cache_and_breaker():
+    """Unresolvable names aren't re-queried within the negative TTL; a dead API trips the breaker"""
+    StubGeocodingHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGeocodingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    now = [0.0]
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            geocoder = Geocoder(
+                Gazetteer(),
+                LearnedPlaceCache(os.path.join(tmp, "cache.tsv")),
+                remote_enabled=True,
+                pool=HTTPConnectionPool("127.0.0.1", port=port, scheme="http"),
+                negative_ttl_seconds=60,
+                clock=lambda: now[0],
+            )
+            # The stub only knows Hood River, Oregon
+            assert geocoder.resolve("Hood River, WA") is None
+            assert geocoder.resolve("hood river wa") is None
+            assert StubGeocodingHandler.requests == 1
+            now[0] = 61.0
+            assert geocoder.resolve("Hood River, WA") is None
+            assert StubGeocodingHandler.requests == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    breaker = CircuitBreaker("geocoding_test", failure_threshold=2, reset_seconds=60)
+    with tempfile.TemporaryDirectory() as tmp:
+        geocoder = Geocoder(
+            Gazetteer(),
+            LearnedPlaceCache(os.path.join(tmp, "cache.tsv")),
+            remote_enabled=True,
+            pool=HTTPConnectionPool("127.0.0.1", port=port, scheme="http", connect_timeout=0.5),
+            breaker=breaker,
+        )
+        assert geocoder.resolve("Nowhere One") is None
+        assert geocoder.resolve("Nowhere Two") is None
+        assert breaker.state == "open"
+        assert geocoder.resolve("Nowhere Three") is None  # Rejected without connecting
+        assert breaker.stats()["consecutive_failures"] == 2
+    print("✅ Remote negative cache and circuit breaker")
+
+
+def main():
+    print("Testing Geocoding")
+    print("-" * 60)
+
+    tests = [
+        test_normalize_place_name,
+        test_gazetteer_lookup,
+        test_fuzzy_candidates,
+        test_fuzzy_qualifier_does_not_crowd_out,
+        test_geocoder_offline_only,
+        test_remote_fallback_written_back,
+        test_remote_negative_cache_and_breaker,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL GEOCODING TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
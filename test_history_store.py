@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""
+Weather History Tests
+
+Covers the memory-mapped history store (writes, range scans, reopening,
+growth, aggregates, climatology) and get_typical_weather backfilling
+past years once and then answering from the store.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+
+from weather_outfit_adk.history import HistoryStore, FIELDS
+from weather_outfit_adk.history.store import GROW_SLOTS
+
+SEA = (47.61, -122.33, 0)
+LAX = (34.05, -118.24, 0)
+
+
+def _rows(start, days, **fields):
+    return [dict({"date": (start + timedelta(days=i)).isoformat()}, **fields) for i in range(days)]
+
+
+def test_write_and_scan():
+    """Rows round-trip per location, across months, and survive reopening"""
+    with tempfile.TemporaryDirectory() as root:
+        store = HistoryStore(root)
+        written = store.write(SEA, _rows(date(2024, 1, 30), 4, tavg=5.5, tmax=8.0, prcp=None))
+        store.write(LAX, [{"date": "2024-01-31", "tavg": 18.0}, {"date": "bad"}, {"tavg": 1.0}])
+        assert written == 4 and len(store) == 2
+
+        columns = store.scan(SEA, date(2024, 1, 29), date(2024, 2, 3))
+        assert columns["date"][0] == date(2024, 1, 29) and len(columns["date"]) == 6
+        assert columns["tavg"] == [None, 5.5, 5.5, 5.5, 5.5, None]
+        assert columns["prcp"] == [None] * 6
+        assert set(columns) == {"date", *FIELDS}
+        assert store.scan(LAX, date(2024, 1, 31), date(2024, 2, 1))["tavg"] == [18.0, None]
+        assert store.scan((0.0, 0.0, 0), date(2024, 1, 1), date(2024, 1, 2))["tavg"] == [None, None]
+        assert store.scan(SEA, date(2023, 1, 1), date(2023, 1, 1))["tavg"] == [None]  # No month file
+
+        # Later writes replace earlier ones
+        store.write(SEA, [{"date": "2024-01-31", "tavg": -2.25}])
+        assert store.scan(SEA, date(2024, 1, 31), date(2024, 1, 31))["tavg"] == [-2.25]
+        store.close()
+
+        # An interrupted index append is ignored on reopen
+        with open(os.path.join(root, "locations.tsv"), "a") as index:
+            index.write("7\t1.0")
+        reopened = HistoryStore(root)
+        assert len(reopened) == 2
+        assert reopened.scan(SEA, date(2024, 1, 30), date(2024, 2, 2))["tmax"] == [8.0, None, 8.0, 8.0]  # Replaced row had no tmax
+        reopened.close()
+    print("✅ Write and scan")
+
+
+def test_growth_and_aggregate():
+    """Month files grow as locations are added; aggregates cover a range"""
+    with tempfile.TemporaryDirectory() as root:
+        store = HistoryStore(root, max_open_files=1)
+        for i in range(GROW_SLOTS + 5):
+            store.write((float(i), 0.0, 0), [{"date": "2024-06-15", "tavg": float(i)}])
+        store.write(SEA, [{"date": "2023-06-01", "tavg": 1.0}])  # Evicts June 2024
+        assert store.scan((float(GROW_SLOTS + 4), 0.0, 0), date(2024, 6, 15), date(2024, 6, 15))["tavg"] == [GROW_SLOTS + 4.0]
+        assert store.scan((3.0, 0.0, 0), date(2024, 6, 14), date(2024, 6, 15))["tavg"] == [None, 3.0]
+        store.close()
+
+        store = HistoryStore(root)
+        store.write(SEA, [{"date": "2024-03-01", "tmax": 10.0}, {"date": "2024-03-02", "tmax": 14.0}, {"date": "2024-03-04", "tmax": 9.0}])
+        stats = store.aggregate(SEA, date(2024, 3, 1), date(2024, 3, 5))
+        assert stats["tmax"] == {"min": 9.0, "max": 14.0, "mean": 11.0, "count": 3}
+        assert stats["snow"] == {"min": None, "max": None, "mean": None, "count": 0}
+        store.close()
+    print("✅ Growth and aggregate")
+
+
+def test_concurrent_growth_and_eviction():
+    """Growing or evicting a month file never closes a map under a reader"""
+    with tempfile.TemporaryDirectory() as root:
+        store = HistoryStore(root, max_open_files=1)
+        store.write(SEA, _rows(date(2024, 3, 1), 3, tavg=4.0))
+        slot = store._slot(SEA, create=False)
+        with store._month(2024, 3, create=False).block(slot) as held:
+            # Remaps March past GROW_SLOTS, then evicts it for April
+            for i in range(GROW_SLOTS + 44):
+                store.write((float(i), 0.0, 0), _rows(date(2024, 3, 1), 1, tavg=1.0))
+            store.write(SEA, _rows(date(2024, 4, 1), 1, tavg=9.0))
+            assert held[0] == 4.0
+
+        errors = []
+
+        def scan():
+            try:
+                for _ in range(200):
+                    assert store.scan(SEA, date(2024, 3, 1), date(2024, 3, 3))["tavg"] == [4.0] * 3
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=scan) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(2 * GROW_SLOTS):
+            store.write((-1.0 - i, 0.0, 0), _rows(date(2024, 3 + i % 2, 1), 1, tavg=2.0))
+        for reader in readers:
+            reader.join()
+        assert errors == [], errors
+        store.close()
+    print("✅ Concurrent growth and eviction")
+
+
+def test_async_writes_off_loop():
+    """The async paths write history from the executor, not the event loop"""
+    from weather_outfit_adk.tools import weather_tools
+
+    class RecordingStore:
+        def __init__(self):
+            self.threads = []
+
+        def write(self, location, rows):
+            self.threads.append(threading.current_thread())
+            return len(rows)
+
+    async def record():
+        await weather_tools._record_history_async(SEA, _rows(date(2020, 1, 1), 2, tavg=1.0))
+        return threading.current_thread()
+
+    store, saved = RecordingStore(), weather_tools.history_store
+    weather_tools.history_store = store
+    try:
+        loop_thread = asyncio.run(record())
+    finally:
+        weather_tools.history_store = saved
+    assert len(store.threads) == 1 and store.threads[0] is not loop_thread
+    print("✅ Async history writes off the event loop")
+
+
+def test_climatology():
+    """A calendar day pools a window of days over several years"""
+    with tempfile.TemporaryDirectory() as root:
+        store = HistoryStore(root)
+        for year, temp in ((2021, 10.0), (2022, 12.0), (2023, 14.0)):
+            store.write(SEA, _rows(date(year, 2, 26), 3, tavg=temp, tmin=temp - 5, tmax=temp + 5, prcp=0.0, snow=0.0))
+        store.write(SEA, [{"date": "2022-02-27", "tavg": 12.0, "prcp": 4.0, "snow": 20.0}])
+        store.write(SEA, [{"date": "2024-02-29", "tavg": 30.0}])  # Outside first..last year
+
+        stats = store.climatology(SEA, 2, 29, 2021, 2023, window_days=1)  # Feb 28 +/- 1 in these years
+        assert stats["years"] == 3 and stats["days"] == 6
+        assert stats["tavg"]["min"] == 10.0 and stats["tavg"]["max"] == 14.0 and stats["tavg"]["mean"] == 12.0
+        assert stats["tmax"]["max"] == 19.0
+        assert stats["wet_days"] == 1 / 6 and stats["snow_days"] == 1 / 6
+
+        empty = store.climatology(LAX, 7, 1, 2000, 2010)
+        assert empty["days"] == 0 and empty["wet_days"] is None and empty["tavg"]["mean"] is None
+        store.close()
+    print("✅ Climatology")
+
+
+class FakeHistoryProvider:
+    """Daily rows for every requested day: 10°C plus 1°C per year after 2015"""
+
+    name = "fake_history"
+    breaker = None
+
+    def __init__(self):
+        self.calls = []
+
+    def available(self):
+        return True
+
+    def healthy(self):
+        return True
+
+    def supports(self, start, end):
+        return True
+
+    def daily(self, lat, lon, alt, start, end):
+        self.calls.append((start, end))
+        day, last = date.fromisoformat(start), date.fromisoformat(end)
+        rows = []
+        while day <= last:
+            temp = 10.0 + (day.year - 2015)
+            rows.append({"date": day.isoformat(), "tavg": temp, "tmin": temp - 4, "tmax": temp + 4, "prcp": 2.0 if day.day % 2 else 0.0})
+            day += timedelta(days=1)
+        return rows
+
+    async def daily_async(self, lat, lon, alt, start, end):
+        return self.daily(lat, lon, alt, start, end)
+
+
+def test_typical_weather():
+    """Past years are fetched once, then typical weather comes from the store"""
+    from weather_outfit_adk.config.settings import settings
+    from weather_outfit_adk.providers import ProviderRouter
+    from weather_outfit_adk.tools import weather_tools
+
+    fake = FakeHistoryProvider()
+    original = weather_tools.weather_router, weather_tools.history_store, settings.weather_history_years, settings.weather_history_window_days
+    weather_tools.weather_router = ProviderRouter([fake], hedge=False)
+    settings.weather_history_years, settings.weather_history_window_days = 3, 1
+    with tempfile.TemporaryDirectory() as root:
+        weather_tools.history_store = HistoryStore(root)
+        try:
+            typical = weather_tools.get_typical_weather("Seattle", "2020-07-10", "2020-07-11")
+            calls = len(fake.calls)
+            again = asyncio.run(weather_tools.get_typical_weather_async("Seattle, WA", "2020-07-10"))
+            weather_tools.weather_router.providers = []  # Fails if anything goes upstream
+            backwards = weather_tools.get_typical_weather("Seattle", "2020-07-11", "2020-07-10")
+        finally:
+            weather_tools.history_store.close()
+            weather_tools.weather_router, weather_tools.history_store, settings.weather_history_years, settings.weather_history_window_days = original
+
+    assert calls == 3 and len(fake.calls) == 3
+    assert sorted(fake.calls)[0] == ("2017-07-09", "2017-07-12")
+    day = typical["days"][0]
+    assert day["date"] == "2020-07-10" and day["years"] == 3
+    assert day["avg_temp"] == round(13.0 * 9 / 5 + 32, 1)  # Mean of 2017..2019
+    assert day["avg_high"] == round(17.0 * 9 / 5 + 32, 1)
+    assert day["record_high"] == round(18.0 * 9 / 5 + 32, 1)
+    assert day["record_low"] == round(8.0 * 9 / 5 + 32, 1)
+    assert day["rain_chance"] == round(200 / 3, 1)  # Odd days of 9..11
+    assert typical["summary"] == "cool" and "note" not in typical
+    assert again["days"][0] == day
+    assert "error" in backwards
+
+    weather_tools.history_store, saved = None, weather_tools.history_store
+    try:
+        assert "error" in weather_tools.get_typical_weather("Seattle", "2020-07-10")
+    finally:
+        weather_tools.history_store = saved
+    print("✅ Typical weather")
+
+
+def main():
+    print("Testing Weather History")
+    print("-" * 60)
+
+    tests = [
+        test_write_and_scan,
+        test_growth_and_aggregate,
+        test_concurrent_growth_and_eviction,
+        test_climatology,
+        test_async_writes_off_loop,
+        test_typical_weather,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL WEATHER HISTORY TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
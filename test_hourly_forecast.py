@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+"""
+Hourly Forecast Tests
+
+Covers the columnar hourly buffer (interpolation, gaps, merging, TTL),
+Open-Meteo hourly parsing, and get_hourly_forecast answering repeated
+times from one upstream call.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+from weather_outfit_adk.cache import HourlySeriesBuffer
+from weather_outfit_adk.providers.open_meteo import _hourly_rows
+
+
+def _epoch(moment):
+    return datetime.fromisoformat(moment).replace(tzinfo=timezone.utc).timestamp()
+
+
+def test_buffer_interpolates_between_hours():
+    """Continuous fields are interpolated, codes and amounts come from the nearest hour"""
+    now = [0.0]
+    buffer = HourlySeriesBuffer(ttl_seconds=60, max_gap_hours=3, clock=lambda: now[0])
+    buffer.put("sea", [
+        {"time": "2025-11-14T17:00:00", "temp": 10.0, "rhum": 80.0, "wspd": 10.0, "prcp": 0.0, "coco": 3, "source": "fake"},
+        {"time": "2025-11-14T18:00:00", "temp": 12.0, "rhum": None, "wspd": 20.0, "prcp": 1.5, "coco": 8, "utc_offset": -28800},
+        {"time": "2025-11-14T23:00:00", "temp": 6.0},
+    ])
+
+    point = buffer.at("sea", _epoch("2025-11-14T17:15:00"))
+    assert point["temp"] == 10.5 and point["wspd"] == 12.5
+    assert point["rhum"] == 80.0  # One side unknown: the known value
+    assert point["coco"] == 3 and point["prcp"] == 0.0
+    assert buffer.at("sea", _epoch("2025-11-14T17:45:00"))["coco"] == 8
+    assert buffer.at("sea", _epoch("2025-11-14T18:00:00"))["temp"] == 12.0
+    assert point["source"] == "fake"
+    assert buffer.utc_offset("sea") == -28800
+
+    assert buffer.at("sea", _epoch("2025-11-14T20:00:00")) is None  # 5h gap is not interpolated
+    assert buffer.at("sea", _epoch("2025-11-14T16:00:00")) is None
+    assert buffer.at("lax", _epoch("2025-11-14T17:00:00")) is None
+    assert buffer.values("sea", _epoch("2025-11-14T00:00:00"), _epoch("2025-11-14T18:00:00"), "temp") == [10.0, 12.0]
+
+    # Newer rows replace the same hours and extend the series
+    buffer.put("sea", [{"time": "2025-11-14T18:00:00", "temp": 14.0}, {"time": "2025-11-14T19:00:00", "temp": 13.0}])
+    assert buffer.at("sea", _epoch("2025-11-14T18:30:00"))["temp"] == 13.5
+    assert buffer.at("sea", _epoch("2025-11-14T17:00:00"))["temp"] == 10.0
+    assert buffer.utc_offset("sea") == -28800
+
+    now[0] += 61
+    assert buffer.at("sea", _epoch("2025-11-14T18:00:00")) is None
+    assert len(buffer) == 0
+    print("✅ Buffer interpolates between hours")
+
+
+def test_open_meteo_hourly_rows():
+    """Local Open-Meteo hours become UTC rows with Meteostat condition codes"""
+    rows = _hourly_rows({
+        "utc_offset_seconds": -28800,
+        "hourly": {
+            "time": ["2025-11-14T10:00", "2025-11-14T11:00"],
+            "temperature_2m": [9.5, None],
+            "relative_humidity_2m": [85, None],
+            "precipitation": [0.6, None],
+            "snowfall": [0.1, None],
+            "wind_speed_10m": [15.0, None],
+            "weather_code": [61, None],
+            "precipitation_probability": [70, None],
+        },
+    })
+    assert rows == [{
+        "time": "2025-11-14T18:00:00", "utc_offset": -28800, "temp": 9.5, "rhum": 85,
+        "prcp": 0.6, "snow": 1.0, "wspd": 15.0, "coco": 7, "pop": 70,
+    }]
+    print("✅ Open-Meteo hourly rows")
+
+
+class FakeHourlyProvider:
+    """Hourly rows (UTC) for the requested days: 5°C at midnight rising 0.5°C per hour"""
+
+    name = "fake_hourly"
+    breaker = None
+
+    def __init__(self, hourly=True):
+        self.has_hourly = hourly
+        self.calls = []
+
+    def available(self):
+        return True
+
+    def healthy(self):
+        return True
+
+    def supports(self, start, end):
+        return True
+
+    def supports_hourly(self, start, end):
+        return self.has_hourly
+
+    def daily(self, lat, lon, alt, start, end):
+        self.calls.append(("daily", start, end))
+        days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
+        return [
+            {"date": (date.fromisoformat(start) + timedelta(days=i)).isoformat(), "tavg": 10.0, "wspd": 10.0, "prcp": 0.0}
+            for i in range(days)
+        ]
+
+    async def daily_async(self, lat, lon, alt, start, end):
+        return self.daily(lat, lon, alt, start, end)
+
+    def hourly(self, lat, lon, alt, start, end):
+        self.calls.append(("hourly", start, end))
+        day, last = date.fromisoformat(start), date.fromisoformat(end)
+        rows = []
+        while day <= last:
+            for hour in range(24):
+                rows.append({
+                    "time": f"{day.isoformat()}T{hour:02d}:00:00",
+                    "temp": 5.0 + hour / 2, "rhum": 70.0, "wspd": 16.0,
+                    "prcp": 0.5 if hour >= 20 else 0.0, "coco": 7 if hour >= 20 else 2,
+                    "utc_offset": -28800,
+                })
+            day += timedelta(days=1)
+        return rows
+
+    async def hourly_async(self, lat, lon, alt, start, end):
+        return self.hourly(lat, lon, alt, start, end)
+
+
+def test_hourly_forecast_served_from_buffer():
+    """Repeated times at one place cost one upstream call and are interpolated"""
+    from weather_outfit_adk.providers import ProviderRouter
+    from weather_outfit_adk.tools import weather_tools
+
+    fake = FakeHourlyProvider()
+    original = weather_tools.weather_router
+    weather_tools.weather_router = ProviderRouter([fake], hedge=False)
+    weather_tools.hourly_buffer.clear()
+    try:
+        # 10:30 in Seattle (UTC-8) is 18:30 UTC: 5 + 18.5 / 2 = 14.25°C
+        morning = weather_tools.get_hourly_forecast("Seattle", "2025-11-14T10:30:00")
+        evening = weather_tools.get_hourly_forecast("Seattle, WA", "2025-11-14T12:00:00-08:00")
+        later = asyncio.run(weather_tools.get_hourly_forecast_async("seattle", "2025-11-14T13:00:00"))
+    finally:
+        weather_tools.weather_router = original
+        weather_tools.hourly_buffer.clear()
+
+    assert fake.calls == [("hourly", "2025-11-13", "2025-11-15")]
+    assert morning["resolution"] == "hourly"
+    assert morning["forecast"]["temperature"] == round(14.25 * 9 / 5 + 32, 1)
+    assert morning["forecast"]["timestamp"] == "2025-11-14T10:30:00-08:00"
+    assert morning["forecast"]["condition"] == "partly cloudy"
+    assert morning["forecast"]["wind_speed"] == round(16 * 0.621371, 1)
+    assert evening["forecast"]["temperature"] == round(15.0 * 9 / 5 + 32, 1)
+    assert later["forecast"]["condition"] == "light rain"  # 21:00 UTC
+    assert later["forecast"]["rain_chance"] > 0
+    # Local day 2025-11-14 (UTC-8) runs 08:00 UTC .. 07:00 UTC next day
+    assert morning["min_temp"] == round(5.0 * 9 / 5 + 32, 1)
+    assert morning["max_temp"] == round(16.5 * 9 / 5 + 32, 1)
+    print("✅ Hourly forecast served from buffer")
+
+
+def test_hourly_forecast_falls_back_to_daily():
+    """Without hourly data the daily forecast is used and labeled"""
+    from weather_outfit_adk.providers import ProviderRouter
+    from weather_outfit_adk.tools import weather_tools
+
+    fake = FakeHourlyProvider(hourly=False)
+    original = weather_tools.weather_router
+    weather_tools.weather_router = ProviderRouter([fake], hedge=False)
+    weather_tools.hourly_buffer.clear()
+    weather_tools.daily_series_cache.clear()
+    try:
+        forecast = weather_tools.get_hourly_forecast("Denver", "2025-11-14T18:00:00")
+    finally:
+        weather_tools.weather_router = original
+        weather_tools.daily_series_cache.clear()
+
+    assert forecast["resolution"] == "daily"
+    assert forecast["forecast"]["temperature"] == 50.0
+    assert [call[0] for call in fake.calls] == ["daily"]
+    print("✅ Hourly forecast falls back to daily")
+
+
+def main():
+    print("Testing Hourly Forecasts")
+    print("-" * 60)
+
+    tests = [
+        test_buffer_interpolates_between_hours,
+        test_open_meteo_hourly_rows,
+        test_hourly_forecast_served_from_buffer,
+        test_hourly_forecast_falls_back_to_daily,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL HOURLY FORECAST TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+"""
+HTTP Connection Pool Tests
+
+Runs the pooled Meteostat client against a local stub HTTP server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from weather_outfit_adk.providers import (
+    HTTPConnectionPool,
+    AsyncHTTPConnectionPool,
+    MeteostatClient,
+    AsyncMeteostatClient,
+    WeatherProviderError,
+    RateLimiter,
+    RateLimitExceeded,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from weather_outfit_adk.cache import AsyncSingleFlight
+
+
+class StubMeteostatHandler(BaseHTTPRequestHandler):
+    """Answers /point/daily with one canned row and records client connections"""
+
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    host_headers = []
+    requests = 0
+    status = 200
+    drop_keepalive = False
+
+    def do_GET(self):
+        StubMeteostatHandler.connections.add(self.client_address)
+        StubMeteostatHandler.requests += 1
+        StubMeteostatHandler.host_headers.append(self.headers.get("Host"))
+        body = json.dumps({"data": [{"date": "2025-11-14", "tavg": 10.0, "wspd": 12.0, "prcp": 0.0}]}).encode()
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        if self.status == 429:
+            self.send_header("Retry-After", "30")
+        if self.path.startswith("/chunked"):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(body), 16):
+                chunk = body[i:i + 16]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        # Simulate an upstream that silently closes kept-alive sockets
+        self.close_connection = StubMeteostatHandler.drop_keepalive
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    StubMeteostatHandler.connections = set()
+    StubMeteostatHandler.host_headers = []
+    StubMeteostatHandler.requests = 0
+    StubMeteostatHandler.status = 200
+    StubMeteostatHandler.drop_keepalive = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubMeteostatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_pool(server, **kwargs):
+    host, port = server.server_address
+    return HTTPConnectionPool(host, port, scheme="http", name="stub", **kwargs)
+
+
+def make_async_pool(server, **kwargs):
+    host, port = server.server_address
+    return AsyncHTTPConnectionPool(host, port, scheme="http", name="stub_async", **kwargs)
+
+
+def test_connections_are_reused():
+    """Sequential requests share one keep-alive connection"""
+    server = start_stub_server()
+    pool = make_pool(server)
+    client = MeteostatClient(pool, api_key="test-key")
+
+    for _ in range(5):
+        data = client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+        assert data["data"][0]["tavg"] == 10.0
+
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 4
+    assert len(StubMeteostatHandler.connections) == 1
+
+    pool.close()
+    server.shutdown()
+    print("✅ Connection reuse")
+
+
+def test_idle_timeout_discards_connection():
+    """Connections idle longer than idle_timeout are replaced"""
+    server = start_stub_server()
+    pool = make_pool(server, idle_timeout=0.05)
+
+    pool.request("GET", "/point/daily")
+    time.sleep(0.1)
+    pool.request("GET", "/point/daily")
+
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["discarded"] >= 1
+
+    pool.close()
+    server.shutdown()
+    print("✅ Idle timeout")
+
+
+def test_health_check_detects_server_close():
+    """A connection closed by the server is not handed out again"""
+    server = start_stub_server()
+    StubMeteostatHandler.drop_keepalive = True
+    pool = make_pool(server)
+
+    pool.request("GET", "/point/daily")
+    time.sleep(0.05)
+    response = pool.request("GET", "/point/daily")
+
+    assert response.status == 200
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["reused"] == 0
+    assert stats["retries"] == 0
+
+    pool.close()
+    server.shutdown()
+    print("✅ Health check on checkout")
+
+
+def test_concurrent_requests_bounded_idle():
+    """Concurrent bursts never open more than max_size connections"""
+    server = start_stub_server()
+    pool = make_pool(server, max_size=2)
+
+    threads = [threading.Thread(target=pool.request, args=("GET", "/point/daily")) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = pool.stats()
+    assert stats["idle"] <= 2
+    assert stats["in_use"] == 0
+    assert stats["created"] <= 2 and len(StubMeteostatHandler.connections) <= 2
+
+    pool.close()
+    server.shutdown()
+    print("✅ Bounded pool")
+
+
+def test_checkout_waits_then_sheds():
+    """With every connection busy a checkout waits for one, then gives up"""
+    server = start_stub_server()
+    pool = make_pool(server, max_size=1, checkout_timeout=0.1)
+    held = pool._checkout()
+
+    started = time.monotonic()
+    try:
+        pool.request("GET", "/point/daily")
+        assert False, "expected RateLimitExceeded"
+    except RateLimitExceeded as e:
+        assert e.reason == "pool"
+    assert time.monotonic() - started >= 0.1
+
+    # A connection handed back while waiting is picked up
+    threading.Timer(0.05, pool._checkin, args=(held, True)).start()
+    pool.checkout_timeout = 2.0
+    assert pool.request("GET", "/point/daily").status == 200
+    assert pool.stats()["created"] == 1
+
+    pool.close()
+    server.shutdown()
+    print("✅ Checkout waits, then sheds")
+
+
+def test_http_errors_raise():
+    """Non-2xx responses surface as WeatherProviderError"""
+    server = start_stub_server()
+    StubMeteostatHandler.status = 429
+    client = MeteostatClient(make_pool(server), api_key="test-key")
+
+    try:
+        client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+        assert False, "expected WeatherProviderError"
+    except WeatherProviderError as e:
+        assert e.status == 429
+
+    server.shutdown()
+    print("✅ HTTP errors raise")
+
+
+def test_429_throttles_limiter():
+    """A 429 with Retry-After pauses the client's rate limiter"""
+    server = start_stub_server()
+    StubMeteostatHandler.status = 429
+    limiter = RateLimiter("stub", rate_per_second=1000, burst=5)
+    client = MeteostatClient(make_pool(server), api_key="test-key", limiter=limiter)
+
+    try:
+        client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+        assert False, "expected WeatherProviderError"
+    except WeatherProviderError as e:
+        assert e.status == 429
+    assert limiter.stats()["tokens"] == 0
+    try:
+        limiter.acquire(timeout=0.05)  # Still inside the 30s Retry-After
+        assert False, "expected RateLimitExceeded"
+    except WeatherProviderError as e:
+        assert e.status == 429
+
+    server.shutdown()
+    print("✅ 429 throttles limiter")
+
+
+def test_breaker_fails_fast_on_5xx():
+    """Repeated 5xx responses open the client's circuit; further calls never reach the server"""
+    server = start_stub_server()
+    StubMeteostatHandler.status = 503
+    breaker = CircuitBreaker("stub", failure_threshold=2, reset_seconds=60)
+    client = MeteostatClient(make_pool(server), api_key="test-key", breaker=breaker)
+
+    for _ in range(2):
+        try:
+            client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+            assert False, "expected WeatherProviderError"
+        except CircuitOpenError:
+            assert False, "circuit opened too early"
+        except WeatherProviderError as e:
+            assert e.status == 503
+    requests = StubMeteostatHandler.requests
+
+    try:
+        client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+        assert False, "expected CircuitOpenError"
+    except CircuitOpenError:
+        pass
+    assert StubMeteostatHandler.requests == requests == 2
+
+    server.shutdown()
+    print("✅ Breaker fails fast on 5xx")
+
+
+def test_async_connections_are_reused():
+    """Async client reuses one connection and parses chunked bodies"""
+    server = start_stub_server()
+    pool = make_async_pool(server)
+    client = AsyncMeteostatClient(pool, api_key="test-key")
+
+    async def run():
+        for _ in range(3):
+            data = await client.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+            assert data["data"][0]["tavg"] == 10.0
+        chunked = await pool.request("GET", "/chunked")
+        assert json.loads(chunked.body)["data"][0]["wspd"] == 12.0
+        await pool.close()
+
+    asyncio.run(run())
+
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 3
+    assert len(StubMeteostatHandler.connections) == 1
+    # The stub listens on a non-default port, so the Host header must carry it
+    host, port = server.server_address
+    assert StubMeteostatHandler.host_headers == [f"{host}:{port}"] * 4
+
+    server.shutdown()
+    print("✅ Async connection reuse")
+
+
+def test_async_stale_connection_replaced():
+    """Async pool drops connections the server closed while idle"""
+    server = start_stub_server()
+    StubMeteostatHandler.drop_keepalive = True
+    pool = make_async_pool(server)
+
+    async def run():
+        await pool.request("GET", "/point/daily")
+        await asyncio.sleep(0.05)
+        response = await pool.request("GET", "/point/daily")
+        assert response.status == 200
+
+    asyncio.run(run())
+    assert pool.stats()["created"] == 2
+
+    server.shutdown()
+    print("✅ Async stale connection replaced")
+
+
+def test_async_single_flight():
+    """Concurrent coroutines for one key share a single upstream request"""
+    server = start_stub_server()
+    pool = make_async_pool(server)
+    flight = AsyncSingleFlight(name="test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return (await pool.request("GET", "/point/daily")).status
+
+    async def run():
+        return await asyncio.gather(*(flight.do("seattle", fetch) for _ in range(50)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(status == 200 for status, _ in results)
+    assert sum(1 for _, shared in results if shared) == 49
+
+    server.shutdown()
+    print("✅ Async single-flight")
+
+
+def main():
+    print("Testing HTTP Connection Pool")
+    print("-" * 60)
+
+    tests = [
+        test_connections_are_reused,
+        test_idle_timeout_discards_connection,
+        test_health_check_detects_server_close,
+        test_concurrent_requests_bounded_idle,
+        test_checkout_waits_then_sheds,
+        test_http_errors_raise,
+        test_429_throttles_limiter,
+        test_breaker_fails_fast_on_5xx,
+        test_async_connections_are_reused,
+        test_async_stale_connection_replaced,
+        test_async_single_flight,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL HTTP POOL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
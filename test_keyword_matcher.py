@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""
+Keyword Matcher Tests
+
+Checks the Aho-Corasick matcher against naive substring scans, its
+word-boundary and priority rules, and that classify_activity still
+classifies like the original per-category substring checks.
+"""
+
+import os
+import random
+import tempfile
+
+from weather_outfit_adk.tools.activity_tools import (
+    ACTIVITY_RULES,
+    build_activity_matcher,
+    classify_activity,
+    load_activity_keywords,
+)
+from weather_outfit_adk.tools.keyword_matcher import KeywordMatcher
+
+
+def _reference_classify_activity(activity_text):
+    """classify_activity as originally written (parity reference)"""
+    activity_lower = activity_text.lower()
+    activity_rules = {
+        "work": (["work", "office", "meeting", "presentation", "business"], "business_casual", "low"),
+        "sports": (["hike", "hiking", "bike", "biking", "cycling", "run", "running", "gym", "workout", "exercise"], "casual", "high"),
+        "formal": (["date", "dinner", "restaurant", "party", "event", "wedding", "formal"], "formal", "low"),
+        "casual": (["walk", "walking", "shopping", "errands", "casual", "coffee", "hanging out"], "casual", "medium"),
+    }
+    category, formality, movement, notes = "casual", "casual", "medium", ""
+    for act_cat, (keywords, act_formality, act_movement) in activity_rules.items():
+        if any(keyword in activity_lower for keyword in keywords):
+            category, formality, movement = act_cat, act_formality, act_movement
+            if category == "sports":
+                notes = "Recommend flexible, breathable clothing"
+            elif category == "formal":
+                notes = "Prioritize style and appearance"
+            elif category == "work":
+                notes = "Balance comfort and professionalism"
+            break
+    return {
+        "category": category,
+        "formality_level": formality,
+        "movement_level": movement,
+        "notes": notes or "General outdoor activity"
+    }
+
+
+def _naive_matches(keywords, text):
+    text = text.lower()
+    found = set()
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start != -1:
+            found.add((start, start + len(keyword), keyword))
+            start = text.find(keyword, start + 1)
+    return found
+
+
+def test_matches_naive_scan():
+    """Every occurrence, overlapping ones included, over a large vocabulary"""
+    rng = random.Random(2)
+    alphabet = "abcde "
+    keywords = sorted({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))).strip() or "a" for _ in range(5000)})
+    matcher = KeywordMatcher()
+    for keyword in keywords:
+        matcher.add(keyword, keyword)
+    assert len(matcher) == len(keywords)
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet + "ABCxyz") for _ in range(rng.randint(0, 80)))
+        matches = matcher.find_all(text)
+        assert {(m.start, m.end, m.keyword) for m in matches} == _naive_matches(keywords, text), text
+        assert [m.end for m in matches] == sorted(m.end for m in matches)
+    print("✅ Matches naive scan")
+
+
+def test_word_boundaries_and_priority():
+    """Whole-word keywords respect boundaries; best() prefers priority, then position, then length"""
+    matcher = KeywordMatcher()
+    matcher.add("run", "sports", priority=1, whole_word=True)
+    matcher.add("date", "formal", priority=2, whole_word=True)
+    matcher.add("coffee", "casual", priority=0)
+    matcher.add("coffee run", "errand", priority=0)
+
+    assert [m.value for m in matcher.find_all("Brunch, then update the run_log")] == []
+    assert [m.value for m in matcher.find_all("Run! (date)")] == ["sports", "formal"]
+    assert matcher.best("run then date").value == "formal"
+    assert matcher.best("coffee run").value == "sports"
+    assert matcher.best("decaf coffee run").keyword == "run"
+    assert matcher.best("nothing here") is None
+
+    matcher.add("decaf", "casual", priority=0)
+    assert matcher.best("decaf coffee").keyword == "decaf"
+    assert KeywordMatcher().find_all("anything") == []
+    try:
+        matcher.add("", "empty")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty keyword accepted")
+    print("✅ Word boundaries and priority")
+
+
+def test_classify_activity_parity():
+    """classify_activity agrees with the original substring rules"""
+    phrases = [
+        "going hiking", "office meeting", "date night", "morning run", "brunch with friends",
+        "workout at the gym", "network event", "Walking the dog", "HANGING OUT downtown",
+        "business dinner", "errands then coffee", "bike to work", "", "sleeping in",
+        "update the wedding list", "Café", "exercise", "party", "formal gala",
+    ]
+    rng = random.Random(9)
+    keywords = [keyword for rules in ACTIVITY_RULES.values() for keyword in rules["keywords"]]
+    fillers = ["the", "a", "with", "friends", "then", "later", "ok", "un", "ning", "ing", "-", " "]
+    for _ in range(3000):
+        words = [rng.choice(keywords + fillers) for _ in range(rng.randint(0, 5))]
+        phrase = rng.choice(["", " "]).join(words)
+        phrases.append(phrase.upper() if rng.random() < 0.2 else phrase)
+
+    for phrase in phrases:
+        assert classify_activity(phrase) == _reference_classify_activity(phrase), phrase
+    print("✅ classify_activity parity")
+
+
+def test_extra_keywords_file():
+    """Keywords from a TSV file extend the vocabulary, whole-word by default"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keywords.tsv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("# keyword\tcategory\tmode\n")
+            f.write("ski\tsports\n")
+            f.write("conference\twork\n")
+            f.write("gala\tformal\tsubstring\n")
+            f.write("yoga\tstretching\n")
+        assert load_activity_keywords(path) == [
+            ("ski", "sports", True),
+            ("conference", "work", True),
+            ("gala", "formal", False),
+        ]
+
+        matcher = build_activity_matcher(path)
+        assert matcher.best("ski trip").value == "sports"
+        assert matcher.best("skinny jeans") is None
+        assert matcher.best("galas").value == "formal"
+        assert matcher.best("conference then ski").value == "work"
+        assert build_activity_matcher(os.path.join(tmp, "missing.tsv")).best("hiking").value == "sports"
+    print("✅ Extra keywords file")
+
+
+def main():
+    print("Testing Keyword Matcher")
+    print("-" * 60)
+
+    tests = [
+        test_matches_naive_scan,
+        test_word_boundaries_and_priority,
+        test_classify_activity_parity,
+        test_extra_keywords_file,
+    ]
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL KEYWORD MATCHER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Monitoring Tests
+
+Checks the package imports cleanly when the optional OpenTelemetry
+packages are missing, and that MetricBuffer aggregates hot-path metrics
+locally before handing them to the collector.
+"""
+
+import subprocess
+import sys
+import time
+
+from weather_outfit_adk.cache.weather_cache import WeatherCache
+from weather_outfit_adk.monitoring.metrics import MetricBuffer, buffered_metrics
+
+
+class RecordingCollector:
+    """Collector stand-in that records each call it receives"""
+
+    def __init__(self):
+        self.calls = []
+
+    def increment_counter(self, metric_name, value=1, labels=None):
+        self.calls.append(("counter", metric_name, value, labels))
+
+    def set_gauge(self, metric_name, value, labels=None):
+        self.calls.append(("gauge", metric_name, value, labels))
+
+    def record_latency(self, metric_name, duration_ms, labels=None):
+        self.calls.append(("latency", metric_name, duration_ms, labels))
+
+
+# Importing with opentelemetry blocked, as on installs without the tracing extras
+_WITHOUT_OPENTELEMETRY = """
+import sys
+sys.modules["opentelemetry"] = None
+import weather_outfit_adk.monitoring
+import weather_outfit_adk.providers
+import weather_outfit_adk.tools
+from weather_outfit_adk.monitoring import setup_tracing
+assert setup_tracing("test") is None
+print("imported")
+"""
+
+
+def test_imports_without_opentelemetry():
+    """Tools and providers import when opentelemetry is not installed"""
+    result = subprocess.run(
+        [sys.executable, "-c", _WITHOUT_OPENTELEMETRY],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "imported" in result.stdout
+    print("✅ Imports without OpenTelemetry")
+
+
+def test_buffer_aggregates_until_flush():
+    """Counters sum, gauges keep the last value, latencies average; nothing is sent before flush"""
+    collector = RecordingCollector()
+    buffer = MetricBuffer(collector, interval_seconds=0)
+    for _ in range(1000):
+        buffer.increment_counter("weather_cache_requests", labels={"cache": "t", "result": "hit"})
+    buffer.increment_counter("weather_cache_requests", value=5, labels={"cache": "t", "result": "miss"})
+    buffer.set_gauge("weather_cache_entries", 3, labels={"cache": "t"})
+    buffer.set_gauge("weather_cache_entries", 7, labels={"cache": "t"})
+    buffer.record_latency("weather_provider_latency", 10.0, labels={"provider": "p"})
+    buffer.record_latency("weather_provider_latency", 30.0, labels={"provider": "p"})
+    assert collector.calls == []
+
+    buffer.flush()
+    assert sorted(collector.calls, key=repr) == sorted([
+        ("counter", "weather_cache_requests", 1000, {"cache": "t", "result": "hit"}),
+        ("counter", "weather_cache_requests", 5, {"cache": "t", "result": "miss"}),
+        ("gauge", "weather_cache_entries", 7, {"cache": "t"}),
+        ("latency", "weather_provider_latency", 20.0, {"provider": "p"}),
+    ], key=repr)
+
+    collector.calls.clear()
+    buffer.flush()
+    assert collector.calls == []
+    print("✅ Buffer aggregates until flush")
+
+
+def test_buffer_publishes_on_timer():
+    """A background thread publishes without an explicit flush"""
+    collector = RecordingCollector()
+    buffer = MetricBuffer(collector, interval_seconds=0.05)
+    buffer.increment_counter("geocode_lookups", labels={"source": "gazetteer"})
+    deadline = time.monotonic() + 5
+    while not collector.calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert collector.calls == [("counter", "geocode_lookups", 1, {"source": "gazetteer"})]
+    print("✅ Buffer publishes on a timer")
+
+
+def test_cache_lookups_do_not_call_collector():
+    """WeatherCache hits and stores only touch the buffer"""
+    collector = RecordingCollector()
+    original = buffered_metrics.collector
+    buffered_metrics.flush()
+    buffered_metrics.collector = collector
+    try:
+        cache = WeatherCache(name="buffered")
+        cache.put("k", {"temp": 1})
+        for _ in range(100):
+            assert cache.get("k") == {"temp": 1}
+        buffered_metrics.flush()
+        # One aggregated call per publication (the timer may have published once meanwhile)
+        hits = [call[2] for call in collector.calls if call[1:2] == ("weather_cache_requests",) and call[3]["result"] == "hit"]
+        assert sum(hits) == 100 and len(hits) <= 2, hits
+    finally:
+        buffered_metrics.collector = original
+    print("✅ Cache lookups stay off the collector")
+
+
+def main():
+    print("Testing Monitoring")
+    print("-" * 60)
+
+    tests = [
+        test_imports_without_opentelemetry,
+        test_buffer_aggregates_until_flush,
+        test_buffer_publishes_on_timer,
+        test_cache_lookups_do_not_call_collector,
+    ]
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL MONITORING TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Batch Outfit Planning Tests
+
+Checks plan_outfits_batch row-for-row against plan_outfit, with NumPy
+and with the scalar fallback, for string and integer-code inputs.
+"""
+
+import random
+
+from weather_outfit_adk.tools.outfit_batch import (
+    NUMPY_AVAILABLE,
+    SLOT_VALUES,
+    SLOTS,
+    plan_outfits_batch,
+)
+from weather_outfit_adk.tools.outfit_lattice import ACTIVITY_CODES, PERSONA_CODES
+from weather_outfit_adk.tools.outfit_tools import plan_outfit
+
+ACTIVITIES = ["casual", "work", "sports", "formal", "hiking"]
+FORMALITIES = ["casual", "business_casual", "formal", "black_tie"]
+PERSONAS = ["practical", "fashion", "kid_friendly", "goth"]
+COMFORTS = ["runs_cold", "neutral", "runs_hot", "unknown"]
+
+
+def _columns(n, seed=11):
+    rng = random.Random(seed)
+
+    def weather(low, high, breaks):
+        # Mostly exact rule thresholds and their neighbours, some NaN
+        pick = rng.random()
+        if pick < 0.05:
+            return float("nan")
+        if pick < 0.5:
+            return rng.choice(breaks) + rng.choice([-0.5, 0, 0.5, 1])
+        return round(rng.uniform(low, high), rng.choice([0, 1]))
+
+    temperature = [round(rng.uniform(-10, 110), rng.choice([0, 1])) for _ in range(n)]
+    rain_chance = [weather(0, 100, [30, 40, 60, 70]) for _ in range(n)]
+    wind_speed = [weather(0, 40, [10, 15, 20, 25]) for _ in range(n)]
+    contexts = {
+        "activity": [rng.choice(ACTIVITIES) for _ in range(n)],
+        "formality": [rng.choice(FORMALITIES) for _ in range(n)],
+        "persona": [rng.choice(PERSONAS) for _ in range(n)],
+        "comfort": [rng.choice(COMFORTS) for _ in range(n)],
+    }
+    return temperature, rain_chance, wind_speed, contexts
+
+
+def _expected(temperature, rain_chance, wind_speed, contexts):
+    return [
+        plan_outfit(
+            temperature[i], rain_chance[i], wind_speed[i],
+            activity_category=contexts["activity"][i],
+            formality_level=contexts["formality"][i],
+            persona=contexts["persona"][i],
+            comfort_profile=contexts["comfort"][i],
+        )
+        for i in range(len(temperature))
+    ]
+
+
+def test_scalar_fallback_matches_plan_outfit():
+    """Without NumPy every row matches plan_outfit"""
+    temperature, rain_chance, wind_speed, contexts = _columns(3000)
+    batch = plan_outfits_batch(temperature, rain_chance, wind_speed, vectorized=False, **contexts)
+    assert batch.to_dicts() == _expected(temperature, rain_chance, wind_speed, contexts)
+    print("✅ Scalar fallback matches plan_outfit")
+
+
+def test_vectorized_matches_plan_outfit():
+    """NumPy path matches plan_outfit, from strings and from integer codes"""
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, skipping vectorized parity")
+        return
+    import numpy as np
+
+    temperature, rain_chance, wind_speed, contexts = _columns(20000)
+    expected = _expected(temperature, rain_chance, wind_speed, contexts)
+    batch = plan_outfits_batch(np.array(temperature), np.array(rain_chance), np.array(wind_speed), **contexts)
+    assert len(batch) == len(expected)
+    assert batch.to_dicts() == expected
+
+    codes = dict(contexts)
+    codes["activity"] = np.array([ACTIVITY_CODES.get(value, 0) for value in contexts["activity"]], dtype=np.int8)
+    codes["persona"] = [PERSONA_CODES.get(value, 0) for value in contexts["persona"]]
+    from_codes = plan_outfits_batch(temperature, rain_chance, wind_speed, **codes)
+    assert np.array_equal(from_codes.plans, batch.plans)
+
+    scalar = plan_outfits_batch(temperature, rain_chance, wind_speed, vectorized=False, **contexts)
+    assert list(batch.plans) == scalar.plans
+    print("✅ Vectorized batch matches plan_outfit")
+
+
+def test_slot_codes():
+    """Slot codes decode through the shared tables to plan_outfit's values"""
+    temperature, rain_chance, wind_speed, contexts = _columns(500, seed=4)
+    expected = _expected(temperature, rain_chance, wind_speed, contexts)
+    for vectorized in ([False, True] if NUMPY_AVAILABLE else [False]):
+        batch = plan_outfits_batch(temperature, rain_chance, wind_speed, vectorized=vectorized, **contexts)
+        for slot in SLOTS:
+            decoded = [SLOT_VALUES[slot][code] for code in batch.codes(slot)]
+            if slot == "accessories":
+                decoded = [list(value) for value in decoded]
+            assert decoded == [plan[slot] for plan in expected], slot
+    assert max(len(values) for values in SLOT_VALUES.values()) < 100
+    print("✅ Slot codes")
+
+
+def test_broadcast_and_validation():
+    """One string applies to every row; bad lengths and codes are rejected"""
+    batch = plan_outfits_batch([20, 95], [80, 0], [25, 0], activity="sports", persona="fashion", vectorized=False)
+    assert batch[0] == plan_outfit(20, 80, 25, activity_category="sports", persona="fashion")
+    assert batch[1] == plan_outfit(95, 0, 0, activity_category="sports", persona="fashion")
+    assert len(plan_outfits_batch([], [], [], vectorized=False)) == 0
+
+    for vectorized in ([False, True] if NUMPY_AVAILABLE else [False]):
+        for kwargs in ({"rain_chance": [1]}, {"activity": ["work"]}, {"persona": [0, 99]}):
+            args = {"temperature": [50, 60], "rain_chance": [1, 2], "wind_speed": [3, 4], "vectorized": vectorized}
+            args.update(kwargs)
+            try:
+                plan_outfits_batch(**args)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{kwargs} accepted (vectorized={vectorized})")
+    print("✅ Broadcast and validation")
+
+
+def main():
+    print("Testing Batch Outfit Planning")
+    print("-" * 60)
+
+    tests = [
+        test_scalar_fallback_matches_plan_outfit,
+        test_vectorized_matches_plan_outfit,
+        test_slot_codes,
+        test_broadcast_and_validation,
+    ]
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL BATCH OUTFIT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Outfit Rule Tests
+
+Checks the compiled rule tables give exactly the answers of the original
+if/elif rules (kept in outfit_reference.py) over a grid covering every
+threshold, both sides of it and every context combination.
+"""
+
+import itertools
+import math
+
+from outfit_reference import reference_plan_outfit
+from weather_outfit_adk.tools.outfit_rules import ABOVE, BELOW, Bands, DecisionTable
+from weather_outfit_adk.tools.outfit_tools import plan_outfit
+
+ACTIVITIES = ("casual", "work", "sports", "formal", "gardening")
+FORMALITIES = ("casual", "business_casual", "formal", "black_tie")
+MOVEMENTS = ("low", "medium", "high")
+PERSONAS = ("practical", "fashion", "kid_friendly", "goth")
+COMFORTS = ("runs_cold", "neutral", "runs_hot", "unknown")
+
+
+def _around(thresholds, shifts=(0,)):
+    """Each threshold (shifted), the floats either side of it, and half a unit either side"""
+    values = set()
+    for threshold in thresholds:
+        for shift in shifts:
+            t = threshold + shift
+            values.update((t, math.nextafter(t, -math.inf), math.nextafter(t, math.inf), t - 0.5, t + 0.5))
+    return sorted(values)
+
+
+# Every threshold in the rules; temperatures also shifted by the comfort offsets
+TEMPERATURES = [-40, 0, 120, 55.5] + _around((30, 32, 40, 50, 60, 65, 70, 75, 80), shifts=(-5, 0, 5))
+RAIN_CHANCES = [0, 100] + _around((30, 40))
+WIND_SPEEDS = [0, 60] + _around((15, 20))
+
+
+def test_bands_and_tables():
+    """Threshold tables read like the if/elif chains they replace"""
+    from weather_outfit_adk.tools.outfit_rules import Dimension
+
+    dimension = Dimension("test")
+    below = Bands(dimension, BELOW, [(40, "cold"), (60, "cool"), (None, "warm")])
+    above = Bands(dimension, ABOVE, [(20, "gale"), (15, "windy"), (None, "calm")])
+    assert [below(x) for x in (39.9, 40, 59, 60, math.nan)] == ["cold", "cool", "cool", "warm", "warm"]
+    assert [above(x) for x in (15, 15.1, 20, 21, math.nan)] == ["calm", "windy", "windy", "gale", "calm"]
+
+    table = DecisionTable((("t", below), ("w", above)), [
+        ({"t": "cold", "w": ("windy", "gale")}, "coat and hat"),
+        ({"t": "cold"}, "coat"),
+    ], default="shirt")
+    dimension.compile()
+    table.compile()
+    assert table(30, 16) == "coat and hat" and table(30, 10) == "coat" and table(70, 30) == "shirt"
+    for t, w in itertools.product((30, 40, 70, math.nan), (10, 15, 16, 25, math.nan)):
+        assert table.answers[dimension.band(t)][dimension.band(w)] == table(t, w)
+
+    for bad in (
+        lambda: Bands(dimension, BELOW, [(60, "a"), (40, "b"), (None, "c")]),
+        lambda: Bands(dimension, ABOVE, [(15, "a"), (20, "b"), (None, "c")]),
+        lambda: Bands(dimension, BELOW, [(40, "a")]),
+        lambda: DecisionTable((("t", below),), [({"t": "freezing"}, "x")]),
+    ):
+        try:
+            bad()
+        except ValueError:
+            continue
+        raise AssertionError("Invalid rule table was accepted")
+    print("✅ Bands and decision tables")
+
+
+def test_parity_every_context():
+    """Identical plans for every context combination at every threshold"""
+    weather = list(itertools.product(TEMPERATURES[::3], RAIN_CHANCES[::2], WIND_SPEEDS[::2]))
+    contexts = list(itertools.product(ACTIVITIES, FORMALITIES, PERSONAS, COMFORTS))
+    checked = 0
+    for i, (activity, formality, persona, comfort) in enumerate(contexts):
+        movement = MOVEMENTS[i % len(MOVEMENTS)]
+        for temperature, rain, wind in weather:
+            args = (temperature, rain, wind, activity, formality, movement, persona, comfort)
+            assert plan_outfit(*args) == reference_plan_outfit(*args), args
+            checked += 1
+    print(f"✅ Parity across every context ({checked} plans)")
+
+
+def test_parity_full_weather_grid():
+    """Identical plans over the full weather grid for the contexts that change slots"""
+    contexts = [
+        ("casual", "casual", "medium", "practical", "neutral"),
+        ("work", "business_casual", "low", "fashion", "runs_cold"),
+        ("sports", "casual", "high", "kid_friendly", "runs_hot"),
+        ("sports", "formal", "high", "practical", "runs_cold"),
+        ("formal", "formal", "low", "kid_friendly", "neutral"),
+    ]
+    checked = 0
+    for temperature, rain, wind in itertools.product(TEMPERATURES, RAIN_CHANCES, WIND_SPEEDS):
+        for context in contexts:
+            args = (temperature, rain, wind) + context
+            assert plan_outfit(*args) == reference_plan_outfit(*args), args
+            checked += 1
+    print(f"✅ Parity across the full weather grid ({checked} plans)")
+
+
+def test_parity_non_finite():
+    """NaN and infinities take the same branches (or raise the same error)"""
+    values = (math.nan, math.inf, -math.inf, 50)
+    for temperature, rain, wind, persona in itertools.product(values, values, values, PERSONAS):
+        args = (temperature, rain, wind, "sports", "casual", "high", persona, "runs_cold")
+        try:
+            expected = reference_plan_outfit(*args)
+        except (ValueError, OverflowError) as e:
+            try:
+                plan_outfit(*args)
+            except type(e):
+                continue
+            raise AssertionError(f"plan_outfit{args} should raise {type(e).__name__}")
+        assert plan_outfit(*args) == expected, args
+    print("✅ Parity for non-finite inputs")
+
+
+def test_lattice_classes():
+    """Every input lands on a precomputed plan; values without rules share one class"""
+    from weather_outfit_adk.tools.outfit_lattice import LATTICE, plan_index
+    from weather_outfit_adk.tools.outfit_rules import RAIN, WIND
+
+    indexes = {
+        plan_index(temperature, rain, wind, activity, formality, persona, comfort)
+        for temperature, rain, wind in itertools.product(TEMPERATURES + [math.nan], RAIN.representatives, WIND.representatives)
+        for activity, formality, persona, comfort in itertools.product(ACTIVITIES, FORMALITIES, PERSONAS, COMFORTS)
+    }
+    assert min(indexes) >= 0 and max(indexes) < len(LATTICE)
+    assert len(indexes) == len(LATTICE)  # The grid reaches every class
+
+    plain = plan_index(58, 10, 5, "casual", "casual", "practical", "neutral")
+    assert plan_index(58, 10, 5, "gardening", "black_tie", "goth", "unknown") == plain
+    assert plan_index(58.4, 0, 0, "casual", "business_casual", "practical", "neutral") == plain
+    assert plan_index(58, 41, 5, "casual", "casual", "practical", "neutral") != plain
+
+    # Equal accessory lists and notes are one shared object
+    accessories = {}
+    for plan in LATTICE:
+        assert accessories.setdefault(plan[4], plan[4]) is plan[4]
+    print(f"✅ Lattice covers every class ({len(LATTICE)} plans)")
+
+
+def main():
+    print("Testing Outfit Rules")
+    print("-" * 60)
+
+    tests = [
+        test_bands_and_tables,
+        test_parity_every_context,
+        test_parity_full_weather_grid,
+        test_parity_non_finite,
+        test_lattice_classes,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL OUTFIT RULE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Shared Outfit Plan Tests
+
+Checks shared plans match plan_outfit, are shared and read-only, stay
+bounded, and report lookups and table size through buffered metrics.
+"""
+
+import random
+
+from weather_outfit_adk.monitoring.metrics import buffered_metrics
+from weather_outfit_adk.tools.outfit_lattice import LATTICE
+from weather_outfit_adk.tools.outfit_shared import SharedPlanTable
+from weather_outfit_adk.tools.outfit_tools import plan_outfit, plan_outfit_shared
+
+ACTIVITIES = ["casual", "work", "sports", "formal", "hiking"]
+FORMALITIES = ["casual", "business_casual", "formal"]
+PERSONAS = ["practical", "fashion", "kid_friendly"]
+COMFORTS = ["runs_cold", "neutral", "runs_hot"]
+
+
+class RecordingCollector:
+    def __init__(self):
+        self.calls = []
+
+    def increment_counter(self, metric_name, value=1, labels=None):
+        self.calls.append(("counter", metric_name, value, labels))
+
+    def set_gauge(self, metric_name, value, labels=None):
+        self.calls.append(("gauge", metric_name, value, labels))
+
+    def record_latency(self, metric_name, duration_ms, labels=None):
+        self.calls.append(("latency", metric_name, duration_ms, labels))
+
+
+def test_matches_plan_outfit():
+    """Shared plans equal plan_outfit's, accessories as a tuple"""
+    rng = random.Random(8)
+    table = SharedPlanTable(name="test_match")
+    for _ in range(20000):
+        args = (
+            round(rng.uniform(-10, 110), rng.choice([0, 1])),
+            rng.choice([0, 29.9, 30, 30.5, 40, 60, 70, rng.uniform(0, 100)]),
+            rng.choice([0, 10, 15, 20, 25, rng.uniform(0, 40)]),
+            rng.choice(ACTIVITIES),
+            rng.choice(FORMALITIES),
+            "medium",
+            rng.choice(PERSONAS),
+            rng.choice(COMFORTS),
+        )
+        expected = plan_outfit(*args)
+        expected["accessories"] = tuple(expected["accessories"])
+        assert dict(table.get(*args)) == expected, args
+    assert 0 < len(table) <= len(LATTICE) + table.max_noted
+    print("✅ Shared plans match plan_outfit")
+
+
+def test_shared_and_frozen():
+    """Inputs landing on one lattice entry share one read-only plan"""
+    table = SharedPlanTable(name="test_frozen")
+    first = table.get(61.2, 12.0, 4.0, persona="fashion")
+    assert table.get(64.9, 20.0, 3.5, persona="fashion") is first
+    assert len(table) == 1
+    try:
+        first["top"] = "tuxedo"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("shared plan is writable")
+    assert isinstance(first["accessories"], tuple)
+
+    # The practical note quotes the temperature, so each degree is its own plan
+    practical = table.get(61.2, 12.0, 4.0)
+    assert table.get(61.7, 12.0, 4.0) is practical
+    assert table.get(62.1, 12.0, 4.0) is not practical
+    assert "62°F" in table.get(62.1, 12.0, 4.0)["notes"]
+
+    assert plan_outfit_shared(61.2, 12.0, 4.0) is plan_outfit_shared(61.3, 11.0, 4.5)
+    print("✅ Shared, read-only plans")
+
+
+def test_noted_plans_bounded():
+    """Past max_noted, temperature-quoting plans are built per call instead of kept"""
+    table = SharedPlanTable(name="test_bounded", max_noted=3)
+    for temperature in (40, 41, 42, 43):
+        table.get(temperature, 0, 0)
+    assert len(table) == 3
+    assert table.get(40, 0, 0) is table.get(40, 0, 0)
+    overflow = table.get(43, 0, 0)
+    assert overflow is not table.get(43, 0, 0) and dict(overflow) == dict(table.get(43, 0, 0))
+    table.clear()
+    assert len(table) == 0
+    print("✅ Bounded")
+
+
+def test_publishes_metrics():
+    """Lookups and table size go through the buffered publisher"""
+    collector = RecordingCollector()
+    original = buffered_metrics.collector
+    buffered_metrics.flush()
+    buffered_metrics.collector = collector
+    try:
+        table = SharedPlanTable(name="test_publish")
+        for _ in range(4):
+            table.get(70, 0, 0, persona="fashion")
+        table.get(70, 0, 0)
+        buffered_metrics.flush()
+    finally:
+        buffered_metrics.collector = original
+
+    labels = {"table": "test_publish"}
+    lookups = {}
+    for kind, name, value, call_labels in collector.calls:
+        if kind == "counter" and name == "outfit_shared_plan_lookups" and call_labels["table"] == "test_publish":
+            lookups[call_labels["result"]] = lookups.get(call_labels["result"], 0) + value
+    assert lookups == {"hit": 3, "built": 2}, lookups
+    assert ("gauge", "outfit_shared_plan_entries", 2, labels) in collector.calls
+    print("✅ Metrics published")
+
+
+def main():
+    print("Testing Shared Outfit Plans")
+    print("-" * 60)
+
+    tests = [
+        test_matches_plan_outfit,
+        test_shared_and_frozen,
+        test_noted_plans_bounded,
+        test_publishes_metrics,
+    ]
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL SHARED OUTFIT PLAN TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Weather Provider Tests
+
+Drives the ProviderRouter with in-process fake providers: failover,
+hedged requests, latency-based ordering and priority propagation.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date
+
+from weather_outfit_adk.providers import (
+    CircuitBreaker,
+    ProviderRouter,
+    RateLimiter,
+    RateLimitExceeded,
+    WeatherProvider,
+    WeatherProviderError,
+    current_priority,
+    request_priority,
+    PREWARM,
+)
+from weather_outfit_adk.providers.open_meteo import _daily_rows
+
+
+class FakeProvider(WeatherProvider):
+    """Answers after a fixed delay (or fails) and records each call"""
+
+    def __init__(self, name, delay=0.0, fail=False, breaker=None):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.breaker = breaker
+        self.calls = []
+        self.finished = threading.Event()
+
+    def _rows(self, start):
+        self.calls.append(current_priority())
+        if self.fail:
+            raise WeatherProviderError(f"{self.name} is down")
+        return [{"date": start, "tavg": 10.0}]
+
+    def daily(self, lat, lon, alt, start, end):
+        time.sleep(self.delay)
+        try:
+            return self._rows(start)
+        finally:
+            self.finished.set()
+
+    async def daily_async(self, lat, lon, alt, start, end):
+        await asyncio.sleep(self.delay)
+        return self._rows(start)
+
+
+class LimitedProvider(FakeProvider):
+    """Takes a rate limiter token before answering, like the Meteostat client"""
+
+    def __init__(self, name, limiter):
+        super().__init__(name)
+        self.limiter = limiter
+        self.shed = []
+
+    def daily(self, lat, lon, alt, start, end):
+        try:
+            self.limiter.acquire(timeout=5)
+        except RateLimitExceeded as e:
+            self.shed.append(e.reason)
+            raise
+        finally:
+            self.finished.set()
+        return self._rows(start)
+
+
+def test_failover_to_secondary():
+    """A failing primary falls over to the next provider"""
+    primary = FakeProvider("primary", fail=True)
+    secondary = FakeProvider("secondary")
+    router = ProviderRouter([primary, secondary], hedge=False)
+
+    rows = router.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+    assert rows[0]["source"] == "secondary"
+    assert len(primary.calls) == len(secondary.calls) == 1
+
+    rows = asyncio.run(router.daily_async(47.6, -122.3, 50, "2025-11-14", "2025-11-14"))
+    assert rows[0]["source"] == "secondary"
+
+    try:
+        ProviderRouter([FakeProvider("a", fail=True)]).daily(0, 0, 0, "2025-11-14", "2025-11-14")
+        assert False, "expected WeatherProviderError"
+    except WeatherProviderError:
+        pass
+    print("✅ Failover to secondary")
+
+
+def test_hedged_request_cuts_tail():
+    """A slow primary is hedged after the delay and the faster secondary answers"""
+    primary = FakeProvider("primary", delay=0.5)
+    secondary = FakeProvider("secondary", delay=0.01)
+    router = ProviderRouter([primary, secondary], max_hedge_delay=0.05)
+
+    start = time.monotonic()
+    rows = router.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+    elapsed = time.monotonic() - start
+    assert rows[0]["source"] == "secondary"
+    assert 0.05 <= elapsed < 0.3
+    primary.finished.wait(1)
+
+    # Fast primaries never trigger a hedge
+    fast = FakeProvider("fast")
+    spare = FakeProvider("spare")
+    assert ProviderRouter([fast, spare], max_hedge_delay=0.2).daily(0, 0, 0, "2025-11-14", "2025-11-14")[0]["source"] == "fast"
+    assert spare.calls == []
+    print("✅ Hedged request cuts tail")
+
+
+def test_unhedged_calls_run_inline():
+    """Without a hedge to race, the call runs on the caller's thread"""
+    threads = []
+
+    class ThreadRecordingProvider(FakeProvider):
+        def daily(self, lat, lon, alt, start, end):
+            threads.append(threading.current_thread())
+            return super().daily(lat, lon, alt, start, end)
+
+    ProviderRouter([ThreadRecordingProvider("a"), ThreadRecordingProvider("b")], hedge=False).daily(0, 0, 0, "2025-11-14", "2025-11-14")
+    ProviderRouter([ThreadRecordingProvider("only")]).daily(0, 0, 0, "2025-11-14", "2025-11-14")
+    assert threads == [threading.current_thread()] * 2
+    print("✅ Unhedged calls run inline")
+
+
+def test_losing_hedge_skips_rate_limit():
+    """A loser still waiting for a rate limiter token is shed without using it"""
+    limiter = RateLimiter("hedge_test", rate_per_second=2, burst=1)
+    limiter.acquire()  # Drain the bucket: the next token is 0.5s away
+    primary = LimitedProvider("primary", limiter)
+    secondary = FakeProvider("secondary", delay=0.01)
+    router = ProviderRouter([primary, secondary], max_hedge_delay=0.05)
+
+    rows = router.daily(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+    assert rows[0]["source"] == "secondary"
+    assert primary.finished.wait(2)
+    assert primary.shed == ["abandoned"] and primary.calls == []
+    # The token is still there for the next caller, and the shed isn't held against the provider
+    time.sleep(0.5)
+    assert limiter.stats()["tokens"] >= 1.0
+    assert router.stats()["primary"]["error_rate"] == 0.0
+    print("✅ Losing hedge skips rate limit")
+
+
+def test_async_hedge_cancels_loser():
+    """On the async path the slower call is cancelled once the hedge wins"""
+    primary = FakeProvider("primary", delay=0.5)
+    secondary = FakeProvider("secondary", delay=0.01)
+    router = ProviderRouter([primary, secondary], max_hedge_delay=0.05)
+
+    async def run():
+        rows = await router.daily_async(47.6, -122.3, 50, "2025-11-14", "2025-11-14")
+        await asyncio.sleep(0.6)
+        return rows
+
+    rows = asyncio.run(run())
+    assert rows[0]["source"] == "secondary"
+    assert primary.calls == []  # Cancelled before it finished
+    print("✅ Async hedge cancels loser")
+
+
+def test_hedge_delay_tracks_p95():
+    """The hedge delay follows the primary's p95 latency within the configured bounds"""
+    provider = FakeProvider("p")
+    now = [0.0]
+    router = ProviderRouter([provider], min_hedge_delay=0.05, max_hedge_delay=1.0, min_samples=10, clock=lambda: now[0])
+    assert router.hedge_delay(provider) == 1.0  # Not enough samples yet
+
+    for latency in [0.1] * 18 + [0.3, 0.4]:
+        router._observe(provider, now[0] - latency, True)
+    assert router.hedge_delay(provider) == 0.4
+    print("✅ Hedge delay tracks p95")
+
+
+def test_routing_by_health_and_latency():
+    """Open circuits go last; once measured, the faster provider goes first"""
+    breaker = CircuitBreaker("slow_test", failure_threshold=1)
+    slow = FakeProvider("slow", breaker=breaker)
+    quick = FakeProvider("quick")
+    now = [0.0]
+    router = ProviderRouter([slow, quick], min_samples=3, clock=lambda: now[0])
+
+    day = date(2025, 11, 14)
+    assert [p.name for p in router.candidates(day, day)] == ["slow", "quick"]  # Configured order until measured
+
+    for _ in range(3):
+        router._observe(slow, now[0] - 0.4, True)
+        router._observe(quick, now[0] - 0.1, True)
+    assert [p.name for p in router.candidates(day, day)] == ["quick", "slow"]
+
+    breaker.record_failure()
+    for _ in range(3):
+        router._observe(slow, now[0] - 0.01, True)
+    assert [p.name for p in router.candidates(day, day)] == ["quick", "slow"]
+    assert router.stats()["slow"]["healthy"] is False
+    print("✅ Routing by health and latency")
+
+
+def test_priority_reaches_provider_threads():
+    """Hedged/pooled calls run with the caller's request priority"""
+    provider = FakeProvider("p", delay=0.1)
+    hedge = FakeProvider("h")
+    router = ProviderRouter([provider, hedge], max_hedge_delay=0.01)
+    with request_priority(PREWARM):
+        router.daily(0, 0, 0, "2025-11-14", "2025-11-14")
+    assert provider.finished.wait(1)
+    assert provider.calls == hedge.calls == [PREWARM]
+    print("✅ Priority reaches provider threads")
+
+
+def test_open_meteo_rows():
+    """Open-Meteo daily columns become Meteostat-shaped rows"""
+    rows = _daily_rows({"daily": {
+        "time": ["2025-11-14", "2025-11-15"],
+        "temperature_2m_mean": [10.5, None],
+        "temperature_2m_max": [14.0, None],
+        "temperature_2m_min": [7.0, None],
+        "precipitation_sum": [2.5, None],
+        "snowfall_sum": [0.4, None],
+        "wind_speed_10m_mean": [18.0, None],
+        "relative_humidity_2m_mean": [80, None],
+    }})
+    assert rows == [{
+        "date": "2025-11-14", "tavg": 10.5, "tmin": 7.0, "tmax": 14.0,
+        "prcp": 2.5, "snow": 4.0, "wspd": 18.0, "rhum": 80,
+    }]
+    print("✅ Open-Meteo rows")
+
+
+def main():
+    print("Testing Weather Providers")
+    print("-" * 60)
+
+    tests = [
+        test_failover_to_secondary,
+        test_hedged_request_cuts_tail,
+        test_unhedged_calls_run_inline,
+        test_losing_hedge_skips_rate_limit,
+        test_async_hedge_cancels_loser,
+        test_hedge_delay_tracks_p95,
+        test_routing_by_health_and_latency,
+        test_priority_reaches_provider_threads,
+        test_open_meteo_rows,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL WEATHER PROVIDER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+"""
+Rate Limiter Tests
+
+Verifies the token bucket, daily quota and priority classes that guard
+upstream weather API calls.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from weather_outfit_adk.providers import (
+    RateLimiter,
+    RateLimitExceeded,
+    LocalQuotaLedger,
+    SqliteQuotaLedger,
+    request_priority,
+    current_priority,
+    INTERACTIVE,
+    PREWARM,
+)
+
+
+def test_burst_then_paced():
+    """A full bucket admits a burst at once, then calls are paced at the rate"""
+    limiter = RateLimiter("test", rate_per_second=20, burst=2)
+
+    start = time.monotonic()
+    limiter.acquire()
+    limiter.acquire()
+    assert time.monotonic() - start < 0.02
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.04
+    assert limiter.stats()["used_today"] == 3
+    print("✅ Burst then paced")
+
+
+def test_interactive_served_before_prewarm():
+    """A queued interactive call overtakes prewarm calls that queued earlier"""
+    limiter = RateLimiter("test", rate_per_second=10, burst=1)
+    limiter.acquire()
+    order = []
+
+    def call(priority):
+        limiter.acquire(priority)
+        order.append(priority)
+
+    prewarm = threading.Thread(target=call, args=(PREWARM,))
+    prewarm.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=call, args=(INTERACTIVE,))
+    interactive.start()
+    prewarm.join()
+    interactive.join()
+
+    assert order == [INTERACTIVE, PREWARM]
+    print("✅ Interactive served before prewarm")
+
+
+def test_deadline_sheds():
+    """A call that can't get a token before its deadline is shed"""
+    limiter = RateLimiter("test", rate_per_second=1, burst=1, max_wait={INTERACTIVE: 0.05})
+    limiter.acquire()
+
+    start = time.monotonic()
+    try:
+        limiter.acquire()
+        assert False, "expected RateLimitExceeded"
+    except RateLimitExceeded as e:
+        assert e.reason == "deadline" and e.status == 429
+    assert 0.04 <= time.monotonic() - start < 0.5
+    assert limiter.stats()["waiting"] == 0
+    print("✅ Deadline sheds")
+
+
+def test_daily_quota_reserve():
+    """Prewarm calls stop short of the reserved share; the day rolling over resets the quota"""
+    day = [date(2025, 11, 14)]
+    limiter = RateLimiter("test", rate_per_second=0, daily_quota=10, quota_reserve=0.2, today=lambda: day[0])
+
+    with request_priority(PREWARM):
+        assert current_priority() == PREWARM
+        for _ in range(8):
+            limiter.acquire()
+        try:
+            limiter.acquire()
+            assert False, "expected RateLimitExceeded"
+        except RateLimitExceeded as e:
+            assert e.reason == "quota"
+    assert current_priority() == INTERACTIVE
+
+    limiter.acquire()
+    limiter.acquire()
+    try:
+        limiter.acquire()
+        assert False, "expected RateLimitExceeded"
+    except RateLimitExceeded as e:
+        assert e.reason == "quota"
+
+    day[0] += timedelta(days=1)
+    limiter.acquire(PREWARM)
+    assert limiter.stats()["used_today"] == 1
+    print("✅ Daily quota reserve")
+
+
+# Another process spending the same ledger: prints how many calls it was admitted
+_OTHER_PROCESS = """
+import sys
+from weather_outfit_adk.providers import RateLimiter, RateLimitExceeded, SqliteQuotaLedger
+limiter = RateLimiter("meteostat", rate_per_second=0, daily_quota=30, quota_ledger=SqliteQuotaLedger(sys.argv[1], "meteostat"))
+admitted = 0
+for _ in range(20):
+    try:
+        limiter.acquire()
+        admitted += 1
+    except RateLimitExceeded:
+        pass
+print(admitted)
+"""
+
+
+def test_shared_daily_quota():
+    """Limiters in several threads and processes share one daily quota through the ledger"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "quota.db")
+        # Start yesterday so the rollover lands on the real date the other process uses
+        day = [date.today() - timedelta(days=1)]
+        limiters = [
+            RateLimiter("meteostat", rate_per_second=0, daily_quota=30, today=lambda: day[0],
+                        quota_ledger=SqliteQuotaLedger(path, "meteostat"))
+            for _ in range(2)
+        ]
+        # Another quota in the same file is counted separately
+        other = RateLimiter("geocoding", rate_per_second=0, daily_quota=1, quota_ledger=SqliteQuotaLedger(path, "geocoding"))
+        other.acquire()
+
+        admitted = []
+
+        def spend(limiter):
+            for _ in range(10):
+                try:
+                    limiter.acquire()
+                    admitted.append(1)
+                except RateLimitExceeded as e:
+                    assert e.reason == "quota"
+
+        threads = [threading.Thread(target=spend, args=(limiter,)) for limiter in limiters for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(admitted) == 30
+        assert limiters[0].stats()["used_today"] == limiters[1].stats()["used_today"] == 30
+
+        # A new day starts from zero for everyone
+        day[0] += timedelta(days=1)
+        limiters[1].acquire()
+        assert limiters[0].stats()["used_today"] == 1
+
+        result = subprocess.run([sys.executable, "-c", _OTHER_PROCESS, path], capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+        assert int(result.stdout.strip().splitlines()[-1]) == 20
+        for _ in range(9):
+            limiters[0].acquire()
+        try:
+            limiters[0].acquire()
+            assert False, "expected RateLimitExceeded"
+        except RateLimitExceeded as e:
+            assert e.reason == "quota"
+    print("✅ Shared daily quota")
+
+
+class SlowLedger(LocalQuotaLedger):
+    """In-memory ledger that blocks like a contended SQLite file and records how it was called"""
+
+    blocking = True
+
+    def __init__(self, limiter_cond=None, delay=0.0, refuse=False):
+        super().__init__()
+        self.cond = limiter_cond
+        self.delay = delay
+        self.refuse = refuse
+        self.reads = 0
+        self.calls_under_lock = 0
+        self.threads = set()
+
+    def _enter(self):
+        self.threads.add(threading.current_thread())
+        if self.cond is not None and self.cond._is_owned():
+            self.calls_under_lock += 1
+        time.sleep(self.delay)
+
+    def used(self, day):
+        self.reads += 1
+        self._enter()
+        return super().used(day)
+
+    def consume(self, day, limit):
+        self._enter()
+        return None if self.refuse else super().consume(day, limit)
+
+
+def test_ledger_io_outside_lock():
+    """The ledger is read at most once per refresh and never called under the limiter's lock"""
+    ledger = SlowLedger(delay=0.01)
+    limiter = RateLimiter("test", rate_per_second=100, burst=1, daily_quota=1000, quota_ledger=ledger, quota_refresh=60)
+    ledger.cond = limiter._cond
+
+    threads = [threading.Thread(target=limiter.acquire, kwargs={"timeout": 5}) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert ledger.calls_under_lock == 0
+    # Waiters re-polling every few ms reuse the cached count
+    assert ledger.reads <= 2, ledger.reads
+    assert limiter.stats()["used_today"] == 10
+
+    # A call the ledger refuses gives its token back
+    ledger.refuse = True
+    limiter._tokens = 1.0
+    try:
+        limiter.acquire()
+        assert False, "expected RateLimitExceeded"
+    except RateLimitExceeded as e:
+        assert e.reason == "quota"
+    assert limiter.stats()["tokens"] >= 1.0
+    print("✅ Ledger I/O outside the lock")
+
+
+def test_async_ledger_io_off_loop():
+    """acquire_async runs a blocking ledger on a worker thread"""
+    ledger = SlowLedger(delay=0.2)
+    limiter = RateLimiter("test", rate_per_second=0, daily_quota=100, quota_ledger=ledger)
+
+    async def run():
+        gaps = []
+        stop = asyncio.Event()
+
+        async def ticker():
+            last = time.monotonic()
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticks = asyncio.ensure_future(ticker())
+        await limiter.acquire_async()
+        stop.set()
+        await ticks
+        return max(gaps)
+
+    assert asyncio.run(run()) < 0.15
+    assert threading.main_thread() not in ledger.threads
+    assert ledger.used(date.today().isoformat()) == 1
+    print("✅ Async ledger I/O off the loop")
+
+
+def test_throttle_pauses_admissions():
+    """throttle() (an upstream 429) empties the bucket for the given time"""
+    limiter = RateLimiter("test", rate_per_second=1000, burst=5)
+    limiter.throttle(0.1)
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+    print("✅ Throttle pauses admissions")
+
+
+def test_async_acquire():
+    """Async waiters are paced and prioritized like threads"""
+    limiter = RateLimiter("test", rate_per_second=20, burst=1)
+    order = []
+
+    async def call(priority, delay):
+        await asyncio.sleep(delay)
+        await limiter.acquire_async(priority)
+        order.append(priority)
+
+    async def run():
+        await limiter.acquire_async()
+        await asyncio.gather(call(PREWARM, 0), call(PREWARM, 0.005), call(INTERACTIVE, 0.01))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert order == [INTERACTIVE, PREWARM, PREWARM]
+    assert time.monotonic() - start >= 0.14
+    print("✅ Async acquire")
+
+
+def main():
+    print("Testing Rate Limiter")
+    print("-" * 60)
+
+    tests = [
+        test_burst_then_paced,
+        test_interactive_served_before_prewarm,
+        test_deadline_sheds,
+        test_daily_quota_reserve,
+        test_shared_daily_quota,
+        test_ledger_io_outside_lock,
+        test_async_ledger_io_off_loop,
+        test_throttle_pauses_admissions,
+        test_async_acquire,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL RATE LIMITER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Tool Name Tests
+
+Checks the asyncio weather tools are published to the model under the
+original tool names, with their signatures and docstrings intact.
+"""
+
+import asyncio
+import inspect
+
+from weather_outfit_adk.tools.location_tools import resolve_city_async
+from weather_outfit_adk.tools.tool_names import as_tool
+from weather_outfit_adk.tools.weather_tools import get_weather_range_async, get_weather_smart_async
+
+
+def test_wrapped_tool_metadata():
+    """The wrapper carries the original name and the coroutine's signature and docstring"""
+    for func, name in (
+        (get_weather_smart_async, "get_weather_smart"),
+        (get_weather_range_async, "get_weather_range"),
+        (resolve_city_async, "resolve_city"),
+    ):
+        tool = as_tool(func, name)
+        assert tool.__name__ == name and tool.__qualname__ == name
+        assert inspect.iscoroutinefunction(tool)
+        assert inspect.signature(tool) == inspect.signature(func)
+        assert tool.__doc__ == func.__doc__
+        # The coroutine itself keeps its own name for tracebacks and logs
+        assert func.__name__ == f"{name}_async"
+    print("✅ Wrapped tool metadata")
+
+
+def test_wrapped_tool_calls_through():
+    """Calling the wrapper awaits the coroutine with the same arguments"""
+    calls = []
+
+    async def lookup_async(city: str, days: int = 1) -> dict:
+        calls.append((city, days))
+        return {"city": city, "days": days}
+
+    tool = as_tool(lookup_async, "lookup")
+    assert asyncio.run(tool("Seattle", days=3)) == {"city": "Seattle", "days": 3}
+    assert calls == [("Seattle", 3)]
+    print("✅ Wrapped tool calls through")
+
+
+def main():
+    print("Testing Tool Names")
+    print("-" * 60)
+
+    tests = [
+        test_wrapped_tool_metadata,
+        test_wrapped_tool_calls_through,
+    ]
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL TOOL NAME TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,706 @@
+#!/usr/bin/env python
+"""
+Weather Cache Tests
+
+Verifies the bounded LRU + TTL cache that sits behind get_weather_smart.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+from weather_outfit_adk.cache import WeatherCache, WeatherRecord, SingleFlight
+
+
+def _as_record(fake_current_weather):
+    """Adapt a fake returning weather dicts to the tools' record-returning loader"""
+    return lambda city, datetime_str=None: WeatherRecord.coerce(fake_current_weather(city, datetime_str))
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_expiry():
+    """Entries expire after their TTL"""
+    clock = FakeClock()
+    cache = WeatherCache(name="test", ttl_seconds=60, stripes=1, clock=clock)
+
+    cache.put("seattle", {"temperature": 55.0})
+    assert cache.get("seattle") == {"temperature": 55.0}
+
+    clock.now += 61
+    assert cache.get("seattle") is None
+    assert cache.stats()["expirations"] == 1
+    print("✅ TTL expiry")
+
+
+def test_lru_eviction_by_entries():
+    """Least recently used entry is evicted when the entry budget is exceeded"""
+    cache = WeatherCache(name="test", max_entries=2, stripes=1)
+
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+    print("✅ LRU eviction (entries)")
+
+
+def test_eviction_by_bytes():
+    """Byte budget is enforced"""
+    cache = WeatherCache(name="test", max_entries=100, max_bytes=200, stripes=1)
+
+    for i in range(10):
+        cache.put(f"city{i}", {"note": "x" * 40})
+
+    assert cache.size_bytes <= 200
+    assert len(cache) < 10
+    print("✅ LRU eviction (bytes)")
+
+
+def test_copy_on_read_and_write():
+    """Callers can't mutate cached values"""
+    cache = WeatherCache(name="test", stripes=1)
+
+    original = {"temperature": 60.0, "tags": ["rain"]}
+    cache.put("portland", original)
+    original["temperature"] = 0.0
+
+    first = cache.get("portland")
+    first["from_cache"] = True
+    first["tags"].append("wind")
+
+    second = cache.get("portland")
+    assert second == {"temperature": 60.0, "tags": ["rain"]}
+    print("✅ Copy on read/write")
+
+
+def test_concurrent_access():
+    """Concurrent writers and readers stay within budget"""
+    cache = WeatherCache(name="test", max_entries=64, stripes=8)
+
+    def worker(offset):
+        for i in range(500):
+            key = f"city{(i + offset) % 200}"
+            if cache.get(key) is None:
+                cache.put(key, {"i": i})
+
+    threads = [threading.Thread(target=worker, args=(n * 17,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = cache.stats()
+    assert stats["entries"] <= 64
+    assert stats["hits"] + stats["misses"] == 8 * 500
+    print("✅ Concurrent access")
+
+
+def test_single_flight_coalesces():
+    """Concurrent callers for one key share a single execution"""
+    flight = SingleFlight(name="test", timeout_seconds=5)
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"temperature": 42.0}
+
+    def worker():
+        results.append(flight.do("seattle", fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 20
+    assert sum(1 for _, shared in results if shared) == 19
+    assert all(result == {"temperature": 42.0} for result, _ in results)
+    assert flight.in_flight() == 0
+    print("✅ Single-flight coalescing")
+
+
+def test_single_flight_timeout_falls_back():
+    """Followers that time out call the function themselves"""
+    flight = SingleFlight(name="test", timeout_seconds=0.05)
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return "leader"
+
+    leader = threading.Thread(target=flight.do, args=("k", slow))
+    leader.start()
+    time.sleep(0.02)
+
+    result, shared = flight.do("k", lambda: "follower")
+    release.set()
+    leader.join()
+
+    assert result == "follower"
+    assert shared is False
+    print("✅ Single-flight timeout fallback")
+
+
+def test_weather_batch_order_and_isolation():
+    """Batch results keep input order, de-duplicate cities and isolate failures"""
+    from weather_outfit_adk.tools import weather_tools
+
+    fetched = []
+
+    def fake_current_weather(city, datetime_str=None):
+        fetched.append(city)
+        if city == "Atlantis":
+            raise RuntimeError("unknown city")
+        return {"temperature": 50.0 + len(city), "city": city}
+
+    original = weather_tools._current_record
+    weather_tools._current_record = _as_record(fake_current_weather)
+    weather_tools.weather_cache.clear()
+    try:
+        batch = weather_tools.get_weather_batch(
+            ["Seattle", "Atlantis", " seattle", "Denver"], "2025-11-14T09:00:00"
+        )
+    finally:
+        weather_tools._current_record = original
+        weather_tools.weather_cache.clear()
+
+    assert sorted(fetched) == ["Atlantis", "Denver", "Seattle"]
+    assert [r["city"] for r in batch["results"]] == ["Seattle", "Atlantis", " seattle", "Denver"]
+    assert batch["unique_cities"] == 3
+    assert batch["errors"] == 1
+    assert "error" in batch["results"][1]
+    assert batch["results"][0]["weather"]["temperature"] == batch["results"][2]["weather"]["temperature"]
+    print("✅ Weather batch ordering and error isolation")
+
+
+class FakeMeteostatClient:
+    """Returns one daily row per requested day and counts upstream calls"""
+
+    api_key = "test-key"
+    breaker = None
+
+    def __init__(self):
+        self.calls = []
+
+    def daily(self, lat, lon, alt, start, end):
+        self.calls.append((start, end))
+        day, last = date.fromisoformat(start), date.fromisoformat(end)
+        rows = []
+        while day <= last:
+            rows.append({"date": day.isoformat(), "tavg": float(day.day), "wspd": 10.0, "prcp": 0.0})
+            day += timedelta(days=1)
+        return {"data": rows}
+
+
+def test_range_prefetch_serves_window_locally():
+    """One upstream call answers every date inside the prefetch window"""
+    from weather_outfit_adk.tools import weather_tools
+
+    from weather_outfit_adk.providers import MeteostatProvider, ProviderRouter
+
+    fake = FakeMeteostatClient()
+    original_router = weather_tools.weather_router
+    weather_tools.weather_router = ProviderRouter([MeteostatProvider(fake)])
+    weather_tools.daily_series_cache.clear()
+    try:
+        window = weather_tools.settings.weather_prefetch_days
+        base = date(2025, 11, 14)
+        offsets = [0] + [o for o in range(-window, window + 1) if o != 0]
+        temps = {
+            offset: weather_tools.get_current_weather("Seattle", (base + timedelta(days=offset)).isoformat())["temperature"]
+            for offset in offsets
+        }
+    finally:
+        weather_tools.weather_router = original_router
+        weather_tools.daily_series_cache.clear()
+
+    assert len(fake.calls) == 1
+    assert len(temps) == 2 * window + 1
+    assert temps[0] == round(14 * 9 / 5 + 32, 1)
+    print("✅ Date-range prefetch")
+
+
+def test_spatial_keys_share_entries_across_aliases():
+    """Aliases and nearby points of one place hit the same cache entry"""
+    from weather_outfit_adk.geo import geohash_encode, geohash_center
+    from weather_outfit_adk.tools import weather_tools
+
+    assert geohash_encode(42.6, -5.6, 5) == "ezs42"
+    lat, lon = geohash_center("ezs42")
+    assert geohash_encode(lat, lon, 5) == "ezs42"
+
+    fetched = []
+
+    def fake_current_weather(city, datetime_str=None):
+        fetched.append(city)
+        return {"temperature": 55.0, "city": city}
+
+    original = weather_tools._current_record
+    weather_tools._current_record = _as_record(fake_current_weather)
+    weather_tools.weather_cache.clear()
+    try:
+        first = weather_tools.get_weather_smart("New York", "2025-11-14T09:00:00")
+        second = weather_tools.get_weather_smart("NYC", "2025-11-14T18:00:00")
+        third = asyncio.run(weather_tools.get_weather_smart_async("new york, ny", "2025-11-14"))
+        batch = weather_tools.get_weather_batch(["Manhattan", "Denver"], "2025-11-14")
+    finally:
+        weather_tools._current_record = original
+        weather_tools.weather_cache.clear()
+
+    assert fetched == ["New York", "Denver"]
+    assert first["from_cache"] is False
+    assert second["from_cache"] is True and second["city"] == "NYC"
+    assert third["from_cache"] is True and third["city"] == "new york, ny"
+    assert batch["cache_hits"] == 1
+    assert batch["results"][0]["weather"]["city"] == "Manhattan"
+    print("✅ Spatial cache keys shared across aliases")
+
+
+def test_persistent_tier_survives_restart():
+    """Entries written through to SQLite are served and warm-loaded by a new cache"""
+    import tempfile
+    from weather_outfit_adk.cache import PersistentCache
+
+    wall = [1000.0]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "weather.db")
+        disk = PersistentCache(path, max_entries=3, compact_every=1000, clock=lambda: wall[0])
+        before = WeatherCache(ttl_seconds=60, backing=disk)
+        before.put(("geohash:c23nb", "2025-11-14"), {"temperature": 51.0})
+        before.put(("geohash:dr5ru", "2025-11-14"), {"temperature": 44.0}, ttl_seconds=5)
+
+        # "Restart": fresh memory tier on a fresh connection to the same file
+        disk_after = PersistentCache(path, max_entries=3, clock=lambda: wall[0])
+        after = WeatherCache(ttl_seconds=60, backing=disk_after)
+        assert after.get(("geohash:c23nb", "2025-11-14")) == {"temperature": 51.0}
+        assert after.stats()["backing_hits"] == 1
+
+        wall[0] += 10  # Second entry's TTL has passed
+        warmed = WeatherCache(ttl_seconds=60, backing=disk_after)
+        assert warmed.warm() == 1
+        assert ("geohash:c23nb", "2025-11-14") in warmed
+
+        for i in range(6):
+            disk_after.put(f"k{i}", {"i": i}, ttl_seconds=100 + i)
+        assert disk_after.compact() >= 0
+        assert len(disk_after) == 3
+        assert disk_after.get("k5") is not None and disk_after.get("k0") is None
+        disk.close()
+        disk_after.close()
+    print("✅ Persistent tier survives restart")
+
+
+class SlowBacking:
+    """Backing tier whose reads and writes block like a busy SQLite file"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.rows = {}
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.current_thread())
+        time.sleep(self.delay)
+        return (self.rows[key], 60.0) if key in self.rows else None
+
+    def put(self, key, value, ttl_seconds):
+        self.threads.add(threading.current_thread())
+        time.sleep(self.delay)  # e.g. a commit that triggers compaction
+        self.rows[key] = value
+
+    def stats(self):
+        return {"entries": len(self.rows)}
+
+
+def test_async_backing_io_off_loop():
+    """Async lookups and writes leave backing-tier I/O to worker threads"""
+    backing = SlowBacking(delay=0.3)
+    backing.rows["warm"] = {"temperature": 60.0}
+    cache = WeatherCache(name="async_backing", ttl_seconds=60, backing=backing)
+
+    async def run():
+        gaps = []
+
+        async def ticker(stop):
+            last = time.monotonic()
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        stop = asyncio.Event()
+        ticks = asyncio.ensure_future(ticker(stop))
+        assert await cache.get_async("warm") == {"temperature": 60.0}
+        assert await cache.get_stale_async("cold") is None
+        written = cache.put_async("new", {"temperature": 41.0})
+        # The memory tier has the value before the backing write lands
+        assert cache.get("new") == {"temperature": 41.0} and "new" not in backing.rows
+        await written
+        stop.set()
+        await ticks
+        return max(gaps)
+
+    worst_gap = asyncio.run(run())
+    assert worst_gap < 0.2, worst_gap
+    assert backing.rows["new"] == {"temperature": 41.0}
+    assert threading.main_thread() not in backing.threads
+    stats = cache.stats()
+    assert stats["backing_hits"] == 1 and stats["misses"] == 1
+    # The warm row was promoted into memory: no second backing read
+    assert cache.get("warm") == {"temperature": 60.0}
+    print("✅ Async backing I/O stays off the loop")
+
+
+def test_stale_while_revalidate():
+    """Expired entries are served stale once while a single background refresh runs"""
+    from weather_outfit_adk.tools import weather_tools
+
+    fetched = []
+    release = threading.Event()
+
+    def fake_current_weather(city, datetime_str=None):
+        fetched.append(city)
+        release.wait(5)
+        return {"temperature": 60.0 + len(fetched), "city": city}
+
+    original = weather_tools._current_record
+    weather_tools._current_record = _as_record(fake_current_weather)
+    weather_tools.weather_cache.clear()
+    try:
+        key = weather_tools._cache_key("Denver", "2025-11-14")
+        weather_tools.weather_cache.put(key, WeatherRecord(temperature=40.0, city="Denver"), ttl_seconds=0.01)
+        time.sleep(0.05)
+
+        # Both callers get the stale value immediately; only one refresh is started
+        first = weather_tools.get_weather_smart("Denver", "2025-11-14")
+        second = weather_tools.get_weather_smart("denver", "2025-11-14")
+        assert first["temperature"] == 40.0 and first["stale"] is True
+        assert second["temperature"] == 40.0
+        release.set()
+
+        deadline = time.time() + 5
+        while weather_tools.weather_refresher.pending() and time.time() < deadline:
+            time.sleep(0.01)
+
+        refreshed = weather_tools.get_weather_smart("Denver", "2025-11-14")
+    finally:
+        weather_tools._current_record = original
+        weather_tools.weather_cache.clear()
+
+    assert fetched == ["Denver"]
+    assert refreshed["temperature"] == 61.0 and "stale" not in refreshed
+    print("✅ Stale-while-revalidate")
+
+
+def test_refresh_ahead_of_hot_keys():
+    """Hot keys about to expire are refreshed before they go stale; cold ones are not"""
+    from weather_outfit_adk.cache import BackgroundRefresher
+
+    now = [0.0]
+    cache = WeatherCache(ttl_seconds=100, stale_seconds=50, clock=lambda: now[0])
+    refresher = BackgroundRefresher(name="test", ttl_remaining=cache.ttl_remaining, ahead_seconds=20, min_hits=3)
+    refreshed = []
+
+    def loader(key):
+        return lambda: (refreshed.append(key), cache.put(key, {"v": 2}))
+
+    cache.put("hot", {"v": 1})
+    cache.put("cold", {"v": 1})
+    for _ in range(5):
+        refresher.touch("hot", loader("hot"))
+    refresher.touch("cold", loader("cold"))
+
+    now[0] = 50.0
+    assert refresher.scan_once() == 0  # Not close enough to expiry yet
+
+    now[0] = 90.0
+    for _ in range(3):
+        refresher.touch("hot", loader("hot"))
+    assert refresher.scan_once() == 1
+    refresher.stop()
+
+    assert refreshed == ["hot"]
+    assert cache.ttl_remaining("hot") == 100
+    assert cache.get_stale("cold") == ({"v": 1}, False)
+    now[0] = 120.0
+    assert cache.get("cold") is None and cache.get_stale("cold") == ({"v": 1}, True)
+    now[0] = 151.0
+    assert cache.get_stale("cold") is None
+    print("✅ Refresh-ahead of hot keys")
+
+
+def test_popularity_sketch_finds_heavy_hitters():
+    """Count-min estimates never undercount and the top-K holds the heaviest keys"""
+    from weather_outfit_adk.cache import PopularityTracker
+
+    tracker = PopularityTracker(k=3, width=256, depth=4)
+    truth = {}
+    for i in range(200):
+        key = f"city-{i % 40}"
+        truth[key] = truth.get(key, 0) + 1
+        tracker.record(key, payload=key.upper())
+    for _ in range(50):
+        for key in ("seattle", "denver", "miami"):
+            truth[key] = truth.get(key, 0) + 1
+            tracker.record(key, payload=key.upper())
+
+    assert all(tracker.estimate(key) >= count for key, count in truth.items())
+    top = tracker.top_k()
+    assert {key for key, _, _ in top} == {"seattle", "denver", "miami"}
+    assert top[0][2] == top[0][0].upper()
+
+    before = {key: count for key, count, _ in top}
+    tracker.decay()
+    assert tracker.estimate("seattle") >= 25
+    assert {key: count for key, count, _ in tracker.top_k()} == {key: count // 2 for key, count in before.items()}
+    print("✅ Popularity sketch finds heavy hitters")
+
+
+def test_prewarm_popular_keys_before_peak():
+    """Popular (location, day) keys are fetched ahead of the peak and their hits attributed"""
+    from datetime import datetime
+    from weather_outfit_adk.cache import Prewarmer
+    from weather_outfit_adk.tools import weather_tools
+
+    calls = []
+
+    def fake_current_weather(city, datetime_str=None):
+        calls.append(city)
+        return {"temperature": 55.0, "condition": "Clear", "city": city}
+
+    wall = [datetime(2025, 11, 14, 5, 0)]
+    prewarmer = Prewarmer(
+        weather_tools._prewarm_target,
+        ttl_remaining=weather_tools.weather_cache.ttl_remaining,
+        name="test",
+        min_hits=3,
+        peak_hours=[7],
+        lead_minutes=60,
+        rate_per_second=0,
+        now=lambda: wall[0],
+    )
+    original = (weather_tools._current_record, weather_tools.weather_prewarmer)
+    weather_tools._current_record = _as_record(fake_current_weather)
+    weather_tools.weather_prewarmer = prewarmer
+    weather_tools.weather_cache.clear()
+    try:
+        today = date.today().isoformat()
+        for _ in range(4):
+            weather_tools.get_weather_smart("Denver", today)
+        weather_tools.get_weather_smart("Miami", today)
+        weather_tools.weather_cache.clear()
+        calls.clear()
+
+        assert not prewarmer.due()  # 05:00 is outside the hour before the 07:00 peak
+        wall[0] = datetime(2025, 11, 14, 6, 30)
+        assert prewarmer.due()
+        assert prewarmer.run_once() == {"fetched": 1, "fresh": 0, "failed": 0}
+        assert calls == ["Denver"]
+        assert not prewarmer.due()  # Next run waits for the interval
+
+        weather = weather_tools.get_weather_smart("denver", today)
+        assert weather["from_cache"] and calls == ["Denver"]
+        assert prewarmer.run_once()["fresh"] == 1
+        stats = prewarmer.stats()
+        assert stats["prewarmed_hits"] == 1 and stats["hit_contribution"] > 0
+    finally:
+        weather_tools._current_record, weather_tools.weather_prewarmer = original
+        prewarmer.stop()
+        weather_tools.weather_cache.clear()
+    print("✅ Prewarm popular keys before peak")
+
+
+def test_negative_caching_of_failures():
+    """Failures and missing days are cached briefly; shed calls are not cached at all"""
+    from weather_outfit_adk.tools import weather_tools
+
+    responses = {
+        "Denver": lambda: weather_tools._mock_weather(
+            "no data", error="No weather data available for this date", error_type="no_data"
+        ),
+        "Miami": lambda: weather_tools._mock_weather("down", error="API error: meteostat circuit is open"),
+        "Boston": lambda: weather_tools._mock_weather("shed", error="Rate limited: quota", error_type="rate_limited"),
+    }
+    calls = []
+
+    def fake_current_weather(city, datetime_str=None):
+        calls.append(city)
+        return responses[city]()
+
+    original = weather_tools._current_record
+    weather_tools._current_record = _as_record(fake_current_weather)
+    weather_tools.weather_cache.clear()
+    try:
+        for _ in range(2):
+            for city in responses:
+                weather_tools.get_weather_smart(city, "2025-11-14")
+        assert calls == ["Denver", "Miami", "Boston", "Boston"]
+
+        no_data = weather_tools.weather_cache.ttl_remaining(weather_tools._cache_key("Denver", "2025-11-14"))
+        failure = weather_tools.weather_cache.ttl_remaining(weather_tools._cache_key("Miami", "2025-11-14"))
+        assert 0 < failure <= weather_tools.settings.weather_negative_cache_ttl_seconds
+        assert failure < no_data <= weather_tools.settings.weather_no_data_cache_ttl_seconds
+    finally:
+        weather_tools._current_record = original
+        weather_tools.weather_cache.clear()
+    print("✅ Negative caching of failures")
+
+
+def test_weather_record_round_trip():
+    """Records convert losslessly to tool dicts and to the JSON tiers' positional form"""
+    import json
+    import sys
+    import tempfile
+    from weather_outfit_adk.cache import PersistentCache
+
+    weather = {
+        "temperature": 57.2, "feels_like": 55.2, "condition": "light " + "rain",
+        "rain_chance": 30.0, "wind_speed": 7.5, "humidity": 81.0,
+        "timestamp": "2025-11-14T18:00:00+00:00", "city": "Seattle", "source": "meteostat",
+    }
+    record = WeatherRecord.from_dict(weather)
+    assert record.to_dict() == weather
+    assert record.condition is sys.intern("light rain")
+    assert not hasattr(record, "__dict__")
+    assert WeatherRecord.from_json(json.loads(json.dumps(record.to_json()))) == record
+
+    naive = WeatherRecord.at("2025-11-14T09:30:00", temperature=50.0)
+    assert naive.to_dict()["timestamp"] == "2025-11-14T09:30:00"
+    assert naive.to_dict(from_cache=True, city="Tacoma")["city"] == "Tacoma"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        disk = PersistentCache(os.path.join(tmp, "weather.db"))
+        disk.put("legacy", weather, ttl_seconds=60)  # Written before records existed
+        cache = WeatherCache(ttl_seconds=60, backing=disk, encode=WeatherRecord.to_json, decode=WeatherRecord.from_json)
+        cache.put("new", record)
+        assert isinstance(disk.get("new")[0], list)
+        assert cache.get("legacy") == record
+
+        fresh = WeatherCache(ttl_seconds=60, backing=disk, encode=WeatherRecord.to_json, decode=WeatherRecord.from_json)
+        assert fresh.get("new") == record
+        disk.close()
+    print("✅ Weather record round trip")
+
+
+def _shared_cache_writer(path, key, value):
+    """Runs in a child process"""
+    from weather_outfit_adk.cache import SharedMemoryCache
+    cache = SharedMemoryCache(path, slots=64, slot_bytes=512)
+    cache.put(key, value, ttl_seconds=60)
+    cache.close()
+
+
+def test_shared_cache_across_processes():
+    """An entry written by one process is read by another; replacement is atomic"""
+    import multiprocessing
+    import tempfile
+    from weather_outfit_adk.cache import SharedMemoryCache, SHARED_CACHE_AVAILABLE
+
+    if not SHARED_CACHE_AVAILABLE:
+        print("⚠️  Shared cache not available on this platform, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "weather.shm")
+        shared = SharedMemoryCache(path, slots=64, slot_bytes=512)
+        key = ("geohash:c23nb", "2025-11-14")
+
+        child = multiprocessing.get_context("spawn").Process(
+            target=_shared_cache_writer, args=(path, list(key), {"temperature": 48.0})
+        )
+        child.start()
+        child.join(30)
+        assert child.exitcode == 0
+
+        value, remaining = shared.get(key)
+        assert value == {"temperature": 48.0} and 0 < remaining <= 60
+
+        # Per-process memory tier reads through to the shared table
+        local = WeatherCache(ttl_seconds=60, backing=shared)
+        assert local.get(key) == {"temperature": 48.0}
+
+        # Concurrent writers replacing the same key never expose a torn entry
+        errors = []
+
+        def writer(n):
+            for i in range(200):
+                shared.put(key, {"temperature": float(n), "pad": "x" * (n * 40)}, ttl_seconds=60)
+
+        def reader():
+            for _ in range(400):
+                found = shared.get(key)
+                if found is not None and found[0]["pad"] != "x" * (int(found[0]["temperature"]) * 40):
+                    errors.append(found)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in (1, 5)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+
+        # Filling far more keys than slots evicts instead of failing
+        for i in range(200):
+            shared.put(f"k{i}", {"i": i}, ttl_seconds=60)
+        assert len(shared) <= 64
+        assert shared.get("k199")[0] == {"i": 199}
+        shared.close()
+    print("✅ Shared cache across processes")
+
+
+def main():
+    print("Testing Weather Cache")
+    print("-" * 60)
+
+    tests = [
+        test_ttl_expiry,
+        test_lru_eviction_by_entries,
+        test_eviction_by_bytes,
+        test_copy_on_read_and_write,
+        test_concurrent_access,
+        test_single_flight_coalesces,
+        test_single_flight_timeout_falls_back,
+        test_weather_batch_order_and_isolation,
+        test_range_prefetch_serves_window_locally,
+        test_spatial_keys_share_entries_across_aliases,
+        test_persistent_tier_survives_restart,
+        test_async_backing_io_off_loop,
+        test_shared_cache_across_processes,
+        test_stale_while_revalidate,
+        test_refresh_ahead_of_hot_keys,
+        test_popularity_sketch_finds_heavy_hitters,
+        test_prewarm_popular_keys_before_peak,
+        test_negative_caching_of_failures,
+        test_weather_record_round_trip,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL WEATHER CACHE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
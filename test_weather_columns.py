@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Weather Column Tests
+
+Checks the scalar and NumPy-vectorized daily-row transforms agree, and
+drives get_weather_range with a fake provider.
+"""
+
+import asyncio
+import random
+
+from weather_outfit_adk.tools.weather_columns import (
+    NUMPY_AVAILABLE,
+    derive_row,
+    derive_rows,
+)
+
+
+def _random_rows(n, seed=3):
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return None if rng.random() < 0.1 else value
+
+    rows = []
+    for i in range(n):
+        row = {
+            "date": f"2025-11-{1 + i % 28:02d}",
+            "tavg": maybe(round(rng.uniform(-25, 40), rng.choice([1, 2]))),
+            "tmax": maybe(round(rng.uniform(-20, 45), 1)),
+            "wspd": maybe(round(rng.uniform(0, 80), 1)),
+            "prcp": maybe(rng.choice([0.0, 0.5, 2.0, 2.5, 10.0, 12.3, rng.uniform(0, 30)])),
+            "snow": maybe(rng.choice([0.0, 0.0, 0.0, 4.0])),
+        }
+        if rng.random() < 0.8:
+            row["rhum"] = maybe(rng.choice([55, 80.5, rng.uniform(10, 100)]))
+        rows.append(row)
+    # Values whose x * 10 sits within float error of a .5 tie
+    rows.append({"tavg": 1.05, "tmax": None, "wspd": 1.05 / 0.621371, "prcp": 0.105, "snow": None})
+    rows.append({"tavg": 0.0, "tmax": 9.0, "wspd": None, "prcp": None, "snow": None, "rhum": None})
+    return rows
+
+
+def test_scalar_row():
+    """derive_row converts units, derives the condition and handles missing fields"""
+    assert derive_row({"tavg": 10.0, "wspd": 20.0, "prcp": 3.0, "snow": 0.0, "rhum": 70}) == {
+        "temperature": 50.0, "feels_like": 48.0, "condition": "light rain",
+        "rain_chance": 30.0, "wind_speed": 12.4, "humidity": 70,
+    }
+    freezing = derive_row({"tavg": 0.0, "tmax": 4.0, "wspd": None, "prcp": None})
+    assert freezing["temperature"] == 32.0  # 0°C is a reading, not a missing value
+    assert freezing["wind_speed"] == 0.0 and freezing["humidity"] == 50.0
+    assert derive_row({"tmax": 30.0, "prcp": 25.0, "snow": 1.0})["condition"] == "snowy"
+    assert derive_row({})["temperature"] == 68.0
+    print("✅ Scalar row transform")
+
+
+def test_vectorized_matches_scalar():
+    """The NumPy path gives exactly the scalar path's results"""
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, skipping vectorized parity")
+        return
+
+    rows = _random_rows(5000)
+    scalar = [derive_row(row) for row in rows]
+    vectorized = derive_rows(rows, vectorized=True)
+    assert vectorized == scalar
+    assert derive_rows(rows[:3]) == scalar[:3]  # Small batches stay scalar
+    print("✅ Vectorized transform matches scalar")
+
+
+class FakeProvider:
+    """Daily rows for every requested day except the 3rd of the month"""
+
+    name = "fake"
+    breaker = None
+
+    def __init__(self):
+        self.calls = []
+
+    def available(self):
+        return True
+
+    def healthy(self):
+        return True
+
+    def supports(self, start, end):
+        return True
+
+    def daily(self, lat, lon, alt, start, end):
+        from datetime import date, timedelta
+        self.calls.append((start, end))
+        day, last = date.fromisoformat(start), date.fromisoformat(end)
+        rows = []
+        while day <= last:
+            if day.day != 3:
+                rows.append({"date": day.isoformat(), "tavg": float(day.day), "wspd": 10.0, "prcp": 0.0})
+            day += timedelta(days=1)
+        return list(reversed(rows))
+
+    async def daily_async(self, lat, lon, alt, start, end):
+        return self.daily(lat, lon, alt, start, end)
+
+
+def test_weather_range():
+    """One upstream call answers a whole range, in date order, with gaps counted"""
+    from weather_outfit_adk.providers import ProviderRouter
+    from weather_outfit_adk.tools import weather_tools
+
+    fake = FakeProvider()
+    original = weather_tools.weather_router
+    weather_tools.weather_router = ProviderRouter([fake], hedge=False)
+    try:
+        week = weather_tools.get_weather_range("Seattle", "2025-11-01", "2025-11-07")
+        same = asyncio.run(weather_tools.get_weather_range_async("Seattle", "2025-11-05"))
+        backwards = weather_tools.get_weather_range("Seattle", "2025-11-07", "2025-11-01")
+        too_long = weather_tools.get_weather_range("Seattle", "2020-01-01", "2025-01-01")
+    finally:
+        weather_tools.weather_router = original
+
+    assert len(fake.calls) == 2
+    assert week["count"] == 6 and week["missing_days"] == 1
+    assert [d["date"] for d in week["days"]] == ["2025-11-01", "2025-11-02", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07"]
+    assert week["days"][0]["temperature"] == round(1 * 9 / 5 + 32, 1)
+    assert week["days"][0]["source"] == "fake"
+    assert same["count"] == 1 and same["days"][0]["temperature"] == 41.0
+    assert "error" in backwards and "error" in too_long
+    print("✅ Weather range")
+
+
+def main():
+    print("Testing Weather Columns")
+    print("-" * 60)
+
+    tests = [
+        test_scalar_row,
+        test_vectorized_matches_scalar,
+        test_weather_range,
+    ]
+
+    for test in tests:
+        test()
+
+    print("=" * 60)
+    print("✅ ALL WEATHER COLUMN TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
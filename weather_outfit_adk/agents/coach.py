@@ -1,9 +1,10 @@
 from google.adk.agents import Agent
-from ..tools.weather_tools import get_current_weather, get_weather_smart
+from ..tools.weather_tools import get_weather_smart_async
 from ..tools.activity_tools import classify_activity
 from ..tools.outfit_tools import plan_outfit
 from ..tools.safety_tools import check_safety
 from ..tools.memory_tools import get_user_preferences, update_user_preferences
+from ..tools.tool_names import as_tool
 
 
 coach_agent = Agent(
@@ -60,7 +61,7 @@ Handle edge cases:
     tools=[
         get_user_preferences, 
         update_user_preferences,
-        get_weather_smart,
+        as_tool(get_weather_smart_async, "get_weather_smart"),
         classify_activity,
         plan_outfit,
         check_safety
@@ -1,5 +1,14 @@
 from google.adk.agents import Agent
-from ..tools.weather_tools import get_current_weather, get_hourly_forecast, get_weather_smart
+from ..tools.weather_tools import (
+    get_current_weather_async,
+    get_hourly_forecast_async,
+    get_weather_smart_async,
+    get_weather_batch_async,
+    get_weather_range_async,
+    get_typical_weather_async,
+)
+from ..tools.location_tools import resolve_city_async
+from ..tools.tool_names import as_tool
 
 
 weather_agent = Agent(
@@ -15,10 +24,25 @@ Your role:
 
 Rules:
 - Use get_weather_smart for efficiency (it caches results)
+- Use get_weather_batch when asked about several cities at once
+- Use get_weather_range when asked about several days (e.g. a trip or the week ahead)
+- Use get_typical_weather for "what is it usually like" questions and for dates
+  too far ahead to forecast; say that the answer is based on past years
+- If a location looks misspelled, abbreviated or ambiguous, call resolve_city
+  and use its "resolved" city instead of asking the user to clarify; only ask when
+  "resolved" is null or "ambiguous" is true and the candidates are far apart
 - Be precise with temperature, wind, and rain probability
 - Keep responses focused on weather facts
 - Format data clearly for other agents to use
 """,
     description="Provides accurate weather forecasts by calling weather APIs",
-    tools=[get_current_weather, get_hourly_forecast, get_weather_smart]
+    tools=[
+        as_tool(get_current_weather_async, "get_current_weather"),
+        as_tool(get_hourly_forecast_async, "get_hourly_forecast"),
+        as_tool(get_weather_smart_async, "get_weather_smart"),
+        as_tool(get_weather_batch_async, "get_weather_batch"),
+        as_tool(get_weather_range_async, "get_weather_range"),
+        as_tool(get_typical_weather_async, "get_typical_weather"),
+        as_tool(resolve_city_async, "resolve_city"),
+    ]
 )
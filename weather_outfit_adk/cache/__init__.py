@@ -0,0 +1,34 @@
+"""
+Weather caching layer
+
+Bounded, thread-safe caches used by the weather tools to cut upstream
+API calls.
+"""
+
+from .weather_cache import WeatherCache
+from .record import WeatherRecord
+from .persistent_cache import PersistentCache
+from .shared_cache import SharedMemoryCache, SHARED_CACHE_AVAILABLE
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .refresh import BackgroundRefresher
+from .popularity import CountMinSketch, PopularityTracker
+from .prewarm import Prewarmer
+from .series_cache import DailySeriesCache, location_key
+from .hourly_buffer import HourlySeriesBuffer
+
+__all__ = [
+    "WeatherCache",
+    "WeatherRecord",
+    "PersistentCache",
+    "SharedMemoryCache",
+    "SHARED_CACHE_AVAILABLE",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "BackgroundRefresher",
+    "CountMinSketch",
+    "PopularityTracker",
+    "Prewarmer",
+    "DailySeriesCache",
+    "location_key",
+    "HourlySeriesBuffer",
+]
@@ -0,0 +1,204 @@
+"""
+Hourly Series Buffer
+
+Per-location buffer of hourly weather rows (see providers/base.py). One
+upstream call fills a window of hours for a location; any time inside
+the window is then answered locally by interpolation.
+
+- Columnar storage: an array('d') per field next to an array('d') of
+  UTC epoch seconds, instead of a dict per hour
+- Continuous fields (temp, rhum, wspd, pop) are interpolated linearly
+  between the bracketing hours; per-hour amounts and codes (prcp, snow,
+  coco) come from the nearest hour
+- Times further than max_gap_hours from data are misses, not guesses
+- LRU over locations with a per-location TTL, since forecasts are revised
+- A location's series is rebuilt on put and never modified afterwards,
+  so readers don't hold the lock while interpolating
+"""
+
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from ..monitoring.metrics import buffered_metrics
+
+HOURLY_FIELDS = ("temp", "rhum", "wspd", "pop", "prcp", "snow", "coco")
+INTERPOLATED_FIELDS = ("temp", "rhum", "wspd", "pop")
+
+_NAN = float("nan")
+
+
+def _epoch(moment: str) -> float:
+    """Epoch seconds of an ISO time (naive times are UTC)."""
+    parsed = datetime.fromisoformat(moment)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _value(value: Optional[float]) -> Optional[float]:
+    return None if value is None or math.isnan(value) else value
+
+
+class _Series:
+    __slots__ = ("times", "columns", "utc_offset", "source", "expires_at")
+
+    def __init__(self, times: array, columns: Dict[str, array], utc_offset: Optional[int], source: Optional[str], expires_at: float):
+        self.times = times
+        self.columns = columns
+        self.utc_offset = utc_offset
+        self.source = source
+        self.expires_at = expires_at
+
+
+class HourlySeriesBuffer:
+    """Thread-safe LRU of per-location columnar hourly series."""
+
+    def __init__(
+        self,
+        name: str = "hourly",
+        max_locations: int = 2000,
+        ttl_seconds: float = 3600.0,
+        max_hours: int = 240,
+        max_gap_hours: float = 3.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the buffer
+
+        Args:
+            name: Buffer name used as the metrics label
+            max_locations: Maximum number of location series kept
+            ttl_seconds: Lifetime of a location's series after its last put
+            max_hours: Hours kept per location (the newest are kept)
+            max_gap_hours: Largest gap between data points that is interpolated across
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.name = name
+        self.max_locations = max(1, max_locations)
+        self.ttl_seconds = ttl_seconds
+        self.max_hours = max(2, max_hours)
+        self.max_gap = max_gap_hours * 3600.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._series: "OrderedDict[Hashable, _Series]" = OrderedDict()
+
+    def _live(self, location: Hashable) -> Optional[_Series]:
+        with self._lock:
+            series = self._series.get(location)
+            if series is not None and series.expires_at <= self._clock():
+                del self._series[location]
+                series = None
+            if series is not None:
+                self._series.move_to_end(location)
+        return series
+
+    def put(self, location: Hashable, rows: Iterable[Dict[str, Any]]):
+        """
+        Merge fetched hourly rows into a location's series
+
+        Args:
+            location: Location key (see series_cache.location_key)
+            rows: Hourly rows, each with a UTC "time"; newer rows replace
+                older ones for the same hour
+        """
+        previous = self._live(location)
+        by_time: Dict[float, List[float]] = {}
+        utc_offset = previous.utc_offset if previous is not None else None
+        source = previous.source if previous is not None else None
+
+        if previous is not None:
+            for i, moment in enumerate(previous.times):
+                by_time[moment] = [previous.columns[field][i] for field in HOURLY_FIELDS]
+
+        for row in rows:
+            try:
+                moment = _epoch(str(row["time"]))
+            except (KeyError, ValueError):
+                continue
+            by_time[moment] = [_NAN if row.get(field) is None else float(row[field]) for field in HOURLY_FIELDS]
+            if row.get("utc_offset") is not None:
+                utc_offset = int(row["utc_offset"])
+            source = row.get("source", source)
+
+        ordered = sorted(by_time)[-self.max_hours:]
+        columns = {field: array("d", (by_time[t][j] for t in ordered)) for j, field in enumerate(HOURLY_FIELDS)}
+        series = _Series(array("d", ordered), columns, utc_offset, source, self._clock() + self.ttl_seconds)
+
+        with self._lock:
+            self._series[location] = series
+            self._series.move_to_end(location)
+            while len(self._series) > self.max_locations:
+                self._series.popitem(last=False)
+
+    def at(self, location: Hashable, when: float) -> Optional[Dict[str, Any]]:
+        """
+        Weather at an arbitrary time
+
+        Args:
+            location: Location key
+            when: UTC epoch seconds
+
+        Returns:
+            {"time", HOURLY_FIELDS..., "source"} with None for unknown fields,
+            or None if no live series covers the time
+        """
+        series = self._live(location)
+        point = self._interpolate(series, when) if series is not None else None
+        buffered_metrics.increment_counter(
+            "weather_hourly_lookups",
+            labels={"cache": self.name, "result": "hit" if point is not None else "miss"}
+        )
+        return point
+
+    def _interpolate(self, series: _Series, when: float) -> Optional[Dict[str, Any]]:
+        times = series.times
+        hi = bisect_left(times, when)
+        if hi < len(times) and times[hi] == when:
+            lo = hi
+        else:
+            lo = hi - 1
+            if lo < 0 or hi >= len(times) or times[hi] - times[lo] > self.max_gap:
+                return None
+
+        weight = 0.0 if lo == hi else (when - times[lo]) / (times[hi] - times[lo])
+        nearest = hi if weight >= 0.5 else lo
+        point: Dict[str, Any] = {"time": when, "source": series.source}
+        for field in HOURLY_FIELDS:
+            column = series.columns[field]
+            if field in INTERPOLATED_FIELDS:
+                before, after = _value(column[lo]), _value(column[hi])
+                if before is None or after is None:
+                    point[field] = before if after is None else after
+                else:
+                    point[field] = before + (after - before) * weight
+            else:
+                point[field] = _value(column[nearest])
+        if point["coco"] is not None:
+            point["coco"] = int(point["coco"])
+        return point
+
+    def values(self, location: Hashable, start: float, end: float, field: str) -> List[float]:
+        """Known values of one field for the hours in [start, end] (UTC epoch seconds)"""
+        series = self._live(location)
+        if series is None:
+            return []
+        lo, hi = bisect_left(series.times, start), bisect_right(series.times, end)
+        return [v for v in series.columns[field][lo:hi] if not math.isnan(v)]
+
+    def utc_offset(self, location: Hashable) -> Optional[int]:
+        """The location's UTC offset in seconds, if a provider reported it"""
+        series = self._live(location)
+        return series.utc_offset if series is not None else None
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def __len__(self) -> int:
+        return len(self._series)
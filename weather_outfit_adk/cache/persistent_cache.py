@@ -0,0 +1,229 @@
+"""
+Persistent Weather Cache
+
+SQLite-backed second tier behind WeatherCache so cached weather survives
+restarts and deploys.
+
+- WAL journal: readers never block the writer, and several processes on
+  a host can share one file
+- Wall-clock expiry so TTLs stay meaningful across restarts
+- Periodic TTL-aware compaction: expired rows are deleted first, then the
+  rows closest to expiry until the table is back under its size bound
+- load_live() returns the freshest rows for warm-loading the memory tier
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weather_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+_EXPIRY_INDEX = "CREATE INDEX IF NOT EXISTS weather_cache_expires ON weather_cache (expires_at)"
+
+
+def _encode_key(key: Hashable) -> str:
+    return json.dumps(list(key) if isinstance(key, tuple) else key)
+
+
+def _decode_key(raw: str) -> Hashable:
+    key = json.loads(raw)
+    return tuple(key) if isinstance(key, list) else key
+
+
+class PersistentCache:
+    """TTL key/value store in a SQLite database running in WAL mode."""
+
+    def __init__(
+        self,
+        path: str,
+        name: str = "weather_disk",
+        max_entries: int = 100000,
+        compact_every: int = 500,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the store, creating the database file if needed
+
+        Args:
+            path: SQLite database path
+            name: Cache name used as the metrics label
+            max_entries: Row count kept after compaction
+            compact_every: Run compaction after this many writes
+            clock: Wall-clock time source (overridable for tests)
+        """
+        self.path = path
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self.compact_every = max(1, compact_every)
+        self._clock = clock
+        self._local = threading.local()
+        self._writes_lock = threading.Lock()
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(_SCHEMA)
+        conn.execute(_EXPIRY_INDEX)
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared across threads; keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a live row
+
+        Args:
+            key: Cache key (strings and tuples of JSON-serializable values)
+
+        Returns:
+            Tuple of (value, remaining TTL in seconds), or None on miss/expiry
+        """
+        try:
+            row = self._conn().execute(
+                "SELECT value, expires_at FROM weather_cache WHERE key = ?",
+                (_encode_key(key),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️  Persistent cache read failed: {e}")
+            return None
+
+        remaining = row[1] - self._clock() if row else 0.0
+        if row is None or remaining <= 0:
+            self._record("miss")
+            return None
+
+        self._record("hit")
+        return json.loads(row[0]), remaining
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: float):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Time-to-live from now
+        """
+        now = self._clock()
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO weather_cache (key, value, expires_at, updated_at) VALUES (?, ?, ?, ?)",
+                (_encode_key(key), json.dumps(value, default=str), now + ttl_seconds, now)
+            )
+            conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️  Persistent cache write failed: {e}")
+            return
+
+        with self._writes_lock:
+            self._writes += 1
+            due = self._writes % self.compact_every == 0
+        if due:
+            self.compact()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a row. Returns True if it was present."""
+        conn = self._conn()
+        cursor = conn.execute("DELETE FROM weather_cache WHERE key = ?", (_encode_key(key),))
+        conn.commit()
+        return cursor.rowcount > 0
+
+    def clear(self):
+        """Remove all rows."""
+        conn = self._conn()
+        conn.execute("DELETE FROM weather_cache")
+        conn.commit()
+
+    def compact(self) -> int:
+        """
+        Drop expired rows, then trim to max_entries (rows closest to expiry go first)
+
+        Returns:
+            Number of rows removed
+        """
+        conn = self._conn()
+        try:
+            removed = conn.execute(
+                "DELETE FROM weather_cache WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+            removed += conn.execute(
+                "DELETE FROM weather_cache WHERE key IN ("
+                " SELECT key FROM weather_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,)
+            ).rowcount
+            conn.commit()
+            # Keep the WAL file from growing without bound
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            print(f"⚠️  Persistent cache compaction failed: {e}")
+            return 0
+
+        if removed:
+            buffered_metrics.increment_counter(
+                "weather_cache_evictions", value=removed, labels={"cache": self.name, "reason": "compaction"}
+            )
+        return removed
+
+    def load_live(self, limit: int) -> List[Tuple[Hashable, Any, float]]:
+        """
+        Most recently written live rows, for warm-loading a memory cache
+
+        Args:
+            limit: Maximum number of rows returned
+
+        Returns:
+            List of (key, value, remaining TTL in seconds)
+        """
+        now = self._clock()
+        rows = self._conn().execute(
+            "SELECT key, value, expires_at FROM weather_cache WHERE expires_at > ? "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (now, max(0, limit))
+        ).fetchall()
+        return [(_decode_key(key), json.loads(value), expires_at - now) for key, value, expires_at in rows]
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter("weather_cache_requests", labels={"cache": self.name, "result": result})
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM weather_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Row count and on-disk size"""
+        size = 0
+        for suffix in ("", "-wal"):
+            try:
+                size += os.path.getsize(self.path + suffix)
+            except OSError:
+                pass
+        return {"entries": len(self), "max_entries": self.max_entries, "file_bytes": size}
+
+    def close(self):
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
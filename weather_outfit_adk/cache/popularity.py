@@ -0,0 +1,154 @@
+"""
+Key Popularity Tracking
+
+Approximate per-key access frequencies in constant memory:
+
+- CountMinSketch: depth x width counters with conservative update; an
+  estimate never undercounts and overcounts by at most ~e/width of the
+  total traffic with probability 1 - e^-depth
+- TopK: the k keys with the highest estimates (plus a payload per key,
+  e.g. the city spelling to refetch with)
+- decay() halves every counter so popularity follows recent traffic
+"""
+
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class CountMinSketch:
+    """Count-min sketch with conservative update."""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Initialize the sketch
+
+        Args:
+            width: Counters per row (error ~ total / width)
+            depth: Number of rows / hash functions (confidence)
+        """
+        self.width = max(1, width)
+        self.depth = max(1, depth)
+        self._rows: List[List[int]] = [[0] * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _cells(self, key: Hashable) -> List[int]:
+        return [hash((row, key)) % self.width for row in range(self.depth)]
+
+    def add(self, key: Hashable, count: int = 1) -> int:
+        """
+        Count occurrences of key
+
+        Returns:
+            The key's new estimate
+        """
+        cells = self._cells(key)
+        # Conservative update: only raise counters that are below the new estimate
+        estimate = min(self._rows[row][cell] for row, cell in enumerate(cells)) + count
+        for row, cell in enumerate(cells):
+            if self._rows[row][cell] < estimate:
+                self._rows[row][cell] = estimate
+        self.total += count
+        return estimate
+
+    def estimate(self, key: Hashable) -> int:
+        return min(self._rows[row][cell] for row, cell in enumerate(self._cells(key)))
+
+    def decay(self):
+        """Halve every counter."""
+        for row in self._rows:
+            for i, value in enumerate(row):
+                row[i] = value >> 1
+        self.total >>= 1
+
+
+class TopK:
+    """The k keys with the highest counts seen so far."""
+
+    def __init__(self, k: int = 100):
+        self.k = max(1, k)
+        self._items: Dict[Hashable, Tuple[int, Any]] = {}
+        self._min_key: Optional[Hashable] = None
+
+    def _find_min(self) -> Hashable:
+        if self._min_key is None or self._min_key not in self._items:
+            self._min_key = min(self._items, key=lambda k: self._items[k][0])
+        return self._min_key
+
+    def offer(self, key: Hashable, count: int, payload: Any = None):
+        """Record key's current count, admitting it if it beats the smallest member."""
+        if key in self._items:
+            self._items[key] = (count, payload)
+            if key == self._min_key:
+                self._min_key = None
+            return
+
+        if len(self._items) < self.k:
+            self._items[key] = (count, payload)
+            self._min_key = None
+            return
+
+        smallest = self._find_min()
+        if count > self._items[smallest][0]:
+            del self._items[smallest]
+            self._items[key] = (count, payload)
+            self._min_key = None
+
+    def items(self) -> List[Tuple[Hashable, int, Any]]:
+        """Members as (key, count, payload), highest count first"""
+        ranked = [(key, count, payload) for key, (count, payload) in self._items.items()]
+        ranked.sort(key=lambda item: -item[1])
+        return ranked
+
+    def decay(self):
+        """Halve member counts, dropping members that reach zero."""
+        self._items = {key: (count >> 1, payload) for key, (count, payload) in self._items.items() if count > 1}
+        self._min_key = None
+
+
+class PopularityTracker:
+    """Thread-safe count-min sketch + top-K over access keys."""
+
+    def __init__(self, k: int = 100, width: int = 2048, depth: int = 4):
+        """
+        Initialize the tracker
+
+        Args:
+            k: Number of most popular keys kept
+            width: Count-min sketch width
+            depth: Count-min sketch depth
+        """
+        self._lock = threading.Lock()
+        self.sketch = CountMinSketch(width, depth)
+        self.top = TopK(k)
+
+    def record(self, key: Hashable, payload: Any = None) -> int:
+        """
+        Count one access
+
+        Args:
+            key: Access key
+            payload: Data kept with the key while it is in the top-K
+
+        Returns:
+            The key's estimated access count
+        """
+        with self._lock:
+            estimate = self.sketch.add(key)
+            self.top.offer(key, estimate, payload)
+        return estimate
+
+    def estimate(self, key: Hashable) -> int:
+        with self._lock:
+            return self.sketch.estimate(key)
+
+    def top_k(self, n: Optional[int] = None) -> List[Tuple[Hashable, int, Any]]:
+        """Most popular keys as (key, estimated count, payload)"""
+        with self._lock:
+            ranked = self.top.items()
+        return ranked if n is None else ranked[:n]
+
+    def decay(self):
+        """Halve all counts so older traffic fades out."""
+        with self._lock:
+            self.sketch.decay()
+            self.top.decay()
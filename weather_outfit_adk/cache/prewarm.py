@@ -0,0 +1,236 @@
+"""
+Popularity-driven Prewarming
+
+Fills the cache with the most requested keys before traffic peaks, so the
+first requests of the morning are hits instead of upstream calls:
+
+- record(): every lookup counts its popularity key in a count-min sketch
+  and top-K (PopularityTracker)
+- run_once(): maps the top-K keys to cache keys, skips entries that are
+  still fresh and reloads the rest as a paced batch
+- A daemon thread runs it every interval_seconds, limited to the
+  lead_minutes before each configured peak hour (any time if none)
+- note_hit(): cache hits on prewarmed entries are counted separately,
+  giving the prewarmer's share of all hits
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+from .popularity import PopularityTracker
+
+Loader = Callable[[], object]
+# Popularity key + payload -> (cache key, loader); None if the key can't be prewarmed
+Target = Callable[[Hashable, Any], Optional[Tuple[Hashable, Loader]]]
+
+
+class Prewarmer:
+    """Scheduled prefetch of the most popular cache keys."""
+
+    def __init__(
+        self,
+        target: Target,
+        ttl_remaining: Callable[[Hashable], Optional[float]],
+        name: str = "weather",
+        top_k: int = 200,
+        min_hits: int = 3,
+        interval_seconds: float = 900.0,
+        peak_hours: Iterable[int] = (),
+        lead_minutes: float = 45.0,
+        rate_per_second: float = 2.0,
+        concurrency: int = 2,
+        entry_ttl_seconds: float = 1800.0,
+        decay_seconds: float = 86400.0,
+        tracker: Optional[PopularityTracker] = None,
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Initialize the prewarmer (the scheduler thread starts on first record)
+
+        Args:
+            target: Maps a popularity key and its payload to (cache key, loader)
+            ttl_remaining: Returns seconds until a cache key expires (None if absent)
+            name: Name used as the metrics label
+            top_k: Number of most popular keys tracked and prewarmed
+            min_hits: Minimum (decayed) access count for a key to be prewarmed
+            interval_seconds: Seconds between prewarm runs; entries with more
+                TTL than this left are skipped
+            peak_hours: Local hours (0-23) when traffic peaks; empty runs all day
+            lead_minutes: How long before each peak hour runs are allowed
+            rate_per_second: Maximum reloads started per second
+            concurrency: Reloads running at once
+            entry_ttl_seconds: Cache TTL, used to attribute hits to prewarmed entries
+            decay_seconds: Halve popularity counts this often
+            tracker: Popularity tracker (a new one by default)
+            clock: Monotonic time source (overridable for tests)
+            now: Local wall-clock time source (overridable for tests)
+        """
+        self.target = target
+        self.ttl_remaining = ttl_remaining
+        self.name = name
+        self.min_hits = min_hits
+        self.interval_seconds = interval_seconds
+        self.peak_hours = sorted({int(h) % 24 for h in peak_hours})
+        self.lead_minutes = lead_minutes
+        self.rate_per_second = rate_per_second
+        self.entry_ttl_seconds = entry_ttl_seconds
+        self.decay_seconds = decay_seconds
+        self.tracker = tracker or PopularityTracker(k=top_k)
+        self.top_k = top_k
+        self._clock = clock
+        self._now = now
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix=f"{name}-prewarm")
+        self._lock = threading.Lock()
+        self._prewarmed: Dict[Hashable, float] = {}
+        self._hits = {"prewarmed": 0, "organic": 0}
+        self._last_run: Optional[float] = None
+        self._last_decay = clock()
+        self._scheduler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def record(self, key: Hashable, payload: Any = None):
+        """
+        Count an access
+
+        Args:
+            key: Popularity key (e.g. location + day offset)
+            payload: Data target() needs to rebuild the request (e.g. the city name)
+        """
+        self.tracker.record(key, payload)
+        if self._scheduler is None:
+            self._start_scheduler()
+
+    def note_hit(self, cache_key: Hashable):
+        """Count a cache hit, attributing it to prewarming if the entry was prewarmed."""
+        with self._lock:
+            expires = self._prewarmed.get(cache_key)
+            if expires is not None and expires <= self._clock():
+                del self._prewarmed[cache_key]
+                expires = None
+            source = "prewarmed" if expires is not None else "organic"
+            self._hits[source] += 1
+        buffered_metrics.increment_counter("weather_prewarm_hits", labels={"cache": self.name, "source": source})
+
+    def in_window(self) -> bool:
+        """True if a prewarm run is allowed now (within lead_minutes before a peak hour)."""
+        if not self.peak_hours:
+            return True
+        now = self._now()
+        minute_of_day = now.hour * 60 + now.minute
+        for hour in self.peak_hours:
+            until_peak = (hour * 60 - minute_of_day) % (24 * 60)
+            if 0 < until_peak <= self.lead_minutes:
+                return True
+        return False
+
+    def due(self) -> bool:
+        """True if the scheduler should run now."""
+        if self._last_run is not None and self._clock() - self._last_run < self.interval_seconds:
+            return False
+        return self.in_window()
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Prewarm the most popular keys whose entries are missing or expire before the next run
+
+        Returns:
+            Counts of keys fetched, skipped as fresh, and failed
+        """
+        self._last_run = self._clock()
+        counts = {"fetched": 0, "fresh": 0, "failed": 0}
+
+        batch = []
+        for key, hits, payload in self.tracker.top_k(self.top_k):
+            if hits < self.min_hits:
+                break
+            planned = self.target(key, payload)
+            if planned is None:
+                continue
+            cache_key, loader = planned
+            remaining = self.ttl_remaining(cache_key)
+            if remaining is not None and remaining > self.interval_seconds:
+                counts["fresh"] += 1
+                continue
+            batch.append((cache_key, loader))
+
+        futures = []
+        spacing = 1.0 / self.rate_per_second if self.rate_per_second > 0 else 0.0
+        for i, (cache_key, loader) in enumerate(batch):
+            if i and spacing and self._stop.wait(spacing):
+                break
+            futures.append((cache_key, self._executor.submit(loader)))
+
+        for cache_key, future in futures:
+            try:
+                stored = future.result()
+            except Exception as e:
+                print(f"⚠️  Prewarm failed for {cache_key}: {e}")
+                stored = False
+            if stored is False:
+                counts["failed"] += 1
+                continue
+            counts["fetched"] += 1
+            with self._lock:
+                self._prewarmed[cache_key] = self._clock() + self.entry_ttl_seconds
+
+        for result, count in counts.items():
+            if count:
+                buffered_metrics.increment_counter(
+                    "weather_prewarm_fetches", value=count, labels={"cache": self.name, "result": result}
+                )
+        self._expire_marks()
+        return counts
+
+    def _expire_marks(self):
+        now = self._clock()
+        with self._lock:
+            for key in [k for k, expires in self._prewarmed.items() if expires <= now]:
+                del self._prewarmed[key]
+
+    def tick(self):
+        """One scheduler step: decay popularity when due, then prewarm when due."""
+        if self._clock() - self._last_decay >= self.decay_seconds:
+            self._last_decay = self._clock()
+            self.tracker.decay()
+        if self.due():
+            self.run_once()
+
+    def _start_scheduler(self):
+        with self._lock:
+            if self._scheduler is not None:
+                return
+            self._scheduler = threading.Thread(target=self._loop, name=f"{self.name}-prewarm", daemon=True)
+        self._scheduler.start()
+
+    def _loop(self):
+        # Check often enough not to miss a short window before a peak
+        while not self._stop.wait(min(self.interval_seconds, 60.0)):
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"⚠️  Prewarm run failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit attribution and tracked popularity"""
+        with self._lock:
+            hits = dict(self._hits)
+            prewarmed = len(self._prewarmed)
+        total = hits["prewarmed"] + hits["organic"]
+        return {
+            "prewarmed_entries": prewarmed,
+            "prewarmed_hits": hits["prewarmed"],
+            "organic_hits": hits["organic"],
+            "hit_contribution": hits["prewarmed"] / total if total else 0.0,
+            "tracked_accesses": self.tracker.sketch.total,
+        }
+
+    def stop(self):
+        """Stop the scheduler thread and wait for running reloads."""
+        self._stop.set()
+        self._executor.shutdown(wait=True)
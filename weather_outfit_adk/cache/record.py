@@ -0,0 +1,180 @@
+"""
+Weather Record
+
+Compact representation of one weather result, used inside the weather
+tools and caches instead of per-call dicts:
+
+- __slots__ instead of a per-instance dict
+- Timestamps as epoch seconds (plus the UTC offset for aware times)
+  instead of ISO strings, so nothing is parsed on cache hits; the ISO
+  strings for the tool dict are rendered once, on the first to_dict()
+- Interned condition/source/error_type strings, shared by every record
+- A positional JSON form (to_json) for the shared/persistent tiers
+
+Records are treated as immutable once cached (the cache shares them
+between readers instead of copying); use replace() to derive a new one.
+to_dict() builds the tool-facing dict at the boundary.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+_CORE_FIELDS = ("temperature", "feels_like", "condition", "rain_chance", "wind_speed", "humidity")
+_OPTIONAL_FIELDS = ("city", "source", "error", "error_type", "note")
+_INTERNED = ("condition", "source", "error_type")
+_FIELDS = _CORE_FIELDS + ("timestamp", "utc_offset") + _OPTIONAL_FIELDS + ("cached_at",)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _to_epoch(moment: Optional[Union[datetime, str, float]]) -> Tuple[Optional[float], Optional[int]]:
+    """(epoch seconds, UTC offset in seconds or None for naive times)"""
+    if moment is None:
+        return None, None
+    if isinstance(moment, (int, float)):
+        return float(moment), None
+    if isinstance(moment, str):
+        try:
+            moment = datetime.fromisoformat(moment.replace("Z", "+00:00"))
+        except ValueError:
+            return None, None
+    offset = moment.utcoffset()
+    return moment.timestamp(), int(offset.total_seconds()) if offset is not None else None
+
+
+def _to_iso(epoch: Optional[float], offset: Optional[int]) -> Optional[str]:
+    if epoch is None:
+        return None
+    if offset is None:
+        return datetime.fromtimestamp(epoch).isoformat()
+    return datetime.fromtimestamp(epoch, timezone(timedelta(seconds=offset))).isoformat()
+
+
+class WeatherRecord:
+    """One weather result (°F, mph, %), with epoch timestamps."""
+
+    __slots__ = _FIELDS + ("_iso",)
+
+    def __init__(
+        self,
+        temperature: Optional[float] = None,
+        feels_like: Optional[float] = None,
+        condition: Optional[str] = None,
+        rain_chance: Optional[float] = None,
+        wind_speed: Optional[float] = None,
+        humidity: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        utc_offset: Optional[int] = None,
+        city: Optional[str] = None,
+        source: Optional[str] = None,
+        error: Optional[str] = None,
+        error_type: Optional[str] = None,
+        note: Optional[str] = None,
+        cached_at: Optional[float] = None
+    ):
+        """
+        Initialize the record
+
+        Args:
+            timestamp: Epoch seconds of the time the weather is for
+            utc_offset: UTC offset (seconds) the timestamp was given in, None if naive/local
+            cached_at: Epoch seconds when the record was cached
+            (other fields as in the tool dict)
+        """
+        self.temperature = temperature
+        self.feels_like = feels_like
+        self.condition = _intern(condition)
+        self.rain_chance = rain_chance
+        self.wind_speed = wind_speed
+        self.humidity = humidity
+        self.timestamp = timestamp
+        self.utc_offset = utc_offset
+        self.city = city
+        self.source = _intern(source)
+        self.error = error
+        self.error_type = _intern(error_type)
+        self.note = note
+        self.cached_at = cached_at
+        self._iso: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+    @classmethod
+    def at(cls, moment: Union[datetime, str, float, None], **fields: Any) -> "WeatherRecord":
+        """Build a record for a datetime (or ISO string) instead of epoch seconds."""
+        timestamp, utc_offset = _to_epoch(moment)
+        return cls(timestamp=timestamp, utc_offset=utc_offset, **fields)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WeatherRecord":
+        """Convert a tool-style weather dict (ISO timestamps); unknown keys are dropped."""
+        fields = {name: data.get(name) for name in _CORE_FIELDS + _OPTIONAL_FIELDS}
+        cached_at, _ = _to_epoch(data.get("cached_at"))
+        return cls.at(data.get("timestamp"), cached_at=cached_at, **fields)
+
+    @classmethod
+    def coerce(cls, value: Union["WeatherRecord", Dict[str, Any]]) -> "WeatherRecord":
+        """Return value as a record (dicts are converted)."""
+        return value if isinstance(value, cls) else cls.from_dict(value)
+
+    def replace(self, **changes: Any) -> "WeatherRecord":
+        """Copy of the record with some fields changed."""
+        copy = WeatherRecord.__new__(WeatherRecord)
+        for name in _FIELDS:
+            setattr(copy, name, changes.pop(name, getattr(self, name)))
+        copy._iso = None
+        if changes:
+            raise TypeError(f"Unknown WeatherRecord fields: {', '.join(changes)}")
+        for name in _INTERNED:
+            setattr(copy, name, _intern(getattr(copy, name)))
+        return copy
+
+    def to_dict(self, **extra: Any) -> Dict[str, Any]:
+        """
+        Tool-facing dict: core fields always, optional ones only when set
+
+        Args:
+            **extra: Additional keys (e.g. from_cache=True, or city=... to relabel)
+        """
+        iso = self._iso
+        if iso is None:
+            iso = self._iso = (_to_iso(self.timestamp, self.utc_offset), _to_iso(self.cached_at, None))
+        weather: Dict[str, Any] = {
+            "temperature": self.temperature,
+            "feels_like": self.feels_like,
+            "condition": self.condition,
+            "rain_chance": self.rain_chance,
+            "wind_speed": self.wind_speed,
+            "humidity": self.humidity,
+            "timestamp": iso[0],
+        }
+        for name in _OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                weather[name] = value
+        if iso[1] is not None:
+            weather["cached_at"] = iso[1]
+        weather.update(extra)
+        return weather
+
+    def to_json(self) -> List[Any]:
+        """Positional form (field order) for the JSON-serialized cache tiers."""
+        return [getattr(self, name) for name in _FIELDS]
+
+    @classmethod
+    def from_json(cls, value: Union[List[Any], Dict[str, Any]]) -> "WeatherRecord":
+        """Inverse of to_json; also accepts dicts written before records existed."""
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls(*value)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, WeatherRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _FIELDS)
+
+    __hash__ = None  # Mutable until cached
+
+    def __repr__(self) -> str:
+        return f"WeatherRecord(city={self.city!r}, temperature={self.temperature!r}, condition={self.condition!r})"
@@ -0,0 +1,190 @@
+"""
+Background Refresh
+
+Keeps popular weather entries fresh without making requests wait:
+
+- refresh(): one background reload per key at a time, on a small worker
+  pool (used when a stale entry is served inside its grace window)
+- touch() + scan_once(): access counts per key; a daemon thread
+  periodically reloads the hottest keys that are about to expire, so
+  they never go stale in the first place. Counts are halved on every
+  scan so popularity tracks recent traffic.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, List, Optional, Set, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+
+Loader = Callable[[], object]
+
+
+class _Tracked:
+    __slots__ = ("hits", "loader")
+
+    def __init__(self, loader: Loader):
+        self.hits = 0
+        self.loader = loader
+
+
+class BackgroundRefresher:
+    """Deduplicated background reloads plus refresh-ahead of hot keys."""
+
+    def __init__(
+        self,
+        name: str = "weather",
+        ttl_remaining: Optional[Callable[[Hashable], Optional[float]]] = None,
+        max_workers: int = 2,
+        ahead_seconds: float = 120.0,
+        scan_interval: float = 30.0,
+        hot_keys: int = 50,
+        min_hits: int = 3,
+        max_tracked: int = 10000
+    ):
+        """
+        Initialize the refresher (the scan thread starts on first touch)
+
+        Args:
+            name: Name used as the metrics label
+            ttl_remaining: Returns seconds until a key expires (negative if
+                stale, None if absent); required for refresh-ahead
+            max_workers: Background reload threads
+            ahead_seconds: Refresh hot keys expiring within this many seconds
+            scan_interval: Seconds between hot-key scans
+            hot_keys: Number of most-accessed keys considered per scan
+            min_hits: Minimum (decayed) accesses for a key to count as hot
+            max_tracked: Maximum number of keys with access counts
+        """
+        self.name = name
+        self.ttl_remaining = ttl_remaining
+        self.ahead_seconds = ahead_seconds
+        self.scan_interval = scan_interval
+        self.hot_keys = hot_keys
+        self.min_hits = min_hits
+        self.max_tracked = max(1, max_tracked)
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=f"{name}-refresh")
+        self._lock = threading.Lock()
+        self._pending: Set[Hashable] = set()
+        self._tracked: "OrderedDict[Hashable, _Tracked]" = OrderedDict()
+        self._scanner: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def refresh(self, key: Hashable, loader: Loader) -> bool:
+        """
+        Reload a key in the background unless a reload is already pending
+
+        Args:
+            key: Cache key being refreshed
+            loader: Zero-argument function that fetches and stores the new value
+
+        Returns:
+            True if a reload was scheduled
+        """
+        with self._lock:
+            if key in self._pending:
+                self._record("coalesced")
+                return False
+            self._pending.add(key)
+
+        self._record("scheduled")
+        self._executor.submit(self._run, key, loader)
+        return True
+
+    def _run(self, key: Hashable, loader: Loader):
+        try:
+            loader()
+            self._record("succeeded")
+        except Exception as e:
+            print(f"⚠️  Background refresh failed for {key}: {e}")
+            self._record("failed")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def touch(self, key: Hashable, loader: Loader):
+        """
+        Count an access to key and remember how to reload it
+
+        Args:
+            key: Cache key that was requested
+            loader: Zero-argument function that fetches and stores the value
+        """
+        with self._lock:
+            tracked = self._tracked.get(key)
+            if tracked is None:
+                tracked = _Tracked(loader)
+                self._tracked[key] = tracked
+                if len(self._tracked) > self.max_tracked:
+                    self._tracked.popitem(last=False)
+            else:
+                tracked.loader = loader
+                self._tracked.move_to_end(key)
+            tracked.hits += 1
+
+        if self._scanner is None and self.ttl_remaining is not None:
+            self._start_scanner()
+
+    def hottest(self, n: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """Most-accessed keys with their decayed access counts"""
+        with self._lock:
+            counts = [(key, t.hits) for key, t in self._tracked.items()]
+        counts.sort(key=lambda item: -item[1])
+        return counts[:self.hot_keys if n is None else n]
+
+    def scan_once(self) -> int:
+        """
+        Refresh hot keys that expire within ahead_seconds, then decay counts
+
+        Returns:
+            Number of refreshes scheduled
+        """
+        if self.ttl_remaining is None:
+            return 0
+
+        scheduled = 0
+        for key, hits in self.hottest():
+            if hits < self.min_hits:
+                break
+            remaining = self.ttl_remaining(key)
+            if remaining is not None and remaining <= self.ahead_seconds:
+                with self._lock:
+                    tracked = self._tracked.get(key)
+                if tracked is not None and self.refresh(key, tracked.loader):
+                    scheduled += 1
+
+        with self._lock:
+            for key in [k for k, t in self._tracked.items() if t.hits <= 1]:
+                del self._tracked[key]
+            for tracked in self._tracked.values():
+                tracked.hits //= 2
+        return scheduled
+
+    def _start_scanner(self):
+        with self._lock:
+            if self._scanner is not None:
+                return
+            self._scanner = threading.Thread(target=self._scan_loop, name=f"{self.name}-refresh-scan", daemon=True)
+        self._scanner.start()
+
+    def _scan_loop(self):
+        while not self._stop.wait(self.scan_interval):
+            try:
+                self.scan_once()
+            except Exception as e:
+                print(f"⚠️  Refresh scan failed: {e}")
+
+    def pending(self) -> int:
+        """Number of reloads queued or running"""
+        with self._lock:
+            return len(self._pending)
+
+    def stop(self):
+        """Stop the scan thread and wait for running reloads."""
+        self._stop.set()
+        self._executor.shutdown(wait=True)
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter("weather_cache_refreshes", labels={"cache": self.name, "result": result})
@@ -0,0 +1,131 @@
+"""
+Daily Series Cache
+
+Location-keyed cache of Meteostat daily rows. The provider fetches a
+whole window of days (e.g. ±7 days around the requested date) in one
+upstream call and stores every row here, so later requests for any date
+inside the window are answered locally.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+
+# (lat, lon, altitude) rounded so equivalent coordinates share a window
+LocationKey = Tuple[float, float, int]
+
+
+def location_key(lat: float, lon: float, alt: int) -> LocationKey:
+    return (round(lat, 4), round(lon, 4), int(alt))
+
+
+class _Window:
+    __slots__ = ("start", "end", "rows", "expires_at")
+
+    def __init__(self, start: date, end: date, rows: Dict[date, Dict[str, Any]], expires_at: float):
+        self.start = start
+        self.end = end
+        self.rows = rows
+        self.expires_at = expires_at
+
+
+class DailySeriesCache:
+    """Thread-safe LRU cache of per-location daily observation windows."""
+
+    MISSING = object()  # Date is inside a cached window but upstream had no row for it
+
+    def __init__(
+        self,
+        name: str = "daily_series",
+        max_locations: int = 2000,
+        ttl_seconds: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            name: Cache name used as the metrics label
+            max_locations: Maximum number of location windows kept
+            ttl_seconds: Lifetime of a fetched window
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.name = name
+        self.max_locations = max(1, max_locations)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: "OrderedDict[Hashable, _Window]" = OrderedDict()
+
+    def get(self, location: Hashable, day: date) -> Any:
+        """
+        Look up the row for one day
+
+        Args:
+            location: Location key (see location_key)
+            day: Date to look up
+
+        Returns:
+            The row dict, DailySeriesCache.MISSING if the day is covered but
+            has no data, or None if no live window covers the day
+        """
+        with self._lock:
+            window = self._windows.get(location)
+            if window is not None and window.expires_at <= self._clock():
+                del self._windows[location]
+                window = None
+            if window is not None:
+                self._windows.move_to_end(location)
+
+        if window is None or not (window.start <= day <= window.end):
+            self._record("miss")
+            return None
+
+        row = window.rows.get(day)
+        if row is None:
+            self._record("gap")
+            return self.MISSING
+
+        self._record("hit")
+        return dict(row)
+
+    def put(self, location: Hashable, start: date, end: date, rows: Iterable[Dict[str, Any]]):
+        """
+        Store a fetched window, replacing any previous window for the location
+
+        Args:
+            location: Location key (see location_key)
+            start: First day covered by the fetch
+            end: Last day covered by the fetch (inclusive)
+            rows: Meteostat daily rows, each with a "date" field
+        """
+        by_day: Dict[date, Dict[str, Any]] = {}
+        for row in rows:
+            try:
+                by_day[date.fromisoformat(str(row["date"])[:10])] = dict(row)
+            except (KeyError, ValueError):
+                continue
+
+        window = _Window(start, end, by_day, self._clock() + self.ttl_seconds)
+        with self._lock:
+            self._windows[location] = window
+            self._windows.move_to_end(location)
+            while len(self._windows) > self.max_locations:
+                self._windows.popitem(last=False)
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter(
+            "weather_series_lookups",
+            labels={"cache": self.name, "result": result}
+        )
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -0,0 +1,312 @@
+"""
+Shared-memory Weather Cache
+
+Fixed-size hash table in a memory-mapped file (normally under /dev/shm)
+shared by every process on a host: gunicorn workers, the A2A services
+and the frontend all read and fill the same entries, so one upstream
+fetch serves all of them.
+
+- Open addressing with a short linear probe window; a full window
+  replaces the entry closest to expiry
+- Entries are replaced atomically: writers lock the key's probe window
+  (fcntl byte-range lock across processes, a mutex across threads) and
+  bump a per-slot sequence counter around the write (seqlock); readers
+  take no locks and retry if the counter was odd or changed while they read
+- Wall-clock expiry so all processes agree on freshness
+- Optional backing tier (PersistentCache) consulted on misses
+
+POSIX only (fcntl); SHARED_CACHE_AVAILABLE is False elsewhere.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+try:
+    import fcntl
+    SHARED_CACHE_AVAILABLE = True
+except ImportError:
+    SHARED_CACHE_AVAILABLE = False
+
+from ..monitoring.metrics import buffered_metrics
+from .persistent_cache import _decode_key, _encode_key
+
+if TYPE_CHECKING:
+    from .persistent_cache import PersistentCache
+
+_MAGIC = b"WXSHM001"
+_HEADER = struct.Struct("<8sII")  # magic, slot count, slot size
+_HEADER_SIZE = 64
+# seq, key hash, expires_at, updated_at, key length, value length
+_SLOT_HEADER = struct.Struct("<QQddHI")
+_PROBE = 8
+_READ_RETRIES = 4
+
+
+def _key_hash(encoded_key: bytes) -> int:
+    # Python's hash() is salted per process; the table needs a stable hash.
+    # 0 marks an empty slot.
+    return int.from_bytes(hashlib.blake2b(encoded_key, digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryCache:
+    """Cross-process TTL cache in a memory-mapped hash table."""
+
+    def __init__(
+        self,
+        path: str,
+        name: str = "weather_shared",
+        slots: int = 16384,
+        slot_bytes: int = 1024,
+        clock: Callable[[], float] = time.time,
+        backing: Optional["PersistentCache"] = None
+    ):
+        """
+        Open (or create) the shared table
+
+        Args:
+            path: File backing the table (e.g. /dev/shm/weather_outfit_cache)
+            name: Cache name used as the metrics label
+            slots: Number of slots when creating the file
+            slot_bytes: Size of each slot (header + key + JSON value) when creating the file
+            clock: Wall-clock time source (overridable for tests)
+            backing: Optional persistent tier consulted on misses and written through on put
+
+        An existing file keeps its own geometry regardless of slots/slot_bytes.
+        """
+        if not SHARED_CACHE_AVAILABLE:
+            raise RuntimeError("SharedMemoryCache requires fcntl (POSIX)")
+
+        self.path = path
+        self.name = name
+        self.backing = backing
+        self._clock = clock
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # fcntl locks are per process, so threads also serialize on a mutex
+        self._write_lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self.slots, self.slot_bytes = self._init_file(max(_PROBE, slots), max(_SLOT_HEADER.size + 64, slot_bytes))
+        self._map = mmap.mmap(self._fd, _HEADER_SIZE + self.slots * self.slot_bytes)
+
+    def _init_file(self, slots: int, slot_bytes: int) -> Tuple[int, int]:
+        """Write the header if the file is new (under an exclusive lock), then read the geometry."""
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER_SIZE, 0)
+        try:
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size:
+                magic, existing_slots, existing_bytes = _HEADER.unpack(header)
+                if magic == _MAGIC:
+                    return existing_slots, existing_bytes
+            os.ftruncate(self._fd, _HEADER_SIZE + slots * slot_bytes)
+            os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, slot_bytes), 0)
+            return slots, slot_bytes
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER_SIZE, 0)
+
+    def _offset(self, slot: int) -> int:
+        return _HEADER_SIZE + slot * self.slot_bytes
+
+    def _read_slot(self, slot: int) -> Optional[Tuple[int, float, float, bytes, bytes]]:
+        """Consistent snapshot of a slot: (key hash, expires_at, updated_at, key, value)."""
+        offset = self._offset(slot)
+        for _ in range(_READ_RETRIES):
+            seq, key_hash, expires_at, updated_at, key_len, value_len = _SLOT_HEADER.unpack_from(self._map, offset)
+            if seq & 1:
+                continue  # Writer in progress
+            if key_hash == 0:
+                return None
+            start = offset + _SLOT_HEADER.size
+            key = self._map[start:start + key_len]
+            value = self._map[start + key_len:start + key_len + value_len]
+            if _SLOT_HEADER.unpack_from(self._map, offset)[0] == seq:
+                return key_hash, expires_at, updated_at, key, value
+        return None
+
+    def _write_slot(self, slot: int, key_hash: int, expires_at: float, key: bytes, value: bytes):
+        """Replace a slot's contents; caller holds the window lock."""
+        offset = self._offset(slot)
+        seq = _SLOT_HEADER.unpack_from(self._map, offset)[0]
+        struct.pack_into("<Q", self._map, offset, seq + 1)
+        start = offset + _SLOT_HEADER.size
+        self._map[start:start + len(key) + len(value)] = key + value
+        _SLOT_HEADER.pack_into(
+            self._map, offset, seq + 2, key_hash, expires_at, self._clock(), len(key), len(value)
+        )
+
+    def _probe(self, key_hash: int) -> range:
+        # Windows never wrap, so each one is a single contiguous lock range
+        first = key_hash % (self.slots - _PROBE + 1)
+        return range(first, first + _PROBE)
+
+    @contextmanager
+    def _locked(self, window: range):
+        length = len(window) * self.slot_bytes
+        with self._write_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, self._offset(window.start))
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, self._offset(window.start))
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a live entry
+
+        Args:
+            key: Cache key (strings and tuples of JSON-serializable values)
+
+        Returns:
+            Tuple of (value, remaining TTL in seconds), or None on miss/expiry
+        """
+        encoded = _encode_key(key).encode("utf-8")
+        key_hash = _key_hash(encoded)
+        now = self._clock()
+        for slot in self._probe(key_hash):
+            snapshot = self._read_slot(slot)
+            if snapshot is None or snapshot[0] != key_hash or snapshot[3] != encoded:
+                continue
+            if snapshot[1] <= now:
+                break
+            self._record("hit")
+            return json.loads(snapshot[4]), snapshot[1] - now
+
+        if self.backing is not None:
+            found = self.backing.get(key)
+            if found is not None:
+                self._put_local(key, found[0], found[1])
+                return found
+
+        self._record("miss")
+        return None
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: float):
+        """
+        Store a value, atomically replacing any previous entry for the key
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Time-to-live from now
+        """
+        self._put_local(key, value, ttl_seconds)
+        if self.backing is not None:
+            self.backing.put(key, value, ttl_seconds)
+
+    def _put_local(self, key: Hashable, value: Any, ttl_seconds: float):
+        encoded = _encode_key(key).encode("utf-8")
+        try:
+            payload = json.dumps(value, default=str).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        if _SLOT_HEADER.size + len(encoded) + len(payload) > self.slot_bytes:
+            self._evicted("oversize")
+            return
+
+        key_hash = _key_hash(encoded)
+        window = self._probe(key_hash)
+        with self._locked(window):
+            now = self._clock()
+            target = None
+            victim, victim_expiry = window.start, float("inf")
+            for slot in window:
+                snapshot = self._read_slot(slot)
+                if snapshot is not None and snapshot[0] == key_hash and snapshot[3] == encoded:
+                    target = slot
+                    break
+                if target is None and (snapshot is None or snapshot[1] <= now):
+                    target = slot
+                elif snapshot is not None and snapshot[1] < victim_expiry:
+                    victim, victim_expiry = slot, snapshot[1]
+
+            if target is None:
+                target = victim
+                self._evicted("capacity")
+            self._write_slot(target, key_hash, now + ttl_seconds, encoded, payload)
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove an entry (from both tiers). Returns True if it was present."""
+        in_backing = self.backing.delete(key) if self.backing is not None else False
+        encoded = _encode_key(key).encode("utf-8")
+        key_hash = _key_hash(encoded)
+        window = self._probe(key_hash)
+        with self._locked(window):
+            for slot in window:
+                snapshot = self._read_slot(slot)
+                if snapshot is not None and snapshot[0] == key_hash and snapshot[3] == encoded:
+                    self._write_slot(slot, 0, 0.0, b"", b"")
+                    return True
+        return in_backing
+
+    def clear(self):
+        """Remove all entries (from both tiers)."""
+        if self.backing is not None:
+            self.backing.clear()
+        with self._locked(range(self.slots)):
+            for slot in range(self.slots):
+                if self._read_slot(slot) is not None:
+                    self._write_slot(slot, 0, 0.0, b"", b"")
+
+    def compact(self) -> int:
+        """Compact the backing tier (expired slots here are reused in place)."""
+        return self.backing.compact() if self.backing is not None else 0
+
+    def load_live(self, limit: int) -> List[Tuple[Hashable, Any, float]]:
+        """
+        Most recently written live entries, topped up from the backing tier
+
+        Args:
+            limit: Maximum number of entries returned
+
+        Returns:
+            List of (key, value, remaining TTL in seconds)
+        """
+        now = self._clock()
+        live = []
+        for slot in range(self.slots):
+            snapshot = self._read_slot(slot)
+            if snapshot is not None and snapshot[1] > now:
+                live.append(snapshot)
+        live.sort(key=lambda s: -s[2])
+
+        rows = [(_decode_key(s[3].decode("utf-8")), json.loads(s[4]), s[1] - now) for s in live[:limit]]
+        if len(rows) < limit and self.backing is not None:
+            seen = {s[3] for s in live}
+            for key, value, remaining in self.backing.load_live(limit):
+                if len(rows) >= limit:
+                    break
+                if _encode_key(key).encode("utf-8") not in seen:
+                    self._put_local(key, value, remaining)
+                    rows.append((key, value, remaining))
+        return rows
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter("weather_cache_requests", labels={"cache": self.name, "result": result})
+
+    def _evicted(self, reason: str):
+        buffered_metrics.increment_counter("weather_cache_evictions", labels={"cache": self.name, "reason": reason})
+
+    def __len__(self) -> int:
+        now = self._clock()
+        snapshots = (self._read_slot(slot) for slot in range(self.slots))
+        return sum(1 for snapshot in snapshots if snapshot is not None and snapshot[1] > now)
+
+    def stats(self) -> Dict[str, Any]:
+        """Live entry count and table geometry"""
+        stats: Dict[str, Any] = {"entries": len(self), "slots": self.slots, "slot_bytes": self.slot_bytes}
+        if self.backing is not None:
+            stats["backing"] = self.backing.stats()
+        return stats
+
+    def close(self):
+        """Unmap the table and close the file."""
+        self._map.close()
+        os.close(self._fd)
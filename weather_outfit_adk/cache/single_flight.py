@@ -0,0 +1,204 @@
+"""
+Request Coalescing (single-flight)
+
+Concurrent callers asking for the same key share one in-flight call:
+the first caller (leader) runs the function, everyone else waits for
+its result instead of issuing a duplicate upstream request.
+
+SingleFlight coalesces threads; AsyncSingleFlight coalesces coroutines
+running on the same event loop.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one execution."""
+
+    def __init__(self, name: str = "weather", timeout_seconds: float = 10.0):
+        """
+        Initialize the coalescer
+
+        Args:
+            name: Name used as the metrics label
+            timeout_seconds: How long followers wait for the leader before
+                giving up and calling the function themselves
+        """
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout_seconds: Optional[float] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Run fn once per key across concurrent callers
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument function producing the result
+            timeout_seconds: Override for the follower wait timeout
+
+        Returns:
+            Tuple of (result, shared) where shared is True if the result
+            came from another caller's in-flight call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if leader:
+            return self._lead(key, call, fn), False
+
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        if not call.done.wait(timeout):
+            self._record("timeout")
+            return fn(), False
+
+        self._record("coalesced")
+        if call.error is not None:
+            raise call.error
+        return call.result, True
+
+    def _lead(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> Any:
+        self._record("leader")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter(
+            "weather_singleflight_calls",
+            labels={"flight": self.name, "result": result}
+        )
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched"""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutines for the same key into one execution."""
+
+    def __init__(self, name: str = "weather", timeout_seconds: float = 10.0):
+        """
+        Initialize the coalescer
+
+        Args:
+            name: Name used as the metrics label
+            timeout_seconds: How long followers wait for the leader before
+                giving up and awaiting the function themselves
+        """
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        # In-flight futures belong to the loop that created them
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _calls_for_loop(self) -> Dict[Hashable, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        calls = self._calls.get(loop)
+        if calls is None:
+            calls = {}
+            self._calls[loop] = calls
+        return calls
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout_seconds: Optional[float] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Await fn once per key across concurrent coroutines
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function producing the result
+            timeout_seconds: Override for the follower wait timeout
+
+        Returns:
+            Tuple of (result, shared) where shared is True if the result
+            came from another coroutine's in-flight call
+        """
+        calls = self._calls_for_loop()
+        future = calls.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            calls[key] = future
+            self._record("leader")
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                # Mark retrieved so a failure nobody waited on doesn't log a warning
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+                return result, False
+            finally:
+                calls.pop(key, None)
+
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._record("timeout")
+            return await fn(), False
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The leader was cancelled (e.g. its client went away); fetch ourselves
+            return await fn(), False
+
+        self._record("coalesced")
+        return result, True
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter(
+            "weather_singleflight_calls",
+            labels={"flight": self.name, "result": result}
+        )
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched on the running loop"""
+        return len(self._calls_for_loop())
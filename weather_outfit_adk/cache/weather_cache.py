@@ -0,0 +1,436 @@
+"""
+Bounded Weather Cache
+
+In-process LRU + TTL cache used behind get_weather_smart.
+
+- Entry and byte budgets with least-recently-used eviction
+- Per-entry TTL, expired entries are dropped on access and on purge
+- Optional stale grace window: get_stale() keeps serving an expired entry
+  for stale_seconds so callers can refresh it in the background
+- Lock striping: keys hash onto independent stripes so concurrent
+  gunicorn threads only contend when they touch the same stripe
+- Copy-on-write and copy-on-read so callers never share cached dicts
+  (immutable values such as WeatherRecord are shared as-is)
+- Optional backing tier (shared_cache.py across processes, and/or
+  persistent_cache.py across restarts): misses fall through to it, writes
+  go to both, and warm() preloads from it. encode/decode convert values
+  to and from the JSON-serializable form the backing tiers store
+- Async callers use get_async / get_stale_async / put_async: the memory
+  tier is read inline, but backing-tier reads run on a small thread pool
+  and writes (and the compaction they trigger) are queued on a single
+  writer thread, so SQLite I/O never runs on the event loop
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .persistent_cache import PersistentCache
+    from .shared_cache import SharedMemoryCache
+
+from ..monitoring.metrics import buffered_metrics
+
+# Memory-tier lookup result meaning "not in memory, try the backing tier"
+_MISS = object()
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy nested dicts/lists so cached data can't be mutated from outside."""
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
+
+
+def _estimate_size(key: Hashable, value: Any) -> int:
+    """Approximate memory cost of an entry (serialized size of key and value)."""
+    try:
+        return len(str(key)) + len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(str(key)) + len(repr(value))
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "size")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.size = size
+
+
+class _Stripe:
+    __slots__ = ("lock", "entries", "bytes")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.bytes = 0
+
+
+class WeatherCache:
+    """Thread-safe LRU + TTL cache with entry and byte budgets."""
+
+    def __init__(
+        self,
+        name: str = "weather",
+        max_entries: int = 10000,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 1800.0,
+        stripes: int = 16,
+        stale_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        backing: Optional[Union["SharedMemoryCache", "PersistentCache"]] = None,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            name: Cache name used as the metrics label
+            max_entries: Maximum number of live entries across all stripes
+            max_bytes: Approximate maximum serialized size across all stripes
+            ttl_seconds: Default time-to-live for entries
+            stripes: Number of independently locked stripes
+            stale_seconds: Grace period after expiry during which get_stale()
+                still returns the entry (marked stale)
+            clock: Monotonic time source (overridable for tests)
+            backing: Optional shared or persistent tier consulted on
+                misses and written through on put
+            encode: Converts a value to its JSON-serializable form (for the
+                backing tier and size estimates)
+            decode: Inverse of encode, applied to values read from the backing tier
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = max(0.0, stale_seconds)
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._clock = clock
+        self.backing = backing
+        self._encode = encode
+        self._decode = decode
+        self._stripes: List[_Stripe] = [_Stripe() for _ in range(max(1, stripes))]
+        self._stripe_max_entries = max(1, self.max_entries // len(self._stripes))
+        self._stripe_max_bytes = max(1, self.max_bytes // len(self._stripes))
+        # Created on first async use of the backing tier
+        self._executor_lock = threading.Lock()
+        self._backing_readers: Optional[ThreadPoolExecutor] = None
+        self._backing_writer: Optional[ThreadPoolExecutor] = None
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "backing_hits": 0,
+            "stale_hits": 0,
+        }
+
+    def _stripe_for(self, key: Hashable) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _count(self, stat: str, metric_name: str, labels: Dict[str, str]):
+        with self._stats_lock:
+            self._stats[stat] += 1
+        buffered_metrics.increment_counter(metric_name, labels=labels)
+
+    def _record_hit(self):
+        self._count("hits", "weather_cache_requests", {"cache": self.name, "result": "hit"})
+
+    def _record_miss(self):
+        self._count("misses", "weather_cache_requests", {"cache": self.name, "result": "miss"})
+
+    def _record_eviction(self, reason: str):
+        stat = "expirations" if reason == "expired" else "evictions"
+        self._count(stat, "weather_cache_evictions", {"cache": self.name, "reason": reason})
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a live entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            A private copy of the cached value, or None on miss/expiry
+        """
+        found = self._lookup(key, allow_stale=False)
+        return found[0] if found is not None else None
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up an entry, accepting one that expired within stale_seconds
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (private copy of the value, is_stale), or None on miss
+        """
+        return self._lookup(key, allow_stale=True)
+
+    async def get_async(self, key: Hashable) -> Optional[Any]:
+        """Async version of get (a backing-tier read runs off the event loop)."""
+        found = await self._lookup_async(key, allow_stale=False)
+        return found[0] if found is not None else None
+
+    async def get_stale_async(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """Async version of get_stale (a backing-tier read runs off the event loop)."""
+        return await self._lookup_async(key, allow_stale=True)
+
+    def _lookup(self, key: Hashable, allow_stale: bool) -> Optional[Tuple[Any, bool]]:
+        found = self._lookup_memory(key, allow_stale)
+        if found is not _MISS:
+            return found
+        value = self._get_from_backing(key)
+        return (value, False) if value is not None else None
+
+    async def _lookup_async(self, key: Hashable, allow_stale: bool) -> Optional[Tuple[Any, bool]]:
+        found = self._lookup_memory(key, allow_stale)
+        if found is not _MISS:
+            return found
+        if self.backing is None:
+            self._record_miss()
+            return None
+        readers = self._executors()[0]
+        value = await asyncio.get_running_loop().run_in_executor(readers, self._get_from_backing, key)
+        return (value, False) if value is not None else None
+
+    def _lookup_memory(self, key: Hashable, allow_stale: bool) -> Any:
+        """Memory-tier lookup: (value copy, is_stale), or _MISS to fall through to the backing tier"""
+        stripe = self._stripe_for(key)
+        now = self._clock()
+        expired = False
+        stale = False
+
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None:
+                if entry.stale_until <= now:
+                    del stripe.entries[key]
+                    stripe.bytes -= entry.size
+                    entry = None
+                    expired = True
+                elif entry.expires_at <= now and not allow_stale:
+                    entry = None
+                else:
+                    stale = entry.expires_at <= now
+                    stripe.entries.move_to_end(key)
+                    value = entry.value
+
+        if expired:
+            self._record_eviction("expired")
+        if entry is None:
+            return _MISS
+
+        if stale:
+            self._count("stale_hits", "weather_cache_requests", {"cache": self.name, "result": "stale_hit"})
+        else:
+            self._record_hit()
+        return _copy_value(value), stale
+
+    def ttl_remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until key expires (negative while stale), or None if absent"""
+        stripe = self._stripe_for(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None:
+                return None
+            return entry.expires_at - self._clock()
+
+    def _get_from_backing(self, key: Hashable) -> Optional[Any]:
+        found = self.backing.get(key) if self.backing is not None else None
+        if found is None:
+            self._record_miss()
+            return None
+
+        value, remaining = found
+        if self._decode is not None:
+            value = self._decode(value)
+        self._store(key, value, remaining)
+        self._count("backing_hits", "weather_cache_requests", {"cache": self.name, "result": "backing_hit"})
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        Store a value, evicting least-recently-used entries to stay within budget
+
+        Args:
+            key: Cache key
+            value: Value to cache (copied on write)
+            ttl_seconds: Override for the default TTL
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._store(key, value, ttl)
+        if self.backing is not None:
+            self.backing.put(key, self._encode(value) if self._encode is not None else value, ttl)
+
+    def put_async(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> "asyncio.Future":
+        """
+        Store a value from an event loop: the memory tier is updated at once,
+        the backing-tier write is queued on the writer thread (write-behind)
+
+        Args:
+            key: Cache key
+            value: Value to cache (copied on write)
+            ttl_seconds: Override for the default TTL
+
+        Returns:
+            Future resolved once the backing tier has the value; callers
+            that don't need that may drop it
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._store(key, value, ttl)
+        loop = asyncio.get_running_loop()
+        if self.backing is None:
+            done = loop.create_future()
+            done.set_result(None)
+            return done
+        encoded = self._encode(value) if self._encode is not None else value
+        return loop.run_in_executor(self._executors()[1], self.backing.put, key, encoded, ttl)
+
+    def _executors(self) -> Tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+        """Backing-tier reader pool and single writer thread (keeps writes in order)"""
+        with self._executor_lock:
+            if self._backing_writer is None:
+                self._backing_readers = ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"{self.name}-backing-read")
+                self._backing_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}-backing-write")
+            return self._backing_readers, self._backing_writer
+
+    def warm(self, limit: Optional[int] = None) -> int:
+        """
+        Load the freshest live entries from the backing tier
+
+        Args:
+            limit: Maximum entries loaded (defaults to max_entries)
+
+        Returns:
+            Number of entries loaded
+        """
+        if self.backing is None:
+            return 0
+        self.backing.compact()
+        rows = self.backing.load_live(self.max_entries if limit is None else limit)
+        # Oldest first so the freshest rows end up most recently used
+        for key, value, remaining in reversed(rows):
+            self._store(key, self._decode(value) if self._decode is not None else value, remaining)
+        return len(rows)
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        size = _estimate_size(key, self._encode(value) if self._encode is not None else value)
+        if size > self._stripe_max_bytes:
+            # Larger than a whole stripe's budget; caching it would flush the stripe
+            self._record_eviction("oversize")
+            return
+
+        expires_at = self._clock() + ttl
+        entry = _Entry(_copy_value(value), expires_at, expires_at + self.stale_seconds, size)
+        stripe = self._stripe_for(key)
+        evicted: List[str] = []
+
+        with stripe.lock:
+            previous = stripe.entries.pop(key, None)
+            if previous is not None:
+                stripe.bytes -= previous.size
+
+            stripe.entries[key] = entry
+            stripe.bytes += size
+
+            while len(stripe.entries) > self._stripe_max_entries:
+                evicted.append(self._evict_oldest(stripe, "capacity"))
+            while stripe.bytes > self._stripe_max_bytes:
+                evicted.append(self._evict_oldest(stripe, "bytes"))
+
+        for reason in evicted:
+            self._record_eviction(reason)
+
+        buffered_metrics.set_gauge("weather_cache_entries", len(self), labels={"cache": self.name})
+
+    def _evict_oldest(self, stripe: _Stripe, reason: str) -> str:
+        """Drop the LRU entry of a stripe (caller holds the stripe lock)."""
+        _, oldest = stripe.entries.popitem(last=False)
+        stripe.bytes -= oldest.size
+        if oldest.stale_until <= self._clock():
+            return "expired"
+        return reason
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove an entry (from both tiers). Returns True if it was present."""
+        in_backing = self.backing.delete(key) if self.backing is not None else False
+        stripe = self._stripe_for(key)
+        with stripe.lock:
+            entry = stripe.entries.pop(key, None)
+            if entry is None:
+                return in_backing
+            stripe.bytes -= entry.size
+            return True
+
+    def clear(self):
+        """Remove all entries (from both tiers)."""
+        if self.backing is not None:
+            self.backing.clear()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.bytes = 0
+
+    def purge_expired(self) -> int:
+        """
+        Sweep every stripe for entries past their stale grace window
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                dead = [k for k, e in stripe.entries.items() if e.stale_until <= now]
+                for key in dead:
+                    stripe.bytes -= stripe.entries.pop(key).size
+            removed += len(dead)
+
+        for _ in range(removed):
+            self._record_eviction("expired")
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        stripe = self._stripe_for(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            return entry is not None and entry.expires_at > self._clock()
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(stripe.bytes for stripe in self._stripes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current occupancy"""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+
+        served = stats["hits"] + stats["backing_hits"] + stats["stale_hits"]
+        lookups = served + stats["misses"]
+        stats["hit_ratio"] = served / lookups if lookups else 0.0
+        stats["entries"] = len(self)
+        stats["bytes"] = self.size_bytes
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        if self.backing is not None:
+            stats["backing"] = self.backing.stats()
+
+        buffered_metrics.set_gauge("weather_cache_bytes", stats["bytes"], labels={"cache": self.name})
+        return stats
@@ -11,7 +11,112 @@ class Settings:
         self.google_cloud_location: str = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
         self.default_model: str = os.getenv("DEFAULT_MODEL", "gemini-2.0-flash-exp")
         self.enable_caching: bool = os.getenv("ENABLE_CACHING", "true").lower() == "true"
-    
+
+        # Weather cache budget
+        self.weather_cache_ttl_seconds: float = float(os.getenv("WEATHER_CACHE_TTL_SECONDS", "1800"))
+        self.weather_cache_max_entries: int = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "10000"))
+        self.weather_cache_max_bytes: int = int(os.getenv("WEATHER_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+        self.weather_cache_stripes: int = int(os.getenv("WEATHER_CACHE_STRIPES", "16"))
+        self.weather_singleflight_timeout_seconds: float = float(os.getenv("WEATHER_SINGLEFLIGHT_TIMEOUT_SECONDS", "10"))
+        # Geohash precision of weather cache keys (5 ~ 4.9 km cells); 0 keys by city name
+        self.weather_cache_geohash_precision: int = int(os.getenv("WEATHER_CACHE_GEOHASH_PRECISION", "5"))
+        # Stale-while-revalidate grace window and background refresh of hot keys
+        self.weather_cache_stale_seconds: float = float(os.getenv("WEATHER_CACHE_STALE_SECONDS", "600"))
+        self.weather_refresh_workers: int = int(os.getenv("WEATHER_REFRESH_WORKERS", "2"))
+        self.weather_refresh_ahead_seconds: float = float(os.getenv("WEATHER_REFRESH_AHEAD_SECONDS", "120"))
+        self.weather_refresh_scan_seconds: float = float(os.getenv("WEATHER_REFRESH_SCAN_SECONDS", "30"))
+        self.weather_refresh_hot_keys: int = int(os.getenv("WEATHER_REFRESH_HOT_KEYS", "50"))
+        self.weather_refresh_min_hits: int = int(os.getenv("WEATHER_REFRESH_MIN_HITS", "3"))
+        # Prewarm the most popular (location, day) keys shortly before peak hours
+        self.weather_prewarm_enabled: bool = os.getenv("WEATHER_PREWARM_ENABLED", "true").lower() == "true"
+        self.weather_prewarm_top_k: int = int(os.getenv("WEATHER_PREWARM_TOP_K", "200"))
+        self.weather_prewarm_min_hits: int = int(os.getenv("WEATHER_PREWARM_MIN_HITS", "3"))
+        self.weather_prewarm_interval_seconds: float = float(os.getenv("WEATHER_PREWARM_INTERVAL_SECONDS", "900"))
+        # Comma-separated local hours, e.g. "7,17"; empty prewarms on every interval
+        self.weather_prewarm_peak_hours: str = os.getenv("WEATHER_PREWARM_PEAK_HOURS", "7,17")
+        self.weather_prewarm_lead_minutes: float = float(os.getenv("WEATHER_PREWARM_LEAD_MINUTES", "45"))
+        self.weather_prewarm_rate_per_second: float = float(os.getenv("WEATHER_PREWARM_RATE_PER_SECOND", "2"))
+        self.weather_prewarm_decay_seconds: float = float(os.getenv("WEATHER_PREWARM_DECAY_SECONDS", "86400"))
+
+        # Optional on-disk tier (SQLite, WAL) so the cache survives restarts; unset disables it
+        self.weather_persistent_cache_path: Optional[str] = os.getenv("WEATHER_PERSISTENT_CACHE_PATH")
+        self.weather_persistent_cache_max_entries: int = int(os.getenv("WEATHER_PERSISTENT_CACHE_MAX_ENTRIES", "100000"))
+        self.weather_persistent_cache_warm_entries: int = int(os.getenv("WEATHER_PERSISTENT_CACHE_WARM_ENTRIES", "5000"))
+        # Optional host-wide shared-memory tier (e.g. /dev/shm/weather_outfit_cache); unset disables it
+        self.weather_shared_cache_path: Optional[str] = os.getenv("WEATHER_SHARED_CACHE_PATH")
+        self.weather_shared_cache_slots: int = int(os.getenv("WEATHER_SHARED_CACHE_SLOTS", "16384"))
+        self.weather_shared_cache_slot_bytes: int = int(os.getenv("WEATHER_SHARED_CACHE_SLOT_BYTES", "1024"))
+        self.weather_batch_concurrency: int = int(os.getenv("WEATHER_BATCH_CONCURRENCY", "8"))
+
+        # Daily range prefetch: one upstream call covers +/- N days per location
+        self.weather_prefetch_days: int = int(os.getenv("WEATHER_PREFETCH_DAYS", "7"))
+        self.weather_series_max_locations: int = int(os.getenv("WEATHER_SERIES_MAX_LOCATIONS", "2000"))
+        self.weather_series_ttl_seconds: float = float(os.getenv("WEATHER_SERIES_TTL_SECONDS", "1800"))
+        # Longest date range get_weather_range answers in one call
+        self.weather_range_max_days: int = int(os.getenv("WEATHER_RANGE_MAX_DAYS", "92"))
+
+        # Hourly forecasts: one upstream call fetches +/- N days of hours per location,
+        # later times are interpolated from the buffered series
+        self.weather_hourly_window_days: int = int(os.getenv("WEATHER_HOURLY_WINDOW_DAYS", "1"))
+        self.weather_hourly_max_locations: int = int(os.getenv("WEATHER_HOURLY_MAX_LOCATIONS", "2000"))
+        self.weather_hourly_ttl_seconds: float = float(os.getenv("WEATHER_HOURLY_TTL_SECONDS", "3600"))
+        self.weather_hourly_max_gap_hours: float = float(os.getenv("WEATHER_HOURLY_MAX_GAP_HOURS", "3"))
+
+        # Optional on-disk daily history (memory-mapped month files) for get_typical_weather;
+        # fetched past days are written into it. Unset disables it
+        self.weather_history_path: Optional[str] = os.getenv("WEATHER_HISTORY_PATH")
+        self.weather_history_years: int = int(os.getenv("WEATHER_HISTORY_YEARS", "10"))
+        self.weather_history_window_days: int = int(os.getenv("WEATHER_HISTORY_WINDOW_DAYS", "3"))
+        self.weather_history_max_open_files: int = int(os.getenv("WEATHER_HISTORY_MAX_OPEN_FILES", "64"))
+
+        # Client-side budget for the Meteostat RapidAPI plan (daily quota 0 = unlimited)
+        self.meteostat_rate_per_second: float = float(os.getenv("METEOSTAT_RATE_PER_SECOND", "5"))
+        self.meteostat_burst: int = int(os.getenv("METEOSTAT_BURST", "10"))
+        self.meteostat_daily_quota: int = int(os.getenv("METEOSTAT_DAILY_QUOTA", "0"))
+        # Share of the daily quota that prewarming may not touch
+        self.meteostat_quota_reserve: float = float(os.getenv("METEOSTAT_QUOTA_RESERVE", "0.2"))
+        # SQLite file counting the daily quota for every process and service that points at it;
+        # unset counts per process, each getting METEOSTAT_DAILY_QUOTA / METEOSTAT_QUOTA_PROCESSES
+        self.meteostat_quota_path: Optional[str] = os.getenv("METEOSTAT_QUOTA_PATH")
+        self.meteostat_quota_processes: int = int(os.getenv("METEOSTAT_QUOTA_PROCESSES", "1"))
+        # How long the shared count used to shed calls early is cached between ledger reads
+        self.meteostat_quota_refresh_seconds: float = float(os.getenv("METEOSTAT_QUOTA_REFRESH_SECONDS", "1"))
+        self.meteostat_max_wait_seconds: float = float(os.getenv("METEOSTAT_MAX_WAIT_SECONDS", "2"))
+        self.meteostat_prewarm_max_wait_seconds: float = float(os.getenv("METEOSTAT_PREWARM_MAX_WAIT_SECONDS", "30"))
+
+        # Weather providers in order of preference, and hedging of slow calls
+        self.weather_providers: str = os.getenv("WEATHER_PROVIDERS", "meteostat,open_meteo")
+        self.weather_hedge_enabled: bool = os.getenv("WEATHER_HEDGE_ENABLED", "true").lower() == "true"
+        self.weather_hedge_min_delay_ms: float = float(os.getenv("WEATHER_HEDGE_MIN_DELAY_MS", "50"))
+        self.weather_hedge_max_delay_ms: float = float(os.getenv("WEATHER_HEDGE_MAX_DELAY_MS", "1500"))
+
+        # Circuit breakers per upstream (Meteostat, geocoding) and negative caching of failures
+        self.circuit_breaker_failure_threshold: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+        self.circuit_breaker_reset_seconds: float = float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", "30"))
+        self.weather_negative_cache_ttl_seconds: float = float(os.getenv("WEATHER_NEGATIVE_CACHE_TTL_SECONDS", "60"))
+        self.weather_no_data_cache_ttl_seconds: float = float(os.getenv("WEATHER_NO_DATA_CACHE_TTL_SECONDS", "900"))
+
+        # Upstream HTTP connection pools: blocking pools open at most POOL_SIZE connections per host;
+        # async pools keep that many idle per event loop
+        self.weather_http_pool_size: int = int(os.getenv("WEATHER_HTTP_POOL_SIZE", "8"))
+        self.weather_http_idle_timeout_seconds: float = float(os.getenv("WEATHER_HTTP_IDLE_TIMEOUT_SECONDS", "60"))
+        self.weather_http_connect_timeout_seconds: float = float(os.getenv("WEATHER_HTTP_CONNECT_TIMEOUT_SECONDS", "3"))
+        self.weather_http_read_timeout_seconds: float = float(os.getenv("WEATHER_HTTP_READ_TIMEOUT_SECONDS", "10"))
+        self.weather_http_checkout_timeout_seconds: float = float(os.getenv("WEATHER_HTTP_CHECKOUT_TIMEOUT_SECONDS", "5"))
+
+        # Extra activity keywords for classify_activity (TSV: keyword, category[, word|substring]); unset uses the built-in list
+        self.activity_keywords_path: Optional[str] = os.getenv("ACTIVITY_KEYWORDS_PATH")
+
+        # Geocoding: bundled gazetteer first, remote API only when opted in
+        self.gazetteer_path: Optional[str] = os.getenv("GAZETTEER_PATH")
+        self.geocoding_remote_fallback: bool = os.getenv("GEOCODING_REMOTE_FALLBACK", "false").lower() == "true"
+        self.geocode_fuzzy_min_score: float = float(os.getenv("GEOCODE_FUZZY_MIN_SCORE", "0.7"))
+        self.geocode_negative_ttl_seconds: float = float(os.getenv("GEOCODE_NEGATIVE_TTL_SECONDS", "300"))
+        self.geocode_cache_path: str = os.getenv(
+            "GEOCODE_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "weather_outfit_adk", "geocode_cache.tsv")
+        )
+
     def validate(self) -> bool:
         """Check if required settings are present."""
         if not self.weather_api_key:
@@ -0,0 +1,26 @@
+"""
+Offline geocoding
+
+Bundled city gazetteer and the geocoder the weather tools use to turn
+city names into coordinates.
+"""
+
+from .gazetteer import Gazetteer, Place, normalize_place_name, split_qualifier
+from .fuzzy import CityCandidate, CityResolver
+from .geohash import geohash_bounds, geohash_center, geohash_encode
+from .geocoder import GEOCODING_HOST, Geocoder, LearnedPlaceCache
+
+__all__ = [
+    "Gazetteer",
+    "Place",
+    "normalize_place_name",
+    "split_qualifier",
+    "CityCandidate",
+    "CityResolver",
+    "geohash_encode",
+    "geohash_bounds",
+    "geohash_center",
+    "Geocoder",
+    "LearnedPlaceCache",
+    "GEOCODING_HOST",
+]
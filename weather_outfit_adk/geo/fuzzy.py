@@ -0,0 +1,191 @@
+"""
+Fuzzy City Resolution
+
+Typo-tolerant lookup over the gazetteer's names and aliases ("seatle",
+"san fran", "Sea Tac"). A trigram inverted index narrows the gazetteer
+to the handful of keys sharing the most trigrams with the query; those
+are re-scored with a bounded edit distance and ranked.
+
+Scores are in [0, 1]: 1.0 is an exact name/alias match.
+"""
+
+import heapq
+import threading
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from .gazetteer import Gazetteer, Place, split_qualifier
+
+
+def trigrams(text: str) -> Set[str]:
+    """Padded character trigrams of an already normalized string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions count as one edit)
+
+    Returns max_distance + 1 as soon as the distance is known to exceed max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class CityCandidate(NamedTuple):
+    place: Place
+    score: float
+    matched: str  # Normalized gazetteer name or alias that matched
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.place.name,
+            "admin": self.place.admin,
+            "country": self.place.country,
+            "display_name": self.place.display_name,
+            "latitude": self.place.latitude,
+            "longitude": self.place.longitude,
+            "elevation": self.place.elevation,
+            "population": self.place.population,
+            "score": round(self.score, 3),
+            "matched": self.matched,
+        }
+
+
+class CityResolver:
+    """Ranked, typo-tolerant city lookup backed by a trigram index."""
+
+    def __init__(self, gazetteer: Gazetteer, max_candidates: int = 16, min_overlap: float = 0.3):
+        """
+        Initialize the resolver (the index is built on first use)
+
+        Args:
+            gazetteer: Gazetteer whose names and aliases are indexed
+            max_candidates: Keys re-scored per query after trigram filtering
+            min_overlap: Minimum trigram Dice coefficient for a key to be
+                re-scored (prefix matches are always kept)
+        """
+        self.gazetteer = gazetteer
+        self.max_candidates = max_candidates
+        self.min_overlap = min_overlap
+        self._lock = threading.Lock()
+        self._keys: Optional[List[str]] = None
+        self._postings: Dict[str, List[int]] = {}
+        self._trigram_counts: List[int] = []
+        self._places: List[List[Place]] = []
+
+    def _ensure_index(self) -> List[str]:
+        if self._keys is not None:
+            return self._keys
+        with self._lock:
+            if self._keys is None:
+                keys = sorted(self.gazetteer.keys())
+                postings: Dict[str, List[int]] = defaultdict(list)
+                counts = []
+                for key_id, key in enumerate(keys):
+                    grams = trigrams(key)
+                    counts.append(len(grams))
+                    for gram in grams:
+                        postings[gram].append(key_id)
+                self._postings = dict(postings)
+                self._trigram_counts = counts
+                self._places = [self.gazetteer.places_named(key) for key in keys]
+                self._keys = keys
+        return self._keys
+
+    @staticmethod
+    def _quick_score(query: str, key: str) -> Optional[float]:
+        if query == key:
+            return 1.0
+        # Partially typed names ("san fr") rank close behind exact matches
+        if len(query) >= 3 and key.startswith(query):
+            return 0.85 + 0.1 * len(query) / len(key)
+        return None
+
+    @staticmethod
+    def _fuzzy_score(query: str, key: str, dice: float) -> float:
+        longest = max(len(query), len(key))
+        # About one typo per five characters; beyond that it's a different name
+        # ("atlantis" is not "atlanta")
+        max_distance = max(1, longest // 5)
+        distance = edit_distance(query, key, max_distance)
+        edit_similarity = 1.0 - distance / longest if distance <= max_distance else 0.0
+        return 0.5 * dice + 0.5 * edit_similarity
+
+    def candidates(self, query: str, limit: int = 5) -> List[CityCandidate]:
+        """
+        Rank gazetteer places for a free-text city query
+
+        Args:
+            query: City name, optionally followed by ", <state/region/country>"
+            limit: Maximum number of candidates returned
+
+        Returns:
+            Candidates ordered by score, then population (one per place)
+        """
+        keys = self._ensure_index()
+        name, qualifier = split_qualifier(query)
+        if not name:
+            return []
+
+        query_grams = trigrams(name)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for key_id in self._postings.get(gram, ()):
+                shared[key_id] += 1
+
+        overlaps = []
+        for key_id, common in shared.items():
+            dice = 2.0 * common / (len(query_grams) + self._trigram_counts[key_id])
+            if dice >= self.min_overlap or keys[key_id].startswith(name):
+                overlaps.append((dice, key_id))
+        overlaps.sort(reverse=True)
+
+        best: Dict[Place, CityCandidate] = {}
+        top_scores: List[float] = []  # Min-heap of the best `limit` key scores so far
+        for dice, key_id in overlaps[:self.max_candidates]:
+            places = [place for place in self._places[key_id] if place.matches_qualifier(qualifier)]
+            if not places:
+                # Keys the qualifier rules out must not raise the cut for the ones it keeps
+                continue
+            key = keys[key_id]
+            score = self._quick_score(name, key)
+            if score is None:
+                # Skip the edit distance when even a perfect one couldn't make the cut
+                if len(top_scores) >= limit and 0.5 * dice + 0.5 <= top_scores[0]:
+                    continue
+                score = self._fuzzy_score(name, key, dice)
+            if len(top_scores) < limit:
+                heapq.heappush(top_scores, score)
+            elif score > top_scores[0]:
+                heapq.heapreplace(top_scores, score)
+            for place in places:
+                current = best.get(place)
+                if current is None or score > current.score:
+                    best[place] = CityCandidate(place, score, key)
+
+        ranked = sorted(best.values(), key=lambda c: (-c.score, -c.place.population))
+        return ranked[:limit]
+
+    def best(self, query: str, min_score: float = 0.0) -> Optional[CityCandidate]:
+        """Top candidate if its score is at least min_score."""
+        ranked = self.candidates(query, limit=1)
+        if ranked and ranked[0].score >= min_score:
+            return ranked[0]
+        return None
+
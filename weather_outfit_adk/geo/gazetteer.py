@@ -0,0 +1,259 @@
+"""
+City Gazetteer
+
+Offline city lookup backed by a tab-separated gazetteer file
+(name, aliases, admin region, country, lat, lon, elevation, population).
+
+The file is memory-mapped and indexed lazily on first use: normalized
+names and aliases map to byte offsets of their rows, so an exact lookup
+is a dict read and a prefix search is a bisect over the sorted keys.
+Rows are decoded on demand and memoized.
+"""
+
+import mmap
+import os
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), "data", "cities.tsv")
+
+# Qualifier spellings ("Redmond, Washington") mapped to the codes used in the file
+US_STATES = {
+    "alabama": "al", "alaska": "ak", "arizona": "az", "arkansas": "ar", "california": "ca",
+    "colorado": "co", "connecticut": "ct", "delaware": "de", "district of columbia": "dc",
+    "florida": "fl", "georgia": "ga", "hawaii": "hi", "idaho": "id", "illinois": "il",
+    "indiana": "in", "iowa": "ia", "kansas": "ks", "kentucky": "ky", "louisiana": "la",
+    "maine": "me", "maryland": "md", "massachusetts": "ma", "michigan": "mi", "minnesota": "mn",
+    "mississippi": "ms", "missouri": "mo", "montana": "mt", "nebraska": "ne", "nevada": "nv",
+    "new hampshire": "nh", "new jersey": "nj", "new mexico": "nm", "new york": "ny",
+    "north carolina": "nc", "north dakota": "nd", "ohio": "oh", "oklahoma": "ok", "oregon": "or",
+    "pennsylvania": "pa", "rhode island": "ri", "south carolina": "sc", "south dakota": "sd",
+    "tennessee": "tn", "texas": "tx", "utah": "ut", "vermont": "vt", "virginia": "va",
+    "washington": "wa", "west virginia": "wv", "wisconsin": "wi", "wyoming": "wy",
+}
+
+COUNTRY_ALIASES = {
+    "usa": "us", "united states": "us", "united states of america": "us", "america": "us",
+    "uk": "gb", "united kingdom": "gb", "great britain": "gb", "england": "gb", "scotland": "gb",
+    "canada": "ca", "mexico": "mx", "france": "fr", "germany": "de", "spain": "es",
+    "italy": "it", "japan": "jp", "china": "cn", "india": "in", "australia": "au",
+    "brazil": "br", "ireland": "ie", "netherlands": "nl",
+}
+
+
+def normalize_place_name(text: str) -> str:
+    """
+    Normalize a place name for indexing and lookup.
+
+    Strips accents, lowercases, turns punctuation into spaces and collapses
+    whitespace: "  São  Paulo " -> "sao paulo", "St. Louis" -> "st louis".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    ascii_text = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    cleaned = "".join(c if c.isalnum() else " " for c in ascii_text)
+    return " ".join(cleaned.split())
+
+
+def split_qualifier(query: str) -> Tuple[str, Optional[str]]:
+    """Split "Redmond, WA" into ("redmond", "wa"); qualifiers are normalized."""
+    name, _, qualifier = query.partition(",")
+    qualifier = normalize_place_name(qualifier)
+    return normalize_place_name(name), qualifier or None
+
+
+class Place(NamedTuple):
+    name: str
+    aliases: Tuple[str, ...]
+    admin: str
+    country: str
+    latitude: float
+    longitude: float
+    elevation: int
+    population: int
+
+    @property
+    def coordinates(self) -> Tuple[float, float, int]:
+        """(latitude, longitude, altitude) as used by the weather provider"""
+        return (self.latitude, self.longitude, self.elevation)
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.name}, {self.admin}, {self.country}" if self.admin else f"{self.name}, {self.country}"
+
+    def matches_qualifier(self, qualifier: Optional[str]) -> bool:
+        """True if qualifier names this place's admin region or country."""
+        if not qualifier:
+            return True
+        code = US_STATES.get(qualifier) or COUNTRY_ALIASES.get(qualifier) or qualifier
+        return code in (self.admin.lower(), self.country.lower())
+
+    def to_row(self) -> str:
+        """Serialize as a gazetteer file row."""
+        return "\t".join([
+            self.name,
+            ",".join(self.aliases),
+            self.admin,
+            self.country,
+            f"{self.latitude:.4f}",
+            f"{self.longitude:.4f}",
+            str(self.elevation),
+            str(self.population),
+        ]) + "\n"
+
+
+def parse_place(line: str) -> Optional[Place]:
+    """Parse one gazetteer row; returns None for comments and malformed rows."""
+    if not line.strip() or line.startswith("#"):
+        return None
+    parts = line.rstrip("\r\n").split("\t")
+    if len(parts) < 8:
+        return None
+    try:
+        return Place(
+            name=parts[0],
+            aliases=tuple(a for a in parts[1].split(",") if a),
+            admin=parts[2],
+            country=parts[3],
+            latitude=float(parts[4]),
+            longitude=float(parts[5]),
+            elevation=int(float(parts[6] or 0)),
+            population=int(float(parts[7] or 0)),
+        )
+    except ValueError:
+        return None
+
+
+class Gazetteer:
+    """Memory-mapped, lazily indexed city gazetteer."""
+
+    def __init__(self, path: str = DEFAULT_GAZETTEER_PATH):
+        """
+        Initialize the gazetteer (the file is not read until the first lookup)
+
+        Args:
+            path: Path to a gazetteer TSV file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._mmap: Optional[mmap.mmap] = None
+        self._exact: Dict[str, List[int]] = {}
+        self._sorted_keys: List[str] = []
+        self._sorted_offsets: List[int] = []
+        self._population: Dict[int, int] = {}
+        self._places: Dict[int, Place] = {}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._build_index()
+            self._loaded = True
+
+    def _build_index(self):
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Only the name, alias and population columns are decoded here; full
+        # rows are parsed from the map when a lookup first returns them
+        pairs: List[Tuple[str, int]] = []
+        offset = 0
+        for raw in iter(self._mmap.readline, b""):
+            if raw.strip() and not raw.startswith(b"#"):
+                parts = raw.split(b"\t", 8)
+                if len(parts) >= 8:
+                    try:
+                        self._population[offset] = int(float(parts[7] or 0))
+                    except ValueError:
+                        self._population[offset] = 0
+                    names = [parts[0].decode("utf-8")]
+                    names.extend(parts[1].decode("utf-8").split(","))
+                    for key in {normalize_place_name(n) for n in names}:
+                        if key:
+                            self._exact.setdefault(key, []).append(offset)
+                            pairs.append((key, offset))
+            offset += len(raw)
+
+        # Most populous place first for each name
+        for offsets in self._exact.values():
+            offsets.sort(key=lambda o: -self._population[o])
+
+        pairs.sort(key=lambda p: (p[0], -self._population[p[1]]))
+        self._sorted_keys = [key for key, _ in pairs]
+        self._sorted_offsets = [off for _, off in pairs]
+
+    def _place_at(self, offset: int) -> Optional[Place]:
+        place = self._places.get(offset)
+        if place is None:
+            end = self._mmap.find(b"\n", offset)
+            raw = self._mmap[offset:end if end >= 0 else len(self._mmap)]
+            place = parse_place(raw.decode("utf-8"))
+            if place is not None:
+                self._places[offset] = place
+        return place
+
+    def places_named(self, name: str) -> List[Place]:
+        """All places whose normalized name or alias equals name, most populous first"""
+        self._ensure_loaded()
+        places = (self._place_at(o) for o in self._exact.get(normalize_place_name(name), []))
+        return [p for p in places if p is not None]
+
+    def lookup(self, name: str, qualifier: Optional[str] = None) -> Optional[Place]:
+        """
+        Exact lookup by name or alias
+
+        Args:
+            name: City name ("Seattle", "NYC")
+            qualifier: Optional admin region or country ("WA", "Oregon", "UK")
+
+        Returns:
+            The most populous matching Place, or None
+        """
+        self._ensure_loaded()
+        qualifier = normalize_place_name(qualifier) if qualifier else None
+        for offset in self._exact.get(normalize_place_name(name), []):
+            place = self._place_at(offset)
+            if place is not None and place.matches_qualifier(qualifier):
+                return place
+        return None
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Place]:
+        """
+        Places whose name or alias starts with prefix
+
+        Args:
+            prefix: Name prefix ("san f")
+            limit: Maximum number of places returned
+
+        Returns:
+            Distinct matching places in key order
+        """
+        self._ensure_loaded()
+        prefix = normalize_place_name(prefix)
+        results: List[Place] = []
+        seen = set()
+        i = bisect_left(self._sorted_keys, prefix)
+        while i < len(self._sorted_keys) and self._sorted_keys[i].startswith(prefix) and len(results) < limit:
+            offset = self._sorted_offsets[i]
+            if offset not in seen:
+                seen.add(offset)
+                place = self._place_at(offset)
+                if place is not None:
+                    results.append(place)
+            i += 1
+        return results
+
+    def keys(self) -> List[str]:
+        """All indexed normalized names and aliases"""
+        self._ensure_loaded()
+        return list(self._exact.keys())
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._population)
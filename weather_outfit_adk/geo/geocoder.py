@@ -0,0 +1,311 @@
+"""
+City Geocoder
+
+Resolves city names to coordinates without a network round trip:
+
+1. Bundled gazetteer (memory-mapped, see gazetteer.py)
+2. Persistent learned cache of earlier remote results
+3. Fuzzy match against the gazetteer for typos (see fuzzy.py)
+4. Open-Meteo geocoding API - opt-in (GEOCODING_REMOTE_FALLBACK=true);
+   results are written back to the learned cache. Names the API can't
+   resolve (or that failed) are remembered for a short negative TTL, and
+   an optional circuit breaker fails fast while the API is down.
+
+Unresolved names return None rather than a default city.
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from ..cache.single_flight import AsyncSingleFlight, SingleFlight
+from ..monitoring.metrics import buffered_metrics
+from ..providers.async_http_pool import AsyncHTTPConnectionPool
+from ..providers.circuit_breaker import CircuitBreaker
+from ..providers.errors import CircuitOpenError, WeatherProviderError
+from ..providers.http_pool import HTTPConnectionPool, PooledResponse
+from .fuzzy import CityResolver
+from .gazetteer import US_STATES, Gazetteer, Place, normalize_place_name, parse_place, split_qualifier
+
+GEOCODING_HOST = "geocoding-api.open-meteo.com"
+
+_STATE_CODES = {name: code.upper() for name, code in US_STATES.items()}
+
+_MAX_NEGATIVE_ENTRIES = 10000
+
+_CACHE_HEADER = "# name\taliases\tadmin\tcountry\tlatitude\tlongitude\televation\tpopulation\n"
+
+
+def _geocoding_path(name: str) -> str:
+    """Open-Meteo geocoding search path for a city name."""
+    encoded_city = urllib.parse.quote(name)
+    return f"/v1/search?name={encoded_city}&count=10&language=en&format=json"
+
+
+def _places_from_response(response: PooledResponse) -> List[Place]:
+    """Convert an Open-Meteo geocoding response into Places."""
+    if response.status >= 400:
+        raise WeatherProviderError(
+            f"Geocoding returned HTTP {response.status} {response.reason}",
+            status=response.status
+        )
+    data: Dict[str, Any] = json.loads(response.body.decode("utf-8"))
+
+    places = []
+    for result in data.get("results") or []:
+        country = (result.get("country_code") or "").upper()
+        admin = result.get("admin1") or ""
+        if country == "US":
+            admin = _STATE_CODES.get(normalize_place_name(admin), admin)
+        places.append(Place(
+            name=result.get("name", ""),
+            aliases=(),
+            admin=admin,
+            country=country,
+            latitude=float(result["latitude"]),
+            longitude=float(result["longitude"]),
+            elevation=int(result.get("elevation") or 0),
+            population=int(result.get("population") or 0),
+        ))
+    return places
+
+
+class LearnedPlaceCache:
+    """Append-only TSV of remotely geocoded places, keyed by the query that found them."""
+
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the cache (the file is read on first use)
+
+        Args:
+            path: Cache file path; None disables persistence
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._places: Optional[Dict[str, Place]] = None
+
+    def _load(self) -> Dict[str, Place]:
+        if self._places is not None:
+            return self._places
+        with self._lock:
+            if self._places is None:
+                places: Dict[str, Place] = {}
+                if self.path and os.path.exists(self.path):
+                    try:
+                        with open(self.path, encoding="utf-8") as f:
+                            for line in f:
+                                place = parse_place(line)
+                                if place is not None:
+                                    for alias in place.aliases:
+                                        places[alias] = place
+                    except OSError as e:
+                        print(f"⚠️  Could not read geocode cache {self.path}: {e}")
+                self._places = places
+        return self._places
+
+    def get(self, key: str) -> Optional[Place]:
+        return self._load().get(key)
+
+    def put(self, key: str, place: Place):
+        """Remember place under key and append it to the cache file."""
+        self._load()
+        place = place._replace(aliases=(key,))
+        with self._lock:
+            self._places[key] = place
+            if not self.path:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                is_new = not os.path.exists(self.path)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if is_new:
+                        f.write(_CACHE_HEADER)
+                    f.write(place.to_row())
+            except OSError as e:
+                print(f"⚠️  Could not write geocode cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class Geocoder:
+    """Gazetteer-first geocoder with an optional remote fallback."""
+
+    def __init__(
+        self,
+        gazetteer: Gazetteer,
+        learned: LearnedPlaceCache,
+        remote_enabled: bool = False,
+        pool: Optional[HTTPConnectionPool] = None,
+        pool_async: Optional[AsyncHTTPConnectionPool] = None,
+        resolver: Optional[CityResolver] = None,
+        fuzzy_min_score: float = 0.7,
+        breaker: Optional[CircuitBreaker] = None,
+        negative_ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the geocoder
+
+        Args:
+            gazetteer: Bundled offline gazetteer
+            learned: Persistent cache of remote results
+            remote_enabled: Whether to query the remote geocoder on a local miss
+            pool: Connection pool for GEOCODING_HOST (sync lookups)
+            pool_async: Async connection pool for GEOCODING_HOST
+            resolver: Fuzzy resolver used when no exact match is found
+                (defaults to one over the gazetteer)
+            fuzzy_min_score: Minimum fuzzy score accepted as a match
+            breaker: Optional circuit breaker for the remote geocoder
+            negative_ttl_seconds: How long a name the remote geocoder couldn't
+                resolve is answered locally with None
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.gazetteer = gazetteer
+        self.learned = learned
+        self.remote_enabled = remote_enabled
+        self.pool = pool
+        self.pool_async = pool_async
+        self.resolver = resolver or CityResolver(gazetteer)
+        self.fuzzy_min_score = fuzzy_min_score
+        self.breaker = breaker
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._flight = SingleFlight(name="geocode")
+        self._flight_async = AsyncSingleFlight(name="geocode_async")
+        self._negative_lock = threading.Lock()
+        self._negative: "OrderedDict[str, float]" = OrderedDict()
+
+    def _resolve_local(self, query: str) -> Optional[Place]:
+        name, qualifier = split_qualifier(query)
+        if not name:
+            return None
+
+        place = self.gazetteer.lookup(name, qualifier)
+        if place is not None:
+            self._record("gazetteer")
+            return place
+
+        place = self.learned.get(normalize_place_name(query))
+        if place is not None:
+            self._record("cache")
+            return place
+
+        candidate = self.resolver.best(query, self.fuzzy_min_score)
+        if candidate is not None:
+            self._record("fuzzy")
+            return candidate.place
+        return None
+
+    def _pick_remote(self, query: str, places: List[Place]) -> Optional[Place]:
+        _, qualifier = split_qualifier(query)
+        for place in places:
+            if place.matches_qualifier(qualifier):
+                self.learned.put(normalize_place_name(query), place)
+                self._record("remote")
+                return place
+        return None
+
+    def _known_unresolved(self, key: str) -> bool:
+        """True if the remote geocoder recently failed to resolve key."""
+        with self._negative_lock:
+            expires = self._negative.get(key)
+            if expires is None:
+                return False
+            if expires <= self._clock():
+                del self._negative[key]
+                return False
+        self._record("negative")
+        return True
+
+    def _remember_unresolved(self, key: str):
+        if self.negative_ttl_seconds <= 0:
+            return
+        with self._negative_lock:
+            self._negative[key] = self._clock() + self.negative_ttl_seconds
+            self._negative.move_to_end(key)
+            if len(self._negative) > _MAX_NEGATIVE_ENTRIES:
+                self._negative.popitem(last=False)
+
+    def _finish_remote(self, query: str, key: str, places: Optional[List[Place]]) -> Optional[Place]:
+        """Pick a remote result; None for places means the circuit was open (not cached)."""
+        place = self._pick_remote(query, places or [])
+        if place is None:
+            if places is not None:
+                self._remember_unresolved(key)
+            self._record("unresolved")
+        return place
+
+    def _fetch_remote(self, query: str) -> List[Place]:
+        path = _geocoding_path(split_qualifier(query)[0])
+        if self.breaker is None:
+            return _places_from_response(self.pool.request("GET", path))
+        with self.breaker.guard():
+            return _places_from_response(self.pool.request("GET", path))
+
+    async def _fetch_remote_async(self, query: str) -> List[Place]:
+        path = _geocoding_path(split_qualifier(query)[0])
+        if self.breaker is None:
+            return _places_from_response(await self.pool_async.request("GET", path))
+        async with self.breaker.guard_async():
+            return _places_from_response(await self.pool_async.request("GET", path))
+
+    def resolve(self, query: str) -> Optional[Place]:
+        """
+        Resolve a city query such as "Seattle" or "Portland, ME"
+
+        Args:
+            query: City name, optionally followed by ", <state/region/country>"
+
+        Returns:
+            The resolved Place, or None if it can't be resolved
+        """
+        place = self._resolve_local(query)
+        if place is not None or not (self.remote_enabled and self.pool):
+            if place is None:
+                self._record("unresolved")
+            return place
+
+        key = normalize_place_name(query)
+        if self._known_unresolved(key):
+            return None
+
+        try:
+            places, _ = self._flight.do(key, lambda: self._fetch_remote(query))
+        except CircuitOpenError:
+            places = None
+        except Exception as e:
+            print(f"Geocoding failed for {query}: {e}")
+            places = []
+
+        return self._finish_remote(query, key, places)
+
+    async def resolve_async(self, query: str) -> Optional[Place]:
+        """Async version of resolve; the remote fallback uses the asyncio pool."""
+        place = self._resolve_local(query)
+        if place is not None or not (self.remote_enabled and self.pool_async):
+            if place is None:
+                self._record("unresolved")
+            return place
+
+        key = normalize_place_name(query)
+        if self._known_unresolved(key):
+            return None
+
+        try:
+            places, _ = await self._flight_async.do(key, lambda: self._fetch_remote_async(query))
+        except CircuitOpenError:
+            places = None
+        except Exception as e:
+            print(f"Geocoding failed for {query}: {e}")
+            places = []
+
+        return self._finish_remote(query, key, places)
+
+    @staticmethod
+    def _record(source: str):
+        buffered_metrics.increment_counter("geocode_lookups", labels={"source": source})
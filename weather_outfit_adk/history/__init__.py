@@ -0,0 +1,12 @@
+"""
+Weather history
+
+Embedded on-disk store of daily observations for climatology queries.
+"""
+
+from .store import HistoryStore, FIELDS
+
+__all__ = [
+    "HistoryStore",
+    "FIELDS",
+]
@@ -0,0 +1,372 @@
+"""
+Weather History Store
+
+Embedded columnar store of daily weather observations, used for
+climatology ("typical weather on this date") beyond the short-lived caches.
+
+Layout under the root directory:
+
+    locations.tsv        append-only index: slot, lat, lon, alt
+    2024/2024-11.wx      one memory-mapped file per month
+
+A month file is a 64-byte header followed by one fixed-size block per
+location slot. A block holds FIELDS x 31 days as float32 (native byte
+order), column by column, so a location's month is one contiguous
+868-byte read and each field's days are contiguous. Missing values are
+NaN. Files grow GROW_SLOTS blocks at a time as locations are added, so
+thousands of locations cost ~3.5 MB per month and a decade ~420 MB.
+
+Writers serialize on a mutex per store and, where fcntl exists, on
+advisory file locks, so several processes on one node can share a root.
+Readers take no locks (a torn read can only mix an old and a new value
+of the same day).
+"""
+
+import math
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from ..monitoring.metrics import buffered_metrics
+
+FIELDS = ("tavg", "tmin", "tmax", "prcp", "snow", "wspd", "rhum")
+DAYS = 31
+BLOCK_VALUES = len(FIELDS) * DAYS
+BLOCK_BYTES = BLOCK_VALUES * 4
+GROW_SLOTS = 256
+
+_MAGIC = b"WXHIST01"
+_HEADER_SIZE = 64
+_NAN_BLOCK = memoryview(bytearray(BLOCK_BYTES)).cast("f")
+for _i in range(BLOCK_VALUES):
+    _NAN_BLOCK[_i] = math.nan
+_NAN_BLOCK = _NAN_BLOCK.tobytes()
+_INDEX = "locations.tsv"
+
+LocationKey = Tuple[float, float, int]
+
+
+@contextmanager
+def _file_lock(fd: int):
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _months(start: date, end: date) -> Iterator[Tuple[int, int, int, int]]:
+    """(year, month, first day, last day) for each month touched by [start, end]"""
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        first = start.day if (year, month) == (start.year, start.month) else 1
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        last = end.day if (year, month) == (end.year, end.month) else (next_month - timedelta(days=1)).day
+        yield year, month, first, last
+        year, month = next_month.year, next_month.month
+
+
+def _release(month_map: mmap.mmap):
+    """Close a map, unless a block view still points into it
+
+    Such a map is only dropped here: it is unmapped when its last view is
+    released, so readers never see it closed underneath them.
+    """
+    try:
+        month_map.close()
+    except BufferError:
+        pass
+
+
+class _MonthFile:
+    """One month's memory-mapped block file."""
+
+    def __init__(self, path: str, fd: int):
+        self.path = path
+        self.fd = fd
+        self.map: Optional[mmap.mmap] = None
+        self.slots = 0
+        self._remap()
+
+    @classmethod
+    def open(cls, path: str, create: bool) -> Optional["_MonthFile"]:
+        if not create and not os.path.exists(path):
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with _file_lock(fd):
+            if os.fstat(fd).st_size < _HEADER_SIZE:
+                os.pwrite(fd, _MAGIC.ljust(_HEADER_SIZE, b"\0"), 0)
+            elif os.pread(fd, len(_MAGIC), 0) != _MAGIC:
+                os.close(fd)
+                raise ValueError(f"{path} is not a weather history file")
+        return cls(path, fd)
+
+    def _remap(self):
+        size = os.fstat(self.fd).st_size
+        slots = max(0, (size - _HEADER_SIZE) // BLOCK_BYTES)
+        if self.map is not None and slots == self.slots:
+            return
+        if self.map is not None:
+            _release(self.map)
+        self.map = mmap.mmap(self.fd, _HEADER_SIZE + slots * BLOCK_BYTES) if slots else None
+        self.slots = slots
+
+    def has(self, slot: int) -> bool:
+        if slot >= self.slots:
+            self._remap()  # Another process may have grown the file
+        return slot < self.slots
+
+    def grow(self, slot: int):
+        """Make room for slot, filling new blocks with NaN."""
+        if self.has(slot):
+            return
+        with _file_lock(self.fd):
+            current = max(0, (os.fstat(self.fd).st_size - _HEADER_SIZE) // BLOCK_BYTES)
+            if current <= slot:
+                target = (slot // GROW_SLOTS + 1) * GROW_SLOTS
+                os.pwrite(self.fd, _NAN_BLOCK * (target - current), _HEADER_SIZE + current * BLOCK_BYTES)
+        self._remap()
+
+    @contextmanager
+    def block(self, slot: int) -> Iterator[memoryview]:
+        """float32 view of a slot's block (FIELDS x DAYS, column by column)"""
+        offset = _HEADER_SIZE + slot * BLOCK_BYTES
+        with memoryview(self.map)[offset:offset + BLOCK_BYTES] as raw, raw.cast("f") as values:
+            yield values
+
+    def close(self):
+        if self.map is not None:
+            _release(self.map)
+            self.map = None
+        os.close(self.fd)
+
+
+def _stats(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"min": None, "max": None, "mean": None, "count": 0}
+    return {
+        "min": min(values),
+        "max": max(values),
+        "mean": sum(values) / len(values),
+        "count": len(values),
+    }
+
+
+class HistoryStore:
+    """Memory-mapped columnar store of daily weather, partitioned by month and location."""
+
+    def __init__(self, root: str, name: str = "history", max_open_files: int = 64):
+        """
+        Open (or create) a store
+
+        Args:
+            root: Directory holding the index and month files
+            name: Store name used as the metrics label
+            max_open_files: Month files kept mapped at once (least recently used are closed)
+        """
+        self.root = root
+        self.name = name
+        self.max_open_files = max(1, max_open_files)
+        self._lock = threading.RLock()
+        self._files: "OrderedDict[Tuple[int, int], _MonthFile]" = OrderedDict()
+        self._slots: Dict[LocationKey, int] = {}
+        os.makedirs(root, exist_ok=True)
+        self._index_fd = os.open(os.path.join(root, _INDEX), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._load_index()
+
+    def _load_index(self):
+        with open(os.path.join(self.root, _INDEX)) as index:
+            for line in index:
+                try:
+                    slot, lat, lon, alt = line.rstrip("\n").split("\t")
+                    self._slots[(float(lat), float(lon), int(alt))] = int(slot)
+                except ValueError:
+                    continue  # Partial line from an interrupted append
+
+    def _slot(self, location: Hashable, create: bool) -> Optional[int]:
+        slot = self._slots.get(location)
+        if slot is not None or not create:
+            return slot
+        with self._lock, _file_lock(self._index_fd):
+            self._load_index()  # Another process may have added it
+            slot = self._slots.get(location)
+            if slot is None:
+                slot = max(self._slots.values(), default=-1) + 1
+                lat, lon, alt = location
+                os.write(self._index_fd, f"{slot}\t{lat}\t{lon}\t{alt}\n".encode("utf-8"))
+                self._slots[location] = slot
+        return slot
+
+    def _month(self, year: int, month: int, create: bool) -> Optional[_MonthFile]:
+        with self._lock:
+            month_file = self._files.get((year, month))
+            if month_file is None:
+                path = os.path.join(self.root, f"{year:04d}", f"{year:04d}-{month:02d}.wx")
+                month_file = _MonthFile.open(path, create)
+                if month_file is None:
+                    return None
+                self._files[(year, month)] = month_file
+                while len(self._files) > self.max_open_files:
+                    self._files.popitem(last=False)[1].close()
+            self._files.move_to_end((year, month))
+            return month_file
+
+    def write(self, location: LocationKey, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store daily rows for a location (later writes replace earlier ones)
+
+        Args:
+            location: Location key (see series_cache.location_key)
+            rows: Daily rows with a "date" (YYYY-MM-DD) and any of FIELDS
+
+        Returns:
+            Number of days written
+        """
+        by_month: Dict[Tuple[int, int], List[Tuple[int, Dict[str, Any]]]] = {}
+        for row in rows:
+            try:
+                day = date.fromisoformat(str(row["date"])[:10])
+            except (KeyError, ValueError):
+                continue
+            by_month.setdefault((day.year, day.month), []).append((day.day, row))
+        if not by_month:
+            return 0
+
+        slot = self._slot(location, create=True)
+        written = 0
+        with self._lock:
+            for (year, month), days in by_month.items():
+                month_file = self._month(year, month, create=True)
+                month_file.grow(slot)
+                with month_file.block(slot) as values:
+                    for day, row in days:
+                        for i, field in enumerate(FIELDS):
+                            value = row.get(field)
+                            values[i * DAYS + day - 1] = math.nan if value is None else float(value)
+                written += len(days)
+
+        buffered_metrics.increment_counter("weather_history_days", value=written, labels={"store": self.name, "op": "write"})
+        return written
+
+    def scan(self, location: LocationKey, start: date, end: date) -> Dict[str, List[Any]]:
+        """
+        Range scan for one location
+
+        Returns:
+            Columns: "date" (every day in [start, end]) and one list per
+            field, None where nothing is stored
+        """
+        columns: Dict[str, List[Any]] = {"date": [], **{field: [] for field in FIELDS}}
+        slot = self._slot(location, create=False)
+        for year, month, first, last in _months(start, end):
+            columns["date"].extend(date(year, month, day) for day in range(first, last + 1))
+            # Under the lock: a concurrent write may grow (remap) the file or evict it
+            with self._lock:
+                month_file = self._month(year, month, create=False) if slot is not None else None
+                if month_file is None or not month_file.has(slot):
+                    block = None
+                else:
+                    with month_file.block(slot) as values:
+                        block = values.tolist()
+            if block is None:
+                for field in FIELDS:
+                    columns[field].extend([None] * (last - first + 1))
+                continue
+            for i, field in enumerate(FIELDS):
+                columns[field].extend(v if v == v else None for v in block[i * DAYS + first - 1:i * DAYS + last])
+
+        read = sum(1 for v in columns["tavg"] if v is not None)
+        buffered_metrics.increment_counter("weather_history_days", value=read, labels={"store": self.name, "op": "read"})
+        return columns
+
+    def coverage(self, location: LocationKey, start: date, end: date) -> float:
+        """Share of days in [start, end] with a stored average or maximum temperature"""
+        columns = self.scan(location, start, end)
+        known = sum(1 for avg, high in zip(columns["tavg"], columns["tmax"]) if avg is not None or high is not None)
+        return known / len(columns["date"]) if columns["date"] else 0.0
+
+    def aggregate(self, location: LocationKey, start: date, end: date) -> Dict[str, Dict[str, Optional[float]]]:
+        """min / max / mean / count of every field over [start, end]"""
+        columns = self.scan(location, start, end)
+        return {field: _stats([v for v in columns[field] if v is not None]) for field in FIELDS}
+
+    def climatology(
+        self,
+        location: LocationKey,
+        month: int,
+        day: int,
+        first_year: int,
+        last_year: int,
+        window_days: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Typical weather for a calendar day, pooled over years
+
+        Args:
+            location: Location key
+            month: Calendar month
+            day: Calendar day (Feb 29 uses Feb 28 in non-leap years)
+            first_year: First year included
+            last_year: Last year included
+            window_days: Days either side of the date pooled with it
+
+        Returns:
+            {field: {min, max, mean, count}, "days": observed days,
+             "years": years with data, "wet_days": share with >= 1 mm of
+             precipitation, "snow_days": share with snow}
+        """
+        pooled: Dict[str, List[float]] = {field: [] for field in FIELDS}
+        years = 0
+        wet = snow = observed = 0
+        for year in range(first_year, last_year + 1):
+            center = date(year, month, min(day, 28) if month == 2 and day == 29 and not _leap(year) else day)
+            span = timedelta(days=max(0, window_days))
+            columns = self.scan(location, center - span, center + span)
+            found = False
+            for i in range(len(columns["date"])):
+                if columns["tavg"][i] is None and columns["tmax"][i] is None:
+                    continue
+                found = True
+                observed += 1
+                prcp, snow_depth = columns["prcp"][i], columns["snow"][i]
+                wet += 1 if prcp is not None and prcp >= 1.0 else 0
+                snow += 1 if snow_depth is not None and snow_depth > 0 else 0
+                for field in FIELDS:
+                    if columns[field][i] is not None:
+                        pooled[field].append(columns[field][i])
+            years += found
+
+        result: Dict[str, Any] = {field: _stats(values) for field, values in pooled.items()}
+        result["days"] = observed
+        result["years"] = years
+        result["wet_days"] = wet / observed if observed else None
+        result["snow_days"] = snow / observed if observed else None
+        return result
+
+    def __len__(self) -> int:
+        """Number of locations in the index"""
+        return len(self._slots)
+
+    def close(self):
+        with self._lock:
+            for month_file in self._files.values():
+                month_file.close()
+            self._files.clear()
+            os.close(self._index_fd)
+
+
+def _leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
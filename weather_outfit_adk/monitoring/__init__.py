@@ -17,13 +17,15 @@ Quick Start:
         result = do_operation()
 """
 
-from .metrics import MetricsCollector, agent_metrics
+from .metrics import MetricsCollector, MetricBuffer, agent_metrics, buffered_metrics
 from .logging_config import setup_logging, get_logger
 from .tracing import setup_tracing, trace_agent_call
 
 __all__ = [
     "MetricsCollector",
+    "MetricBuffer",
     "agent_metrics",
+    "buffered_metrics",
     "setup_logging",
     "get_logger",
     "setup_tracing",
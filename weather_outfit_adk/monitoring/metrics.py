@@ -8,8 +8,10 @@ Tracks:
 - Request counts
 """
 
+import atexit
 import time
 import os
+import threading
 from typing import Dict, Optional, Any
 from contextlib import contextmanager
 
@@ -36,6 +38,32 @@ class MetricsCollector:
         "tool_calls": ["tool", "status"],
         "http_request_latency": ["service", "method", "path", "status"],
         "http_requests": ["service", "method", "status"],
+        "weather_cache_requests": ["cache", "result"],
+        "weather_cache_evictions": ["cache", "reason"],
+        "weather_cache_entries": ["cache"],
+        "weather_cache_bytes": ["cache"],
+        "weather_cache_alias_hits": ["cache", "alias"],
+        "weather_cache_refreshes": ["cache", "result"],
+        "weather_prewarm_fetches": ["cache", "result"],
+        "weather_prewarm_hits": ["cache", "source"],
+        "weather_singleflight_calls": ["flight", "result"],
+        "weather_series_lookups": ["cache", "result"],
+        "weather_hourly_lookups": ["cache", "result"],
+        "weather_history_days": ["store", "op"],
+        "weather_http_pool_checkouts": ["pool", "result"],
+        "weather_http_pool_connections": ["pool", "state"],
+        "weather_rate_limit_requests": ["limiter", "priority", "result"],
+        "weather_rate_limit_tokens": ["limiter", "priority"],
+        "weather_rate_limit_quota_remaining": ["limiter"],
+        "weather_circuit_calls": ["upstream", "result"],
+        "weather_circuit_transitions": ["upstream", "state"],
+        "weather_circuit_state": ["upstream"],
+        "weather_provider_calls": ["provider", "result"],
+        "weather_provider_latency": ["provider"],
+        "weather_provider_hedges": ["provider", "result"],
+        "geocode_lookups": ["source"],
+        "outfit_shared_plan_lookups": ["table", "result"],
+        "outfit_shared_plan_entries": ["table"],
     }
     
     def __init__(self):
@@ -59,11 +87,14 @@ class MetricsCollector:
         # In-memory counters for local tracking
         self.counters: Dict[str, int] = {}
         self.timers: Dict[str, list] = {}
+        self.gauges: Dict[str, float] = {}
+        self._lock = threading.Lock()
     
     def increment_counter(self, metric_name: str, value: int = 1, labels: Optional[Dict[str, str]] = None):
         """Increment a counter metric"""
         key = f"{metric_name}:{labels or {}}"
-        self.counters[key] = self.counters.get(key, 0) + value
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
         
         if self.enabled:
             # Use gauge to report current count
@@ -77,9 +108,8 @@ class MetricsCollector:
     def record_latency(self, metric_name: str, duration_ms: float, labels: Optional[Dict[str, str]] = None):
         """Record a latency/duration metric"""
         key = f"{metric_name}:{labels or {}}"
-        if key not in self.timers:
-            self.timers[key] = []
-        self.timers[key].append(duration_ms)
+        with self._lock:
+            self.timers.setdefault(key, []).append(duration_ms)
         
         if self.enabled:
             self._write_custom_metric(
@@ -89,6 +119,20 @@ class MetricsCollector:
                 labels=labels or {}
             )
     
+    def set_gauge(self, metric_name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        """Record the current value of a gauge metric (sizes, utilization)"""
+        key = f"{metric_name}:{labels or {}}"
+        with self._lock:
+            self.gauges[key] = value
+        
+        if self.enabled:
+            self._write_custom_metric(
+                metric_type="gauge",
+                metric_name=metric_name,
+                value=value,
+                labels=labels or {}
+            )
+    
     @contextmanager
     def measure_time(self, metric_name: str, labels: Optional[Dict[str, str]] = None):
         """Context manager to measure execution time"""
@@ -190,13 +234,19 @@ class MetricsCollector:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current metrics statistics"""
+        with self._lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            timers = {key: list(values) for key, values in self.timers.items()}
+        
         stats = {
-            "counters": dict(self.counters),
+            "counters": counters,
+            "gauges": gauges,
             "latencies": {}
         }
         
         # Calculate average latencies
-        for key, values in self.timers.items():
+        for key, values in timers.items():
             if values:
                 stats["latencies"][key] = {
                     "count": len(values),
@@ -212,6 +262,117 @@ class MetricsCollector:
 agent_metrics = MetricsCollector()
 
 
+class MetricBuffer:
+    """
+    Aggregates hot-path metrics in process and publishes them on a timer
+
+    MetricsCollector writes each call to Cloud Monitoring synchronously,
+    which is too slow (and too frequent for the API's write limits) for
+    per-lookup metrics in caches, pools and limiters. MetricBuffer has the
+    same increment_counter / set_gauge / record_latency methods but only
+    updates in-memory aggregates; a daemon thread hands them to the
+    collector every interval_seconds:
+
+    - counters: the increase since the last publication
+    - gauges: the latest value
+    - latencies: the mean of the samples since the last publication
+    """
+
+    def __init__(self, collector: MetricsCollector, interval_seconds: float = 10.0):
+        """
+        Initialize the buffer
+
+        Args:
+            collector: Collector the aggregates are published to
+            interval_seconds: Seconds between publications (0 publishes only on flush())
+        """
+        self.collector = collector
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._counters: Dict[tuple, int] = {}
+        self._gauges: Dict[tuple, float] = {}
+        self._latencies: Dict[tuple, list] = {}
+        self._publisher: Optional[threading.Thread] = None
+        if hasattr(os, "register_at_fork"):
+            # Threads don't survive fork: each worker starts its own publisher
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    @staticmethod
+    def _key(metric_name: str, labels: Optional[Dict[str, str]]) -> tuple:
+        return (metric_name, tuple(labels.items()) if labels else ())
+
+    def increment_counter(self, metric_name: str, value: int = 1, labels: Optional[Dict[str, str]] = None):
+        """Add to a counter (published as the increase since the last publication)"""
+        key = self._key(metric_name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        if self._publisher is None:
+            self._start_publisher()
+
+    def set_gauge(self, metric_name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        """Set a gauge (published as the latest value)"""
+        key = self._key(metric_name, labels)
+        with self._lock:
+            self._gauges[key] = value
+        if self._publisher is None:
+            self._start_publisher()
+
+    def record_latency(self, metric_name: str, duration_ms: float, labels: Optional[Dict[str, str]] = None):
+        """Record a latency sample (published as the mean since the last publication)"""
+        key = self._key(metric_name, labels)
+        with self._lock:
+            total = self._latencies.get(key)
+            if total is None:
+                self._latencies[key] = [duration_ms, 1]
+            else:
+                total[0] += duration_ms
+                total[1] += 1
+        if self._publisher is None:
+            self._start_publisher()
+
+    def flush(self):
+        """Publish everything aggregated so far to the collector"""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            gauges, self._gauges = self._gauges, {}
+            latencies, self._latencies = self._latencies, {}
+        for (metric_name, labels), value in counters.items():
+            self.collector.increment_counter(metric_name, value=value, labels=dict(labels))
+        for (metric_name, labels), value in gauges.items():
+            self.collector.set_gauge(metric_name, value, labels=dict(labels))
+        for (metric_name, labels), (total, count) in latencies.items():
+            self.collector.record_latency(metric_name, total / count, labels=dict(labels))
+
+    def _start_publisher(self):
+        if self.interval_seconds <= 0:
+            return
+        with self._lock:
+            if self._publisher is not None:
+                return
+            self._publisher = threading.Thread(target=self._publish_loop, name="metrics-publisher", daemon=True)
+        self._publisher.start()
+
+    def _publish_loop(self):
+        while True:
+            time.sleep(self.interval_seconds)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️  Metrics publication failed: {e}")
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._publisher = None
+
+
+# Buffered front of agent_metrics for per-request metrics on hot paths
+buffered_metrics = MetricBuffer(
+    agent_metrics,
+    interval_seconds=float(os.getenv("METRICS_PUBLISH_INTERVAL_SECONDS", "10")),
+)
+atexit.register(buffered_metrics.flush)
+
+
 # Convenience decorators
 def track_agent_call(agent_name: str):
     """Decorator to track agent calls"""
@@ -25,10 +25,10 @@ except ImportError:
 
 
 # Global tracer
-_tracer: Optional[trace.Tracer] = None
+_tracer: Optional["trace.Tracer"] = None
 
 
-def setup_tracing(service_name: str) -> Optional[trace.Tracer]:
+def setup_tracing(service_name: str) -> Optional["trace.Tracer"]:
     """
     Set up OpenTelemetry tracing with Cloud Trace export
     
@@ -78,7 +78,7 @@ def setup_tracing(service_name: str) -> Optional[trace.Tracer]:
         return None
 
 
-def get_tracer() -> Optional[trace.Tracer]:
+def get_tracer() -> Optional["trace.Tracer"]:
     """Get the current tracer instance"""
     return _tracer
 
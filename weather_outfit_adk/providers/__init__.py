@@ -0,0 +1,53 @@
+"""
+Weather provider clients
+
+Pooled HTTP clients (blocking and asyncio) for the upstream weather APIs
+used by the weather tools, the WeatherProvider interface over them, and
+the router that picks between providers.
+"""
+
+from .errors import WeatherProviderError, RateLimitExceeded, CircuitOpenError
+from .http_pool import HTTPConnectionPool, PooledResponse
+from .async_http_pool import AsyncHTTPConnectionPool
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import (
+    RateLimiter,
+    LocalQuotaLedger,
+    SqliteQuotaLedger,
+    request_priority,
+    current_priority,
+    abandon_when,
+    INTERACTIVE,
+    PREWARM,
+)
+from .base import WeatherProvider
+from .meteostat import MeteostatClient, AsyncMeteostatClient, MeteostatProvider, METEOSTAT_HOST
+from .open_meteo import OpenMeteoProvider, OPEN_METEO_HOST, WEATHER_CODES
+from .router import ProviderRouter
+
+__all__ = [
+    "WeatherProviderError",
+    "RateLimitExceeded",
+    "CircuitOpenError",
+    "HTTPConnectionPool",
+    "PooledResponse",
+    "AsyncHTTPConnectionPool",
+    "CircuitBreaker",
+    "RateLimiter",
+    "LocalQuotaLedger",
+    "SqliteQuotaLedger",
+    "request_priority",
+    "current_priority",
+    "abandon_when",
+    "INTERACTIVE",
+    "PREWARM",
+    "WeatherProvider",
+    "MeteostatClient",
+    "AsyncMeteostatClient",
+    "MeteostatProvider",
+    "METEOSTAT_HOST",
+    "OpenMeteoProvider",
+    "OPEN_METEO_HOST",
+    "WEATHER_CODES",
+    "ProviderRouter",
+]
@@ -0,0 +1,288 @@
+"""
+Asyncio Keep-alive HTTP Connection Pool
+
+asyncio counterpart of HTTPConnectionPool for code running on an event
+loop (uvicorn/Starlette A2A services, async ADK tools). Speaks plain
+HTTP/1.1 over asyncio streams so the loop is never blocked on network I/O.
+
+Streams are bound to the loop that opened them, so idle connections are
+kept per event loop.
+"""
+
+import asyncio
+import ssl
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+from .http_pool import PooledResponse
+
+_STALE_CONNECTION_ERRORS = (
+    asyncio.IncompleteReadError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class _RemoteDisconnected(ConnectionError):
+    """Server closed the connection before sending a status line."""
+
+
+class _AsyncConnection:
+    __slots__ = ("reader", "writer", "last_used", "requests")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+        self.requests = 0
+
+    def is_alive(self) -> bool:
+        return not (self.reader.at_eof() or self.writer.is_closing())
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class AsyncHTTPConnectionPool:
+    """Keep-alive connection pool for one host, usable from any event loop."""
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        scheme: str = "https",
+        max_size: int = 8,
+        idle_timeout: float = 60.0,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        name: Optional[str] = None
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            host: Upstream host name
+            port: Upstream port (defaults to the scheme's port)
+            scheme: "https" or "http"
+            max_size: Maximum number of idle connections kept per event loop
+            idle_timeout: Seconds after which an idle connection is discarded
+            connect_timeout: TCP/TLS connect timeout in seconds
+            read_timeout: Timeout in seconds for each read once connected
+            name: Pool name used as the metrics label (defaults to host)
+        """
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported scheme: {scheme}")
+
+        self.host = host
+        self.port = port or (443 if scheme == "https" else 80)
+        self.scheme = scheme
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.name = name or host
+
+        # RFC 9112 3.2: the Host header carries the port unless it is the scheme's default
+        host_name = f"[{host}]" if ":" in host else host
+        default_port = 443 if scheme == "https" else 80
+        self._host_header = host_name if self.port == default_port else f"{host_name}:{self.port}"
+        self._ssl_context = ssl.create_default_context() if scheme == "https" else None
+        self._idle: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[_AsyncConnection]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "discarded": 0,
+            "retries": 0,
+        }
+
+    def _idle_for_loop(self) -> List[_AsyncConnection]:
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get(loop)
+        if idle is None:
+            idle = []
+            self._idle[loop] = idle
+        return idle
+
+    async def _new_connection(self) -> _AsyncConnection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host,
+                self.port,
+                ssl=self._ssl_context,
+                server_hostname=self.host if self._ssl_context else None
+            ),
+            timeout=self.connect_timeout
+        )
+        self._stats["created"] += 1
+        buffered_metrics.increment_counter(
+            "weather_http_pool_checkouts",
+            labels={"pool": self.name, "result": "new"}
+        )
+        return _AsyncConnection(reader, writer)
+
+    async def _checkout(self) -> _AsyncConnection:
+        idle = self._idle_for_loop()
+        now = time.monotonic()
+        while idle:
+            conn = idle.pop()
+            if now - conn.last_used <= self.idle_timeout and conn.is_alive():
+                self._stats["reused"] += 1
+                buffered_metrics.increment_counter(
+                    "weather_http_pool_checkouts",
+                    labels={"pool": self.name, "result": "reused"}
+                )
+                return conn
+            buffered_metrics.increment_counter(
+                "weather_http_pool_checkouts",
+                labels={"pool": self.name, "result": "stale"}
+            )
+            self._discard(conn)
+        return await self._new_connection()
+
+    def _discard(self, conn: _AsyncConnection):
+        conn.close()
+        self._stats["discarded"] += 1
+
+    def _checkin(self, conn: _AsyncConnection, reusable: bool):
+        conn.last_used = time.monotonic()
+        idle = self._idle_for_loop()
+        if reusable and len(idle) < self.max_size:
+            idle.append(conn)
+        else:
+            self._discard(conn)
+        buffered_metrics.set_gauge("weather_http_pool_connections", len(idle), labels={"pool": self.name, "state": "idle"})
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
+    ) -> PooledResponse:
+        """
+        Send a request over a pooled connection
+
+        Args:
+            method: HTTP method
+            path: Request path including query string
+            headers: Request headers
+            body: Optional request body
+
+        Returns:
+            PooledResponse with the fully read body
+        """
+        conn = await self._checkout()
+        reused = conn.requests > 0
+
+        try:
+            response, reusable = await self._send(conn, method, path, headers, body)
+        except (_RemoteDisconnected,) + _STALE_CONNECTION_ERRORS:
+            self._checkin(conn, reusable=False)
+            if not reused:
+                raise
+            # Server closed a kept-alive connection while it sat in the pool
+            self._stats["retries"] += 1
+            conn = await self._checkout()
+            try:
+                response, reusable = await self._send(conn, method, path, headers, body)
+            except BaseException:
+                self._checkin(conn, reusable=False)
+                raise
+        except BaseException:
+            self._checkin(conn, reusable=False)
+            raise
+
+        self._checkin(conn, reusable)
+        return response
+
+    async def _send(
+        self,
+        conn: _AsyncConnection,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        body: Optional[bytes]
+    ) -> Tuple[PooledResponse, bool]:
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self._host_header}"]
+        for key, value in (headers or {}).items():
+            lines.append(f"{key}: {value}")
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        lines.append("Connection: keep-alive")
+        conn.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await asyncio.wait_for(conn.writer.drain(), timeout=self.read_timeout)
+
+        status_line = await self._readline(conn)
+        if not status_line:
+            raise _RemoteDisconnected("Remote end closed connection without response")
+        version, status, reason = self._parse_status_line(status_line)
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = await self._readline(conn)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        connection = response_headers.get("connection", "").lower()
+        will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            data = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked(conn)
+        elif "content-length" in response_headers:
+            data = await self._read_exactly(conn, int(response_headers["content-length"]))
+        else:
+            data = await asyncio.wait_for(conn.reader.read(), timeout=self.read_timeout)
+            will_close = True
+
+        conn.requests += 1
+        return PooledResponse(status, reason, response_headers, data), not will_close
+
+    @staticmethod
+    def _parse_status_line(line: bytes) -> Tuple[str, int, str]:
+        parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ConnectionError(f"Malformed status line: {line!r}")
+        return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+    async def _readline(self, conn: _AsyncConnection) -> bytes:
+        return await asyncio.wait_for(conn.reader.readline(), timeout=self.read_timeout)
+
+    async def _read_exactly(self, conn: _AsyncConnection, n: int) -> bytes:
+        return await asyncio.wait_for(conn.reader.readexactly(n), timeout=self.read_timeout)
+
+    async def _read_chunked(self, conn: _AsyncConnection) -> bytes:
+        chunks = []
+        while True:
+            size_line = await self._readline(conn)
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while (await self._readline(conn)) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self._read_exactly(conn, size))
+            await self._read_exactly(conn, 2)
+
+    async def close(self):
+        """Close idle connections owned by the running event loop."""
+        idle = self._idle_for_loop()
+        while idle:
+            self._discard(idle.pop())
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters"""
+        stats = dict(self._stats)
+        stats["max_size"] = self.max_size
+        return stats
@@ -0,0 +1,100 @@
+"""
+Weather Provider Interface
+
+Common interface for upstream daily-weather sources, so the weather tools
+(and the ProviderRouter) don't depend on any one API.
+
+Providers return daily rows in Meteostat's shape, whatever the upstream:
+
+    {"date": "2025-11-14", "tavg": 10.2, "tmin": 6.0, "tmax": 14.1,
+     "prcp": 1.3, "snow": 0.0, "wspd": 12.0, "rhum": 71.0}
+
+(temperatures in °C, precipitation/snow in mm, wind in km/h). Missing
+fields are omitted or None.
+
+Providers with hourly data also implement hourly(), returning rows keyed
+by UTC hour, in the same units:
+
+    {"time": "2025-11-14T18:00:00", "temp": 9.1, "rhum": 80.0, "prcp": 0.4,
+     "snow": 0.0, "wspd": 14.0, "coco": 7, "pop": 60.0, "utc_offset": -28800}
+
+coco is a Meteostat weather condition code, pop the probability of
+precipitation in percent, and utc_offset the location's offset from UTC
+in seconds; all three are optional.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from .circuit_breaker import OPEN, CircuitBreaker
+from .errors import WeatherProviderError
+
+
+class WeatherProvider(ABC):
+    """A source of daily weather observations/forecasts."""
+
+    name: str = "provider"
+    breaker: Optional[CircuitBreaker] = None
+
+    def available(self) -> bool:
+        """True if the provider is configured (e.g. has an API key)."""
+        return True
+
+    def healthy(self) -> bool:
+        """True unless the provider's circuit breaker is open."""
+        return self.breaker is None or self.breaker.state != OPEN
+
+    def supports(self, start: date, end: date) -> bool:
+        """True if the provider can serve every day in [start, end]."""
+        return True
+
+    @abstractmethod
+    def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        """
+        Fetch daily rows for a point
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD), inclusive
+
+        Returns:
+            Daily rows (see module docstring); days without data are absent
+
+        Raises:
+            WeatherProviderError: If the upstream call fails
+        """
+
+    @abstractmethod
+    async def daily_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        """Async version of daily."""
+
+    def supports_hourly(self, start: date, end: date) -> bool:
+        """True if hourly() can serve every day in [start, end]."""
+        return False
+
+    def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        """
+        Fetch hourly rows for a point
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD, UTC)
+            end: End date (YYYY-MM-DD, UTC), inclusive
+
+        Returns:
+            Hourly rows (see module docstring) in time order
+
+        Raises:
+            WeatherProviderError: If the upstream call fails or the provider has no hourly data
+        """
+        raise WeatherProviderError(f"{self.name} has no hourly data")
+
+    async def hourly_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        """Async version of hourly."""
+        raise WeatherProviderError(f"{self.name} has no hourly data")
@@ -0,0 +1,173 @@
+"""
+Circuit Breaker
+
+Stops calling an upstream that is failing, so an outage costs a
+microsecond check instead of a connect/read timeout per request:
+
+- closed: calls go through; failure_threshold consecutive failures open it
+- open: calls are rejected with CircuitOpenError until reset_seconds pass
+- half-open: up to half_open_calls probe calls go through; a success
+  closes the circuit, a failure opens it again for another reset_seconds
+
+Only upstream failures count (connection errors, timeouts, 5xx). Client
+errors such as 404 mean the upstream is healthy, and RateLimitExceeded is
+raised before the call is made, so neither affects the circuit.
+"""
+
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator
+
+from ..monitoring.metrics import buffered_metrics
+from .errors import CircuitOpenError, RateLimitExceeded, WeatherProviderError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """True if an exception means the upstream itself is unhealthy."""
+    if isinstance(error, (RateLimitExceeded, CircuitOpenError)):
+        return False
+    if isinstance(error, WeatherProviderError):
+        return error.status is None or error.status >= 500
+    return isinstance(error, (OSError, TimeoutError))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker (closed)
+
+        Args:
+            name: Upstream name used as the metrics label
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: How long the circuit stays open before probing
+            half_open_calls: Probe calls allowed at once while half-open
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+            self._transition(HALF_OPEN)
+
+    def _transition(self, state: str):
+        self._state = state
+        if state == OPEN:
+            self._opened_at = self._clock()
+        if state != CLOSED:
+            self._probes = 0
+        buffered_metrics.increment_counter("weather_circuit_transitions", labels={"upstream": self.name, "state": state})
+        buffered_metrics.set_gauge("weather_circuit_state", _STATE_VALUES[state], labels={"upstream": self.name})
+
+    def before_call(self):
+        """
+        Admit a call or fail fast
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                self._record("probe")
+                return
+            retry_in = max(0.0, self.reset_seconds - (self._clock() - self._opened_at))
+        self._record("rejected")
+        raise CircuitOpenError(f"{self.name} circuit is open", retry_in=retry_in)
+
+    def record_success(self):
+        """The admitted call succeeded."""
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self):
+        """The admitted call failed because of the upstream."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._transition(OPEN)
+
+    def release(self):
+        """The admitted call never reached the upstream (e.g. it was rate limited)."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def _finish(self, error: BaseException):
+        # Cancellation and local shedding say nothing about the upstream
+        if isinstance(error, RateLimitExceeded) or not isinstance(error, Exception):
+            self.release()
+        elif is_upstream_failure(error):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one upstream call under the breaker
+
+            with breaker.guard():
+                response = pool.request(...)
+        """
+        self.before_call()
+        try:
+            yield
+        except BaseException as e:
+            self._finish(e)
+            raise
+        self.record_success()
+
+    @asynccontextmanager
+    async def guard_async(self) -> AsyncIterator[None]:
+        """Async version of guard."""
+        self.before_call()
+        try:
+            yield
+        except BaseException as e:
+            self._finish(e)
+            raise
+        self.record_success()
+
+    def stats(self) -> Dict[str, object]:
+        """Current state and consecutive failure count"""
+        with self._lock:
+            self._maybe_half_open()
+            return {"state": self._state, "consecutive_failures": self._failures}
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter("weather_circuit_calls", labels={"upstream": self.name, "result": result})
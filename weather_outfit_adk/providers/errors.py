@@ -0,0 +1,27 @@
+"""Exceptions raised by weather provider clients."""
+
+from typing import Optional
+
+
+class WeatherProviderError(Exception):
+    """An upstream weather/geocoding call failed."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class RateLimitExceeded(WeatherProviderError):
+    """A call was shed by the client-side rate limiter before reaching the upstream."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message, status=429)
+        self.reason = reason
+
+
+class CircuitOpenError(WeatherProviderError):
+    """A call was rejected without contacting the upstream because its circuit is open."""
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        super().__init__(message, status=503)
+        self.retry_in = retry_in
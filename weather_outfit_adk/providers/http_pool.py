@@ -0,0 +1,307 @@
+"""
+Keep-alive HTTP Connection Pool
+
+Reuses http.client connections to a single upstream host instead of
+paying a TCP + TLS handshake on every request.
+
+- At most max_size connections per host: checkouts beyond that wait up
+  to checkout_timeout for one to come back, then are shed
+- Idle connections kept LIFO so warm connections are reused first
+- Idle timeout and a liveness check on checkout
+- Separate connect and read timeouts
+- One transparent retry when a reused connection turns out to be stale
+"""
+
+import http.client
+import select
+import threading
+import time
+from typing import Dict, List, Optional
+
+from ..monitoring.metrics import buffered_metrics
+from .errors import RateLimitExceeded
+
+# Errors that mean a pooled connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class PooledResponse:
+    """Fully read HTTP response (the body is drained so the socket can be reused)"""
+
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "last_used", "requests")
+
+    def __init__(self, conn: http.client.HTTPConnection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.requests = 0
+
+
+class HTTPConnectionPool:
+    """Thread-safe keep-alive connection pool for one host."""
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        scheme: str = "https",
+        max_size: int = 8,
+        idle_timeout: float = 60.0,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        checkout_timeout: float = 5.0,
+        name: Optional[str] = None
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            host: Upstream host name
+            port: Upstream port (defaults to the scheme's port)
+            scheme: "https" or "http"
+            max_size: Maximum number of connections open to the host (in use or idle)
+            idle_timeout: Seconds after which an idle connection is discarded
+            connect_timeout: TCP/TLS connect timeout in seconds
+            read_timeout: Socket read timeout in seconds once connected
+            checkout_timeout: Seconds to wait for a free connection when max_size are in use
+            name: Pool name used as the metrics label (defaults to host)
+        """
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported scheme: {scheme}")
+
+        self.host = host
+        self.port = port
+        self.scheme = scheme
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.checkout_timeout = checkout_timeout
+        self.name = name or host
+
+        self._lock = threading.Lock()
+        self._returned = threading.Condition(self._lock)
+        self._idle: List[_PooledConnection] = []
+        self._in_use = 0
+        self._closed = False
+        self._stats: Dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "discarded": 0,
+            "retries": 0,
+        }
+
+    def _new_connection(self) -> _PooledConnection:
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(self.host, self.port, timeout=self.connect_timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.connect_timeout)
+
+        conn.connect()
+        conn.sock.settimeout(self.read_timeout)
+
+        with self._lock:
+            self._stats["created"] += 1
+        buffered_metrics.increment_counter(
+            "weather_http_pool_checkouts",
+            labels={"pool": self.name, "result": "new"}
+        )
+        return _PooledConnection(conn)
+
+    @staticmethod
+    def _is_alive(pooled: _PooledConnection) -> bool:
+        """
+        Health check for an idle connection.
+
+        A healthy idle keep-alive socket has nothing to read; if it is
+        readable the server either closed it or sent unsolicited data.
+        """
+        sock = pooled.conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _discard(self, pooled: _PooledConnection):
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._stats["discarded"] += 1
+
+    def _checkout(self) -> _PooledConnection:
+        now = time.monotonic()
+        deadline = now + self.checkout_timeout
+        while True:
+            with self._lock:
+                while not self._closed and self._in_use >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._returned.wait(remaining)
+                if self._closed:
+                    raise RuntimeError(f"Connection pool {self.name} is closed")
+                exhausted = self._in_use >= self.max_size
+                if not exhausted:
+                    pooled = self._idle.pop() if self._idle else None
+                    self._in_use += 1
+
+            if exhausted:
+                buffered_metrics.increment_counter(
+                    "weather_http_pool_checkouts",
+                    labels={"pool": self.name, "result": "timeout"}
+                )
+                raise RateLimitExceeded(
+                    f"Connection pool {self.name}: all {self.max_size} connections busy for {self.checkout_timeout}s",
+                    reason="pool"
+                )
+
+            if pooled is None:
+                try:
+                    return self._new_connection()
+                except Exception:
+                    self._release_slot()
+                    raise
+
+            if now - pooled.last_used <= self.idle_timeout and self._is_alive(pooled):
+                with self._lock:
+                    self._stats["reused"] += 1
+                buffered_metrics.increment_counter(
+                    "weather_http_pool_checkouts",
+                    labels={"pool": self.name, "result": "reused"}
+                )
+                return pooled
+
+            buffered_metrics.increment_counter(
+                "weather_http_pool_checkouts",
+                labels={"pool": self.name, "result": "stale"}
+            )
+            self._release_slot()
+            self._discard(pooled)
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_use -= 1
+            self._returned.notify()
+
+    def _checkin(self, pooled: _PooledConnection, reusable: bool):
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            self._in_use -= 1
+            self._returned.notify()
+            keep = reusable and not self._closed and len(self._idle) < self.max_size
+            if keep:
+                self._idle.append(pooled)
+        if not keep:
+            self._discard(pooled)
+        self._publish_utilization()
+
+    def _publish_utilization(self):
+        with self._lock:
+            idle = len(self._idle)
+            in_use = self._in_use
+        buffered_metrics.set_gauge("weather_http_pool_connections", idle, labels={"pool": self.name, "state": "idle"})
+        buffered_metrics.set_gauge("weather_http_pool_connections", in_use, labels={"pool": self.name, "state": "in_use"})
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
+    ) -> PooledResponse:
+        """
+        Send a request over a pooled connection
+
+        Args:
+            method: HTTP method
+            path: Request path including query string
+            headers: Request headers
+            body: Optional request body
+
+        Returns:
+            PooledResponse with the fully read body
+        """
+        pooled = self._checkout()
+        reused = pooled.requests > 0
+
+        try:
+            response = self._send(pooled, method, path, headers, body)
+        except _STALE_CONNECTION_ERRORS:
+            self._checkin(pooled, reusable=False)
+            if not reused:
+                raise
+            # Server closed a kept-alive connection between our health check and the write
+            with self._lock:
+                self._stats["retries"] += 1
+            pooled = self._checkout()
+            try:
+                response = self._send(pooled, method, path, headers, body)
+            except Exception:
+                self._checkin(pooled, reusable=False)
+                raise
+        except Exception:
+            self._checkin(pooled, reusable=False)
+            raise
+
+        return response
+
+    def _send(
+        self,
+        pooled: _PooledConnection,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        body: Optional[bytes]
+    ) -> PooledResponse:
+        pooled.conn.request(method, path, body=body, headers=headers or {})
+        res = pooled.conn.getresponse()
+        data = res.read()
+        pooled.requests += 1
+
+        response = PooledResponse(
+            status=res.status,
+            reason=res.reason,
+            headers={k.lower(): v for k, v in res.getheaders()},
+            body=data
+        )
+        self._checkin(pooled, reusable=not res.will_close)
+        return response
+
+    def close(self):
+        """Close all idle connections and refuse new checkouts."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._returned.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters and current utilization"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = self._in_use
+        stats["max_size"] = self.max_size
+        return stats
@@ -0,0 +1,244 @@
+"""
+Meteostat RapidAPI Client
+
+Thin clients for the Meteostat point endpoints on RapidAPI that send
+every request over a shared keep-alive connection pool. MeteostatClient
+is blocking; AsyncMeteostatClient is its asyncio counterpart, and
+MeteostatProvider exposes both through the WeatherProvider interface.
+
+An optional CircuitBreaker fails calls fast while Meteostat is down, and
+an optional RateLimiter is consulted before every request and paused for
+Retry-After when the API answers 429 anyway.
+"""
+
+import json
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from .async_http_pool import AsyncHTTPConnectionPool
+from .base import WeatherProvider
+from .circuit_breaker import CircuitBreaker
+from .errors import WeatherProviderError
+from .http_pool import HTTPConnectionPool, PooledResponse
+from .rate_limit import RateLimiter
+
+METEOSTAT_HOST = "meteostat.p.rapidapi.com"
+# Pause used when a 429 carries no usable Retry-After
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+def _daily_params(lat: float, lon: float, alt: int, start: str, end: str) -> Dict[str, Any]:
+    return {"lat": lat, "lon": lon, "alt": alt, "start": start, "end": end}
+
+
+def _hourly_rows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Meteostat hourly rows ("2025-11-14 18:00:00", UTC) with ISO times."""
+    rows = []
+    for row in data.get("data") or []:
+        if not row.get("time"):
+            continue
+        row = dict(row)
+        row["time"] = str(row["time"]).replace(" ", "T")
+        rows.append(row)
+    return rows
+
+
+class _MeteostatBase:
+    """Request building and response parsing shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self._api_key = api_key
+        self.limiter = limiter
+        self.breaker = breaker
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key or os.getenv("RAPIDAPI_KEY")
+
+    def _prepare(self, path: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        api_key = self.api_key
+        if not api_key:
+            raise WeatherProviderError("RAPIDAPI_KEY not set")
+
+        headers = {
+            'x-rapidapi-key': api_key,
+            'x-rapidapi-host': METEOSTAT_HOST
+        }
+        return f"{path}?{urlencode(params)}", headers
+
+    def _parse(self, response: PooledResponse) -> Dict[str, Any]:
+        if response.status == 429 and self.limiter is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after", _DEFAULT_RETRY_AFTER))
+            except ValueError:
+                retry_after = _DEFAULT_RETRY_AFTER
+            self.limiter.throttle(retry_after)
+
+        if response.status >= 400:
+            raise WeatherProviderError(
+                f"Meteostat returned HTTP {response.status} {response.reason}",
+                status=response.status
+            )
+
+        try:
+            return json.loads(response.body.decode("utf-8"))
+        except ValueError as e:
+            raise WeatherProviderError(f"Invalid JSON from Meteostat: {e}", status=response.status)
+
+
+class MeteostatClient(_MeteostatBase):
+    """Meteostat client backed by an HTTPConnectionPool."""
+
+    def __init__(
+        self,
+        pool: HTTPConnectionPool,
+        api_key: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the client
+
+        Args:
+            pool: Connection pool for METEOSTAT_HOST
+            api_key: RapidAPI key (defaults to the RAPIDAPI_KEY env var at request time)
+            limiter: Optional rate limiter / quota budget for the RapidAPI plan
+            breaker: Optional circuit breaker for the Meteostat upstream
+        """
+        super().__init__(api_key, limiter, breaker)
+        self.pool = pool
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, headers = self._prepare(path, params)
+        if self.breaker is None:
+            return self._send(url, headers)
+        with self.breaker.guard():
+            return self._send(url, headers)
+
+    def _send(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self._parse(self.pool.request("GET", url, headers=headers))
+
+    def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> Dict[str, Any]:
+        """
+        Fetch daily observations for a point
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD), inclusive
+
+        Returns:
+            Parsed Meteostat response ({"meta": ..., "data": [...]})
+        """
+        return self._get("/point/daily", _daily_params(lat, lon, alt, start, end))
+
+    def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> Dict[str, Any]:
+        """
+        Fetch hourly observations (and model forecasts) for a point
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD, UTC)
+            end: End date (YYYY-MM-DD, UTC), inclusive
+
+        Returns:
+            Parsed Meteostat response ({"meta": ..., "data": [...]})
+        """
+        return self._get("/point/hourly", _daily_params(lat, lon, alt, start, end))
+
+
+class AsyncMeteostatClient(_MeteostatBase):
+    """Meteostat client backed by an AsyncHTTPConnectionPool."""
+
+    def __init__(
+        self,
+        pool: AsyncHTTPConnectionPool,
+        api_key: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the client
+
+        Args:
+            pool: Async connection pool for METEOSTAT_HOST
+            api_key: RapidAPI key (defaults to the RAPIDAPI_KEY env var at request time)
+            limiter: Optional rate limiter (may be shared with a MeteostatClient)
+            breaker: Optional circuit breaker (may be shared with a MeteostatClient)
+        """
+        super().__init__(api_key, limiter, breaker)
+        self.pool = pool
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, headers = self._prepare(path, params)
+        if self.breaker is None:
+            return await self._send(url, headers)
+        async with self.breaker.guard_async():
+            return await self._send(url, headers)
+
+    async def _send(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        if self.limiter is not None:
+            await self.limiter.acquire_async()
+        return self._parse(await self.pool.request("GET", url, headers=headers))
+
+    async def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> Dict[str, Any]:
+        """Async version of MeteostatClient.daily"""
+        return await self._get("/point/daily", _daily_params(lat, lon, alt, start, end))
+
+    async def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> Dict[str, Any]:
+        """Async version of MeteostatClient.hourly"""
+        return await self._get("/point/hourly", _daily_params(lat, lon, alt, start, end))
+
+
+class MeteostatProvider(WeatherProvider):
+    """WeatherProvider over the Meteostat RapidAPI clients."""
+
+    name = "meteostat"
+
+    def __init__(self, client: MeteostatClient, client_async: Optional[AsyncMeteostatClient] = None):
+        """
+        Initialize the provider
+
+        Args:
+            client: Blocking Meteostat client
+            client_async: Async Meteostat client (async calls fail without one)
+        """
+        self.client = client
+        self.client_async = client_async
+        self.breaker = client.breaker
+
+    def available(self) -> bool:
+        return bool(self.client.api_key)
+
+    def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return self.client.daily(lat, lon, alt, start, end).get("data") or []
+
+    async def daily_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        if self.client_async is None:
+            raise WeatherProviderError("No async Meteostat client configured")
+        data = await self.client_async.daily(lat, lon, alt, start, end)
+        return data.get("data") or []
+
+    def supports_hourly(self, start: date, end: date) -> bool:
+        return True
+
+    def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return _hourly_rows(self.client.hourly(lat, lon, alt, start, end))
+
+    async def hourly_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        if self.client_async is None:
+            raise WeatherProviderError("No async Meteostat client configured")
+        return _hourly_rows(await self.client_async.hourly(lat, lon, alt, start, end))
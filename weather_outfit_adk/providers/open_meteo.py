@@ -0,0 +1,252 @@
+"""
+Open-Meteo Provider
+
+WeatherProvider over the free Open-Meteo forecast API (no API key),
+sending requests over the shared keep-alive connection pools.
+
+- daily(): daily aggregates converted to Meteostat-shaped rows; the
+  forecast endpoint covers the past PAST_DAYS days through FORECAST_DAYS
+  ahead, so ranges outside that window are left to other providers
+- hourly(): hourly series with times converted to UTC, WMO weather
+  codes mapped to Meteostat condition codes, and the location's UTC offset
+- current(): current temperature (°F) and condition, used by the
+  standalone Flask app
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from .async_http_pool import AsyncHTTPConnectionPool
+from .base import WeatherProvider
+from .circuit_breaker import CircuitBreaker
+from .errors import WeatherProviderError
+from .http_pool import HTTPConnectionPool, PooledResponse
+
+OPEN_METEO_HOST = "api.open-meteo.com"
+PAST_DAYS = 92
+FORECAST_DAYS = 15
+
+_DAILY_FIELDS = {
+    "temperature_2m_mean": "tavg",
+    "temperature_2m_min": "tmin",
+    "temperature_2m_max": "tmax",
+    "precipitation_sum": "prcp",
+    "snowfall_sum": "snow",
+    # Meteostat wspd is the daily average wind speed, not the peak
+    "wind_speed_10m_mean": "wspd",
+    "relative_humidity_2m_mean": "rhum",
+}
+
+_HOURLY_FIELDS = {
+    "temperature_2m": "temp",
+    "relative_humidity_2m": "rhum",
+    "precipitation": "prcp",
+    "snowfall": "snow",
+    "wind_speed_10m": "wspd",
+    "weather_code": "coco",
+    "precipitation_probability": "pop",
+}
+
+# WMO weather code -> Meteostat condition code
+_WMO_TO_COCO = {
+    0: 1, 1: 2, 2: 3, 3: 4, 45: 5, 48: 6,
+    51: 7, 53: 7, 55: 8, 56: 10, 57: 11,
+    61: 7, 63: 8, 65: 9, 66: 10, 67: 11,
+    71: 14, 73: 15, 75: 16, 77: 14,
+    80: 17, 81: 17, 82: 18, 85: 21, 86: 22,
+    95: 25, 96: 26, 99: 26,
+}
+
+# WMO weather interpretation codes
+WEATHER_CODES = {
+    0: "Clear sky",
+    1: "Partly cloudy",
+    2: "Overcast",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Foggy",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with hail",
+    99: "Thunderstorm with hail",
+}
+
+
+def _daily_path(lat: float, lon: float, alt: int, start: str, end: str) -> str:
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "elevation": alt,
+        "daily": ",".join(_DAILY_FIELDS),
+        "start_date": start,
+        "end_date": end,
+        "timezone": "auto",
+    }
+    return f"/v1/forecast?{urlencode(params)}"
+
+
+def _hourly_path(lat: float, lon: float, alt: int, start: str, end: str) -> str:
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "elevation": alt,
+        "hourly": ",".join(_HOURLY_FIELDS),
+        # A day either side: dates are local to the location, callers ask in UTC
+        "start_date": (date.fromisoformat(start) - timedelta(days=1)).isoformat(),
+        "end_date": (date.fromisoformat(end) + timedelta(days=1)).isoformat(),
+        "timezone": "auto",
+    }
+    return f"/v1/forecast?{urlencode(params)}"
+
+
+def _current_path(lat: float, lon: float) -> str:
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "current": "temperature_2m,weather_code",
+        "temperature_unit": "fahrenheit",
+    }
+    return f"/v1/forecast?{urlencode(params)}"
+
+
+def _parse(response: PooledResponse) -> Dict[str, Any]:
+    if response.status >= 400:
+        raise WeatherProviderError(
+            f"Open-Meteo returned HTTP {response.status} {response.reason}",
+            status=response.status
+        )
+    try:
+        return json.loads(response.body.decode("utf-8"))
+    except ValueError as e:
+        raise WeatherProviderError(f"Invalid JSON from Open-Meteo: {e}", status=response.status)
+
+
+def _daily_rows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert Open-Meteo's column-per-field daily block into Meteostat-style rows."""
+    daily = data.get("daily") or {}
+    days = daily.get("time") or []
+    rows = []
+    for i, day in enumerate(days):
+        row: Dict[str, Any] = {"date": day}
+        for field, name in _DAILY_FIELDS.items():
+            values = daily.get(field) or []
+            row[name] = values[i] if i < len(values) else None
+        if row["snow"] is not None:
+            row["snow"] = row["snow"] * 10  # cm of snowfall -> mm
+        if row["tavg"] is None and row["tmax"] is None:
+            continue  # No data for this day
+        rows.append(row)
+    return rows
+
+
+def _hourly_rows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert Open-Meteo's hourly block (local times) into UTC, Meteostat-style rows."""
+    hourly = data.get("hourly") or {}
+    offset = int(data.get("utc_offset_seconds") or 0)
+    rows = []
+    for i, moment in enumerate(hourly.get("time") or []):
+        row: Dict[str, Any] = {
+            "time": (datetime.fromisoformat(moment) - timedelta(seconds=offset)).isoformat(),
+            "utc_offset": offset,
+        }
+        for field, name in _HOURLY_FIELDS.items():
+            values = hourly.get(field) or []
+            row[name] = values[i] if i < len(values) else None
+        if row["temp"] is None:
+            continue  # No data for this hour
+        if row["snow"] is not None:
+            row["snow"] = row["snow"] * 10  # cm of snowfall -> mm
+        if row["coco"] is not None:
+            row["coco"] = _WMO_TO_COCO.get(row["coco"])
+        rows.append(row)
+    return rows
+
+
+class OpenMeteoProvider(WeatherProvider):
+    """Open-Meteo forecast API client."""
+
+    name = "open_meteo"
+
+    def __init__(
+        self,
+        pool: HTTPConnectionPool,
+        pool_async: Optional[AsyncHTTPConnectionPool] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the provider
+
+        Args:
+            pool: Connection pool for OPEN_METEO_HOST
+            pool_async: Async connection pool (async calls fail without one)
+            breaker: Optional circuit breaker for the Open-Meteo upstream
+        """
+        self.pool = pool
+        self.pool_async = pool_async
+        self.breaker = breaker
+
+    def supports(self, start: date, end: date) -> bool:
+        today = date.today()
+        return today - timedelta(days=PAST_DAYS) <= start and end <= today + timedelta(days=FORECAST_DAYS)
+
+    def _get(self, path: str) -> Dict[str, Any]:
+        if self.breaker is None:
+            return _parse(self.pool.request("GET", path))
+        with self.breaker.guard():
+            return _parse(self.pool.request("GET", path))
+
+    async def _get_async(self, path: str) -> Dict[str, Any]:
+        if self.pool_async is None:
+            raise WeatherProviderError("No async Open-Meteo pool configured")
+        if self.breaker is None:
+            return _parse(await self.pool_async.request("GET", path))
+        async with self.breaker.guard_async():
+            return _parse(await self.pool_async.request("GET", path))
+
+    def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return _daily_rows(self._get(_daily_path(lat, lon, alt, start, end)))
+
+    async def daily_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return _daily_rows(await self._get_async(_daily_path(lat, lon, alt, start, end)))
+
+    def supports_hourly(self, start: date, end: date) -> bool:
+        # One day of slack each side for the UTC -> local date shift
+        return self.supports(start - timedelta(days=1), end + timedelta(days=1))
+
+    def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return _hourly_rows(self._get(_hourly_path(lat, lon, alt, start, end)))
+
+    async def hourly_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> List[Dict[str, Any]]:
+        return _hourly_rows(await self._get_async(_hourly_path(lat, lon, alt, start, end)))
+
+    def current(self, lat: float, lon: float) -> Dict[str, Any]:
+        """
+        Current conditions for a point
+
+        Returns:
+            {"temperature": °F, "weather_code": WMO code, "condition": description}
+        """
+        current = self._get(_current_path(lat, lon)).get("current") or {}
+        if current.get("temperature_2m") is None:
+            raise WeatherProviderError("Open-Meteo returned no current conditions")
+        code = current.get("weather_code")
+        return {
+            "temperature": float(current["temperature_2m"]),
+            "weather_code": code,
+            "condition": WEATHER_CODES.get(code, "Partly cloudy"),
+        }
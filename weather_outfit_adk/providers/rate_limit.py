@@ -0,0 +1,488 @@
+"""
+Client-side Rate Limiting
+
+Keeps upstream calls inside the provider plan instead of finding out from
+429 responses:
+
+- Token bucket: rate_per_second sustained, burst at once
+- Daily quota: calls per calendar day; part of it (quota_reserve) is held
+  back for interactive traffic so prewarming can never use up the day.
+  The count lives in a quota ledger: per process by default
+  (LocalQuotaLedger), or shared by every process and service pointing at
+  the same SQLite file (SqliteQuotaLedger), so workers can't each spend
+  the whole plan. Ledger I/O never runs under the limiter's lock (nor on
+  the event loop for acquire_async): the token is reserved first and the
+  call counted afterwards, and the day's count used to shed early is
+  cached for quota_refresh seconds
+- Priority classes: waiting interactive calls are always admitted before
+  waiting prewarm calls
+- Deadlines: a call waits at most its class's max wait (or an explicit
+  timeout) and is then shed with RateLimitExceeded
+- throttle(): an upstream 429 pauses the bucket for its Retry-After
+- Abandoned calls: a waiting call whose abandon_when() event is set
+  (e.g. a hedge that lost) leaves the queue without taking a token
+
+The priority of the current call is carried in a context variable, so
+code deep inside a fetch (e.g. a prewarm reload) doesn't have to pass it
+through every layer:
+
+    with request_priority(PREWARM):
+        get_current_weather(city)
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..monitoring.metrics import buffered_metrics
+from .errors import RateLimitExceeded
+
+INTERACTIVE = "interactive"
+PREWARM = "prewarm"
+# Lower rank is served first
+PRIORITIES = {INTERACTIVE: 0, PREWARM: 1}
+
+_priority: ContextVar[str] = ContextVar("upstream_priority", default=INTERACTIVE)
+_abandoned: ContextVar[Optional[threading.Event]] = ContextVar("upstream_abandoned", default=None)
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Run upstream calls made inside the block under the given priority class."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority class: {priority}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    """Priority class of upstream calls made from the current context"""
+    return _priority.get()
+
+
+@contextmanager
+def abandon_when(event: threading.Event) -> Iterator[None]:
+    """Shed upstream calls made inside the block, instead of admitting them, once event is set."""
+    token = _abandoned.set(event)
+    try:
+        yield
+    finally:
+        _abandoned.reset(token)
+
+
+class LocalQuotaLedger:
+    """Calls per day, counted in this process only."""
+
+    # In memory: cheap enough to call from the event loop
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._day: Optional[str] = None
+        self._used = 0
+
+    def used(self, day: str) -> int:
+        """Calls counted on day"""
+        with self._lock:
+            return self._used if day == self._day else 0
+
+    def consume(self, day: str, limit: Optional[int]) -> Optional[int]:
+        """
+        Count one call on day unless limit calls were already counted (None: no limit)
+
+        Returns:
+            Calls counted on day including this one, or None if the limit was reached
+        """
+        with self._lock:
+            if day != self._day:
+                self._day, self._used = day, 0
+            if limit is not None and self._used >= limit:
+                return None
+            self._used += 1
+            return self._used
+
+
+class SqliteQuotaLedger:
+    """
+    Calls per day in a SQLite table, shared by every process using the file
+
+    Each consume() is one BEGIN IMMEDIATE transaction, so concurrent
+    processes can't both take the last call of the day. If the database
+    is unavailable, calls are let through (with a warning) rather than
+    failing every upstream request.
+    """
+
+    # Disk I/O (and possibly a wait on another process's write lock)
+    blocking = True
+
+    def __init__(self, path: str, name: str):
+        """
+        Open (or create) the ledger
+
+        Args:
+            path: SQLite database path
+            name: Quota name (one row per name and day)
+        """
+        self.path = path
+        self.name = name
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS quota_usage ("
+            "name TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL, PRIMARY KEY (name, day))"
+        )
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared across threads; keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def used(self, day: str) -> int:
+        """Calls counted on day (by every process)"""
+        try:
+            row = self._conn().execute(
+                "SELECT used FROM quota_usage WHERE name = ? AND day = ?", (self.name, day)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️  Quota ledger read failed: {e}")
+            return 0
+        return row[0] if row else 0
+
+    def consume(self, day: str, limit: Optional[int]) -> Optional[int]:
+        """
+        Count one call on day unless limit calls were already counted (None: no limit)
+
+        Returns:
+            Calls counted on day including this one (0 if the database failed
+            and the call was let through uncounted), or None if the limit was reached
+        """
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("INSERT OR IGNORE INTO quota_usage (name, day, used) VALUES (?, ?, 0)", (self.name, day))
+                admitted = conn.execute(
+                    "UPDATE quota_usage SET used = used + 1 WHERE name = ? AND day = ? AND used < ?",
+                    (self.name, day, 2 ** 62 if limit is None else limit)
+                ).rowcount == 1
+                used = conn.execute(
+                    "SELECT used FROM quota_usage WHERE name = ? AND day = ?", (self.name, day)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM quota_usage WHERE name = ? AND day < ?", (self.name, day))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            print(f"⚠️  Quota ledger write failed, not counting the call: {e}")
+            return 0
+        return used if admitted else None
+
+
+class RateLimiter:
+    """Token bucket + daily quota with prioritized, deadline-bounded waiting."""
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        burst: int = 1,
+        daily_quota: int = 0,
+        quota_reserve: float = 0.2,
+        max_wait: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+        quota_ledger: Optional[Union[LocalQuotaLedger, SqliteQuotaLedger]] = None,
+        quota_refresh: float = 1.0
+    ):
+        """
+        Initialize the limiter
+
+        Args:
+            name: Limiter name used as the metrics label
+            rate_per_second: Sustained calls per second (<= 0 disables the bucket)
+            burst: Bucket capacity (calls allowed back to back)
+            daily_quota: Calls allowed per calendar day (0 = unlimited)
+            quota_reserve: Fraction of the daily quota only interactive calls may use
+            max_wait: Default seconds a call may wait for a token, per priority class
+            clock: Monotonic time source (overridable for tests)
+            today: Calendar day source for the quota (overridable for tests)
+            quota_ledger: Where calls against daily_quota are counted; defaults
+                to this process only (LocalQuotaLedger), pass a SqliteQuotaLedger
+                to share the quota between processes
+            quota_refresh: Seconds the day's count is cached between ledger
+                reads (calls counted by this limiter update it immediately)
+        """
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.daily_quota = max(0, daily_quota)
+        self.quota_reserve = min(1.0, max(0.0, quota_reserve))
+        self.max_wait = {INTERACTIVE: 2.0, PREWARM: 30.0}
+        self.max_wait.update(max_wait or {})
+        self._clock = clock
+        self._today = today
+
+        self._cond = threading.Condition()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._waiting: List[Tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._quota = quota_ledger or LocalQuotaLedger()
+        self.quota_refresh = quota_refresh
+        # (day, calls counted, time.monotonic() of the last ledger read)
+        self._quota_used: Tuple[Optional[str], int, float] = (None, 0, float("-inf"))
+        self._quota_reading = False
+
+    def _refill(self, now: float):
+        if now < self._blocked_until:
+            self._updated = now
+            return
+        elapsed = now - max(self._updated, self._blocked_until)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def _quota_limit(self, priority: str) -> int:
+        if priority == INTERACTIVE:
+            return self.daily_quota
+        return int(self.daily_quota * (1.0 - self.quota_reserve))
+
+    def _enter(self, priority: Optional[str], timeout: Optional[float]) -> Tuple[str, Tuple[int, int], float]:
+        """Queue a ticket (caller holds the lock)."""
+        priority = priority or current_priority()
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        wait = self.max_wait.get(priority, 0.0) if timeout is None else timeout
+        ticket = (PRIORITIES[priority], next(self._tickets))
+        heapq.heappush(self._waiting, ticket)
+        return priority, ticket, self._clock() + wait
+
+    def _step(self, priority: str, ticket: Tuple[int, int], deadline: float, day: str) -> Optional[float]:
+        """
+        Try to reserve a token for a queued ticket (caller holds the lock)
+
+        Checks the quota against the cached count only; the caller counts
+        the call in the ledger (see _consume) after releasing the lock.
+
+        Returns:
+            None if a token was reserved, otherwise seconds to wait before trying again
+
+        Raises:
+            RateLimitExceeded: If the quota is used up, the deadline passed or the call was abandoned
+        """
+        abandoned = _abandoned.get()
+        if abandoned is not None and abandoned.is_set():
+            self._shed(priority, "abandoned")
+            raise RateLimitExceeded(f"{self.name} {priority} call abandoned by its caller", reason="abandoned")
+
+        if self.daily_quota and self._cached_used(day) >= self._quota_limit(priority):
+            self._shed_quota(priority)
+
+        now = self._clock()
+        if self.rate_per_second <= 0 and now >= self._blocked_until:
+            wait = 0.0
+        else:
+            self._refill(now)
+            if self._tokens >= 1.0:
+                wait = 0.0
+            elif self.rate_per_second > 0:
+                wait = max(self._blocked_until - now, 0.0) + (1.0 - self._tokens) / self.rate_per_second
+            else:
+                wait = self._blocked_until - now
+
+        if wait == 0.0 and self._waiting[0] == ticket:
+            heapq.heappop(self._waiting)
+            if self.rate_per_second > 0:
+                self._tokens -= 1.0
+            return None
+
+        remaining = deadline - now
+        if remaining <= 0:
+            self._shed(priority, "deadline")
+            raise RateLimitExceeded(f"{self.name} rate limit: no token within deadline for {priority} call", reason="deadline")
+        # Not at the head of the queue: check again once the head has had its turn
+        return min(wait or 0.01, remaining)
+
+    def _cached_used(self, day: str) -> int:
+        """Calls counted on day as of the last ledger read or consume (caller holds the lock)."""
+        cached_day, used, _ = self._quota_used
+        return used if cached_day == day else 0
+
+    def _claim_quota_read(self, day: str) -> bool:
+        """Whether the caller should refresh the cached count; one caller reads at a time."""
+        if not self.daily_quota:
+            return False
+        with self._cond:
+            cached_day, _, read_at = self._quota_used
+            if self._quota_reading or (cached_day == day and time.monotonic() - read_at < self.quota_refresh):
+                return False
+            self._quota_reading = True
+            return True
+
+    def _read_quota(self, day: str):
+        """Refresh the cached count from the ledger (called without the lock)."""
+        try:
+            used = self._quota.used(day)
+        finally:
+            with self._cond:
+                self._quota_reading = False
+        with self._cond:
+            cached_day, cached, _ = self._quota_used
+            # Calls this limiter counted while the read was in flight can't be undone
+            self._quota_used = (day, max(used, cached) if cached_day == day else used, time.monotonic())
+
+    def _consume(self, priority: str, day: str):
+        """
+        Count a call that holds a reserved token (called without the lock)
+
+        Raises:
+            RateLimitExceeded: If the ledger says the quota ran out meanwhile
+                (e.g. another process took the last call); the token is returned
+        """
+        limit = self._quota_limit(priority) if self.daily_quota else None
+        used = self._quota.consume(day, limit)
+        with self._cond:
+            cached_day, cached, _ = self._quota_used
+            if used is None:
+                # Give the token back to whoever is waiting
+                if self.rate_per_second > 0:
+                    self._tokens = min(float(self.burst), self._tokens + 1.0)
+                self._quota_used = (day, max(limit or 0, cached if cached_day == day else 0), time.monotonic())
+                self._cond.notify_all()
+            else:
+                # 0: the ledger let the call through uncounted; keep our own tally
+                used = max(used, cached + 1 if cached_day == day else 1)
+                self._quota_used = (day, used, time.monotonic())
+        if used is None:
+            self._shed_quota(priority)
+
+        self._record(priority, "admitted")
+        buffered_metrics.increment_counter("weather_rate_limit_tokens", labels={"limiter": self.name, "priority": priority})
+        if self.daily_quota:
+            buffered_metrics.set_gauge(
+                "weather_rate_limit_quota_remaining",
+                max(0, self.daily_quota - used),
+                labels={"limiter": self.name}
+            )
+
+    def _leave(self, ticket: Tuple[int, int]):
+        """Drop a ticket that was shed (caller holds the lock)."""
+        if ticket in self._waiting:
+            self._waiting.remove(ticket)
+            heapq.heapify(self._waiting)
+        self._cond.notify_all()
+
+    def acquire(self, priority: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Take one token, waiting behind higher-priority calls if necessary
+
+        Args:
+            priority: Priority class (defaults to the context's request_priority)
+            timeout: Maximum seconds to wait (defaults to the class's max wait)
+
+        Raises:
+            RateLimitExceeded: If the call is shed (quota used up, deadline passed or abandoned)
+        """
+        with self._cond:
+            priority, ticket, deadline = self._enter(priority, timeout)
+        queued = False
+        try:
+            while True:
+                day = self._today().isoformat()
+                if self._claim_quota_read(day):
+                    self._read_quota(day)
+                with self._cond:
+                    wait = self._step(priority, ticket, deadline, day)
+                    if wait is None:
+                        break
+                    if not queued:
+                        queued = True
+                        self._record(priority, "queued")
+                    self._cond.wait(wait)
+        finally:
+            with self._cond:
+                self._leave(ticket)
+        self._consume(priority, day)
+
+    async def acquire_async(self, priority: Optional[str] = None, timeout: Optional[float] = None):
+        """Async version of acquire (waits without blocking the event loop)."""
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            priority, ticket, deadline = self._enter(priority, timeout)
+        queued = False
+        try:
+            while True:
+                day = self._today().isoformat()
+                if self._claim_quota_read(day):
+                    if self._quota.blocking:
+                        await loop.run_in_executor(None, self._read_quota, day)
+                    else:
+                        self._read_quota(day)
+                with self._cond:
+                    wait = self._step(priority, ticket, deadline, day)
+                if wait is None:
+                    break
+                if not queued:
+                    queued = True
+                    self._record(priority, "queued")
+                await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                self._leave(ticket)
+        if self._quota.blocking:
+            await loop.run_in_executor(None, self._consume, priority, day)
+        else:
+            self._consume(priority, day)
+
+    def throttle(self, seconds: float):
+        """Pause admissions (e.g. for an upstream 429's Retry-After)."""
+        with self._cond:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + max(0.0, seconds))
+        self._record(current_priority(), "throttled")
+
+    def stats(self) -> Dict[str, float]:
+        """Tokens available, calls waiting and quota used today"""
+        used_today = self._quota.used(self._today().isoformat())
+        with self._cond:
+            self._refill(self._clock())
+            return {
+                "tokens": round(self._tokens, 3),
+                "waiting": len(self._waiting),
+                "used_today": used_today,
+                "daily_quota": self.daily_quota,
+            }
+
+    def _shed_quota(self, priority: str):
+        self._shed(priority, "quota")
+        raise RateLimitExceeded(f"{self.name} daily quota exhausted for {priority} calls", reason="quota")
+
+    def _shed(self, priority: str, reason: str):
+        self._record(priority, f"shed_{reason}")
+
+    def _record(self, priority: str, result: str):
+        buffered_metrics.increment_counter(
+            "weather_rate_limit_requests", labels={"limiter": self.name, "priority": priority, "result": result}
+        )
@@ -0,0 +1,365 @@
+"""
+Provider Router
+
+Spreads daily (and hourly) weather fetches across several WeatherProviders:
+
+- Ordering by health, then latency: providers that are unavailable or
+  can't serve the range are skipped, open circuits and providers failing
+  most recent calls go last, and once every candidate has enough samples
+  the one with the lowest median latency goes first (until then, the
+  configured order is kept)
+- Failover: if the primary fails, the next provider is tried
+- Hedging: if the primary hasn't answered within its p95 latency
+  (clamped to [min_hedge_delay, max_hedge_delay]), the secondary is
+  fired as well and the first successful answer wins. The loser is
+  cancelled on the async path; on the sync path it is skipped if it
+  hasn't started, shed by the rate limiter if it is still waiting for a
+  token, and otherwise finishes in the background and only feeds the
+  latency stats. Without a hedge to race, sync calls run inline on the
+  caller's thread.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from ..monitoring.metrics import buffered_metrics
+from .base import WeatherProvider
+from .errors import RateLimitExceeded, WeatherProviderError
+from .rate_limit import abandon_when
+
+Rows = List[Dict[str, Any]]
+
+
+class _ProviderStats:
+    """Recent latencies and outcomes of one provider"""
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1.0 - sum(self.outcomes) / len(self.outcomes)
+
+
+class ProviderRouter:
+    """Health/latency-aware routing with failover and hedged requests."""
+
+    def __init__(
+        self,
+        providers: Sequence[WeatherProvider],
+        hedge: bool = True,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 1.5,
+        min_samples: int = 20,
+        max_error_rate: float = 0.5,
+        window: int = 200,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the router
+
+        Args:
+            providers: Providers in order of preference
+            hedge: Fire the next provider when the primary is slow
+            min_hedge_delay: Lower bound on the hedge delay in seconds
+            max_hedge_delay: Upper bound (and the delay before enough samples exist)
+            min_samples: Latency samples needed before p95 / latency ordering is trusted
+            max_error_rate: Recent error rate above which a provider is ranked last
+            window: Number of recent calls kept per provider
+            max_workers: Threads for hedged sync fetches (primary + hedges); size it to
+                the providers' connection pools
+            clock: Monotonic time source (overridable for tests)
+        """
+        if not providers:
+            raise ValueError("ProviderRouter needs at least one provider")
+        self.providers = list(providers)
+        self.hedge = hedge
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = max(1, min_samples)
+        self.max_error_rate = max_error_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {p.name: _ProviderStats(window) for p in self.providers}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="weather-provider")
+
+    def available(self) -> bool:
+        """True if any provider is configured."""
+        return any(p.available() for p in self.providers)
+
+    def candidates(self, start: date, end: date, hourly: bool = False) -> List[WeatherProvider]:
+        """Providers able to serve [start, end] (hourly data if hourly), best first"""
+        supports = (lambda p: p.supports_hourly(start, end)) if hourly else (lambda p: p.supports(start, end))
+        usable = [p for p in self.providers if p.available() and supports(p)]
+        with self._lock:
+            measured = all(len(self._stats[p.name].latencies) >= self.min_samples for p in usable)
+
+            def rank(item):
+                index, provider = item
+                stats = self._stats[provider.name]
+                return (
+                    not provider.healthy(),
+                    stats.error_rate() > self.max_error_rate,
+                    stats.percentile(0.5) if measured else 0.0,
+                    index,
+                )
+
+            ranked = sorted(enumerate(usable), key=rank)
+        return [provider for _, provider in ranked]
+
+    def hedge_delay(self, provider: WeatherProvider) -> float:
+        """Seconds to wait for provider before hedging: its p95 latency, clamped"""
+        with self._lock:
+            stats = self._stats[provider.name]
+            p95 = stats.percentile(0.95) if len(stats.latencies) >= self.min_samples else None
+        if p95 is None:
+            return self.max_hedge_delay
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, p95))
+
+    def _observe(self, provider: WeatherProvider, started: float, ok: bool):
+        elapsed = self._clock() - started
+        with self._lock:
+            stats = self._stats[provider.name]
+            stats.outcomes.append(ok)
+            if ok:
+                stats.latencies.append(elapsed)
+        buffered_metrics.increment_counter(
+            "weather_provider_calls", labels={"provider": provider.name, "result": "success" if ok else "error"}
+        )
+        if ok:
+            buffered_metrics.record_latency("weather_provider_latency", elapsed * 1000, labels={"provider": provider.name})
+
+    def _call(self, provider: WeatherProvider, kind: str, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        started = self._clock()
+        try:
+            rows = getattr(provider, kind)(lat, lon, alt, start, end)
+        except RateLimitExceeded as e:
+            # A hedge shed because it lost says nothing about the provider's health
+            if e.reason == "abandoned":
+                self._record_hedge(provider, "abandoned")
+            else:
+                self._observe(provider, started, False)
+            raise
+        except Exception:
+            self._observe(provider, started, False)
+            raise
+        self._observe(provider, started, True)
+        return rows
+
+    def _call_hedged(
+        self, abandoned: threading.Event, provider: WeatherProvider, kind: str,
+        lat: float, lon: float, alt: int, start: str, end: str
+    ) -> Rows:
+        # Another provider already answered: don't spend a call (or a token) on this one
+        if abandoned.is_set():
+            self._record_hedge(provider, "abandoned")
+            raise WeatherProviderError(f"{provider.name} call abandoned")
+        with abandon_when(abandoned):
+            return self._call(provider, kind, lat, lon, alt, start, end)
+
+    async def _call_async(self, provider: WeatherProvider, kind: str, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        started = self._clock()
+        try:
+            rows = await getattr(provider, f"{kind}_async")(lat, lon, alt, start, end)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._observe(provider, started, False)
+            raise
+        self._observe(provider, started, True)
+        return rows
+
+    def _plan(self, kind: str, start: str, end: str) -> List[WeatherProvider]:
+        candidates = self.candidates(date.fromisoformat(start), date.fromisoformat(end), hourly=kind == "hourly")
+        if not candidates:
+            raise WeatherProviderError(f"No weather provider can serve {kind} data for {start}..{end}")
+        return candidates
+
+    @staticmethod
+    def _tag(rows: Rows, provider: WeatherProvider) -> Rows:
+        for row in rows:
+            row.setdefault("source", provider.name)
+        return rows
+
+    def daily(self, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        """
+        Fetch daily rows from the best provider, hedging and failing over as needed
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD), inclusive
+
+        Returns:
+            Rows tagged with the "source" provider that answered
+
+        Raises:
+            WeatherProviderError: If no provider can serve the range or all of them fail
+        """
+        return self._fetch("daily", lat, lon, alt, start, end)
+
+    async def daily_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        """Async version of daily (the losing hedge is cancelled)."""
+        return await self._fetch_async("daily", lat, lon, alt, start, end)
+
+    def hourly(self, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        """
+        Fetch hourly rows from the best provider with hourly data, hedging and failing over as needed
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            alt: Altitude in meters
+            start: Start date (YYYY-MM-DD, UTC)
+            end: End date (YYYY-MM-DD, UTC), inclusive
+
+        Returns:
+            Rows tagged with the "source" provider that answered
+
+        Raises:
+            WeatherProviderError: If no provider can serve the range or all of them fail
+        """
+        return self._fetch("hourly", lat, lon, alt, start, end)
+
+    async def hourly_async(self, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        """Async version of hourly."""
+        return await self._fetch_async("hourly", lat, lon, alt, start, end)
+
+    def _fetch(self, kind: str, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        queue = self._plan(kind, start, end)
+        if not self.hedge or len(queue) < 2:
+            return self._fetch_inline(queue, kind, lat, lon, alt, start, end)
+
+        pending: Dict[Future, WeatherProvider] = {}
+        primary = queue[0]
+        last_error: Optional[BaseException] = None
+        abandoned = threading.Event()
+
+        def launch(provider: WeatherProvider):
+            # Copy the context so the caller's request priority reaches the rate limiter
+            ctx = contextvars.copy_context()
+            future = self._executor.submit(ctx.run, self._call_hedged, abandoned, provider, kind, lat, lon, alt, start, end)
+            pending[future] = provider
+
+        launch(queue.pop(0))
+        try:
+            while pending:
+                timeout = self.hedge_delay(primary) if queue else None
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Primary is slow: hedge with the next provider
+                    provider = queue.pop(0)
+                    self._record_hedge(provider, "fired")
+                    launch(provider)
+                    continue
+
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        rows = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if len(pending):
+                        self._record_hedge(provider, "won")
+                    return self._tag(rows, provider)
+
+                # Everything that finished failed: fail over to the next provider
+                if not pending and queue:
+                    launch(queue.pop(0))
+        finally:
+            # Losers that haven't started are dropped; ones waiting on a rate limiter are shed
+            abandoned.set()
+            for future in pending:
+                future.cancel()
+
+        raise last_error if last_error else WeatherProviderError("All weather providers failed")
+
+    def _fetch_inline(
+        self, queue: List[WeatherProvider], kind: str, lat: float, lon: float, alt: int, start: str, end: str
+    ) -> Rows:
+        """Try providers one after another on the caller's thread (no hedge to race)."""
+        last_error: Optional[BaseException] = None
+        for provider in queue:
+            try:
+                return self._tag(self._call(provider, kind, lat, lon, alt, start, end), provider)
+            except Exception as e:
+                last_error = e
+        raise last_error if last_error else WeatherProviderError("All weather providers failed")
+
+    async def _fetch_async(self, kind: str, lat: float, lon: float, alt: int, start: str, end: str) -> Rows:
+        queue = self._plan(kind, start, end)
+        pending: Dict[asyncio.Task, WeatherProvider] = {}
+        primary = queue[0]
+        last_error: Optional[BaseException] = None
+
+        def launch(provider: WeatherProvider):
+            task = asyncio.ensure_future(self._call_async(provider, kind, lat, lon, alt, start, end))
+            pending[task] = provider
+
+        launch(queue.pop(0))
+        try:
+            while pending:
+                timeout = self.hedge_delay(primary) if self.hedge and queue else None
+                done, _ = await asyncio.wait(list(pending), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    provider = queue.pop(0)
+                    self._record_hedge(provider, "fired")
+                    launch(provider)
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        rows = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if len(pending):
+                        self._record_hedge(provider, "won")
+                    return self._tag(rows, provider)
+
+                if not pending and queue:
+                    launch(queue.pop(0))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise last_error if last_error else WeatherProviderError("All weather providers failed")
+
+    def _record_hedge(self, provider: WeatherProvider, result: str):
+        buffered_metrics.increment_counter("weather_provider_hedges", labels={"provider": provider.name, "result": result})
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider health and latency percentiles (seconds)"""
+        with self._lock:
+            snapshot = {
+                name: {
+                    "samples": len(stats.latencies),
+                    "p50": stats.percentile(0.5),
+                    "p95": stats.percentile(0.95),
+                    "error_rate": round(stats.error_rate(), 3),
+                }
+                for name, stats in self._stats.items()
+            }
+        for provider in self.providers:
+            snapshot[provider.name]["healthy"] = provider.healthy()
+            snapshot[provider.name]["available"] = provider.available()
+        return snapshot
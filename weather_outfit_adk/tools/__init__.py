@@ -1,5 +1,19 @@
-from .weather_tools import get_current_weather, get_hourly_forecast, get_weather_smart
-from .outfit_tools import plan_outfit
+from .weather_tools import (
+    get_current_weather,
+    get_hourly_forecast,
+    get_weather_smart,
+    get_current_weather_async,
+    get_hourly_forecast_async,
+    get_weather_smart_async,
+    get_weather_batch,
+    get_weather_batch_async,
+    get_weather_range,
+    get_weather_range_async,
+    get_typical_weather,
+    get_typical_weather_async,
+)
+from .location_tools import resolve_city, resolve_city_async
+from .outfit_tools import plan_outfit, plan_outfit_shared
 from .activity_tools import classify_activity
 from .safety_tools import check_safety
 from .memory_tools import get_user_preferences, update_user_preferences, get_memory_instance
@@ -8,7 +22,19 @@ __all__ = [
     "get_current_weather",
     "get_hourly_forecast",
     "get_weather_smart",
+    "get_current_weather_async",
+    "get_hourly_forecast_async",
+    "get_weather_smart_async",
+    "get_weather_batch",
+    "get_weather_batch_async",
+    "get_weather_range",
+    "get_weather_range_async",
+    "get_typical_weather",
+    "get_typical_weather_async",
+    "resolve_city",
+    "resolve_city_async",
     "plan_outfit",
+    "plan_outfit_shared",
     "classify_activity",
     "check_safety",
     "get_user_preferences",
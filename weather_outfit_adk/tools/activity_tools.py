@@ -1,65 +1,101 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from ..config.settings import settings
 from ..schemas.outfit import ActivityContext
+from .keyword_matcher import KeywordMatcher
+
+# In priority order: when keywords of several categories appear, the first listed wins
+ACTIVITY_RULES: Dict[str, Dict[str, Any]] = {
+    "work": {
+        "keywords": ["work", "office", "meeting", "presentation", "business"],
+        "formality": "business_casual",
+        "movement": "low",
+        "notes": "Balance comfort and professionalism"
+    },
+    "sports": {
+        "keywords": ["hike", "hiking", "bike", "biking", "cycling", "run", "running", "gym", "workout", "exercise"],
+        "formality": "casual",
+        "movement": "high",
+        "notes": "Recommend flexible, breathable clothing"
+    },
+    "formal": {
+        "keywords": ["date", "dinner", "restaurant", "party", "event", "wedding", "formal"],
+        "formality": "formal",
+        "movement": "low",
+        "notes": "Prioritize style and appearance"
+    },
+    "casual": {
+        "keywords": ["walk", "walking", "shopping", "errands", "casual", "coffee", "hanging out"],
+        "formality": "casual",
+        "movement": "medium",
+        "notes": ""
+    }
+}
+DEFAULT_CATEGORY = "casual"
+DEFAULT_NOTES = "General outdoor activity"
+
+
+def load_activity_keywords(path: str) -> List[Tuple[str, str, bool]]:
+    """
+    Read extra activity keywords from a TSV file
+
+    Each line is `keyword<TAB>category[<TAB>word|substring]` ('#' starts a
+    comment). Keywords match whole words unless marked substring.
+
+    Returns:
+        List of (keyword, category, whole_word)
+    """
+    keywords = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip() or line.startswith("#"):
+                continue
+            parts = [part.strip() for part in line.rstrip("\n").split("\t")]
+            if len(parts) < 2 or parts[1] not in ACTIVITY_RULES or not parts[0]:
+                print(f"⚠️  Skipping activity keyword line {line_number} in {path}: {line.strip()!r}")
+                continue
+            whole_word = len(parts) < 3 or parts[2] != "substring"
+            keywords.append((parts[0], parts[1], whole_word))
+    return keywords
+
+
+def build_activity_matcher(keywords_path: Optional[str] = None) -> KeywordMatcher:
+    """Matcher over ACTIVITY_RULES keywords (substring, as originally) plus any from keywords_path"""
+    priorities = {category: len(ACTIVITY_RULES) - rank for rank, category in enumerate(ACTIVITY_RULES)}
+    matcher = KeywordMatcher()
+    for category, rules in ACTIVITY_RULES.items():
+        for keyword in rules["keywords"]:
+            matcher.add(keyword, category, priority=priorities[category])
+    if keywords_path:
+        try:
+            extra = load_activity_keywords(keywords_path)
+        except OSError as e:
+            print(f"⚠️  Activity keywords not loaded from {keywords_path}: {e}")
+            extra = []
+        for keyword, category, whole_word in extra:
+            matcher.add(keyword, category, priority=priorities[category], whole_word=whole_word)
+    return matcher.compile()
+
+
+_activity_matcher = build_activity_matcher(settings.activity_keywords_path)
 
 
 def classify_activity(activity_text: str) -> Dict[str, Any]:
     """
     Classify user activity into structured context.
-    
+
     Args:
         activity_text: Free text describing the activity (e.g., "hiking", "office meeting", "date night")
-    
+
     Returns:
         Dictionary with activity category, formality_level, movement_level, and notes
     """
-    activity_lower = activity_text.lower()
-    
-    activity_rules = {
-        "work": {
-            "keywords": ["work", "office", "meeting", "presentation", "business"],
-            "formality": "business_casual",
-            "movement": "low"
-        },
-        "sports": {
-            "keywords": ["hike", "hiking", "bike", "biking", "cycling", "run", "running", "gym", "workout", "exercise"],
-            "formality": "casual",
-            "movement": "high"
-        },
-        "formal": {
-            "keywords": ["date", "dinner", "restaurant", "party", "event", "wedding", "formal"],
-            "formality": "formal",
-            "movement": "low"
-        },
-        "casual": {
-            "keywords": ["walk", "walking", "shopping", "errands", "casual", "coffee", "hanging out"],
-            "formality": "casual",
-            "movement": "medium"
-        }
-    }
-    
-    category = "casual"
-    formality = "casual"
-    movement = "medium"
-    notes = ""
-    
-    for act_cat, rules in activity_rules.items():
-        if any(keyword in activity_lower for keyword in rules["keywords"]):
-            category = act_cat
-            formality = rules["formality"]
-            movement = rules["movement"]
-            
-            if category == "sports":
-                notes = "Recommend flexible, breathable clothing"
-            elif category == "formal":
-                notes = "Prioritize style and appearance"
-            elif category == "work":
-                notes = "Balance comfort and professionalism"
-            
-            break
-    
+    match = _activity_matcher.best(activity_text)
+    category = match.value if match is not None else DEFAULT_CATEGORY
+    rules = ACTIVITY_RULES[category]
+
     return {
         "category": category,
-        "formality_level": formality,
-        "movement_level": movement,
-        "notes": notes or "General outdoor activity"
+        "formality_level": rules["formality"],
+        "movement_level": rules["movement"],
+        "notes": rules["notes"] or DEFAULT_NOTES
     }
@@ -0,0 +1,153 @@
+"""
+Keyword Matcher
+
+Aho-Corasick automaton over a keyword vocabulary: every keyword
+occurrence in a text is found in one pass, however many keywords there
+are (time is linear in the text plus the number of hits).
+
+- Matching is case-insensitive (keywords and text are lowercased, and
+  match spans index the lowercased text)
+- Whole-word keywords only match when not preceded or followed by a
+  letter, digit or underscore; other keywords match anywhere, as
+  `keyword in text` does
+- Each keyword carries a value and a priority; best() picks the hit with
+  the highest priority, then the earliest, then the longest
+- Keywords may be added after matching starts; the automaton is rebuilt
+  on the next lookup
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class KeywordMatch(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    value: Any
+    priority: int
+
+
+class _Keyword(NamedTuple):
+    keyword: str
+    value: Any
+    priority: int
+    whole_word: bool
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Multi-keyword matcher (Aho-Corasick) with word-boundary and priority rules."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._keywords: List[List[_Keyword]] = [[]]
+        self._fail: List[int] = [0]
+        # Nearest state down the fail chain that ends a keyword (-1: none)
+        self._output_link: List[int] = [-1]
+        # The state itself if it ends a keyword, else its output link
+        self._first_output: List[int] = [-1]
+        self._compiled = True
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(keywords) for keywords in self._keywords)
+
+    def add(self, keyword: str, value: Any, priority: int = 0, whole_word: bool = False):
+        """
+        Add a keyword
+
+        Args:
+            keyword: Text to find (case-insensitive)
+            value: Returned with every match of this keyword
+            priority: Higher priorities win in best()
+            whole_word: Only match at word boundaries
+        """
+        keyword = keyword.lower()
+        if not keyword:
+            raise ValueError("Keyword must not be empty")
+
+        with self._lock:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._keywords.append([])
+                state = next_state
+            self._keywords[state].append(_Keyword(keyword, value, priority, whole_word))
+            self._compiled = False
+
+    def compile(self) -> "KeywordMatcher":
+        """Build the fail and output links (done automatically on first lookup)"""
+        with self._lock:
+            if self._compiled:
+                return self
+            states = len(self._goto)
+            fail = [0] * states
+            output_link = [-1] * states
+            queue = deque(self._goto[0].values())
+            while queue:
+                state = queue.popleft()
+                for char, child in self._goto[state].items():
+                    queue.append(child)
+                    fallback = fail[state] if state else 0
+                    while fallback and char not in self._goto[fallback]:
+                        fallback = fail[fallback]
+                    target = self._goto[fallback].get(char, 0) if state else 0
+                    fail[child] = target
+                    output_link[child] = target if self._keywords[target] else output_link[target]
+            self._fail = fail
+            self._output_link = output_link
+            self._first_output = [state if self._keywords[state] else output_link[state] for state in range(states)]
+            self._compiled = True
+        return self
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every keyword occurrence in text, ordered by end position"""
+        if not self._compiled:
+            self.compile()
+        goto, fail, keywords, output_link, first_output = (
+            self._goto, self._fail, self._keywords, self._output_link, self._first_output
+        )
+
+        text = text.lower()
+        length = len(text)
+        matches: List[KeywordMatch] = []
+        state = 0
+        for position, char in enumerate(text):
+            next_state = goto[state].get(char)
+            while next_state is None:
+                if not state:
+                    next_state = 0
+                    break
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state
+
+            found = first_output[state]
+            while found > 0:
+                end = position + 1
+                for keyword in keywords[found]:
+                    start = end - len(keyword.keyword)
+                    if keyword.whole_word and (
+                        (start > 0 and _is_word_char(text[start - 1]))
+                        or (end < length and _is_word_char(text[end]))
+                    ):
+                        continue
+                    matches.append(KeywordMatch(start, end, keyword.keyword, keyword.value, keyword.priority))
+                found = output_link[found]
+        return matches
+
+    def best(self, text: str) -> Optional[KeywordMatch]:
+        """Highest-priority match (then earliest, then longest), or None"""
+        matches = self.find_all(text)
+        if not matches:
+            return None
+        return max(matches, key=lambda match: (match.priority, -match.start, match.end))
@@ -0,0 +1,67 @@
+from typing import Dict, Any, List
+from ..geo.fuzzy import CityCandidate
+from .weather_tools import geocoder
+
+
+def _confident(candidates: List[CityCandidate]) -> bool:
+    return bool(candidates) and candidates[0].score >= geocoder.fuzzy_min_score
+
+
+def _resolution(query: str, candidates: List[CityCandidate]) -> Dict[str, Any]:
+    resolved = candidates[0] if _confident(candidates) else None
+
+    # Ambiguous when another place scores about as well ("Portland", "Springfield")
+    ambiguous = (
+        resolved is not None
+        and len(candidates) > 1
+        and candidates[1].score >= resolved.score - 0.05
+    )
+
+    return {
+        "query": query,
+        "resolved": resolved.to_dict() if resolved else None,
+        "ambiguous": ambiguous,
+        "candidates": [c.to_dict() for c in candidates],
+    }
+
+
+def resolve_city(query: str, limit: int = 5) -> Dict[str, Any]:
+    """
+    Resolve a free-text location to a specific city, tolerating typos and
+    nicknames (e.g., "seatle", "NYC", "san fran", "Redmond, WA").
+
+    Args:
+        query: City name, optionally followed by a state/region/country ("Portland, ME")
+        limit: Maximum number of ranked candidates to return
+
+    Returns:
+        Dictionary with the best match ("resolved", or None), whether the
+        query is ambiguous, and ranked candidates with scores (0-1)
+    """
+    candidates = geocoder.resolver.candidates(query, limit=max(1, limit))
+    if not _confident(candidates):
+        # Not in the gazetteer: learned cache or opt-in remote geocoder
+        place = geocoder.resolve(query)
+        if place is not None:
+            candidates = [CityCandidate(place, 1.0, query)] + candidates[:max(0, limit - 1)]
+    return _resolution(query, candidates)
+
+
+async def resolve_city_async(query: str, limit: int = 5) -> Dict[str, Any]:
+    """
+    Resolve a free-text location to a specific city (non-blocking).
+
+    Args:
+        query: City name, optionally followed by a state/region/country ("Portland, ME")
+        limit: Maximum number of ranked candidates to return
+
+    Returns:
+        Dictionary with the best match ("resolved", or None), whether the
+        query is ambiguous, and ranked candidates with scores (0-1)
+    """
+    candidates = geocoder.resolver.candidates(query, limit=max(1, limit))
+    if not _confident(candidates):
+        place = await geocoder.resolve_async(query)
+        if place is not None:
+            candidates = [CityCandidate(place, 1.0, query)] + candidates[:max(0, limit - 1)]
+    return _resolution(query, candidates)
@@ -0,0 +1,208 @@
+"""
+Batch Outfit Planning
+
+plan_outfit for many people at once (e.g. the morning newsletter run),
+taking columns instead of one call per person.
+
+- Inputs are arrays: temperature, rain chance and wind speed, plus
+  activity / formality / persona / comfort as strings or as integer
+  codes (outfit_lattice.*_CODES, 0 = any value without rules of its own)
+- With NumPy every input is quantized with searchsorted and packed into
+  lattice indexes in a few vectorized passes; without it the scalar
+  plan_index is used per row
+- Results stay columnar: each slot is an integer code into a shared
+  string table, and dicts identical to plan_outfit's are only built for
+  the rows that are read
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from .outfit_lattice import (
+    ACTIVITY_CODES,
+    COMFORT_CODES,
+    FORMALITY_CODES,
+    LATTICE,
+    PERSONA_CODES,
+    plan_index,
+)
+from .outfit_rules import COMFORT_OFFSETS, RAIN, TEMPERATURE, WIND
+
+SLOTS = ("top", "bottom", "outer_layer", "footwear", "accessories")
+
+Categories = Union[None, str, Sequence[Any], "np.ndarray"]
+
+
+def _slot_tables() -> Tuple[Dict[str, Tuple[Any, ...]], Dict[str, List[int]]]:
+    """Per slot: the distinct values, and each lattice plan's code into them"""
+    values: Dict[str, Tuple[Any, ...]] = {}
+    codes: Dict[str, List[int]] = {}
+    for position, slot in enumerate(SLOTS):
+        seen: Dict[Any, int] = {}
+        codes[slot] = [seen.setdefault(plan[position], len(seen)) for plan in LATTICE]
+        values[slot] = tuple(seen)
+    return values, codes
+
+
+# Shared string tables: OutfitBatch.codes(slot) indexes SLOT_VALUES[slot]
+SLOT_VALUES, _PLAN_CODES = _slot_tables()
+if NUMPY_AVAILABLE:
+    _PLAN_CODE_ARRAYS = {slot: np.array(codes, dtype=np.int16) for slot, codes in _PLAN_CODES.items()}
+
+
+class OutfitBatch:
+    """Columnar outfit plans for a batch, materialized per row on demand."""
+
+    def __init__(self, plans: Union[List[int], "np.ndarray"], temperature: Sequence[float]):
+        """
+        Args:
+            plans: Lattice index per row
+            temperature: Input temperature per row (quoted by the practical persona's note)
+        """
+        self.plans = plans
+        self._temperature = temperature
+
+    def __len__(self) -> int:
+        return len(self.plans)
+
+    def codes(self, slot: str) -> Union[List[int], "np.ndarray"]:
+        """Integer code per row into SLOT_VALUES[slot]"""
+        if slot not in SLOTS:
+            raise KeyError(f"Unknown slot {slot!r} (slots: {SLOTS})")
+        if NUMPY_AVAILABLE and isinstance(self.plans, np.ndarray):
+            return _PLAN_CODE_ARRAYS[slot][self.plans]
+        codes = _PLAN_CODES[slot]
+        return [codes[plan] for plan in self.plans]
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        """Row as the dict plan_outfit returns"""
+        top, bottom, outer_layer, footwear, accessories, note_head, note_tail = LATTICE[int(self.plans[row])]
+        return {
+            "top": top,
+            "bottom": bottom,
+            "outer_layer": outer_layer,
+            "footwear": footwear,
+            "accessories": list(accessories),
+            "notes": note_head if note_tail is None else f"{note_head}{int(self._temperature[row])}{note_tail}",
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[row] for row in range(len(self)))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+
+def _names(codes: Dict[str, int]) -> Tuple[Optional[str], ...]:
+    return (None,) + tuple(sorted(codes, key=codes.get))
+
+
+def _encode(values: Categories, codes: Dict[str, int], rows: int, name: str) -> List[int]:
+    """Category column (one string, or per-row strings / integer codes) as a list of codes"""
+    if values is None or isinstance(values, str):
+        return [codes.get(values, 0)] * rows
+    if len(values) != rows:
+        raise ValueError(f"{name} has {len(values)} rows, expected {rows}")
+    encoded = [
+        codes.get(value, 0) if value is None or isinstance(value, str) else int(value)
+        for value in (values.tolist() if hasattr(values, "tolist") else values)
+    ]
+    if any(not 0 <= code <= len(codes) for code in encoded):
+        raise ValueError(f"{name} codes must be between 0 and {len(codes)}")
+    return encoded
+
+
+def _encode_array(values: Categories, codes: Dict[str, int], rows: int, name: str) -> "np.ndarray":
+    """Vectorized _encode: integer arrays are checked, not converted"""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        if len(values) != rows:
+            raise ValueError(f"{name} has {len(values)} rows, expected {rows}")
+        if rows and (values.min() < 0 or values.max() > len(codes)):
+            raise ValueError(f"{name} codes must be between 0 and {len(codes)}")
+        return values.astype(np.int64, copy=False)
+    return np.array(_encode(values, codes, rows, name), dtype=np.int64)
+
+
+def _bands(values: "np.ndarray", breaks: Tuple[float, ...], nan_band: int) -> "np.ndarray":
+    """Vectorized Dimension.band"""
+    bands = np.searchsorted(np.asarray(breaks), values, side="right")
+    bands[np.isnan(values)] = nan_band
+    return bands
+
+
+def plan_outfits_batch(
+    temperature: Sequence[float],
+    rain_chance: Sequence[float],
+    wind_speed: Sequence[float],
+    activity: Categories = "casual",
+    formality: Categories = "casual",
+    persona: Categories = "practical",
+    comfort: Categories = "neutral",
+    vectorized: Optional[bool] = None
+) -> OutfitBatch:
+    """
+    Plan outfits for many rows at once (row i matches plan_outfit on row i's inputs)
+
+    Args:
+        temperature: Temperatures in Fahrenheit
+        rain_chance: Rain probabilities (0-100)
+        wind_speed: Wind speeds in mph
+        activity: Activity categories: one string for every row, or per-row
+            strings / ACTIVITY_CODES
+        formality: Formality levels, same forms (FORMALITY_CODES)
+        persona: Personas, same forms (PERSONA_CODES)
+        comfort: Comfort profiles, same forms (COMFORT_CODES)
+        vectorized: Force (True) or skip (False) the NumPy path; by default it
+            is used when NumPy is installed
+
+    Returns:
+        OutfitBatch: codes(slot) per row into SLOT_VALUES[slot], or batch[i] /
+        to_dicts() for plan_outfit-shaped dicts
+    """
+    rows = len(temperature)
+    for name, column in (("rain_chance", rain_chance), ("wind_speed", wind_speed)):
+        if len(column) != rows:
+            raise ValueError(f"{name} has {len(column)} rows, expected {rows}")
+
+    if vectorized is None:
+        vectorized = NUMPY_AVAILABLE
+    if not vectorized:
+        activities, formalities, personas, comforts = (
+            [names[code] for code in _encode(values, codes, rows, name)]
+            for values, codes, names, name in (
+                (activity, ACTIVITY_CODES, _names(ACTIVITY_CODES), "activity"),
+                (formality, FORMALITY_CODES, _names(FORMALITY_CODES), "formality"),
+                (persona, PERSONA_CODES, _names(PERSONA_CODES), "persona"),
+                (comfort, COMFORT_CODES, _names(COMFORT_CODES), "comfort"),
+            )
+        )
+        plans = [
+            plan_index(temperature[i], rain_chance[i], wind_speed[i], activities[i], formalities[i], personas[i], comforts[i])
+            for i in range(rows)
+        ]
+        return OutfitBatch(plans, temperature)
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed (pip install numpy)")
+
+    temperature = np.asarray(temperature, dtype=np.float64)
+    comfort_codes = _encode_array(comfort, COMFORT_CODES, rows, "comfort")
+    offsets = np.zeros(len(COMFORT_CODES) + 1)
+    for name, code in COMFORT_CODES.items():
+        offsets[code] = COMFORT_OFFSETS.get(name, 0)
+
+    # Same packing as plan_index / context_code
+    contexts = (
+        (_encode_array(activity, ACTIVITY_CODES, rows, "activity") * (len(FORMALITY_CODES) + 1)
+         + _encode_array(formality, FORMALITY_CODES, rows, "formality"))
+        * (len(PERSONA_CODES) + 1) + _encode_array(persona, PERSONA_CODES, rows, "persona")
+    ) * (len(COMFORT_CODES) + 1) + comfort_codes
+    plans = contexts * TEMPERATURE.size + _bands(temperature + offsets[comfort_codes], TEMPERATURE.breaks, TEMPERATURE.nan_band)
+    plans = plans * RAIN.size + _bands(np.asarray(rain_chance, dtype=np.float64), RAIN.breaks, RAIN.nan_band)
+    plans = plans * WIND.size + _bands(np.asarray(wind_speed, dtype=np.float64), WIND.breaks, WIND.nan_band)
+    return OutfitBatch(plans, temperature)
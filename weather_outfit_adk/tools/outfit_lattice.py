@@ -0,0 +1,155 @@
+"""
+Outfit Lattice
+
+plan_outfit's answer depends only on discrete classes of its inputs: the
+band of each weather input (see outfit_rules.Dimension) and whether the
+activity, formality, persona and comfort profile have rules of their
+own. Every class is enumerated once at import (about 10k plans, built
+from the compiled rule tables) and the finished plan of each is kept in
+a flat tuple indexed by a packed integer. Planning is then "quantize the
+inputs, read one tuple".
+
+- Category code 0 is "any value without rules of its own", so unknown
+  strings need no special casing
+- The practical persona's note quotes the actual temperature, so plans
+  store the note split around it (note_tail is None otherwise)
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Optional, Tuple
+
+from .outfit_rules import (
+    ACTIVITIES,
+    ACTIVITY_NOTES,
+    COLD_ACCESSORIES,
+    COMFORT_NOTES,
+    COMFORT_OFFSETS,
+    FORMALITIES,
+    HOT_ACCESSORIES,
+    PERSONA_NOTES,
+    PRACTICAL_WORDS,
+    RAIN,
+    RAIN_ACCESSORIES,
+    TEMPERATURE,
+    WIND,
+    slot_answers,
+)
+
+
+def _codes(values) -> Dict[str, int]:
+    return {value: code for code, value in enumerate(sorted(values), start=1)}
+
+
+ACTIVITY_CODES = _codes(ACTIVITIES | ACTIVITY_NOTES.keys())
+FORMALITY_CODES = _codes(FORMALITIES)
+PERSONA_CODES = _codes(PERSONA_NOTES.keys())
+COMFORT_CODES = _codes(COMFORT_OFFSETS.keys() | COMFORT_NOTES.keys())
+
+# (top, bottom, outer_layer, footwear, accessories, note_head, note_tail)
+Plan = Tuple[str, str, Optional[str], str, Tuple[str, ...], str, Optional[str]]
+
+_FORMALITY_SIZE = len(FORMALITY_CODES) + 1
+_PERSONA_SIZE = len(PERSONA_CODES) + 1
+_COMFORT_SIZE = len(COMFORT_CODES) + 1
+_CONTEXTS = (len(ACTIVITY_CODES) + 1) * _FORMALITY_SIZE * _PERSONA_SIZE * _COMFORT_SIZE
+_TEMP_SIZE, _TEMP_BREAKS, _TEMP_NAN = TEMPERATURE.size, TEMPERATURE.breaks, TEMPERATURE.nan_band
+_RAIN_SIZE, _RAIN_BREAKS, _RAIN_NAN = RAIN.size, RAIN.breaks, RAIN.nan_band
+_WIND_SIZE, _WIND_BREAKS, _WIND_NAN = WIND.size, WIND.breaks, WIND.nan_band
+
+
+def context_code(activity: str, formality: str, persona: str, comfort: str) -> int:
+    """Packed code of the categorical inputs"""
+    return (
+        (ACTIVITY_CODES.get(activity, 0) * _FORMALITY_SIZE + FORMALITY_CODES.get(formality, 0))
+        * _PERSONA_SIZE + PERSONA_CODES.get(persona, 0)
+    ) * _COMFORT_SIZE + COMFORT_CODES.get(comfort, 0)
+
+
+# context_code(...) * _TEMP_SIZE for the documented values, so most
+# requests pack their context with one dict read
+_CONTEXT_BASES = {
+    (activity, formality, persona, comfort): context_code(activity, formality, persona, comfort) * _TEMP_SIZE
+    for activity in ("casual", *ACTIVITY_CODES)
+    for formality in ("casual", "business_casual", *FORMALITY_CODES)
+    for persona in ("practical", *PERSONA_CODES)
+    for comfort in ("neutral", *COMFORT_CODES)
+}
+
+
+def plan_index(
+    temperature: float,
+    rain_chance: float,
+    wind_speed: float,
+    activity: str,
+    formality: str,
+    persona: str,
+    comfort: str
+) -> int:
+    """Index into LATTICE of the class these inputs fall in"""
+    adjusted = temperature + COMFORT_OFFSETS.get(comfort, 0)
+    base = _CONTEXT_BASES.get((activity, formality, persona, comfort))
+    if base is None:
+        base = context_code(activity, formality, persona, comfort) * _TEMP_SIZE
+    temp_band = bisect_right(_TEMP_BREAKS, adjusted) if adjusted == adjusted else _TEMP_NAN
+    rain_band = bisect_right(_RAIN_BREAKS, rain_chance) if rain_chance == rain_chance else _RAIN_NAN
+    wind_band = bisect_right(_WIND_BREAKS, wind_speed) if wind_speed == wind_speed else _WIND_NAN
+    return ((base + temp_band) * _RAIN_SIZE + rain_band) * _WIND_SIZE + wind_band
+
+
+def _build(
+    activity: Optional[str],
+    formality: Optional[str],
+    persona: Optional[str],
+    comfort: Optional[str],
+    temp_band: int,
+    rain_band: int,
+    wind_band: int,
+    interned: Dict[Any, Any]
+) -> Plan:
+    """One class's plan from the compiled rule tables (None: a value without its own rules)"""
+    tops, bottoms, outer_layers, shoes, wind_accessories = slot_answers(activity, formality)
+    accessories = (
+        RAIN_ACCESSORIES.answers[rain_band]
+        + COLD_ACCESSORIES.answers[temp_band]
+        + wind_accessories[wind_band]
+        + HOT_ACCESSORIES.answers[temp_band]
+    )
+
+    suffix = "".join(f" {extra}" for extra in (COMFORT_NOTES.get(comfort), ACTIVITY_NOTES.get(activity)) if extra)
+    persona_notes = PERSONA_NOTES.get(persona)
+    if persona_notes is not None:
+        head, tail = persona_notes.answers[temp_band][rain_band] + suffix, None
+    else:
+        head, tail = f"Weather is {PRACTICAL_WORDS.answers[temp_band]} at ", "°F." + suffix
+
+    return (
+        tops[temp_band],
+        bottoms[temp_band],
+        outer_layers[rain_band][temp_band][wind_band],
+        shoes[rain_band],
+        interned.setdefault(accessories, accessories),
+        interned.setdefault(head, head),
+        interned.setdefault(tail, tail) if tail is not None else None,
+    )
+
+
+def _build_lattice() -> Tuple[Plan, ...]:
+    def decode(codes: Dict[str, int]):
+        return (None,) + tuple(sorted(codes, key=codes.get))
+
+    interned: Dict[Any, Any] = {}  # One shared object per distinct accessory tuple / note part
+    plans = []
+    # Same nesting order as plan_index packs them
+    for activity in decode(ACTIVITY_CODES):
+        for formality in decode(FORMALITY_CODES):
+            for persona in decode(PERSONA_CODES):
+                for comfort in decode(COMFORT_CODES):
+                    for temp_band in range(_TEMP_SIZE):
+                        for rain_band in range(_RAIN_SIZE):
+                            for wind_band in range(_WIND_SIZE):
+                                plans.append(_build(activity, formality, persona, comfort, temp_band, rain_band, wind_band, interned))
+    assert len(plans) == _CONTEXTS * _TEMP_SIZE * _RAIN_SIZE * _WIND_SIZE
+    return tuple(plans)
+
+
+LATTICE: Tuple[Plan, ...] = _build_lattice()
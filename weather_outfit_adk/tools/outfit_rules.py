@@ -0,0 +1,331 @@
+"""
+Outfit Rules
+
+plan_outfit's clothing rules as data. Each rule is a threshold table over
+one weather input, or a first-match table over several. At import the
+thresholds of every table over the same input are merged into one sorted
+breakpoint tuple per input (a Dimension), and every table is compiled to
+its answer for each band of those breakpoints. A plan then costs one
+bisect per input plus tuple indexing.
+
+- Bands: one input split at thresholds. BELOW tables read like
+  `if x < t1 ... elif x < t2 ... else` (ascending thresholds). ABOVE
+  tables read like `if x > t1 ... elif x > t2 ... else` (descending
+  thresholds)
+- DecisionTable: first-match rules over several Bands, compiled to
+  nested tuples indexed by the inputs' bands
+- SlotRules: the tables for one outfit slot. A formality-specific table
+  wins, then an activity-specific one, then the default. slot_answers()
+  resolves all slots for a context with one dict read
+
+"x > t" is stored as "x < nextafter(t)", so both sides share one
+bisect_right. NaN compares false against every threshold and gets a band
+of its own, answered as an if/elif chain would (the else branch).
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BELOW = "below"
+ABOVE = "above"
+
+
+class Dimension:
+    """One rule input; every table over it shares its breakpoints."""
+
+    __slots__ = ("name", "breaks", "nan_band", "representatives", "_thresholds")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.breaks: Tuple[float, ...] = ()
+        self.nan_band = 1
+        self.representatives: Tuple[float, ...] = ()
+        self._thresholds = set()
+
+    def add(self, side: str, threshold: float):
+        self._thresholds.add(threshold if side == BELOW else math.nextafter(threshold, math.inf))
+
+    def compile(self):
+        self.breaks = tuple(sorted(float(threshold) for threshold in self._thresholds))  # float/float compares are the fastest
+        self.nan_band = len(self.breaks) + 1
+        # Any value of a band has the same answer in every table; these stand in for them
+        self.representatives = (-math.inf,) + self.breaks + (math.nan,)
+
+    @property
+    def size(self) -> int:
+        """Number of bands, including the NaN band"""
+        return len(self.breaks) + 2
+
+    def band(self, value: float) -> int:
+        return bisect_right(self.breaks, value) if value == value else self.nan_band
+
+
+class Bands:
+    """A threshold table over one input."""
+
+    __slots__ = ("dimension", "side", "breaks", "labels", "answers", "_find")
+
+    def __init__(self, dimension: Dimension, side: str, rows: Sequence[Tuple[Optional[float], Any]]):
+        """
+        Define a threshold table
+
+        Args:
+            dimension: The input it reads
+            side: BELOW ("x < threshold") or ABOVE ("x > threshold")
+            rows: (threshold, answer) rows in if/elif order, ending with
+                the else row (None, answer)
+        """
+        *limits, (last, otherwise) = rows
+        if last is not None:
+            raise ValueError("The last row of a threshold table is the else row (None, answer)")
+        thresholds = [threshold for threshold, _ in limits]
+        answers = [answer for _, answer in limits]
+
+        if side == BELOW:
+            if thresholds != sorted(thresholds):
+                raise ValueError(f"BELOW thresholds must ascend: {thresholds}")
+            self.breaks = tuple(thresholds)
+            self.labels = tuple(answers) + (otherwise,)
+            self._find = bisect_right
+        elif side == ABOVE:
+            if thresholds != sorted(thresholds, reverse=True):
+                raise ValueError(f"ABOVE thresholds must descend: {thresholds}")
+            self.breaks = tuple(reversed(thresholds))
+            self.labels = (otherwise,) + tuple(reversed(answers))
+            self._find = bisect_left
+        else:
+            raise ValueError(f"Unknown side: {side!r}")
+
+        self.dimension = dimension
+        self.side = side
+        self.answers: Tuple[Any, ...] = ()
+        for threshold in thresholds:
+            dimension.add(side, threshold)
+        _TABLES.append(self)
+
+    def __call__(self, value: float) -> Any:
+        """Answer for a raw input value (the table read on its own)"""
+        return self.labels[self._find(self.breaks, value)]
+
+    def compile(self):
+        self.answers = tuple(self(value) for value in self.dimension.representatives)
+
+
+class DecisionTable:
+    """First-match rules over several Bands."""
+
+    __slots__ = ("names", "bands", "rules", "default", "answers")
+
+    def __init__(
+        self,
+        dimensions: Sequence[Tuple[str, Bands]],
+        rules: Sequence[Tuple[Dict[str, Any], Any]],
+        default: Any = None
+    ):
+        """
+        Define a decision table
+
+        Args:
+            dimensions: (name, Bands) per input, in grid order
+            rules: (condition, answer) rows, first match wins. A condition
+                maps dimension names to a band label or a tuple of labels;
+                dimensions it leaves out match any band
+            default: Answer when no rule matches
+        """
+        self.names = tuple(name for name, _ in dimensions)
+        self.bands = tuple(bands for _, bands in dimensions)
+        self.rules = [
+            ({name: labels if isinstance(labels, tuple) else (labels,) for name, labels in condition.items()}, answer)
+            for condition, answer in rules
+        ]
+        self.default = default
+        for condition, _ in self.rules:
+            for name, labels in condition.items():
+                known = self.bands[self.names.index(name)].labels
+                for label in labels:
+                    if label not in known:
+                        raise ValueError(f"Unknown {name} band {label!r} (bands: {known})")
+        self.answers: Tuple[Any, ...] = ()
+        _TABLES.append(self)
+
+    def __call__(self, *values: float) -> Any:
+        """Answer for raw input values, one per dimension"""
+        labels = dict(zip(self.names, (bands(value) for bands, value in zip(self.bands, values))))
+        for condition, answer in self.rules:
+            if all(labels[name] in allowed for name, allowed in condition.items()):
+                return answer
+        return self.default
+
+    def compile(self):
+        """Nested tuples: answers[band of input 1][band of input 2]..."""
+        def build(depth: int, values: List[float]) -> Any:
+            if depth == len(self.bands):
+                return self(*values)
+            return tuple(build(depth + 1, values + [value]) for value in self.bands[depth].dimension.representatives)
+        self.answers = build(0, [])
+
+
+class SlotRules:
+    """The tables for one outfit slot, picked by formality, then activity, then default."""
+
+    __slots__ = ("default", "by_formality", "by_activity")
+
+    def __init__(self, default: Any, by_formality: Optional[Dict[str, Any]] = None, by_activity: Optional[Dict[str, Any]] = None):
+        self.default = default
+        self.by_formality = by_formality or {}
+        self.by_activity = by_activity or {}
+
+    def pick(self, activity: str, formality: str) -> Any:
+        table = self.by_formality.get(formality)
+        if table is None:
+            table = self.by_activity.get(activity, self.default)
+        return table
+
+
+_TABLES: List[Any] = []
+
+# °F after the comfort adjustment, %, mph
+TEMPERATURE = Dimension("temperature")
+RAIN = Dimension("rain_chance")
+WIND = Dimension("wind_speed")
+
+# Perceived temperature shift per comfort profile (°F)
+COMFORT_OFFSETS = {"runs_cold": -5, "runs_hot": 5}
+
+TOPS = SlotRules(
+    default=Bands(TEMPERATURE, BELOW, [
+        (40, "long-sleeve thermal or henley"),
+        (60, "long-sleeve shirt or light sweater"),
+        (75, "t-shirt or short-sleeve shirt"),
+        (None, "light t-shirt or tank top"),
+    ]),
+    by_formality={
+        "formal": Bands(TEMPERATURE, BELOW, [(60, "dress shirt or blouse with sweater"), (None, "dress shirt or blouse")]),
+    },
+    by_activity={
+        "sports": Bands(TEMPERATURE, BELOW, [(None, "moisture-wicking athletic shirt or tank")]),
+    },
+)
+
+BOTTOMS = SlotRules(
+    default=Bands(TEMPERATURE, BELOW, [
+        (40, "warm pants or jeans"),
+        (65, "jeans or casual pants"),
+        (80, "light pants or shorts"),
+        (None, "shorts or light skirt"),
+    ]),
+    by_activity={
+        "sports": Bands(TEMPERATURE, BELOW, [(50, "athletic leggings or joggers"), (None, "athletic shorts or breathable pants")]),
+    },
+)
+
+# Outer layer answers are indexed [rain band][temperature band][wind band].
+# Warm, calm, dry weather needs no layer because no rule matches it.
+_OUTER_DIMENSIONS = (
+    ("rain", Bands(RAIN, ABOVE, [(40, "wet"), (None, "dry")])),
+    ("temp", Bands(TEMPERATURE, BELOW, [(32, "freezing"), (50, "cold"), (None, "mild")])),
+    ("wind", Bands(WIND, ABOVE, [(15, "windy"), (None, "calm")])),
+)
+
+OUTER_LAYERS = SlotRules(
+    default=DecisionTable(_OUTER_DIMENSIONS, [
+        ({"rain": "wet", "temp": ("freezing", "cold")}, "insulated rain jacket"),
+        ({"rain": "wet"}, "light rain jacket or windbreaker"),
+        ({"temp": "freezing"}, "heavy winter coat"),
+        ({"temp": "cold"}, "medium jacket or fleece"),
+        ({"wind": "windy"}, "windbreaker"),
+    ]),
+    by_formality={
+        "formal": DecisionTable(_OUTER_DIMENSIONS, [
+            ({"rain": "wet"}, "dress coat with rain protection"),
+            ({"temp": ("freezing", "cold")}, "wool coat or blazer"),
+        ]),
+    },
+)
+
+FOOTWEAR = SlotRules(
+    default=Bands(RAIN, ABOVE, [(40, "waterproof boots or rain boots"), (None, "sneakers or casual shoes")]),
+    by_formality={
+        "formal": Bands(RAIN, ABOVE, [(40, "dress shoes (waterproof if possible)"), (None, "dress shoes or heels")]),
+    },
+    by_activity={
+        "sports": Bands(RAIN, ABOVE, [(None, "athletic shoes or trail shoes")]),
+        "work": Bands(RAIN, ABOVE, [(40, "waterproof boots or rain boots"), (None, "comfortable work shoes or loafers")]),
+    },
+)
+
+# Accessories: every table adds its items, in this order
+RAIN_ACCESSORIES = Bands(RAIN, ABOVE, [(40, ("umbrella",)), (None, ())])
+COLD_ACCESSORIES = Bands(TEMPERATURE, BELOW, [
+    (30, ("warm hat or beanie", "scarf", "gloves")),
+    (40, ("warm hat or beanie", "scarf")),
+    (None, ()),
+])
+WIND_ACCESSORIES = SlotRules(
+    default=Bands(WIND, ABOVE, [(None, ())]),
+    by_activity={
+        "sports": Bands(WIND, ABOVE, [(20, ("windproof cap",)), (None, ())]),
+    },
+)
+HOT_ACCESSORIES = Bands(TEMPERATURE, ABOVE, [(80, ("sunglasses", "sunscreen")), (None, ())])
+
+# Persona note answers are indexed [temperature band][rain band]; personas
+# without a table describe the temperature with PRACTICAL_WORDS
+_NOTE_DIMENSIONS = (
+    ("temp", Bands(TEMPERATURE, BELOW, [(50, "cold"), (None, "mild")])),
+    ("rain", Bands(RAIN, ABOVE, [(40, "wet"), (None, "dry")])),
+)
+
+PERSONA_NOTES = {
+    "kid_friendly": DecisionTable(_NOTE_DIMENSIONS, [
+        ({"temp": "cold"}, "Bundle up warm - it's chilly out there!"),
+        ({"rain": "wet"}, "Don't forget your rain gear for puddle jumping!"),
+    ], default="Perfect weather for fun outside!"),
+    "fashion": DecisionTable(_NOTE_DIMENSIONS, [
+        ({"rain": "wet"}, "Layer colors and textures for a stylish look. "
+                          "Rain doesn't mean sacrificing style - try a trendy rain jacket."),
+    ], default="Layer colors and textures for a stylish look."),
+}
+
+PRACTICAL_WORDS = Bands(TEMPERATURE, BELOW, [(50, "cold"), (70, "mild"), (None, "warm")])
+
+COMFORT_NOTES = {
+    "runs_cold": "Since you tend to feel cold, adding extra layers is recommended.",
+    "runs_hot": "Since you tend to feel warm, lighter options are better.",
+}
+
+ACTIVITY_NOTES = {
+    "sports": "Choose breathable, flexible clothing for movement.",
+    "formal": "Dress to impress while staying comfortable.",
+}
+
+for _dimension in (TEMPERATURE, RAIN, WIND):
+    _dimension.compile()
+for _table in _TABLES:
+    _table.compile()
+
+# Compiled answers of every slot for each context that has its own tables
+# (None stands for any other formality / activity)
+SLOTS = (TOPS, BOTTOMS, OUTER_LAYERS, FOOTWEAR, WIND_ACCESSORIES)
+FORMALITIES = frozenset(formality for slot in SLOTS for formality in slot.by_formality)
+ACTIVITIES = frozenset(activity for slot in SLOTS for activity in slot.by_activity)
+_CONTEXTS = {
+    (formality, activity): tuple(slot.pick(activity, formality).answers for slot in SLOTS)
+    for formality in (*FORMALITIES, None)
+    for activity in (*ACTIVITIES, None)
+}
+
+
+def slot_answers(activity: str, formality: str) -> Tuple[Any, ...]:
+    """
+    Compiled answers for a context: (tops, bottoms, outer_layers, footwear, wind_accessories)
+
+    tops and bottoms are indexed by temperature band, outer_layers by
+    [rain][temperature][wind] bands, footwear by rain band and
+    wind_accessories by wind band.
+    """
+    return _CONTEXTS[(
+        formality if formality in FORMALITIES else None,
+        activity if activity in ACTIVITIES else None,
+    )]
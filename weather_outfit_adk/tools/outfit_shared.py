@@ -0,0 +1,128 @@
+"""
+Shared Outfit Plans
+
+Read-only views of the outfit lattice for in-process callers that plan
+repeatedly (coach loops, batch jobs). plan_outfit builds a fresh dict and
+accessories list per call because the ADK tool's result is serialized
+and may be owned by the caller; SharedPlanTable instead hands out one
+frozen plan per lattice entry, shared by every request that lands on it.
+
+- Plans are MappingProxyType views with accessories as the lattice's
+  tuple, equal to plan_outfit's dict apart from the tuple
+- A plan is built the first time its lattice entry is looked up, so the
+  table never holds more than the lattice (about 10k plans)
+- The practical persona's note quotes the temperature, so those plans are
+  kept per lattice entry and whole degree, up to max_noted of them; past
+  that they are built per call (still frozen, just not shared)
+- Lookups (result: hit or built) and the table size go to buffered_metrics
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..monitoring.metrics import buffered_metrics
+from .outfit_lattice import LATTICE, plan_index
+
+
+class SharedPlanTable:
+    """Frozen outfit plans built from the lattice on first use and shared by every caller."""
+
+    def __init__(self, name: str = "outfit_plans", max_noted: int = 4096):
+        """
+        Initialize the table
+
+        Args:
+            name: Table name used as the metrics label
+            max_noted: Maximum number of temperature-quoting plans kept
+        """
+        self.name = name
+        self.max_noted = max(0, max_noted)
+        self._plans: List[Optional[Mapping[str, Any]]] = [None] * len(LATTICE)
+        self._noted: Dict[Tuple[int, int], Mapping[str, Any]] = {}
+        self._entries = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def get(
+        self,
+        temperature: float,
+        rain_chance: float,
+        wind_speed: float,
+        activity_category: str = "casual",
+        formality_level: str = "casual",
+        movement_level: str = "medium",
+        persona: str = "practical",
+        comfort_profile: str = "neutral"
+    ) -> Mapping[str, Any]:
+        """
+        Shared read-only plan for these inputs (same arguments as plan_outfit)
+
+        Returns:
+            Mapping with top, bottom, outer_layer, footwear, accessories (tuple), notes
+        """
+        index = plan_index(
+            temperature, rain_chance, wind_speed,
+            activity_category, formality_level, persona, comfort_profile
+        )
+        if LATTICE[index][6] is None:
+            plan = self._plans[index]
+            if plan is None:
+                plan = self._store(index, None, temperature)
+            else:
+                self._record("hit")
+            return plan
+
+        key = (index, int(temperature))
+        plan = self._noted.get(key)
+        if plan is None:
+            plan = self._store(index, key, temperature)
+        else:
+            self._record("hit")
+        return plan
+
+    def _store(self, index: int, key: Optional[Tuple[int, int]], temperature: float) -> Mapping[str, Any]:
+        top, bottom, outer_layer, footwear, accessories, note_head, note_tail = LATTICE[index]
+        plan = MappingProxyType({
+            "top": top,
+            "bottom": bottom,
+            "outer_layer": outer_layer,
+            "footwear": footwear,
+            "accessories": accessories,
+            "notes": note_head if note_tail is None else f"{note_head}{int(temperature)}{note_tail}",
+        })
+        self._record("built")
+        with self._lock:
+            # Another thread may have stored the same plan meanwhile; keep the first
+            if key is None:
+                existing = self._plans[index]
+                if existing is not None:
+                    return existing
+                self._plans[index] = plan
+            else:
+                existing = self._noted.get(key)
+                if existing is not None:
+                    return existing
+                if len(self._noted) >= self.max_noted:
+                    return plan
+                self._noted[key] = plan
+            self._entries += 1
+            entries = self._entries
+        buffered_metrics.set_gauge("outfit_shared_plan_entries", entries, labels={"table": self.name})
+        return plan
+
+    def _record(self, result: str):
+        buffered_metrics.increment_counter(
+            "outfit_shared_plan_lookups",
+            labels={"table": self.name, "result": result}
+        )
+
+    def clear(self):
+        """Drop every built plan"""
+        with self._lock:
+            self._plans = [None] * len(LATTICE)
+            self._noted.clear()
+            self._entries = 0
+        buffered_metrics.set_gauge("outfit_shared_plan_entries", 0, labels={"table": self.name})
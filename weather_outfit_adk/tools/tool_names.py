@@ -0,0 +1,32 @@
+"""
+Tool Names
+
+ADK publishes each function's __name__ as the tool name the model sees.
+The agents run the asyncio versions of the weather tools, but the model
+(and anything keyed on tool names: prompts, traces, evals) should keep
+seeing the original names, so the coroutines are registered through a
+thin wrapper named after the blocking tool.
+"""
+
+import functools
+from typing import Any, Awaitable, Callable
+
+
+def as_tool(func: Callable[..., Awaitable[Any]], name: str) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap a coroutine tool so ADK registers it under name
+
+    Args:
+        func: Async tool (e.g. get_weather_smart_async)
+        name: Tool name shown to the model (e.g. "get_weather_smart")
+
+    Returns:
+        Coroutine function with func's signature and docstring, named name
+    """
+    @functools.wraps(func)
+    async def tool(*args: Any, **kwargs: Any) -> Any:
+        return await func(*args, **kwargs)
+
+    tool.__name__ = name
+    tool.__qualname__ = name
+    return tool
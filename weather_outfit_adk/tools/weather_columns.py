@@ -0,0 +1,226 @@
+"""
+Weather Column Transforms
+
+Converts Meteostat-shaped daily rows (°C, km/h, mm) into the tool's
+weather fields (°F, mph, rain chance, condition).
+
+- derive_row(): scalar reference, used for single lookups
+- derive_columns(): the same formulas over NumPy columns in one
+  vectorized pass, for multi-day / multi-city ranges
+- derive_rows(): rows in, derived fields out, picking the vectorized path
+  when NumPy is installed and the batch is large enough
+- derive_hour(): the same fields for one (interpolated) hourly point
+
+Both paths give identical results: rounding is done with NumPy and any
+value that lands within float error of a .x5 tie is re-rounded with
+Python's round().
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+COLUMNS = ("tavg", "tmax", "wspd", "prcp", "snow", "rhum")
+DERIVED = ("temperature", "feels_like", "condition", "rain_chance", "wind_speed", "humidity")
+CONDITIONS = ("partly cloudy", "light rain", "rainy", "snowy")
+
+DEFAULT_TEMP_C = 20.0
+DEFAULT_HUMIDITY = 50.0
+KMH_TO_MPH = 0.621371
+
+# Meteostat weather condition codes (coco)
+COCO_CONDITIONS = {
+    1: "clear", 2: "partly cloudy", 3: "cloudy", 4: "overcast",
+    5: "foggy", 6: "freezing fog",
+    7: "light rain", 8: "rainy", 9: "heavy rain", 10: "freezing rain", 11: "freezing rain",
+    12: "sleet", 13: "sleet", 14: "light snow", 15: "snowy", 16: "heavy snow",
+    17: "rain showers", 18: "heavy rain showers", 19: "sleet showers", 20: "sleet showers",
+    21: "snow showers", 22: "heavy snow showers",
+    23: "thunderstorm", 24: "hail", 25: "thunderstorm", 26: "heavy thunderstorm", 27: "stormy",
+}
+
+# Below this many rows the scalar loop is faster than building arrays
+VECTOR_MIN_ROWS = 16
+
+
+def condition_for(prcp: Optional[float], snow: Optional[float]) -> str:
+    """Weather condition from daily precipitation and snow (mm)."""
+    if snow and snow > 0:
+        return "snowy"
+    elif prcp and prcp > 10:
+        return "rainy"
+    elif prcp and prcp > 2:
+        return "light rain"
+    else:
+        return "partly cloudy"
+
+
+def derive_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Derive the tool's weather fields from one daily row
+
+    Missing temperatures fall back to tmax, then 20°C; missing wind and
+    precipitation count as 0; humidity defaults to 50% only when the
+    field is absent.
+    """
+    temp_c = row.get("tavg")
+    if temp_c is None:
+        temp_c = row.get("tmax")
+    if temp_c is None:
+        temp_c = DEFAULT_TEMP_C
+    temp_f = (temp_c * 9/5) + 32
+
+    wind_speed_mph = (row.get("wspd") or 0.0) * KMH_TO_MPH
+
+    prcp = row.get("prcp") or 0.0
+    rain_chance = min(100.0, prcp * 10) if prcp else 0.0
+
+    return {
+        "temperature": round(temp_f, 1),
+        "feels_like": round(temp_f - 2, 1),
+        "condition": condition_for(prcp, row.get("snow")),
+        "rain_chance": round(rain_chance, 1),
+        "wind_speed": round(wind_speed_mph, 1),
+        "humidity": row.get("rhum", DEFAULT_HUMIDITY),
+    }
+
+
+def derive_hour(point: Mapping[str, Any], rain_chance: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Derive the tool's weather fields from one hourly point (see HourlySeriesBuffer.at)
+
+    Args:
+        point: Hourly values (temp, rhum, wspd, pop, prcp, snow, coco)
+        rain_chance: Fallback when the provider gives no precipitation probability
+
+    The condition comes from the condition code when there is one, else
+    from that hour's precipitation.
+    """
+    temp_c = point.get("temp")
+    if temp_c is None:
+        temp_c = DEFAULT_TEMP_C
+    temp_f = (temp_c * 9/5) + 32
+
+    prcp = point.get("prcp") or 0.0
+    snow = point.get("snow") or 0.0
+    condition = COCO_CONDITIONS.get(point.get("coco"))
+    if condition is None:
+        condition = "snowy" if snow > 0 else "rainy" if prcp > 2.5 else "light rain" if prcp > 0.2 else "partly cloudy"
+
+    pop = point.get("pop")
+    if pop is None:
+        pop = rain_chance or 0.0
+
+    humidity = point.get("rhum")
+    return {
+        "temperature": round(temp_f, 1),
+        "feels_like": round(temp_f - 2, 1),
+        "condition": condition,
+        "rain_chance": round(min(100.0, pop), 1),
+        "wind_speed": round((point.get("wspd") or 0.0) * KMH_TO_MPH, 1),
+        "humidity": round(humidity, 1) if humidity is not None else None,
+    }
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]]) -> Dict[str, "np.ndarray"]:
+    """
+    Pack rows into float64 columns (None -> NaN)
+
+    rhum is DEFAULT_HUMIDITY where the field is absent and NaN where it is None,
+    matching derive_row.
+    """
+    columns = {}
+    for name in COLUMNS:
+        default = DEFAULT_HUMIDITY if name == "rhum" else None
+        # float64 arrays store None as NaN
+        columns[name] = np.array([row.get(name, default) for row in rows], dtype=np.float64)
+    return columns
+
+
+def _round1(values: "np.ndarray") -> "np.ndarray":
+    """round(x, 1) per element, bit-identical to Python's round()."""
+    scaled = values * 10
+    rounded = np.round(values, 1)
+    # rint(x * 10) can pick the other integer when x * 10 is within float error of .5
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), 1)
+    return rounded
+
+
+def derive_columns(columns: Mapping[str, "np.ndarray"]) -> Dict[str, "np.ndarray"]:
+    """
+    Vectorized derive_row over columns (see to_columns)
+
+    Returns:
+        Columns for every DERIVED field; condition is an index into CONDITIONS
+        and humidity keeps NaN where the input was None
+    """
+    tavg, tmax = columns["tavg"], columns["tmax"]
+    temp_c = np.where(np.isnan(tavg), np.where(np.isnan(tmax), DEFAULT_TEMP_C, tmax), tavg)
+    temp_f = (temp_c * 9 / 5) + 32
+
+    wind_speed_mph = np.nan_to_num(columns["wspd"], nan=0.0) * KMH_TO_MPH
+
+    prcp = np.nan_to_num(columns["prcp"], nan=0.0)
+    snow = np.nan_to_num(columns["snow"], nan=0.0)
+    rain_chance = np.minimum(100.0, prcp * 10)
+
+    condition = np.select(
+        [snow > 0, prcp > 10, prcp > 2],
+        [CONDITIONS.index("snowy"), CONDITIONS.index("rainy"), CONDITIONS.index("light rain")],
+        default=CONDITIONS.index("partly cloudy"),
+    )
+
+    return {
+        "temperature": _round1(temp_f),
+        "feels_like": _round1(temp_f - 2),
+        "condition": condition,
+        "rain_chance": _round1(rain_chance),
+        "wind_speed": _round1(wind_speed_mph),
+        "humidity": columns["rhum"],
+    }
+
+
+def derive_rows(rows: Sequence[Mapping[str, Any]], vectorized: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    Derive the tool's weather fields for many rows
+
+    Args:
+        rows: Daily rows
+        vectorized: Force (True) or skip (False) the NumPy path; by default it is
+            used when NumPy is installed and there are at least VECTOR_MIN_ROWS rows
+
+    Returns:
+        One dict of DERIVED fields per row, in order
+    """
+    if vectorized is None:
+        vectorized = NUMPY_AVAILABLE and len(rows) >= VECTOR_MIN_ROWS
+    if not vectorized or not rows:
+        return [derive_row(row) for row in rows]
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed (pip install numpy)")
+
+    derived = derive_columns(to_columns(rows))
+    temperature = derived["temperature"].tolist()
+    feels_like = derived["feels_like"].tolist()
+    condition = [CONDITIONS[i] for i in derived["condition"].tolist()]
+    rain_chance = derived["rain_chance"].tolist()
+    wind_speed = derived["wind_speed"].tolist()
+    humidity = [None if h != h else h for h in derived["humidity"].tolist()]  # NaN -> None
+    return [
+        {
+            "temperature": temperature[i],
+            "feels_like": feels_like[i],
+            "condition": condition[i],
+            "rain_chance": rain_chance[i],
+            "wind_speed": wind_speed[i],
+            "humidity": humidity[i],
+        }
+        for i in range(len(rows))
+    ]
@@ -1,70 +1,377 @@
-import os
-import http.client
-import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from ..schemas.weather import WeatherData, ForecastData
+from ..cache.weather_cache import WeatherCache
+from ..cache.record import WeatherRecord
+from ..cache.persistent_cache import PersistentCache
+from ..cache.shared_cache import SharedMemoryCache, SHARED_CACHE_AVAILABLE
+from ..cache.single_flight import SingleFlight, AsyncSingleFlight
+from ..cache.refresh import BackgroundRefresher
+from ..cache.prewarm import Prewarmer
+from ..cache.series_cache import DailySeriesCache, location_key
+from ..cache.hourly_buffer import HourlySeriesBuffer
+from ..config.settings import settings
+from ..history.store import HistoryStore
+from ..providers.http_pool import HTTPConnectionPool
+from ..providers.async_http_pool import AsyncHTTPConnectionPool
+from ..providers.meteostat import MeteostatClient, AsyncMeteostatClient, MeteostatProvider, METEOSTAT_HOST
+from ..providers.open_meteo import OpenMeteoProvider, OPEN_METEO_HOST
+from ..providers.router import ProviderRouter
+from ..providers.errors import RateLimitExceeded
+from ..providers.circuit_breaker import CircuitBreaker
+from ..providers.rate_limit import RateLimiter, SqliteQuotaLedger, request_priority, INTERACTIVE, PREWARM
+from ..geo.gazetteer import Gazetteer, DEFAULT_GAZETTEER_PATH
+from ..geo.geocoder import Geocoder, LearnedPlaceCache, GEOCODING_HOST
+from ..geo.geohash import geohash_encode
+from ..monitoring.metrics import buffered_metrics
+from .weather_columns import derive_hour, derive_row, derive_rows
 
-weather_cache: Dict[str, Dict[str, Any]] = {}
-
-# Common city coordinates mapping (lat, lon, altitude_meters)
-CITY_COORDINATES = {
-    "seattle": (47.6062, -122.3321, 50),
-    "redmond": (47.6740, -122.1215, 50),
-    "new york": (40.7128, -74.0060, 10),
-    "los angeles": (34.0522, -118.2437, 71),
-    "chicago": (41.8781, -87.6298, 179),
-    "san francisco": (37.7749, -122.4194, 52),
-    "miami": (25.7617, -80.1918, 2),
-    "boston": (42.3601, -71.0589, 5),
-    "denver": (39.7392, -104.9903, 1609),
-    "portland": (45.5152, -122.6784, 15),
-    "austin": (30.2672, -97.7431, 149),
-    "phoenix": (33.4484, -112.0740, 331),
-    "atlanta": (33.7490, -84.3880, 320),
-    "dallas": (32.7767, -96.7970, 131),
-    "houston": (29.7604, -95.3698, 12),
+# Optional second tiers: host-wide shared memory in front of on-disk SQLite
+_persistent_cache = PersistentCache(
+    settings.weather_persistent_cache_path,
+    name="weather_disk",
+    max_entries=settings.weather_persistent_cache_max_entries,
+) if settings.weather_persistent_cache_path else None
+
+_shared_cache = SharedMemoryCache(
+    settings.weather_shared_cache_path,
+    name="weather_shared",
+    slots=settings.weather_shared_cache_slots,
+    slot_bytes=settings.weather_shared_cache_slot_bytes,
+    backing=_persistent_cache,
+) if settings.weather_shared_cache_path and SHARED_CACHE_AVAILABLE else None
+
+weather_cache = WeatherCache(
+    name="weather",
+    max_entries=settings.weather_cache_max_entries,
+    max_bytes=settings.weather_cache_max_bytes,
+    ttl_seconds=settings.weather_cache_ttl_seconds,
+    stripes=settings.weather_cache_stripes,
+    stale_seconds=settings.weather_cache_stale_seconds,
+    backing=_shared_cache if _shared_cache is not None else _persistent_cache,
+    encode=WeatherRecord.to_json,
+    decode=WeatherRecord.from_json,
+)
+
+# Start warm after a restart instead of sending every first request upstream
+if weather_cache.backing is not None:
+    try:
+        print(f"✅ Warm-loaded {weather_cache.warm(settings.weather_persistent_cache_warm_entries)} weather cache entries")
+    except Exception as e:
+        print(f"⚠️  Weather cache warm-load failed: {e}")
+
+# Stale-while-revalidate reloads and refresh-ahead of the hottest keys
+weather_refresher = BackgroundRefresher(
+    name="weather",
+    ttl_remaining=weather_cache.ttl_remaining,
+    max_workers=settings.weather_refresh_workers,
+    ahead_seconds=settings.weather_refresh_ahead_seconds,
+    scan_interval=settings.weather_refresh_scan_seconds,
+    hot_keys=settings.weather_refresh_hot_keys,
+    min_hits=settings.weather_refresh_min_hits,
+)
+
+weather_flight = SingleFlight(
+    name="weather",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+weather_flight_async = AsyncSingleFlight(
+    name="weather_async",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+# Per-location windows of daily rows, filled by range prefetch
+daily_series_cache = DailySeriesCache(
+    name="daily_series",
+    max_locations=settings.weather_series_max_locations,
+    ttl_seconds=settings.weather_series_ttl_seconds,
+)
+
+series_flight = SingleFlight(
+    name="daily_series",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+series_flight_async = AsyncSingleFlight(
+    name="daily_series_async",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+# Per-location hourly series; arbitrary times are interpolated from it
+hourly_buffer = HourlySeriesBuffer(
+    name="hourly",
+    max_locations=settings.weather_hourly_max_locations,
+    ttl_seconds=settings.weather_hourly_ttl_seconds,
+    max_gap_hours=settings.weather_hourly_max_gap_hours,
+)
+
+hourly_flight = SingleFlight(
+    name="hourly",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+hourly_flight_async = AsyncSingleFlight(
+    name="hourly_async",
+    timeout_seconds=settings.weather_singleflight_timeout_seconds,
+)
+
+# Optional on-disk daily history for climatology; fetched past days are written through
+history_store = HistoryStore(
+    settings.weather_history_path,
+    name="history",
+    max_open_files=settings.weather_history_max_open_files,
+) if settings.weather_history_path else None
+
+_pool_options = dict(
+    max_size=settings.weather_http_pool_size,
+    idle_timeout=settings.weather_http_idle_timeout_seconds,
+    connect_timeout=settings.weather_http_connect_timeout_seconds,
+    read_timeout=settings.weather_http_read_timeout_seconds,
+)
+# Blocking pools cap connections in flight; callers past the cap wait this long for one
+_sync_pool_options = dict(_pool_options, checkout_timeout=settings.weather_http_checkout_timeout_seconds)
+
+# One budget for sync and async calls: both count against the same RapidAPI plan.
+# Without a shared ledger each process only gets its share of the daily quota
+meteostat_limiter = RateLimiter(
+    "meteostat",
+    rate_per_second=settings.meteostat_rate_per_second,
+    burst=settings.meteostat_burst,
+    daily_quota=(
+        settings.meteostat_daily_quota if settings.meteostat_quota_path
+        else settings.meteostat_daily_quota // max(1, settings.meteostat_quota_processes)
+    ),
+    quota_reserve=settings.meteostat_quota_reserve,
+    quota_ledger=SqliteQuotaLedger(settings.meteostat_quota_path, "meteostat") if settings.meteostat_quota_path else None,
+    quota_refresh=settings.meteostat_quota_refresh_seconds,
+    max_wait={
+        INTERACTIVE: settings.meteostat_max_wait_seconds,
+        PREWARM: settings.meteostat_prewarm_max_wait_seconds,
+    },
+)
+
+# One breaker per upstream, shared by its sync and async clients
+meteostat_breaker = CircuitBreaker(
+    "meteostat",
+    failure_threshold=settings.circuit_breaker_failure_threshold,
+    reset_seconds=settings.circuit_breaker_reset_seconds,
+)
+
+geocoding_breaker = CircuitBreaker(
+    "geocoding",
+    failure_threshold=settings.circuit_breaker_failure_threshold,
+    reset_seconds=settings.circuit_breaker_reset_seconds,
+)
+
+open_meteo_breaker = CircuitBreaker(
+    "open_meteo",
+    failure_threshold=settings.circuit_breaker_failure_threshold,
+    reset_seconds=settings.circuit_breaker_reset_seconds,
+)
+
+meteostat_client = MeteostatClient(
+    HTTPConnectionPool(METEOSTAT_HOST, name="meteostat", **_sync_pool_options),
+    limiter=meteostat_limiter,
+    breaker=meteostat_breaker,
+)
+
+meteostat_client_async = AsyncMeteostatClient(
+    AsyncHTTPConnectionPool(METEOSTAT_HOST, name="meteostat_async", **_pool_options),
+    limiter=meteostat_limiter,
+    breaker=meteostat_breaker,
+)
+
+_providers = {
+    "meteostat": MeteostatProvider(meteostat_client, meteostat_client_async),
+    "open_meteo": OpenMeteoProvider(
+        HTTPConnectionPool(OPEN_METEO_HOST, name="open_meteo", **_sync_pool_options),
+        AsyncHTTPConnectionPool(OPEN_METEO_HOST, name="open_meteo_async", **_pool_options),
+        breaker=open_meteo_breaker,
+    ),
 }
 
+# Daily rows come from the healthiest/fastest provider, hedged when it is slow
+weather_router = ProviderRouter(
+    [_providers[name.strip()] for name in settings.weather_providers.split(",") if name.strip() in _providers]
+    or list(_providers.values()),
+    hedge=settings.weather_hedge_enabled,
+    min_hedge_delay=settings.weather_hedge_min_delay_ms / 1000,
+    max_hedge_delay=settings.weather_hedge_max_delay_ms / 1000,
+    # One thread per pooled connection across the providers; more would only queue on the pools
+    max_workers=settings.weather_http_pool_size * len(_providers),
+)
+
+geocoder = Geocoder(
+    Gazetteer(settings.gazetteer_path or DEFAULT_GAZETTEER_PATH),
+    LearnedPlaceCache(settings.geocode_cache_path),
+    remote_enabled=settings.geocoding_remote_fallback,
+    pool=HTTPConnectionPool(GEOCODING_HOST, name="geocoding", **_sync_pool_options),
+    pool_async=AsyncHTTPConnectionPool(GEOCODING_HOST, name="geocoding_async", **_pool_options),
+    fuzzy_min_score=settings.geocode_fuzzy_min_score,
+    breaker=geocoding_breaker,
+    negative_ttl_seconds=settings.geocode_negative_ttl_seconds,
+)
+
+# Shared across batch calls so total upstream fan-out stays bounded
+_batch_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.weather_batch_concurrency),
+    thread_name_prefix="weather-batch",
+)
 
 def _geocode_city(city: str) -> Optional[Tuple[float, float, int]]:
     """
-    Convert city name to coordinates using free Open-Meteo geocoding API.
-    Falls back to hardcoded coordinates for common cities.
+    Convert city name to coordinates using the bundled gazetteer
+    (typos are matched fuzzily). Names it doesn't know go to the Open-Meteo geocoding API only when
+    GEOCODING_REMOTE_FALLBACK is enabled.
     
     Returns:
         Tuple of (latitude, longitude, altitude) or None
     """
-    city_lower = city.lower().split(',')[0].strip()
-    
-    if city_lower in CITY_COORDINATES:
-        return CITY_COORDINATES[city_lower]
+    place = geocoder.resolve(city)
+    return place.coordinates if place else None
+
+
+async def _geocode_city_async(city: str) -> Optional[Tuple[float, float, int]]:
+    """Async version of _geocode_city (remote fallback uses the pooled asyncio client)."""
+    place = await geocoder.resolve_async(city)
+    return place.coordinates if place else None
+
+
+def _mock_weather(note: str, error: Optional[str] = None, error_type: str = "upstream") -> WeatherRecord:
+    """
+    Placeholder weather returned when real data is unavailable.
     
+    error_type ("upstream", "geocoding", "no_data", "rate_limited") decides
+    how long the placeholder may be cached (see _cache_ttl).
+    """
+    return WeatherRecord(
+        temperature=65.0,
+        feels_like=63.0,
+        condition="partly cloudy",
+        rain_chance=20.0,
+        wind_speed=8.0,
+        humidity=55.0,
+        timestamp=time.time(),
+        error=error or None,
+        error_type=error_type if error else None,
+        note=note,
+    )
+
+
+def _prefetch_window(day: date) -> Tuple[date, date]:
+    """Range of days fetched around a requested day (WEATHER_PREFETCH_DAYS either side)."""
+    span = timedelta(days=max(0, settings.weather_prefetch_days))
+    return day - span, day + span
+
+
+def _row_for_day(rows: List[Dict[str, Any]], day: date) -> Optional[Dict[str, Any]]:
+    prefix = day.isoformat()
+    for row in rows:
+        if str(row.get("date", "")).startswith(prefix):
+            return row
+    return None
+
+
+def _record_history(location: Tuple[float, float, int], rows: List[Dict[str, Any]]):
+    """Write the observed (past) days of fetched daily rows into history_store."""
+    if history_store is None or not rows:
+        return
+    today = date.today().isoformat()
     try:
-        import urllib.request
-        import urllib.parse
-        
-        encoded_city = urllib.parse.quote(city)
-        url = f"https://geocoding-api.open-meteo.com/v1/search?name={encoded_city}&count=1&language=en&format=json"
-        
-        with urllib.request.urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-            
-            if data.get("results") and len(data["results"]) > 0:
-                result = data["results"][0]
-                lat = result["latitude"]
-                lon = result["longitude"]
-                alt = result.get("elevation", 0)
-                return (lat, lon, int(alt))
+        history_store.write(location, [row for row in rows if str(row.get("date", ""))[:10] < today])
     except Exception as e:
-        print(f"Geocoding failed for {city}: {e}")
+        print(f"⚠️  Weather history write failed: {e}")
+
+
+# History writes lock and grow memory-mapped files; the async paths hand them
+# to this thread (one, so writes from the event loop stay ordered)
+_history_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weather-history")
+
+
+def _record_history_async(location: Tuple[float, float, int], rows: List[Dict[str, Any]]) -> "asyncio.Future":
+    """
+    _record_history off the event loop
+
+    Returns:
+        Future of the write; fetch paths don't wait for it, backfills do
+    """
+    return asyncio.get_running_loop().run_in_executor(_history_executor, _record_history, location, rows)
+
+
+def _daily_row(lat: float, lon: float, alt: int, day: date) -> Optional[Dict[str, Any]]:
+    """
+    Daily row (Meteostat-shaped, from weather_router) for one day.
+
+    Served from daily_series_cache when a cached window covers the day;
+    otherwise the whole prefetch window is fetched in one call (coalesced
+    per location) and cached.
+    """
+    location = location_key(lat, lon, alt)
+    cached = daily_series_cache.get(location, day)
+    if cached is DailySeriesCache.MISSING:
+        return None
+    if cached is not None:
+        return cached
+    
+    def fetch(window: Tuple[date, date]) -> Tuple[date, date, List[Dict[str, Any]]]:
+        start, end = window
+        rows = weather_router.daily(lat, lon, alt, start.isoformat(), end.isoformat())
+        daily_series_cache.put(location, start, end, rows)
+        _record_history(location, rows)
+        return start, end, rows
+    
+    window = _prefetch_window(day)
+    (start, end, rows), _ = series_flight.do(location, lambda: fetch(window))
+    if not (start <= day <= end):
+        # We joined an in-flight fetch for a window that doesn't cover our day
+        start, end, rows = fetch(window)
+    return _row_for_day(rows, day)
+
+
+async def _daily_row_async(lat: float, lon: float, alt: int, day: date) -> Optional[Dict[str, Any]]:
+    """Async counterpart of _daily_row."""
+    location = location_key(lat, lon, alt)
+    cached = daily_series_cache.get(location, day)
+    if cached is DailySeriesCache.MISSING:
+        return None
+    if cached is not None:
+        return cached
+    
+    async def fetch(window: Tuple[date, date]) -> Tuple[date, date, List[Dict[str, Any]]]:
+        start, end = window
+        rows = await weather_router.daily_async(lat, lon, alt, start.isoformat(), end.isoformat())
+        daily_series_cache.put(location, start, end, rows)
+        _record_history_async(location, rows)
+        return start, end, rows
     
-    return (47.6062, -122.3321, 50)
+    window = _prefetch_window(day)
+    (start, end, rows), _ = await series_flight_async.do(location, lambda: fetch(window))
+    if not (start <= day <= end):
+        start, end, rows = await fetch(window)
+    return _row_for_day(rows, day)
+
+
+def _weather_from_row(weather: Optional[Dict[str, Any]], city: str, target_date: datetime) -> WeatherRecord:
+    """Convert a daily row into a weather record."""
+    if weather:
+        return WeatherRecord.at(
+            target_date,
+            city=city,
+            source=weather.get("source", "meteostat"),
+            **derive_row(weather)
+        )
+    else:
+        raise Exception("No weather data available for this date")
 
 
 def get_current_weather(city: str, datetime_str: Optional[str] = None) -> Dict[str, Any]:
     """
-    Get current weather conditions for a city using Meteostat RapidAPI.
+    Get current weather conditions for a city from the configured providers
+    (Meteostat RapidAPI, Open-Meteo; see WEATHER_PROVIDERS).
     
     Args:
         city: City name (e.g., "Redmond, WA", "Seattle")
@@ -74,147 +381,439 @@ def get_current_weather(city: str, datetime_str: Optional[str] = None) -> Dict[s
         Dictionary with weather data including temperature, feels_like, condition, 
         rain_chance, and wind_speed
     """
-    api_key = os.getenv("RAPIDAPI_KEY")
+    return _current_record(city, datetime_str).to_dict()
+
+
+async def get_current_weather_async(city: str, datetime_str: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get current weather conditions for a city from the configured providers (non-blocking).
     
-    if not api_key:
-        return {
-            "temperature": 65.0,
-            "feels_like": 63.0,
-            "condition": "partly cloudy",
-            "rain_chance": 20.0,
-            "wind_speed": 8.0,
-            "humidity": 55.0,
-            "timestamp": datetime.now().isoformat(),
-            "note": "Using mock data - set RAPIDAPI_KEY for real data"
-        }
+    Args:
+        city: City name (e.g., "Redmond, WA", "Seattle")
+        datetime_str: Optional datetime string (ISO format) - if None, uses current date
+    
+    Returns:
+        Dictionary with weather data including temperature, feels_like, condition, 
+        rain_chance, and wind_speed
+    """
+    return (await _current_record_async(city, datetime_str)).to_dict()
+
+
+def _current_record(city: str, datetime_str: Optional[str] = None) -> WeatherRecord:
+    """Weather for a city as a record (get_current_weather without the dict conversion)."""
+    if not weather_router.available():
+        return _mock_weather("Using mock data - no weather provider configured (see WEATHER_PROVIDERS)")
     
     coords = _geocode_city(city)
     if not coords:
-        return {
-            "temperature": 65.0,
-            "feels_like": 63.0,
-            "condition": "partly cloudy",
-            "rain_chance": 20.0,
-            "wind_speed": 8.0,
-            "humidity": 55.0,
-            "timestamp": datetime.now().isoformat(),
-            "error": f"Could not geocode city: {city}",
-            "note": "Using mock data - geocoding failed"
-        }
+        return _mock_weather("Using mock data - geocoding failed", error=f"Could not geocode city: {city}", error_type="geocoding")
     
     lat, lon, alt = coords
+    target_date = _parse_target_date(datetime_str)
     
-    target_date = datetime.now()
+    try:
+        row = _daily_row(lat, lon, alt, target_date.date())
+        if row is None:
+            return _mock_weather(
+                "Using mock data - no observations for this date",
+                error="No weather data available for this date",
+                error_type="no_data"
+            )
+        return _weather_from_row(row, city, target_date)
+    except RateLimitExceeded as e:
+        return _mock_weather("Using mock data - upstream rate limit", error=f"Rate limited: {str(e)}", error_type="rate_limited")
+    except Exception as e:
+        return _mock_weather("Using mock data due to API error", error=f"API error: {str(e)}")
+
+
+async def _current_record_async(city: str, datetime_str: Optional[str] = None) -> WeatherRecord:
+    """Async counterpart of _current_record."""
+    if not weather_router.available():
+        return _mock_weather("Using mock data - no weather provider configured (see WEATHER_PROVIDERS)")
+    
+    coords = await _geocode_city_async(city)
+    if not coords:
+        return _mock_weather("Using mock data - geocoding failed", error=f"Could not geocode city: {city}", error_type="geocoding")
+    
+    lat, lon, alt = coords
+    target_date = _parse_target_date(datetime_str)
+    
+    try:
+        row = await _daily_row_async(lat, lon, alt, target_date.date())
+        if row is None:
+            return _mock_weather(
+                "Using mock data - no observations for this date",
+                error="No weather data available for this date",
+                error_type="no_data"
+            )
+        return _weather_from_row(row, city, target_date)
+    except RateLimitExceeded as e:
+        return _mock_weather("Using mock data - upstream rate limit", error=f"Rate limited: {str(e)}", error_type="rate_limited")
+    except Exception as e:
+        return _mock_weather("Using mock data due to API error", error=f"API error: {str(e)}")
+
+
+def _parse_target_date(datetime_str: Optional[str]) -> datetime:
+    """Parse an ISO datetime string, defaulting to now if missing or invalid."""
     if datetime_str:
         try:
-            target_date = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        except:
+            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+        except ValueError:
             pass
+    return datetime.now()
+
+
+def _normalize_city(city: str) -> str:
+    """Normalize a city name for use in cache keys ("  New  York " -> "new york")."""
+    return " ".join(city.lower().split())
+
+
+def _spatial_key(city: str, coords: Optional[Tuple[float, float, int]], datetime_str: Optional[str]) -> Tuple[str, str]:
+    """
+    Cache/coalescing key: geohash cell of the resolved coordinates plus the
+    target date, so every spelling of a city (and its close neighbors) shares
+    one entry. Unresolvable names fall back to the normalized name.
+    """
+    day = _parse_target_date(datetime_str).strftime("%Y-%m-%d")
+    precision = settings.weather_cache_geohash_precision
+    if coords and precision > 0:
+        return (f"geohash:{geohash_encode(coords[0], coords[1], precision)}", day)
+    return (_normalize_city(city), day)
+
+
+def _cache_key(city: str, datetime_str: Optional[str]) -> Tuple[str, str]:
+    coords = _geocode_city(city) if settings.weather_cache_geohash_precision > 0 else None
+    return _spatial_key(city, coords, datetime_str)
+
+
+async def _cache_key_async(city: str, datetime_str: Optional[str]) -> Tuple[str, str]:
+    coords = await _geocode_city_async(city) if settings.weather_cache_geohash_precision > 0 else None
+    return _spatial_key(city, coords, datetime_str)
+
+
+def _serve_cached(weather: WeatherRecord, city: str, stale: bool = False) -> Dict[str, Any]:
+    """
+    Convert a cached (or shared) record to the tool dict, labeled for the
+    requesting city, and record whether it was fetched under a different alias.
+    """
+    extra: Dict[str, Any] = {"from_cache": True}
+    if stale:
+        extra["stale"] = True
+    fetched_for = weather.city
+    if fetched_for is not None:
+        alias = "same" if _normalize_city(fetched_for) == _normalize_city(city) else "cross"
+        buffered_metrics.increment_counter(
+            "weather_cache_alias_hits",
+            labels={"cache": weather_cache.name, "alias": alias}
+        )
+        extra["city"] = city
+    return weather.to_dict(**extra)
+
+
+def _forecast_from_current(city: str, datetime_str: str, current: Dict[str, Any]) -> Dict[str, Any]:
+    """Fallback forecast from the daily row when no hourly data is available."""
+    return {
+        "city": city,
+        "target_time": datetime_str,
+        "forecast": current,
+        "min_temp": current["temperature"] - 5,
+        "max_temp": current["temperature"] + 8,
+        "summary": _get_temp_summary(current["temperature"]),
+        "resolution": "daily"
+    }
+
+
+def _utc_epoch(target: datetime, utc_offset: Optional[int], lon: float) -> float:
+    """
+    UTC epoch seconds of a target time. Aware times are exact; naive times
+    are local time at the location, using the provider-reported UTC offset
+    (or the longitude's nominal offset until one is known).
+    """
+    if target.tzinfo is not None:
+        return target.timestamp()
+    if utc_offset is None:
+        utc_offset = int(round(lon / 15)) * 3600
+    return target.replace(tzinfo=timezone.utc).timestamp() - utc_offset
+
+
+def _hourly_window(when: float) -> Tuple[str, str]:
+    """UTC dates fetched around a target time (WEATHER_HOURLY_WINDOW_DAYS either side)."""
+    day = datetime.fromtimestamp(when, timezone.utc).date()
+    span = timedelta(days=max(0, settings.weather_hourly_window_days))
+    return (day - span).isoformat(), (day + span).isoformat()
+
+
+def _forecast_from_hourly(
+    city: str,
+    datetime_str: str,
+    lon: float,
+    location: Tuple[float, float, int],
+    when: float,
+    point: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the forecast from an interpolated hourly point and the buffered day around it."""
+    hour = 3600
     
-    start_date = target_date.strftime("%Y-%m-%d")
-    end_date = target_date.strftime("%Y-%m-%d")
+    # Without a provider probability, the share of wet hours around the target
+    nearby = hourly_buffer.values(location, when - 3 * hour, when + 3 * hour, "prcp")
+    rain_chance = 100.0 * sum(1 for p in nearby if p >= 0.1) / len(nearby) if nearby else None
+    fields = derive_hour(point, rain_chance)
     
-    try:
-        conn = http.client.HTTPSConnection("meteostat.p.rapidapi.com")
-        
-        headers = {
-            'x-rapidapi-key': api_key,
-            'x-rapidapi-host': "meteostat.p.rapidapi.com"
-        }
-        
-        endpoint = f"/point/daily?lat={lat}&lon={lon}&alt={alt}&start={start_date}&end={end_date}"
-        
-        conn.request("GET", endpoint, headers=headers)
-        res = conn.getresponse()
-        data_raw = res.read()
-        data = json.loads(data_raw.decode("utf-8"))
+    offset = hourly_buffer.utc_offset(location)
+    if offset is None:
+        offset = int(round(lon / 15)) * 3600
+    day_start = when - (when + offset) % 86400
+    temps = hourly_buffer.values(location, day_start, day_start + 86400 - 1, "temp") or [point.get("temp") or 20.0]
+    
+    forecast = WeatherRecord(timestamp=when, utc_offset=offset, city=city, source=point.get("source"), **fields)
+    return {
+        "city": city,
+        "target_time": datetime_str,
+        "forecast": forecast.to_dict(),
+        "min_temp": round(min(temps) * 9/5 + 32, 1),
+        "max_temp": round(max(temps) * 9/5 + 32, 1),
+        "summary": _get_temp_summary(fields["temperature"]),
+        "resolution": "hourly"
+    }
+
+
+def _hourly_point(lat: float, lon: float, alt: int, target: datetime) -> Tuple[Tuple[float, float, int], float, Optional[Dict[str, Any]]]:
+    """
+    Interpolated hourly values at target, from hourly_buffer when it covers
+    the time; otherwise the window around it is fetched in one call
+    (coalesced per location) and buffered.
+    
+    Returns:
+        (location key, UTC epoch seconds of target, point or None)
+    """
+    location = location_key(lat, lon, alt)
+    when = _utc_epoch(target, hourly_buffer.utc_offset(location), lon)
+    point = hourly_buffer.at(location, when)
+    
+    if point is None:
+        def fetch(when: float) -> bool:
+            start, end = _hourly_window(when)
+            hourly_buffer.put(location, weather_router.hourly(lat, lon, alt, start, end))
+            return True
         
-        conn.close()
+        _, shared = hourly_flight.do(location, lambda: fetch(when))
+        when = _utc_epoch(target, hourly_buffer.utc_offset(location), lon)
+        point = hourly_buffer.at(location, when)
+        if point is None and shared:
+            # We joined an in-flight fetch for a window that doesn't cover our time
+            fetch(when)
+            point = hourly_buffer.at(location, when)
+    return location, when, point
+
+
+async def _hourly_point_async(lat: float, lon: float, alt: int, target: datetime) -> Tuple[Tuple[float, float, int], float, Optional[Dict[str, Any]]]:
+    """Async counterpart of _hourly_point."""
+    location = location_key(lat, lon, alt)
+    when = _utc_epoch(target, hourly_buffer.utc_offset(location), lon)
+    point = hourly_buffer.at(location, when)
+    
+    if point is None:
+        async def fetch(when: float) -> bool:
+            start, end = _hourly_window(when)
+            hourly_buffer.put(location, await weather_router.hourly_async(lat, lon, alt, start, end))
+            return True
         
-        if data.get("data") and len(data["data"]) > 0:
-            weather = data["data"][0]
-            
-            temp_c = weather.get("tavg") or weather.get("tmax") or 20.0
-            temp_f = (temp_c * 9/5) + 32
-            
-            wind_speed_kmh = weather.get("wspd", 0.0)
-            wind_speed_mph = wind_speed_kmh * 0.621371
-            
-            prcp = weather.get("prcp", 0.0)
-            rain_chance = min(100.0, prcp * 10) if prcp else 0.0
-            
-            condition = _get_condition_from_data(weather)
-            
-            return {
-                "temperature": round(temp_f, 1),
-                "feels_like": round(temp_f - 2, 1),
-                "condition": condition,
-                "rain_chance": round(rain_chance, 1),
-                "wind_speed": round(wind_speed_mph, 1),
-                "humidity": weather.get("rhum", 50.0),
-                "timestamp": target_date.isoformat(),
-                "city": city,
-                "source": "meteostat"
-            }
-        else:
-            raise Exception("No weather data available for this date")
-            
-    except Exception as e:
-        return {
-            "temperature": 65.0,
-            "feels_like": 63.0,
-            "condition": "partly cloudy",
-            "rain_chance": 20.0,
-            "wind_speed": 8.0,
-            "humidity": 55.0,
-            "timestamp": datetime.now().isoformat(),
-            "error": f"API error: {str(e)}",
-            "note": "Using mock data due to API error"
-        }
-
-
-def _get_condition_from_data(weather: Dict[str, Any]) -> str:
-    """Determine weather condition from Meteostat data."""
-    prcp = weather.get("prcp", 0.0)
-    snow = weather.get("snow", 0.0)
-    
-    if snow and snow > 0:
-        return "snowy"
-    elif prcp and prcp > 10:
-        return "rainy"
-    elif prcp and prcp > 2:
-        return "light rain"
-    else:
-        return "partly cloudy"
+        _, shared = await hourly_flight_async.do(location, lambda: fetch(when))
+        when = _utc_epoch(target, hourly_buffer.utc_offset(location), lon)
+        point = hourly_buffer.at(location, when)
+        if point is None and shared:
+            await fetch(when)
+            point = hourly_buffer.at(location, when)
+    return location, when, point
 
 
 def get_hourly_forecast(city: str, datetime_str: str) -> Dict[str, Any]:
     """
-    Get hourly forecast for a specific time.
+    Get the forecast for a specific time of day.
+    
+    Hourly data is fetched once per location for the days around the target
+    and buffered; other times at the same place are interpolated locally.
+    Falls back to the daily forecast ("resolution": "daily") when no
+    provider has hourly data for the time.
     
     Args:
         city: City name
-        datetime_str: Target datetime (ISO format)
+        datetime_str: Target datetime (ISO format; without an offset it is
+            local time at the city)
     
     Returns:
         Dictionary with forecast data
     """
+    if weather_router.available():
+        coords = _geocode_city(city)
+        if coords:
+            lat, lon, alt = coords
+            try:
+                location, when, point = _hourly_point(lat, lon, alt, _parse_target_date(datetime_str))
+                if point is not None:
+                    return _forecast_from_hourly(city, datetime_str, lon, location, when, point)
+            except Exception as e:
+                print(f"⚠️  Hourly forecast failed, using daily data: {e}")
+    
     current = get_current_weather(city, datetime_str)
+    return _forecast_from_current(city, datetime_str, current)
+
+
+async def get_hourly_forecast_async(city: str, datetime_str: str) -> Dict[str, Any]:
+    """
+    Get the forecast for a specific time of day (non-blocking).
     
-    return {
-        "city": city,
-        "target_time": datetime_str,
-        "forecast": current,
-        "min_temp": current["temperature"] - 5,
-        "max_temp": current["temperature"] + 8,
-        "summary": _get_temp_summary(current["temperature"])
-    }
+    Args:
+        city: City name
+        datetime_str: Target datetime (ISO format; without an offset it is
+            local time at the city)
+    
+    Returns:
+        Dictionary with forecast data
+    """
+    if weather_router.available():
+        coords = await _geocode_city_async(city)
+        if coords:
+            lat, lon, alt = coords
+            try:
+                location, when, point = await _hourly_point_async(lat, lon, alt, _parse_target_date(datetime_str))
+                if point is not None:
+                    return _forecast_from_hourly(city, datetime_str, lon, location, when, point)
+            except Exception as e:
+                print(f"⚠️  Hourly forecast failed, using daily data: {e}")
+    
+    current = await get_current_weather_async(city, datetime_str)
+    return _forecast_from_current(city, datetime_str, current)
+
+
+def _revalidate(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> bool:
+    """
+    Background reload of one entry (coalesced with any blocking miss for the key).
+    
+    Returns:
+        True if fresh data was stored
+    """
+    def fetch() -> Tuple[WeatherRecord, bool]:
+        fetched = _current_record(city, datetime_str)
+        # On upstream errors keep serving the stale entry instead of caching mock data
+        if fetched.error is None:
+            fetched.cached_at = time.time()
+            weather_cache.put(cache_key, fetched)
+        return fetched, False
+    
+    (fetched, _), _ = weather_flight.do(cache_key, fetch)
+    return fetched.error is None
+
+
+def _popularity_key(cache_key: Tuple[str, str]) -> Tuple[str, int]:
+    """
+    Popularity is tracked per location and day offset from today, so
+    yesterday's "weather today in Seattle" traffic prewarms today's entry.
+    """
+    try:
+        offset = (date.fromisoformat(cache_key[1]) - date.today()).days
+    except ValueError:
+        offset = 0
+    return (cache_key[0], offset)
+
+
+def _prewarm_target(key: Tuple[str, int], city: str):
+    """Cache key and loader for a popular (location, day offset) pair."""
+    day = (date.today() + timedelta(days=key[1])).isoformat()
+    cache_key = (key[0], day)
+    
+    def load() -> bool:
+        # Prewarm calls queue behind interactive ones and can't spend the reserved quota
+        with request_priority(PREWARM):
+            return _revalidate(city, day, cache_key)
+    
+    return cache_key, load
+
+
+# Prefetch the most popular locations before the morning/evening peaks
+weather_prewarmer = Prewarmer(
+    _prewarm_target,
+    ttl_remaining=weather_cache.ttl_remaining,
+    name="weather",
+    top_k=settings.weather_prewarm_top_k,
+    min_hits=settings.weather_prewarm_min_hits,
+    interval_seconds=settings.weather_prewarm_interval_seconds,
+    peak_hours=[int(h) for h in settings.weather_prewarm_peak_hours.split(",") if h.strip()],
+    lead_minutes=settings.weather_prewarm_lead_minutes,
+    rate_per_second=settings.weather_prewarm_rate_per_second,
+    entry_ttl_seconds=settings.weather_cache_ttl_seconds,
+    decay_seconds=settings.weather_prewarm_decay_seconds,
+)
+
+
+def _cache_ttl(weather: WeatherRecord) -> Optional[float]:
+    """
+    TTL for caching a fetched result: the cache default for real data,
+    short negative TTLs for failures and "no data for this date" (so an
+    outage or a gap isn't re-fetched on every request), and 0 (don't
+    cache) for calls shed by the rate limiter.
+    """
+    error_type = weather.error_type
+    if error_type is None:
+        return None
+    if error_type == "rate_limited":
+        return 0.0
+    if error_type == "no_data":
+        return settings.weather_no_data_cache_ttl_seconds
+    return settings.weather_negative_cache_ttl_seconds
+
+
+def _cached_weather(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Cache lookup with stale-while-revalidate.
+    
+    Fresh entries are returned as-is. Entries inside the stale grace window
+    (WEATHER_CACHE_STALE_SECONDS) are returned immediately with "stale": True
+    while a single background refresh reloads them.
+    """
+    loader = _track_lookup(city, datetime_str, cache_key)
+    return _serve_lookup(city, cache_key, loader, weather_cache.get_stale(cache_key))
+
+
+async def _cached_weather_async(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Async counterpart of _cached_weather (backing-tier reads run off the event loop)."""
+    loader = _track_lookup(city, datetime_str, cache_key)
+    return _serve_lookup(city, cache_key, loader, await weather_cache.get_stale_async(cache_key))
+
+
+def _track_lookup(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> Callable[[], bool]:
+    """Register a lookup with the refresher and prewarmer; returns the entry's reload function"""
+    loader = lambda: _revalidate(city, datetime_str, cache_key)
+    weather_refresher.touch(cache_key, loader)
+    if settings.weather_prewarm_enabled:
+        weather_prewarmer.record(_popularity_key(cache_key), city)
+    return loader
+
+
+def _serve_lookup(
+    city: str,
+    cache_key: Tuple[str, str],
+    loader: Callable[[], bool],
+    cached: Optional[Tuple[WeatherRecord, bool]]
+) -> Optional[Dict[str, Any]]:
+    if cached is None:
+        return None
+    
+    weather_data, stale = cached
+    if stale and weather_data.error is not None:
+        return None  # Negative entries are never served past their short TTL
+    weather_prewarmer.note_hit(cache_key)
+    if stale:
+        weather_refresher.refresh(cache_key, loader)
+    return _serve_cached(weather_data, city, stale)
 
 
 def get_weather_smart(city: str, datetime_str: Optional[str] = None) -> Dict[str, Any]:
     """
     Get weather with caching to reduce API calls.
-    Cache is valid for 30 minutes.
+    Cache is valid for 30 minutes by default (WEATHER_CACHE_TTL_SECONDS) and
+    keyed by location cell, so "Redmond", "redmond, WA" and nearby points share entries.
+    Just-expired entries are served stale while refreshing in the background.
     
     Args:
         city: City name
@@ -223,24 +822,462 @@ def get_weather_smart(city: str, datetime_str: Optional[str] = None) -> Dict[str
     Returns:
         Cached or fresh weather data
     """
-    cache_key = f"{city}_{datetime_str or 'current'}"
-    now = datetime.now()
+    cache_key = _cache_key(city, datetime_str)
     
-    if cache_key in weather_cache:
-        cached_data = weather_cache[cache_key]
-        cache_time = datetime.fromisoformat(cached_data["cached_at"])
+    cached_data = _cached_weather(city, datetime_str, cache_key)
+    if cached_data is not None:
+        return cached_data
+    
+    return _load_weather(city, datetime_str, cache_key)
+
+
+def _load_weather(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> Dict[str, Any]:
+    """Fetch and cache weather after a miss, coalescing concurrent callers."""
+    def fetch() -> Tuple[WeatherRecord, bool]:
+        # A previous leader may have filled the cache between our miss and taking the lead
+        fresh = weather_cache.get(cache_key)
+        if fresh is not None:
+            return fresh, True
         
-        if now - cache_time < timedelta(minutes=30):
-            cached_data["from_cache"] = True
-            return cached_data
+        fetched = _current_record(city, datetime_str)
+        ttl = _cache_ttl(fetched)
+        if ttl != 0:
+            fetched.cached_at = time.time()
+            weather_cache.put(cache_key, fetched, ttl_seconds=ttl)
+        return fetched, False
+    
+    (weather_data, from_cache), shared = weather_flight.do(cache_key, fetch)
+    
+    if from_cache or shared:
+        return _serve_cached(weather_data, city)
+    return weather_data.to_dict(from_cache=False)
+
+
+async def get_weather_smart_async(city: str, datetime_str: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get weather with caching to reduce API calls (non-blocking).
+    Shares the cache with get_weather_smart; concurrent misses on the same
+    event loop are coalesced into one upstream call.
+    
+    Args:
+        city: City name
+        datetime_str: Optional datetime string
+    
+    Returns:
+        Cached or fresh weather data
+    """
+    cache_key = await _cache_key_async(city, datetime_str)
     
-    weather_data = get_current_weather(city, datetime_str)
-    weather_data["cached_at"] = now.isoformat()
-    weather_data["from_cache"] = False
+    cached_data = await _cached_weather_async(city, datetime_str, cache_key)
+    if cached_data is not None:
+        return cached_data
     
-    weather_cache[cache_key] = weather_data
+    return await _load_weather_async(city, datetime_str, cache_key)
+
+
+async def _load_weather_async(city: str, datetime_str: Optional[str], cache_key: Tuple[str, str]) -> Dict[str, Any]:
+    """Async counterpart of _load_weather."""
+    async def fetch() -> Tuple[WeatherRecord, bool]:
+        fresh = await weather_cache.get_async(cache_key)
+        if fresh is not None:
+            return fresh, True
+        
+        fetched = await _current_record_async(city, datetime_str)
+        ttl = _cache_ttl(fetched)
+        if ttl != 0:
+            fetched.cached_at = time.time()
+            # Write-behind: the persistent/shared tier is written on the cache's writer thread
+            weather_cache.put_async(cache_key, fetched, ttl_seconds=ttl)
+        return fetched, False
     
-    return weather_data
+    (weather_data, from_cache), shared = await weather_flight_async.do(cache_key, fetch)
+    
+    if from_cache or shared:
+        return _serve_cached(weather_data, city)
+    return weather_data.to_dict(from_cache=False)
+
+
+def _plan_batch(cities: List[str], keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """
+    De-duplicate a batch by cache key.
+
+    Returns:
+        Mapping of cache key -> first spelling of the city
+    """
+    unique: Dict[Tuple[str, str], str] = {}
+    for city, key in zip(cities, keys):
+        unique.setdefault(key, city.strip())
+    return unique
+
+
+def _batch_response(
+    cities: List[str],
+    keys: List[Tuple[str, str]],
+    results: Dict[Tuple[str, str], Dict[str, Any]],
+    datetime_str: Optional[str]
+) -> Dict[str, Any]:
+    ordered = []
+    for city, key in zip(cities, keys):
+        entry = {"city": city}
+        entry.update(results[key])
+        if "weather" in entry:
+            entry["weather"] = dict(entry["weather"])
+            if "city" in entry["weather"]:
+                entry["weather"]["city"] = city.strip()
+        ordered.append(entry)
+    
+    return {
+        "datetime": datetime_str,
+        "count": len(ordered),
+        "unique_cities": len(results),
+        "cache_hits": sum(1 for r in results.values() if r.get("weather", {}).get("from_cache")),
+        "errors": sum(1 for r in results.values() if "error" in r),
+        "results": ordered,
+    }
+
+
+def get_weather_batch(cities: List[str], datetime_str: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get weather for several cities at once.
+    
+    Cities are de-duplicated by location (aliases of the same place share
+    one lookup), cache hits are served directly,
+    and misses are fetched concurrently (WEATHER_BATCH_CONCURRENCY at a time).
+    A failure for one city does not affect the others.
+    
+    Args:
+        cities: List of city names (e.g., ["Seattle", "Denver", "Miami"])
+        datetime_str: Optional datetime string applied to every city
+    
+    Returns:
+        Dictionary with per-city results in input order; each result has
+        either a "weather" dict or an "error" message
+    """
+    keys = [_cache_key(city, datetime_str) for city in cities]
+    unique = _plan_batch(cities, keys)
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    
+    misses = []
+    for key, city in unique.items():
+        cached = _cached_weather(city, datetime_str, key)
+        if cached is not None:
+            results[key] = {"weather": cached}
+        else:
+            misses.append((key, city))
+    
+    futures = {key: _batch_executor.submit(_load_weather, city, datetime_str, key) for key, city in misses}
+    for key, future in futures.items():
+        try:
+            results[key] = {"weather": future.result()}
+        except Exception as e:
+            results[key] = {"error": f"Weather lookup failed: {str(e)}"}
+    
+    return _batch_response(cities, keys, results, datetime_str)
+
+
+async def get_weather_batch_async(cities: List[str], datetime_str: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get weather for several cities at once (non-blocking).
+    
+    Same behavior as get_weather_batch, with misses fetched as concurrent
+    coroutines bounded by WEATHER_BATCH_CONCURRENCY.
+    
+    Args:
+        cities: List of city names (e.g., ["Seattle", "Denver", "Miami"])
+        datetime_str: Optional datetime string applied to every city
+    
+    Returns:
+        Dictionary with per-city results in input order; each result has
+        either a "weather" dict or an "error" message
+    """
+    keys = [await _cache_key_async(city, datetime_str) for city in cities]
+    unique = _plan_batch(cities, keys)
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    semaphore = asyncio.Semaphore(max(1, settings.weather_batch_concurrency))
+    
+    async def fetch(key: Tuple[str, str], city: str):
+        try:
+            async with semaphore:
+                results[key] = {"weather": await _load_weather_async(city, datetime_str, key)}
+        except Exception as e:
+            results[key] = {"error": f"Weather lookup failed: {str(e)}"}
+    
+    misses = []
+    for key, city in unique.items():
+        cached = await _cached_weather_async(city, datetime_str, key)
+        if cached is not None:
+            results[key] = {"weather": cached}
+        else:
+            misses.append(fetch(key, city))
+    
+    await asyncio.gather(*misses)
+    return _batch_response(cities, keys, results, datetime_str)
+
+
+def _range_dates(start_date: str, end_date: Optional[str]) -> Tuple[date, date]:
+    """Parse and validate a get_weather_range date range (end defaults to start)."""
+    try:
+        start = date.fromisoformat(start_date.strip()[:10])
+        end = date.fromisoformat(end_date.strip()[:10]) if end_date else start
+    except ValueError:
+        raise ValueError(f"Dates must be YYYY-MM-DD, got {start_date!r}..{end_date!r}")
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    if (end - start).days + 1 > settings.weather_range_max_days:
+        raise ValueError(f"Date range is limited to {settings.weather_range_max_days} days")
+    return start, end
+
+
+def _range_response(city: str, start: date, end: date, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Derive every day of a range in one pass (vectorized when NumPy is installed)."""
+    by_day: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        day = str(row.get("date", ""))[:10]
+        if start.isoformat() <= day <= end.isoformat():
+            by_day.setdefault(day, row)
+    
+    ordered = sorted(by_day.items())
+    days = []
+    for (day, row), fields in zip(ordered, derive_rows([row for _, row in ordered])):
+        fields["date"] = day
+        fields["source"] = row.get("source", "meteostat")
+        days.append(fields)
+    
+    return {
+        "city": city,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "count": len(days),
+        "missing_days": (end - start).days + 1 - len(days),
+        "days": days,
+    }
+
+
+def get_weather_range(city: str, start_date: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get daily weather for every day in a date range with one upstream call.
+    
+    Args:
+        city: City name
+        start_date: First day (YYYY-MM-DD)
+        end_date: Last day, inclusive (YYYY-MM-DD); defaults to start_date.
+            Ranges are limited to WEATHER_RANGE_MAX_DAYS days.
+    
+    Returns:
+        Dictionary with a "days" list (date, temperature, feels_like, condition,
+        rain_chance, wind_speed, humidity, source) in date order, or an "error"
+        message. Days the providers have no data for are left out (see missing_days).
+    """
+    try:
+        start, end = _range_dates(start_date, end_date)
+    except ValueError as e:
+        return {"city": city, "error": str(e)}
+    
+    coords = _geocode_city(city)
+    if not coords:
+        return {"city": city, "error": f"Could not geocode city: {city}"}
+    
+    lat, lon, alt = coords
+    try:
+        rows = weather_router.daily(lat, lon, alt, start.isoformat(), end.isoformat())
+    except RateLimitExceeded as e:
+        return {"city": city, "error": f"Rate limited: {str(e)}"}
+    except Exception as e:
+        return {"city": city, "error": f"API error: {str(e)}"}
+    _record_history(location_key(lat, lon, alt), rows)
+    return _range_response(city, start, end, rows)
+
+
+async def get_weather_range_async(city: str, start_date: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get daily weather for every day in a date range (non-blocking).
+    
+    Args:
+        city: City name
+        start_date: First day (YYYY-MM-DD)
+        end_date: Last day, inclusive (YYYY-MM-DD); defaults to start_date
+    
+    Returns:
+        Same as get_weather_range
+    """
+    try:
+        start, end = _range_dates(start_date, end_date)
+    except ValueError as e:
+        return {"city": city, "error": str(e)}
+    
+    coords = await _geocode_city_async(city)
+    if not coords:
+        return {"city": city, "error": f"Could not geocode city: {city}"}
+    
+    lat, lon, alt = coords
+    try:
+        rows = await weather_router.daily_async(lat, lon, alt, start.isoformat(), end.isoformat())
+    except RateLimitExceeded as e:
+        return {"city": city, "error": f"Rate limited: {str(e)}"}
+    except Exception as e:
+        return {"city": city, "error": f"API error: {str(e)}"}
+    _record_history_async(location_key(lat, lon, alt), rows)
+    return _range_response(city, start, end, rows)
+
+
+# Past-year windows with less stored coverage than this are fetched before answering
+_HISTORY_MIN_COVERAGE = 0.5
+
+
+def _years_back(day: date, years: int) -> date:
+    """The same calendar day `years` earlier (Feb 29 becomes Feb 28)."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+def _history_gaps(location: Tuple[float, float, int], start: date, end: date) -> List[Tuple[date, date]]:
+    """Windows of past years around [start, end] that history_store doesn't cover yet."""
+    span = timedelta(days=max(0, settings.weather_history_window_days))
+    yesterday = date.today() - timedelta(days=1)
+    gaps = []
+    for years in range(1, settings.weather_history_years + 1):
+        first = _years_back(start, years) - span
+        last = min(_years_back(end, years) + span, yesterday)
+        if first <= last and history_store.coverage(location, first, last) < _HISTORY_MIN_COVERAGE:
+            gaps.append((first, last))
+    return gaps
+
+
+def _to_fahrenheit(celsius: Optional[float]) -> Optional[float]:
+    return round((celsius * 9/5) + 32, 1) if celsius is not None else None
+
+
+def _typical_response(city: str, location: Tuple[float, float, int], start: date, end: date, failed: int) -> Dict[str, Any]:
+    """Per-day climatology for [start, end] from history_store."""
+    days = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        stats = history_store.climatology(
+            location,
+            day.month,
+            day.day,
+            day.year - settings.weather_history_years,
+            day.year - 1,
+            window_days=settings.weather_history_window_days,
+        )
+        if not stats["days"]:
+            days.append({"date": day.isoformat(), "years": 0})
+            continue
+        mean_prcp = stats["prcp"]["mean"]
+        days.append({
+            "date": day.isoformat(),
+            "avg_temp": _to_fahrenheit(stats["tavg"]["mean"]),
+            "avg_high": _to_fahrenheit(stats["tmax"]["mean"]),
+            "avg_low": _to_fahrenheit(stats["tmin"]["mean"]),
+            "record_high": _to_fahrenheit(stats["tmax"]["max"]),
+            "record_low": _to_fahrenheit(stats["tmin"]["min"]),
+            "avg_precipitation_mm": round(mean_prcp, 1) if mean_prcp is not None else None,
+            "rain_chance": round(stats["wet_days"] * 100, 1),
+            "snow_chance": round(stats["snow_days"] * 100, 1),
+            "years": stats["years"],
+        })
+
+    response: Dict[str, Any] = {
+        "city": city,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "days": days,
+    }
+    temps = [d["avg_temp"] for d in days if d.get("avg_temp") is not None]
+    if temps:
+        response["summary"] = _get_temp_summary(sum(temps) / len(temps))
+    else:
+        response["error"] = "No historical data available for these dates"
+    if failed:
+        response["note"] = f"{failed} of {settings.weather_history_years} past years could not be fetched"
+    return response
+
+
+def get_typical_weather(city: str, start_date: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get typical (climatological) weather for dates, from past years' observations.
+
+    Past years missing from the history store are fetched once and stored;
+    later questions about the same place and season are answered locally.
+
+    Args:
+        city: City name
+        start_date: First day (YYYY-MM-DD); any year, including future ones
+        end_date: Last day, inclusive (YYYY-MM-DD); defaults to start_date
+
+    Returns:
+        Dictionary with a "days" list (date, avg_temp, avg_high, avg_low,
+        record_high, record_low in °F, avg_precipitation_mm, rain_chance and
+        snow_chance as the % of past days with rain / snow, years of data),
+        or an "error" message. Each day pools WEATHER_HISTORY_WINDOW_DAYS days
+        either side over the last WEATHER_HISTORY_YEARS years.
+    """
+    if history_store is None:
+        return {"city": city, "error": "Historical weather is not enabled (set WEATHER_HISTORY_PATH)"}
+    try:
+        start, end = _range_dates(start_date, end_date)
+    except ValueError as e:
+        return {"city": city, "error": str(e)}
+
+    coords = _geocode_city(city)
+    if not coords:
+        return {"city": city, "error": f"Could not geocode city: {city}"}
+
+    lat, lon, alt = coords
+    location = location_key(lat, lon, alt)
+
+    def backfill(window: Tuple[date, date]) -> bool:
+        first, last = window
+        try:
+            _record_history(location, weather_router.daily(lat, lon, alt, first.isoformat(), last.isoformat()))
+            return True
+        except Exception:
+            return False
+
+    gaps = _history_gaps(location, start, end)
+    failed = sum(1 for ok in _batch_executor.map(backfill, gaps) if not ok)
+    return _typical_response(city, location, start, end, failed)
+
+
+async def get_typical_weather_async(city: str, start_date: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get typical (climatological) weather for dates (non-blocking).
+
+    Args:
+        city: City name
+        start_date: First day (YYYY-MM-DD)
+        end_date: Last day, inclusive (YYYY-MM-DD); defaults to start_date
+
+    Returns:
+        Same as get_typical_weather
+    """
+    if history_store is None:
+        return {"city": city, "error": "Historical weather is not enabled (set WEATHER_HISTORY_PATH)"}
+    try:
+        start, end = _range_dates(start_date, end_date)
+    except ValueError as e:
+        return {"city": city, "error": str(e)}
+
+    coords = await _geocode_city_async(city)
+    if not coords:
+        return {"city": city, "error": f"Could not geocode city: {city}"}
+
+    lat, lon, alt = coords
+    location = location_key(lat, lon, alt)
+
+    async def backfill(window: Tuple[date, date]) -> bool:
+        first, last = window
+        try:
+            rows = await weather_router.daily_async(lat, lon, alt, first.isoformat(), last.isoformat())
+            await _record_history_async(location, rows)
+            return True
+        except Exception:
+            return False
+
+    results = await asyncio.gather(*(backfill(window) for window in _history_gaps(location, start, end)))
+    return _typical_response(city, location, start, end, sum(1 for ok in results if not ok))
 
 
 def _get_temp_summary(temp: float) -> str: